@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark bcrypt on this machine and suggest BCRYPT_ROUNDS.
+
+Hashes a password at increasing cost factors and reports the median time of
+each. The suggested cost is the highest one whose median stays within the
+target latency; every extra round doubles the time.
+
+Usage:
+    python run_bcrypt_benchmark.py
+    python run_bcrypt_benchmark.py --target-ms 250 --samples 5
+"""
+
+import argparse
+import statistics
+import time
+
+from src.infrastructure.security.password_service import hash_password
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 18
+
+
+def measure(rounds: int, samples: int) -> float:
+    """Median milliseconds to hash one password at ``rounds``."""
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hash_password("benchmark-password-1", rounds=rounds)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=3)
+    args = parser.parse_args()
+
+    suggested = MIN_ROUNDS
+    print(f"{'rounds':>6}  {'median ms':>10}")
+    for rounds in range(MIN_ROUNDS, MAX_ROUNDS + 1):
+        median = measure(rounds, args.samples)
+        print(f"{rounds:>6}  {median:>10.1f}")
+        if median > args.target_ms:
+            break
+        suggested = rounds
+
+    print(f"\nBCRYPT_ROUNDS={suggested}  (target {args.target_ms:.0f} ms per hash)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading messages from database rows.
+
+Maps the same in-memory rows three ways and reports the memory held per
+entity and the rows mapped per second:
+
+- dict: the message class as it was before __slots__, built through
+  __init__ with keyword arguments (before)
+- slots: the slotted Message, built the same way
+- mapper: the slotted Message, built by PostgresMessageRepository._parse_row
+  (after)
+
+Bytes per entity include the 8-byte list slot holding it. The field values
+are shared between the three runs and are not counted.
+
+Usage:
+    python run_entity_benchmark.py
+    python run_entity_benchmark.py --messages 1000000
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+
+from src.domain.entities.message import Message
+from src.helpers.helpers import get_now
+from src.infrastructure.repositories.postgres_message_repository import (
+    PostgresMessageRepository,
+)
+
+
+class DictMessage:
+    """The message entity before __slots__, with its BaseEntity inlined."""
+
+    def __init__(
+        self,
+        id,
+        external_id,
+        external_timestamp,
+        chat_id,
+        text,
+        sent_by_user_id=None,
+        read=False,
+        created_at=None,
+        updated_at=None,
+    ):
+        self.created_at = created_at or get_now()
+        self.updated_at = updated_at
+        self.id = id
+        self.external_id = external_id
+        self.external_timestamp = external_timestamp
+        self.chat_id = chat_id
+        self.text = text
+        self.sent_by_user_id = sent_by_user_id
+        self.read = read
+
+
+def keyword_mapper(entity_type):
+    """The keyword-argument mapping the repositories used to do."""
+
+    def parse(row):
+        return entity_type(
+            id=row[0],
+            external_id=row[1],
+            external_timestamp=row[2],
+            chat_id=row[3],
+            text=row[4],
+            sent_by_user_id=row[5],
+            read=row[6],
+            created_at=row[7],
+            updated_at=row[8],
+        )
+
+    return parse
+
+
+def make_rows(count: int) -> list[tuple]:
+    created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    timestamps = [created_at + timedelta(seconds=second) for second in range(3600)]
+    return [
+        (
+            f"message-{index}",
+            f"wamid.{index}",
+            timestamps[index % 3600],
+            "chat-1",
+            "Hello",
+            None,
+            False,
+            timestamps[index % 3600],
+            None,
+        )
+        for index in range(count)
+    ]
+
+
+def measure(parse, rows: list[tuple]) -> tuple[float, float]:
+    """Bytes held per entity, and rows mapped per second."""
+    gc.collect()
+    tracemalloc.start()
+    entities = [parse(row) for row in rows]
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    gc.collect()
+
+    start = time.perf_counter()
+    entities = [parse(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    del entities
+    return held / len(rows), len(rows) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.messages)
+    paths = {
+        "dict   (before)": keyword_mapper(DictMessage),
+        "slots": keyword_mapper(Message),
+        "mapper (after)": PostgresMessageRepository._parse_row,
+    }
+
+    print(f"{args.messages} messages")
+    print(f"{'path':<16} {'bytes/entity':>12} {'rows/s':>12}")
+    for name, parse in paths.items():
+        bytes_per_entity, rows_per_second = measure(parse, rows)
+        print(f"{name:<16} {bytes_per_entity:>12.0f} {rows_per_second:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Script to recompute the unread counters and last-message pointers of chats.
+Run it once after migration 006 to backfill them, and whenever they drift.
+
+Usage:
+    python run_repair_chat_activity.py
+    python run_repair_chat_activity.py --batch-size 1000
+"""
+
+import argparse
+import os
+
+from src.infrastructure.daos.postgres_chat_dao import PostgresChatDAO
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
+from src.infrastructure.database.repair_chat_activity import (
+    DEFAULT_REPAIR_BATCH_SIZE,
+    repair_chat_activity,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_REPAIR_BATCH_SIZE)
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("Erro: DATABASE_URL environment variable is required")
+        print("Configure DATABASE_URL no arquivo .env")
+        exit(1)
+
+    # Convert SQLAlchemy format to psycopg2 format if needed
+    if database_url.startswith("postgresql+asyncpg://"):
+        database_url = database_url.replace("postgresql+asyncpg://", "postgresql://")
+
+    pool = PostgresConnectionPool(database_url, min_size=0, max_size=1)
+    try:
+        repaired = repair_chat_activity(
+            PostgresChatDAO(pool), batch_size=args.batch_size
+        )
+    finally:
+        pool.close()
+
+    print(f"✓ Repaired {repaired} chat(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark rendering a list response of chats.
+
+Compares the per-controller dicts with ``isoformat`` calls rendered by
+``JSONResponse`` (before) against ``serialize_chat`` rendered by
+``FastJSONResponse`` (after), on the same in-memory chats.
+
+Usage:
+    python run_serialization_benchmark.py
+    python run_serialization_benchmark.py --chats 10000 --repeat 20
+"""
+
+import argparse
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+
+from fastapi.responses import JSONResponse
+
+from src.application.dtos.serializers import serialize_chat
+from src.domain.entities.chat import Chat
+from src.helpers.helpers import generate_uuid4
+from src.web.framework.responses import FastJSONResponse
+
+
+def format_chat(chat: Chat) -> dict:
+    """The hand-written dict the chat controllers used to build."""
+    return {
+        "id": chat.id,
+        "company_id": chat.company_id,
+        "contact_id": chat.contact_id,
+        "status": chat.status.value,
+        "attached_user_id": chat.attached_user_id,
+        "created_at": chat.created_at.isoformat(),
+        "updated_at": chat.updated_at.isoformat() if chat.updated_at else None,
+    }
+
+
+def before(chats: list[Chat]) -> bytes:
+    return JSONResponse(content={"results": [format_chat(chat) for chat in chats]}).body
+
+
+def after(chats: list[Chat]) -> bytes:
+    return FastJSONResponse(
+        content={"results": [serialize_chat(chat) for chat in chats]}
+    ).body
+
+
+def measure(render, chats: list[Chat], repeat: int) -> float:
+    """Median milliseconds to render the whole list."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        render(chats)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--chats", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    company_id = generate_uuid4()
+    created_at = datetime(2025, 1, 1, tzinfo=UTC)
+    chats = [
+        Chat(
+            id=generate_uuid4(),
+            company_id=company_id,
+            contact_id=generate_uuid4(),
+            created_at=created_at + timedelta(seconds=index),
+            updated_at=created_at + timedelta(seconds=index, minutes=5),
+        )
+        for index in range(args.chats)
+    ]
+
+    before_ms = measure(before, chats, args.repeat)
+    after_ms = measure(after, chats, args.repeat)
+    print(f"{args.chats} chats, median of {args.repeat} runs")
+    print(f"before (dicts + JSONResponse):              {before_ms:8.1f} ms")
+    print(f"after  (serialize_chat + FastJSONResponse): {after_ms:8.1f} ms")
+    print(f"speedup: {before_ms / after_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from typing import Any
+
+from src.application.caching import CacheStats, TTLCache
+from src.domain.entities.contact import Contact
+
+
+@dataclass(frozen=True)
+class BusinessNumber:
+    """A WhatsApp business number and the company that owns it."""
+
+    phone_number: str
+    company_id: str
+    contact_id: str
+
+    @classmethod
+    def of(cls, contact: Contact) -> "BusinessNumber | None":
+        if contact.company_id is None:
+            return None
+        return cls(
+            phone_number=contact.phone_number,
+            company_id=contact.company_id,
+            contact_id=contact.id,
+        )
+
+
+class BusinessNumberDirectory:
+    """
+    Remember which company owns each receiving phone number.
+
+    Webhooks name the receiver by phone number only, and the owning company
+    almost never changes, so resolutions (including "no such number") are
+    cached for the TTL. Writes to contacts and companies invalidate the
+    affected entries; the TTL bounds staleness from writes made elsewhere.
+    """
+
+    def __init__(self, cache: TTLCache):
+        self._cache = cache
+
+    def get(self, phone_number: str) -> Any:
+        """The cached resolution, or ``MISSING`` when it must be looked up."""
+        return self._cache.get(phone_number)
+
+    def remember(
+        self, phone_number: str, business_number: BusinessNumber | None
+    ) -> None:
+        self._cache.set(phone_number, business_number)
+
+    def forget_phone_number(self, phone_number: str) -> None:
+        self._cache.invalidate(phone_number)
+
+    def forget_contact(self, contact_id: str) -> None:
+        self._cache.invalidate_where(
+            lambda _, number: number is not None and number.contact_id == contact_id
+        )
+
+    def forget_company(self, company_id: str) -> None:
+        self._cache.invalidate_where(
+            lambda _, number: number is not None and number.company_id == company_id
+        )
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
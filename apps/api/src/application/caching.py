@@ -0,0 +1,90 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    size: int
+    capacity: int
+    hits: int
+    misses: int
+
+
+class TTLCache:
+    """
+    Bounded LRU whose entries expire ``ttl_seconds`` after they are set.
+
+    ``get`` returns ``MISSING`` for absent or expired keys, so ``None`` can
+    be cached like any other value. Shared between the event loop and the
+    thread pools, hence the lock.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl_seconds <= 0 or capacity < 1:
+            raise ValueError(f"Invalid cache size: {capacity} entries, {ttl_seconds}s")
+        self.ttl_seconds = ttl_seconds
+        self.capacity = capacity
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                self._entries.pop(key, None)
+                self.misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable, Any], bool]) -> None:
+        """Drop every entry for which ``predicate(key, value)`` holds."""
+        with self._lock:
+            for key in [
+                key
+                for key, (_, value) in self._entries.items()
+                if predicate(key, value)
+            ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                size=len(self._entries),
+                capacity=self.capacity,
+                hits=self.hits,
+                misses=self.misses,
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
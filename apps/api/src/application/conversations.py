@@ -0,0 +1,53 @@
+from dataclasses import dataclass
+
+from src.application.caching import MISSING, CacheStats, TTLCache
+
+
+@dataclass(frozen=True)
+class Conversation:
+    """The contact and chat a sender's messages go to within a company."""
+
+    contact_id: str
+    chat_id: str
+
+
+class ConversationDirectory:
+    """
+    Write-through cache of (company id, sender phone number) -> conversation.
+
+    A sender keeps the same contact and chat for the life of the
+    conversation, so ingestion only needs to look them up (or create them)
+    once. Entries are written after the transaction that read or created
+    them commits, and dropped when the chat or contact is deleted.
+    """
+
+    def __init__(self, cache: TTLCache):
+        self._cache = cache
+
+    def get(self, company_id: str, phone_number: str) -> Conversation | None:
+        conversation = self._cache.get((company_id, phone_number))
+        return None if conversation is MISSING else conversation
+
+    def remember(
+        self, company_id: str, phone_number: str, conversation: Conversation
+    ) -> None:
+        self._cache.set((company_id, phone_number), conversation)
+
+    def forget(self, company_id: str, phone_number: str) -> None:
+        self._cache.invalidate((company_id, phone_number))
+
+    def forget_chat(self, chat_id: str) -> None:
+        self._cache.invalidate_where(
+            lambda _, conversation: conversation.chat_id == chat_id
+        )
+
+    def forget_contact(self, contact_id: str) -> None:
+        self._cache.invalidate_where(
+            lambda _, conversation: conversation.contact_id == contact_id
+        )
+
+    def forget_company(self, company_id: str) -> None:
+        self._cache.invalidate_where(lambda key, _: key[0] == company_id)
+
+    def stats(self) -> CacheStats:
+        return self._cache.stats()
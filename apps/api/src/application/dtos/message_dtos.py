@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+
+@dataclass(frozen=True)
+class IncomingMessage:
+    """One contact message lifted out of a webhook payload."""
+
+    sender_phone_number: str
+    sender_name: str
+    external_id: str
+    timestamp: datetime
+    receiver_phone_number: str
+    text: str
+
+    def to_dict(self) -> dict:
+        """JSON-safe form, as stored in the ingestion queue."""
+        return {
+            "sender_phone_number": self.sender_phone_number,
+            "sender_name": self.sender_name,
+            "external_id": self.external_id,
+            "timestamp": self.timestamp.isoformat(),
+            "receiver_phone_number": self.receiver_phone_number,
+            "text": self.text,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IncomingMessage":
+        return cls(**{**data, "timestamp": datetime.fromisoformat(data["timestamp"])})
+
+
+class ReceiveStatus(StrEnum):
+    CREATED = "created"
+    DUPLICATE = "duplicate"
+    RECEIVER_NOT_FOUND = "receiver_not_found"
+
+
+@dataclass(frozen=True)
+class ReceivedMessageResult:
+    external_id: str
+    status: ReceiveStatus
+    message_id: str | None = None
@@ -0,0 +1,119 @@
+from collections.abc import Callable
+from operator import attrgetter
+from typing import Any
+
+from src.domain.inbox import InboxChat
+
+
+def compile_serializer(
+    fields: tuple[str, ...], enum_fields: tuple[str, ...] = ()
+) -> Callable[[Any], dict]:
+    """
+    Build the function turning an entity into its response dict.
+
+    All fields are read with one ``attrgetter`` call. Enums are replaced by
+    their value; datetimes are left as they are for the response class to
+    encode.
+    """
+    get = attrgetter(*fields)
+
+    if not enum_fields:
+        return lambda entity: dict(zip(fields, get(entity), strict=True))
+
+    def serialize(entity) -> dict:
+        data = dict(zip(fields, get(entity), strict=True))
+        for field in enum_fields:
+            data[field] = data[field].value
+        return data
+
+    return serialize
+
+
+serialize_company = compile_serializer(
+    (
+        "id",
+        "name",
+        "email",
+        "phone",
+        "is_active",
+        "attendant_sees_all_conversations",
+        "whatsapp_api_key",
+        "created_at",
+        "updated_at",
+    )
+)
+
+serialize_user = compile_serializer(
+    (
+        "id",
+        "name",
+        "email",
+        "company_id",
+        "type",
+        "is_active",
+        "created_at",
+        "updated_at",
+    ),
+    enum_fields=("type",),
+)
+
+serialize_contact = compile_serializer(
+    (
+        "id",
+        "name",
+        "phone_number",
+        "email",
+        "company_id",
+        "is_blocked",
+        "tags",
+        "notes",
+        "last_contact_at",
+        "created_at",
+        "updated_at",
+    )
+)
+
+serialize_chat = compile_serializer(
+    (
+        "id",
+        "company_id",
+        "contact_id",
+        "status",
+        "attached_user_id",
+        "created_at",
+        "updated_at",
+    ),
+    enum_fields=("status",),
+)
+
+_serialize_inbox_fields = compile_serializer(
+    (
+        "contact_name",
+        "contact_phone_number",
+        "last_message_text",
+        "last_message_at",
+        "unread_count",
+    )
+)
+
+
+def serialize_inbox_chat(inbox_chat: InboxChat) -> dict:
+    """The chat's own fields, followed by what the inbox shows next to it."""
+    data = serialize_chat(inbox_chat.chat)
+    data.update(_serialize_inbox_fields(inbox_chat))
+    return data
+
+
+serialize_message = compile_serializer(
+    (
+        "id",
+        "external_id",
+        "external_timestamp",
+        "chat_id",
+        "text",
+        "sent_by_user_id",
+        "read",
+        "created_at",
+        "updated_at",
+    )
+)
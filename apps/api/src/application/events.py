@@ -0,0 +1,278 @@
+import asyncio
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any
+
+import orjson
+
+from src.domain.entities.chat import Chat
+from src.domain.errors import ChatNotFoundError
+from src.domain.repositories.chat_repository import IAsyncChatRepository
+
+# Events a subscriber may fall behind by before it is disconnected
+DEFAULT_MAX_PENDING = 100
+
+
+class EventTypes(Enum):
+    MESSAGE_CREATED = "message.created"
+    CHAT_ASSIGNED = "chat.assigned"
+    CHAT_READ = "chat.read"
+
+
+@dataclass(frozen=True, slots=True)
+class Event:
+    """
+    Something that happened to a chat, pushed to its company's subscribers.
+
+    ``attendant_ids`` are the attendants the chat concerns: its attendant,
+    plus the previous one when it is reassigned. An empty set means the chat
+    is unassigned and any attendant of the company may pick it up.
+    """
+
+    type: EventTypes
+    company_id: str
+    chat_id: str
+    attendant_ids: frozenset[str] = field(default_factory=frozenset)
+    data: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def for_chat(
+        cls,
+        event_type: EventTypes,
+        chat: Chat,
+        data: dict[str, Any],
+        previous_attendant_id: str | None = None,
+    ) -> "Event":
+        attendant_ids = {chat.attached_user_id, previous_attendant_id} - {None}
+        return cls(
+            type=event_type,
+            company_id=chat.company_id,
+            chat_id=chat.id,
+            attendant_ids=frozenset(attendant_ids),
+            data=data,
+        )
+
+    def encode(self) -> str:
+        return orjson.dumps(
+            {"type": self.type.value, "chat_id": self.chat_id, "data": self.data}
+        ).decode()
+
+
+class IEventBus(ABC):
+    """Carries events from the worker that produced them to every subscriber."""
+
+    @abstractmethod
+    async def publish(self, event: Event) -> None: ...
+
+
+def coalesce(events: list[Event]) -> list[Event]:
+    """
+    Collapse a burst of events before it is dispatched.
+
+    Exact repeats are dropped, and of several assignments of the same chat
+    to the same attendants only the latest is kept, since it supersedes the
+    others. Messages and reads are all kept, in order.
+    """
+    latest_assignment: dict[tuple[str, frozenset[str]], int] = {}
+    for index, event in enumerate(events):
+        if event.type == EventTypes.CHAT_ASSIGNED:
+            latest_assignment[(event.chat_id, event.attendant_ids)] = index
+
+    seen: set[str] = set()
+    coalesced = []
+    for index, event in enumerate(events):
+        key = (event.chat_id, event.attendant_ids)
+        if event.type == EventTypes.CHAT_ASSIGNED and latest_assignment[key] != index:
+            continue
+        encoded = event.encode()
+        if encoded in seen:
+            continue
+        seen.add(encoded)
+        coalesced.append(event)
+    return coalesced
+
+
+@dataclass(frozen=True)
+class EventHubStats:
+    subscribers: int
+    published: int
+    delivered: int
+    # Subscriptions closed because they fell ``max_pending`` events behind
+    overflowed: int
+
+
+class Subscription:
+    """
+    One connected client's feed of its company's events.
+
+    ``attendant_id`` narrows the feed to the chats that attendant could pick
+    up or is assigned to; without it the client sees the whole company.
+    Events are queued already encoded. A client that lets ``max_pending`` of
+    them pile up is closed rather than buffered without bound: it reconnects
+    and refetches its lists.
+    """
+
+    __slots__ = (
+        "company_id",
+        "attendant_id",
+        "_hub",
+        "_queue",
+        "_max_pending",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        hub: "EventHub",
+        company_id: str,
+        attendant_id: str | None,
+        max_pending: int,
+    ):
+        self.company_id = company_id
+        self.attendant_id = attendant_id
+        self._hub = hub
+        # One spare slot so the close marker always fits
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=max_pending + 1)
+        self._max_pending = max_pending
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def offer(self, payload: str) -> bool:
+        """Queue an encoded event, closing the subscription if it is full."""
+        if self._closed:
+            return False
+        if self._queue.qsize() >= self._max_pending:
+            self.close()
+            return False
+        self._queue.put_nowait(payload)
+        return True
+
+    async def get(self) -> str | None:
+        """The next encoded event, or None once the subscription is closed."""
+        if self._closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._hub._remove(self)
+        # Wakes a pending get() once the queued events are read
+        self._queue.put_nowait(None)
+
+
+class EventHub(IEventBus):
+    """
+    Fans events out to the clients subscribed in this process.
+
+    Subscriptions are indexed by company and attendant, so an event only
+    visits the subscribers it is for and is encoded once however many there
+    are. Delivery never waits on a client: events go into each subscriber's
+    bounded queue. Lives on the event loop; it is not thread-safe.
+
+    Publishing to the hub directly makes it the event bus of a single
+    process; a cross-worker bus dispatches to it instead.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING):
+        self._max_pending = max_pending
+        # company id -> attendant id (None: the whole company) -> subscriptions
+        self._subscriptions: dict[str, dict[str | None, set[Subscription]]] = {}
+        self._count = 0
+        self._published = 0
+        self._delivered = 0
+        self._overflowed = 0
+
+    def subscribe(
+        self, company_id: str, attendant_id: str | None = None
+    ) -> Subscription:
+        subscription = Subscription(
+            self, company_id, attendant_id, max_pending=self._max_pending
+        )
+        attendants = self._subscriptions.setdefault(company_id, {})
+        attendants.setdefault(attendant_id, set()).add(subscription)
+        self._count += 1
+        return subscription
+
+    def _remove(self, subscription: Subscription) -> None:
+        attendants = self._subscriptions.get(subscription.company_id, {})
+        subscriptions = attendants.get(subscription.attendant_id, set())
+        if subscription not in subscriptions:
+            return
+        subscriptions.discard(subscription)
+        self._count -= 1
+        if not subscriptions:
+            del attendants[subscription.attendant_id]
+            if not attendants:
+                del self._subscriptions[subscription.company_id]
+
+    def close_all(self) -> None:
+        """Close every subscription, e.g. after events may have been missed."""
+        for attendants in list(self._subscriptions.values()):
+            for subscriptions in list(attendants.values()):
+                for subscription in list(subscriptions):
+                    subscription.close()
+
+    def _audience(self, event: Event) -> list[Subscription]:
+        attendants = self._subscriptions.get(event.company_id)
+        if not attendants:
+            return []
+        if not event.attendant_ids:
+            return [
+                subscription
+                for subscriptions in attendants.values()
+                for subscription in subscriptions
+            ]
+        return [
+            subscription
+            for attendant_id in (None, *event.attendant_ids)
+            for subscription in attendants.get(attendant_id, ())
+        ]
+
+    def dispatch(self, event: Event) -> int:
+        """Queue ``event`` for its subscribers; returns how many got it."""
+        self._published += 1
+        audience = self._audience(event)
+        if not audience:
+            return 0
+
+        payload = event.encode()
+        delivered = 0
+        for subscription in audience:
+            if subscription.offer(payload):
+                delivered += 1
+            else:
+                self._overflowed += 1
+        self._delivered += delivered
+        return delivered
+
+    async def publish(self, event: Event) -> None:
+        self.dispatch(event)
+
+    def stats(self) -> EventHubStats:
+        return EventHubStats(
+            subscribers=self._count,
+            published=self._published,
+            delivered=self._delivered,
+            overflowed=self._overflowed,
+        )
+
+
+async def publish_chat_event(
+    events: IEventBus,
+    chat_repository: IAsyncChatRepository,
+    event_type: EventTypes,
+    chat_id: str,
+    data: dict[str, Any],
+) -> None:
+    """Publish an event about ``chat_id``, looking up who it is for."""
+    try:
+        chat = await chat_repository.get_by_id(chat_id=chat_id)
+    except ChatNotFoundError:
+        return
+    await events.publish(Event.for_chat(event_type, chat, data))
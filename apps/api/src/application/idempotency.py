@@ -0,0 +1,103 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    ``might_contain`` never misses an added key but can report one that was
+    never added, at a rate set by ``bits`` and ``hashes``.
+    """
+
+    def __init__(self, bits: int, hashes: int = 4):
+        if bits < 8 or hashes < 1:
+            raise ValueError(f"Invalid Bloom filter size: {bits} bits, {hashes} hashes")
+        self.bits = bits
+        self.hashes = hashes
+        self._array = bytearray((bits + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        # Double hashing: position_i = h1 + i * h2
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self.bits for index in range(self.hashes)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._array[position >> 3] |= 1 << (position & 7)
+
+    def might_contain(self, key: str) -> bool:
+        return all(
+            self._array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+@dataclass(frozen=True)
+class IdempotencyStats:
+    size: int
+    capacity: int
+    hits: int
+    misses: int
+
+
+class IdempotencyFilter:
+    """
+    Remember the external ids of recently received messages.
+
+    Redeliveries of a message seen by this process are answered from a
+    bounded LRU without touching the database. Anything else goes to the
+    database, whose ``ON CONFLICT (external_id) DO NOTHING`` stays the
+    authority; the filter is only a fast path and may forget.
+
+    With ``bloom_bits`` a Bloom filter sits in front of the LRU: a key it
+    has never seen is known to be new without an LRU lookup.
+
+    Not thread-safe; it is only used from the event loop.
+    """
+
+    def __init__(self, capacity: int, bloom_bits: int = 0):
+        if capacity < 1:
+            raise ValueError(f"Invalid idempotency cache capacity: {capacity}")
+        self.capacity = capacity
+        self._recent: OrderedDict[str, str | None] = OrderedDict()
+        self._bloom = BloomFilter(bloom_bits) if bloom_bits else None
+        self.hits = 0
+        self.misses = 0
+
+    def seen(self, external_id: str) -> bool:
+        if self._bloom is not None and not self._bloom.might_contain(external_id):
+            self.misses += 1
+            return False
+        if external_id in self._recent:
+            self._recent.move_to_end(external_id)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def message_id(self, external_id: str) -> str | None:
+        """Id of the stored message, when this process is the one that stored it."""
+        return self._recent.get(external_id)
+
+    def add(self, external_id: str, message_id: str | None = None) -> None:
+        if self._bloom is not None:
+            self._bloom.add(external_id)
+        self._recent[external_id] = message_id or self._recent.get(external_id)
+        self._recent.move_to_end(external_id)
+        if len(self._recent) > self.capacity:
+            self._recent.popitem(last=False)
+
+    def stats(self) -> IdempotencyStats:
+        return IdempotencyStats(
+            size=len(self._recent),
+            capacity=self.capacity,
+            hits=self.hits,
+            misses=self.misses,
+        )
+
+    def __len__(self) -> int:
+        return len(self._recent)
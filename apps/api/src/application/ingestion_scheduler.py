@@ -0,0 +1,126 @@
+import asyncio
+import zlib
+from dataclasses import dataclass
+
+from src.application.dtos.message_dtos import IncomingMessage, ReceivedMessageResult
+from src.application.use_cases.message_use_cases import ReceiveMessageUseCase
+
+
+@dataclass(frozen=True)
+class ShardStats:
+    shard: int
+    # Messages handed to the shard and not picked up yet
+    backlog: int
+    busy: bool
+    processed: int
+    failed_batches: int
+
+
+class ShardedIngestionScheduler:
+    """
+    Receive messages in parallel across chats but in order within a chat.
+
+    Every message goes to the shard picked by hashing its (receiver phone,
+    sender phone) pair, i.e. its chat. Each shard has one task working
+    through a FIFO queue, so two messages of the same chat never run at the
+    same time or out of order, while different shards run concurrently.
+    That also keeps two batches from racing to create the same contact or
+    chat.
+    """
+
+    def __init__(self, shards: int):
+        if shards < 1:
+            raise ValueError(f"Invalid ingestion shard count: {shards}")
+        self.shards = shards
+        self._queues: list[asyncio.Queue] = [asyncio.Queue() for _ in range(shards)]
+        self._tasks: list[asyncio.Task] = []
+        self._backlog = [0] * shards
+        self._busy = [False] * shards
+        self._processed = [0] * shards
+        self._failed_batches = [0] * shards
+
+    def shard_of(self, message: IncomingMessage) -> int:
+        # crc32 rather than hash(): stable across processes and restarts
+        key = f"{message.receiver_phone_number}:{message.sender_phone_number}"
+        return zlib.crc32(key.encode()) % self.shards
+
+    def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._run(shard), name=f"ingestion-shard-{shard}")
+            for shard in range(self.shards)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def execute_batch(
+        self,
+        use_case: ReceiveMessageUseCase,
+        messages: list[IncomingMessage],
+    ) -> list[ReceivedMessageResult]:
+        """
+        Split ``messages`` by shard, receive each part on its shard and return
+        the results in the original order.
+
+        All parts are queued before anything is awaited, so batches handed
+        over one after the other keep their order on every shard. Raises the
+        first shard's error once every part has finished.
+        """
+        positions: dict[int, list[int]] = {}
+        for position, message in enumerate(messages):
+            positions.setdefault(self.shard_of(message), []).append(position)
+
+        loop = asyncio.get_running_loop()
+        futures = {}
+        for shard, shard_positions in positions.items():
+            future = loop.create_future()
+            part = [messages[position] for position in shard_positions]
+            self._queues[shard].put_nowait((use_case, part, future))
+            self._backlog[shard] += len(part)
+            futures[shard] = future
+
+        outcomes = await asyncio.gather(*futures.values(), return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+        results: list[ReceivedMessageResult | None] = [None] * len(messages)
+        for shard, outcome in zip(futures, outcomes, strict=True):
+            for position, result in zip(positions[shard], outcome, strict=True):
+                results[position] = result
+        return results
+
+    def stats(self) -> list[ShardStats]:
+        return [
+            ShardStats(
+                shard=shard,
+                backlog=self._backlog[shard],
+                busy=self._busy[shard],
+                processed=self._processed[shard],
+                failed_batches=self._failed_batches[shard],
+            )
+            for shard in range(self.shards)
+        ]
+
+    async def _run(self, shard: int) -> None:
+        queue = self._queues[shard]
+        while True:
+            use_case, messages, future = await queue.get()
+            self._backlog[shard] -= len(messages)
+            self._busy[shard] = True
+            try:
+                results = await use_case.execute_batch(messages)
+            except Exception as error:
+                self._failed_batches[shard] += 1
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                self._processed[shard] += len(messages)
+                if not future.done():
+                    future.set_result(results)
+            finally:
+                self._busy[shard] = False
+                queue.task_done()
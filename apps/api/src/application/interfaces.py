@@ -1,47 +1,93 @@
 from abc import ABC, abstractmethod
 
-from src.domain.repositories.chat_repository import IChatRepository
+from src.application.business_numbers import BusinessNumberDirectory
+from src.application.caching import TTLCache
+from src.application.conversations import ConversationDirectory
+from src.application.events import IEventBus
+from src.domain.repositories.chat_repository import IAsyncChatRepository
 from src.domain.repositories.company_repository import ICompanyRepository
 from src.domain.repositories.contact_repository import IContactRepository
-from src.domain.repositories.message_repository import IMessageRepository
+from src.domain.repositories.ingestion_queue_repository import (
+    IAsyncIngestionQueueRepository,
+)
+from src.domain.repositories.message_repository import IAsyncMessageRepository
 from src.domain.repositories.user_repository import IUserRepository
 
 
 class IUserUseCase(ABC):
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self, user_repository: IUserRepository, user_cache: TTLCache | None = None
+    ):
         self._user_repository = user_repository
+        self._user_cache = user_cache
 
     @abstractmethod
     def execute(self, *args, **kwargs): ...
 
 
 class ICompanyUseCase(ABC):
-    def __init__(self, company_repository: ICompanyRepository):
+    def __init__(
+        self,
+        company_repository: ICompanyRepository,
+        business_numbers: BusinessNumberDirectory | None = None,
+        conversations: ConversationDirectory | None = None,
+    ):
         self._company_repository = company_repository
+        self._business_numbers = business_numbers
+        self._conversations = conversations
 
     @abstractmethod
     def execute(self, *args, **kwargs): ...
 
 
 class IMessageUseCase(ABC):
-    def __init__(self, message_repository: IMessageRepository):
+    def __init__(
+        self,
+        message_repository: IAsyncMessageRepository,
+        chat_repository: IAsyncChatRepository | None = None,
+        events: IEventBus | None = None,
+    ):
         self._message_repository = message_repository
+        self._chat_repository = chat_repository
+        self._events = events
 
     @abstractmethod
-    def execute(self, *args, **kwargs): ...
+    async def execute(self, *args, **kwargs): ...
 
 
 class IContactUseCase(ABC):
-    def __init__(self, contact_repository: IContactRepository):
+    def __init__(
+        self,
+        contact_repository: IContactRepository,
+        business_numbers: BusinessNumberDirectory | None = None,
+        conversations: ConversationDirectory | None = None,
+    ):
         self._contact_repository = contact_repository
+        self._business_numbers = business_numbers
+        self._conversations = conversations
 
     @abstractmethod
     def execute(self, *args, **kwargs): ...
 
 
 class IChatUseCase(ABC):
-    def __init__(self, chat_repository: IChatRepository):
+    def __init__(
+        self,
+        chat_repository: IAsyncChatRepository,
+        conversations: ConversationDirectory | None = None,
+        events: IEventBus | None = None,
+    ):
         self._chat_repository = chat_repository
+        self._conversations = conversations
+        self._events = events
 
     @abstractmethod
-    def execute(self, *args, **kwargs): ...
+    async def execute(self, *args, **kwargs): ...
+
+
+class IIngestionUseCase(ABC):
+    def __init__(self, ingestion_queue_repository: IAsyncIngestionQueueRepository):
+        self._ingestion_queue_repository = ingestion_queue_repository
+
+    @abstractmethod
+    async def execute(self, *args, **kwargs): ...
@@ -1,11 +1,14 @@
 from dataclasses import dataclass
 
+from src.application.caching import TTLCache
 from src.domain.entities.user import User
 from src.domain.errors import UserNotFoundError
 from src.domain.repositories.user_repository import IUserRepository
 from src.infrastructure.security.jwt_service import JWTService
 from src.infrastructure.security.password_service import (
+    DEFAULT_BCRYPT_ROUNDS,
     hash_password,
+    password_needs_rehash,
     validate_password,
     verify_password,
 )
@@ -22,10 +25,14 @@ class LoginUseCase:
     """Authenticate user with email and password."""
 
     def __init__(
-        self, user_repository: IUserRepository, jwt_service: JWTService
+        self,
+        user_repository: IUserRepository,
+        jwt_service: JWTService,
+        bcrypt_rounds: int = DEFAULT_BCRYPT_ROUNDS,
     ) -> None:
         self.user_repository = user_repository
         self.jwt_service = jwt_service
+        self.bcrypt_rounds = bcrypt_rounds
 
     def execute(self, email: str, password: str) -> LoginResult:
         """
@@ -49,6 +56,14 @@ class LoginUseCase:
         if not user.is_active:
             raise ValueError("User account is inactive")
 
+        # The plain password is only known here, so a cost change is applied
+        # to each user's hash on their next login
+        if password_needs_rehash(user.password_hash, self.bcrypt_rounds):
+            self.user_repository.update_password(
+                user_id=user.id,
+                password_hash=hash_password(password, rounds=self.bcrypt_rounds),
+            )
+
         access_token = self.jwt_service.create_access_token(user_id=user.id)
         refresh_token = self.jwt_service.create_refresh_token(user_id=user.id)
 
@@ -89,8 +104,15 @@ class RefreshTokenUseCase:
 class SetPasswordUseCase:
     """Set or update user password."""
 
-    def __init__(self, user_repository: IUserRepository) -> None:
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        user_cache: TTLCache | None = None,
+        bcrypt_rounds: int = DEFAULT_BCRYPT_ROUNDS,
+    ) -> None:
         self.user_repository = user_repository
+        self.user_cache = user_cache
+        self.bcrypt_rounds = bcrypt_rounds
 
     def execute(self, user_id: str, password: str) -> User:
         """
@@ -106,12 +128,14 @@ class SetPasswordUseCase:
         if validation_errors:
             raise ValueError("; ".join(validation_errors))
 
-        password_hash = hash_password(password)
+        password_hash = hash_password(password, rounds=self.bcrypt_rounds)
 
         # Update only the password, not other user fields
         self.user_repository.update_password(
             user_id=user.id, password_hash=password_hash
         )
+        if self.user_cache is not None:
+            self.user_cache.invalidate(user.id)
 
         # Return the user (password_hash won't be included since get_by_id doesn't return it)
         return self.user_repository.get_by_id(user_id=user.id)
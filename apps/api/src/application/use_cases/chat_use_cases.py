@@ -1,52 +1,148 @@
+from collections.abc import AsyncIterator
+
+from src.application.dtos.serializers import serialize_chat
+from src.application.events import Event, EventTypes
 from src.application.interfaces import IChatUseCase
 from src.domain.entities.chat import Chat
+from src.domain.enums import InboxFilters
+from src.domain.inbox import InboxChat
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from src.helpers.helpers import get_now
 
 
 class GetChatUseCase(IChatUseCase):
-    def execute(self, chat_id: str) -> Chat:
-        return self._chat_repository.get_by_id(chat_id=chat_id)
+    async def execute(self, chat_id: str) -> Chat:
+        return await self._chat_repository.get_by_id(chat_id=chat_id)
+
+
+class DeleteChatUseCase(IChatUseCase):
+    async def execute(self, chat_id: str) -> None:
+        await self._chat_repository.delete(chat_id)
+        if self._conversations is not None:
+            self._conversations.forget_chat(chat_id)
 
 
 class ListChatsByCompanyUseCase(IChatUseCase):
-    def execute(self, company_id: str) -> list[Chat]:
-        return self._chat_repository.get_by_company_id(company_id=company_id)
+    async def execute(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return await self._chat_repository.get_by_company_id(
+            company_id=company_id, limit=limit, cursor=cursor
+        )
+
+
+class StreamChatsByCompanyUseCase(IChatUseCase):
+    def execute(self, company_id: str) -> AsyncIterator[Chat]:
+        # Every chat, newest first, fetched as the caller consumes them
+        return self._chat_repository.iter_by_company_id(company_id=company_id)
 
 
 class GetUnassignedChatsUseCase(IChatUseCase):
-    def execute(self, company_id: str) -> list[Chat]:
-        return self._chat_repository.get_unassigned_by_company_id(company_id=company_id)
+    async def execute(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return await self._chat_repository.get_unassigned_by_company_id(
+            company_id=company_id, limit=limit, cursor=cursor
+        )
 
 
 class GetPendingChatsUseCase(IChatUseCase):
-    def execute(self, company_id: str) -> list[Chat]:
-        return self._chat_repository.get_pending_by_company_id(company_id=company_id)
+    async def execute(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return await self._chat_repository.get_pending_by_company_id(
+            company_id=company_id, limit=limit, cursor=cursor
+        )
 
 
 class GetResolvedChatsUseCase(IChatUseCase):
-    def execute(self, company_id: str) -> list[Chat]:
-        return self._chat_repository.get_resolved_by_company_id(company_id=company_id)
+    async def execute(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return await self._chat_repository.get_resolved_by_company_id(
+            company_id=company_id, limit=limit, cursor=cursor
+        )
 
 
 class GetChatsByAttendantUseCase(IChatUseCase):
-    def execute(self, company_id: str, attendant_id: str) -> list[Chat]:
-        return self._chat_repository.get_by_attendant_id(
-            company_id=company_id, attendant_id=attendant_id
+    async def execute(
+        self,
+        company_id: str,
+        attendant_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return await self._chat_repository.get_by_attendant_id(
+            company_id=company_id,
+            attendant_id=attendant_id,
+            limit=limit,
+            cursor=cursor,
         )
 
 
 class SearchChatsUseCase(IChatUseCase):
-    def execute(
-        self, company_id: str, query: str, user_id: str | None = None
-    ) -> list[Chat]:
-        return self._chat_repository.search_chats(
-            company_id=company_id, query=query, user_id=user_id
+    async def execute(
+        self,
+        company_id: str,
+        query: str,
+        user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return await self._chat_repository.search_chats(
+            company_id=company_id,
+            query=query,
+            user_id=user_id,
+            limit=limit,
+            cursor=cursor,
+        )
+
+
+class GetInboxUseCase(IChatUseCase):
+    async def execute(
+        self,
+        company_id: str,
+        inbox_filter: InboxFilters = InboxFilters.ALL,
+        attendant_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[InboxChat]:
+        return await self._chat_repository.get_inbox(
+            company_id=company_id,
+            inbox_filter=inbox_filter,
+            attendant_id=attendant_id,
+            limit=limit,
+            cursor=cursor,
         )
 
 
 class AssignAttendantToChatUseCase(IChatUseCase):
-    def execute(self, chat_id: str, attendant_id: str | None) -> Chat:
-        chat = self._chat_repository.get_by_id(chat_id=chat_id)
+    async def execute(self, chat_id: str, attendant_id: str | None) -> Chat:
+        chat = await self._chat_repository.get_by_id(chat_id=chat_id)
+        previous_attendant_id = chat.attached_user_id
         chat.attached_user_id = attendant_id
         chat.updated_at = get_now()
-        return self._chat_repository.save(chat)
+        chat = await self._chat_repository.save(chat)
+        if self._events is not None:
+            # The previous attendant hears about it too, to drop the chat
+            await self._events.publish(
+                Event.for_chat(
+                    EventTypes.CHAT_ASSIGNED,
+                    chat,
+                    serialize_chat(chat),
+                    previous_attendant_id=previous_attendant_id,
+                )
+            )
+        return chat
@@ -55,6 +55,8 @@ class UpdateCompanyUseCase(ICompanyUseCase):
 
         company.updated_at = get_now()
         self._company_repository.save(company)
+        if self._business_numbers is not None:
+            self._business_numbers.forget_company(company.id)
         return company
 
 
@@ -66,6 +68,10 @@ class GetCompanyUseCase(ICompanyUseCase):
 class DeleteCompanyUseCase(ICompanyUseCase):
     def execute(self, company_id: str) -> None:
         self._company_repository.delete(company_id)
+        if self._business_numbers is not None:
+            self._business_numbers.forget_company(company_id)
+        if self._conversations is not None:
+            self._conversations.forget_company(company_id)
 
 
 class ListCompanyUseCase(ICompanyUseCase):
@@ -3,6 +3,7 @@ from datetime import datetime
 from src.application.interfaces import IContactUseCase
 from src.domain.entities.base import UNSET, UnsetType
 from src.domain.entities.contact import Contact
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from src.helpers.helpers import generate_uuid4, get_now
 
 
@@ -26,6 +27,8 @@ class CreateContactUseCase(IContactUseCase):
             notes=notes,
         )
         self._contact_repository.save(contact)
+        if self._business_numbers is not None:
+            self._business_numbers.forget_phone_number(contact.phone_number)
         return contact
 
 
@@ -75,21 +78,43 @@ class UpdateContactUseCase(IContactUseCase):
 
         contact.updated_at = get_now()
         self._contact_repository.save(contact)
+        if self._business_numbers is not None:
+            self._business_numbers.forget_contact(contact.id)
+            self._business_numbers.forget_phone_number(contact.phone_number)
+        if self._conversations is not None:
+            self._conversations.forget_contact(contact.id)
         return contact
 
 
 class DeleteContactUseCase(IContactUseCase):
     def execute(self, contact_id: str) -> None:
         self._contact_repository.delete(contact_id)
+        if self._business_numbers is not None:
+            self._business_numbers.forget_contact(contact_id)
+        if self._conversations is not None:
+            self._conversations.forget_contact(contact_id)
 
 
 class GetCompanyContactsUseCase(IContactUseCase):
-    def execute(self, company_id: str) -> list[Contact]:
-        return self._contact_repository.get_by_company_id(company_id=company_id)
+    def execute(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
+        return self._contact_repository.get_by_company_id(
+            company_id=company_id, limit=limit, cursor=cursor
+        )
 
 
 class SearchContactsUseCase(IContactUseCase):
-    def execute(self, company_id: str, query: str) -> list[Contact]:
+    def execute(
+        self,
+        company_id: str,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
         return self._contact_repository.search_contacts(
-            company_id=company_id, query=query
+            company_id=company_id, query=query, limit=limit, cursor=cursor
         )
@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+from src.application.dtos.message_dtos import IncomingMessage
+from src.application.ingestion_scheduler import ShardedIngestionScheduler
+from src.application.interfaces import IIngestionUseCase
+from src.application.use_cases.message_use_cases import ReceiveMessageUseCase
+from src.domain.entities.ingestion_job import IngestionJob
+from src.domain.repositories.ingestion_queue_repository import (
+    IAsyncIngestionQueueRepository,
+)
+from src.helpers.helpers import generate_uuid4, get_now
+
+
+class EnqueueMessagesUseCase(IIngestionUseCase):
+    async def execute(self, messages: list[IncomingMessage]) -> IngestionJob:
+        job = IngestionJob(
+            id=generate_uuid4(),
+            payload=[message.to_dict() for message in messages],
+        )
+        return await self._ingestion_queue_repository.enqueue(job)
+
+
+class DrainIngestionQueueUseCase(IIngestionUseCase):
+    """
+    Claim a batch of queued jobs and receive their messages.
+
+    The whole batch goes through ReceiveMessageUseCase.execute_batch at once.
+    If that fails, the jobs are retried one by one so a single bad job does
+    not hold back the others. A failing job is retried with exponential
+    backoff and moved to the dead-letter store after ``max_attempts``.
+    With a ``scheduler`` the messages are received on its per-chat shards.
+    Delivery is at least once; external_id keeps replays idempotent.
+    """
+
+    def __init__(
+        self,
+        ingestion_queue_repository: IAsyncIngestionQueueRepository,
+        receive_message_use_case: ReceiveMessageUseCase,
+        batch_size: int = 100,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 1.0,
+        retry_max_seconds: float = 300.0,
+        scheduler: ShardedIngestionScheduler | None = None,
+    ):
+        super().__init__(ingestion_queue_repository=ingestion_queue_repository)
+        self._receive_message_use_case = receive_message_use_case
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._retry_base_seconds = retry_base_seconds
+        self._retry_max_seconds = retry_max_seconds
+        self._scheduler = scheduler
+
+    async def execute(self) -> int:
+        """Process one batch and return how many jobs were claimed."""
+        jobs = await self._ingestion_queue_repository.claim(
+            limit=self._batch_size, lease_seconds=self._lease_seconds
+        )
+        if not jobs:
+            return 0
+
+        try:
+            await self._receive(jobs)
+            done = jobs
+        except Exception:
+            done = []
+            for job in jobs:
+                try:
+                    await self._receive([job])
+                    done.append(job)
+                except Exception as error:
+                    await self._fail(job, error)
+
+        await self._ingestion_queue_repository.complete([job.id for job in done])
+        return len(jobs)
+
+    async def _receive(self, jobs: list[IngestionJob]) -> None:
+        messages = [
+            IncomingMessage.from_dict(message)
+            for job in jobs
+            for message in job.payload
+        ]
+        if self._scheduler is None:
+            await self._receive_message_use_case.execute_batch(messages)
+        else:
+            await self._scheduler.execute_batch(
+                self._receive_message_use_case, messages
+            )
+
+    async def _fail(self, job: IngestionJob, error: Exception) -> None:
+        job.attempts += 1
+        job.last_error = f"{type(error).__name__}: {error}"
+        job.updated_at = get_now()
+        if job.attempts >= self._max_attempts:
+            await self._ingestion_queue_repository.dead_letter(job)
+            return
+
+        job.available_at = get_now() + timedelta(seconds=self.backoff(job.attempts))
+        await self._ingestion_queue_repository.retry(job)
+
+    def backoff(self, attempts: int) -> float:
+        """Seconds to wait before the next try: base * 2^(attempts - 1), capped."""
+        return min(
+            self._retry_base_seconds * 2 ** (attempts - 1), self._retry_max_seconds
+        )
@@ -1,29 +1,61 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime
 
+from src.application.business_numbers import BusinessNumber, BusinessNumberDirectory
+from src.application.caching import MISSING
+from src.application.conversations import Conversation, ConversationDirectory
+from src.application.dtos.message_dtos import (
+    IncomingMessage,
+    ReceivedMessageResult,
+    ReceiveStatus,
+)
+from src.application.dtos.serializers import serialize_message
+from src.application.events import (
+    Event,
+    EventTypes,
+    IEventBus,
+    publish_chat_event,
+)
 from src.application.exceptions import ReceiverContactDoesNotExistError
+from src.application.idempotency import IdempotencyFilter
 from src.application.interfaces import IMessageUseCase
 from src.domain.entities.chat import Chat
 from src.domain.entities.contact import Contact
 from src.domain.entities.message import Message
 from src.domain.errors import ChatNotFoundError, ContactNotFoundError
-from src.domain.repositories.chat_repository import IChatRepository
-from src.domain.repositories.contact_repository import IContactRepository
-from src.domain.repositories.message_repository import IMessageRepository
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
+from src.domain.repositories.chat_repository import IAsyncChatRepository
+from src.domain.repositories.contact_repository import IAsyncContactRepository
+from src.domain.repositories.message_repository import IAsyncMessageRepository
+from src.domain.repositories.unit_of_work import IUnitOfWork
 from src.helpers.helpers import generate_uuid4, get_now
 
 
 class ReceiveMessageUseCase(IMessageUseCase):
     def __init__(
         self,
-        message_repository: IMessageRepository,
-        contact_repository: IContactRepository,
-        chat_repository: IChatRepository,
+        message_repository: IAsyncMessageRepository,
+        contact_repository: IAsyncContactRepository,
+        chat_repository: IAsyncChatRepository,
+        unit_of_work: IUnitOfWork,
+        idempotency_filter: IdempotencyFilter | None = None,
+        business_numbers: BusinessNumberDirectory | None = None,
+        conversations: ConversationDirectory | None = None,
+        events: IEventBus | None = None,
     ):
-        super().__init__(message_repository=message_repository)
+        super().__init__(
+            message_repository=message_repository,
+            chat_repository=chat_repository,
+            events=events,
+        )
         self._contact_repository = contact_repository
-        self._chat_repository = chat_repository
+        self._unit_of_work = unit_of_work
+        self._idempotency_filter = idempotency_filter
+        self._business_numbers = business_numbers
+        self._conversations = conversations
 
-    def execute(
+    async def execute(
         self,
         sender_phone_number: str,
         sender_name: str,
@@ -32,24 +64,278 @@ class ReceiveMessageUseCase(IMessageUseCase):
         receiver_phone_number: str,
         text: str,
     ) -> Message:
-        # Check for existing message (idempotency)
-        existing_message = self._message_repository.get_by_external_id(
-            external_id=message_external_id
+        conversations: dict[tuple[str, str], Conversation] = {}
+        received: list[Message] = []
+        # All lookups and writes share one connection and commit together
+        async with self._settling(conversations), self._unit_of_work.transaction():
+            message = await self._receive(
+                sender_phone_number=sender_phone_number,
+                sender_name=sender_name,
+                message_external_id=message_external_id,
+                message_timestamp=message_timestamp,
+                receiver_phone_number=receiver_phone_number,
+                text=text,
+                conversations=conversations,
+                received=received,
+            )
+
+        if self._idempotency_filter is not None:
+            self._idempotency_filter.add(message.external_id, message.id)
+        await self._announce(received)
+        return message
+
+    async def _receive(
+        self,
+        sender_phone_number: str,
+        sender_name: str,
+        message_external_id: str,
+        message_timestamp: datetime,
+        receiver_phone_number: str,
+        text: str,
+        conversations: dict[tuple[str, str], Conversation],
+        received: list[Message],
+    ) -> Message:
+        receiver = await self._find_receiver(receiver_phone_number)
+        if receiver is None:
+            raise ReceiverContactDoesNotExistError
+
+        conversation = await self._get_or_create_conversation(
+            company_id=receiver.company_id,
+            sender_phone_number=sender_phone_number,
+            sender_name=sender_name,
+            conversations=conversations,
         )
-        if existing_message:
-            return existing_message
+
+        message = Message(
+            id=generate_uuid4(),
+            external_id=message_external_id,
+            external_timestamp=message_timestamp,
+            chat_id=conversation.chat_id,
+            sent_by_user_id=None,  # Message is from contact
+            text=text,
+            read=False,  # Incoming messages are unread by default
+        )
+        # A redelivery is absorbed by the insert, which hands back the message
+        # stored the first time instead
+        saved_message = await self._message_repository.save(message)
+        if saved_message.id == message.id:
+            received.append(saved_message)
+        return saved_message
+
+    async def execute_batch(
+        self, messages: list[IncomingMessage]
+    ) -> list[ReceivedMessageResult]:
+        """
+        Receive every message of a webhook payload in one transaction.
+
+        Receivers, senders and chats are resolved once per distinct phone
+        number and the new messages are written with a single multi-row
+        insert. Redeliveries are caught by the idempotency filter when this
+        process has seen them, otherwise by the insert skipping external ids
+        that are already stored. One result is returned per incoming message,
+        in order.
+        """
+        conversations: dict[tuple[str, str], Conversation] = {}
+        received: list[Message] = []
+        async with self._settling(conversations), self._unit_of_work.transaction():
+            results = await self._receive_batch(messages, conversations, received)
+
+        # Only remember and announce messages once they are committed
+        if self._idempotency_filter is not None:
+            for result in results:
+                if result.status != ReceiveStatus.RECEIVER_NOT_FOUND:
+                    self._idempotency_filter.add(result.external_id, result.message_id)
+        await self._announce(received)
+        return results
+
+    async def _announce(self, messages: list[Message]) -> None:
+        """Publish newly stored messages, looking each chat up once."""
+        if self._events is None:
+            return
+
+        chats: dict[str, Chat | None] = {}
+        for message in messages:
+            if message.chat_id not in chats:
+                try:
+                    chats[message.chat_id] = await self._chat_repository.get_by_id(
+                        chat_id=message.chat_id
+                    )
+                except ChatNotFoundError:
+                    chats[message.chat_id] = None
+            chat = chats[message.chat_id]
+            if chat is not None:
+                await self._events.publish(
+                    Event.for_chat(
+                        EventTypes.MESSAGE_CREATED, chat, serialize_message(message)
+                    )
+                )
+
+    def _recently_received(self, external_id: str) -> bool:
+        return self._idempotency_filter is not None and self._idempotency_filter.seen(
+            external_id
+        )
+
+    @asynccontextmanager
+    async def _settling(self, conversations: dict[tuple[str, str], Conversation]):
+        """
+        Write the conversations a transaction used to the directory once it
+        commits. If it fails they are dropped instead: a cached chat deleted
+        by another process fails the insert, and the retry must look it up.
+        """
+        try:
+            yield
+        except BaseException:
+            if self._conversations is not None:
+                for company_id, phone_number in conversations:
+                    self._conversations.forget(company_id, phone_number)
+            raise
+        if self._conversations is not None:
+            for (company_id, phone_number), conversation in conversations.items():
+                self._conversations.remember(company_id, phone_number, conversation)
+
+    async def _receive_batch(
+        self,
+        messages: list[IncomingMessage],
+        conversations: dict[tuple[str, str], Conversation],
+        received: list[Message],
+    ) -> list[ReceivedMessageResult]:
+        receivers: dict[str, BusinessNumber | None] = {}
+        new_messages: dict[str, Message] = {}
+        results: list[ReceivedMessageResult] = []
+
+        for incoming in messages:
+            external_id = incoming.external_id
+            # A payload may carry the same message twice; keep the first one
+            if external_id in new_messages:
+                results.append(
+                    ReceivedMessageResult(
+                        external_id=external_id,
+                        status=ReceiveStatus.DUPLICATE,
+                        message_id=new_messages[external_id].id,
+                    )
+                )
+                continue
+
+            if self._recently_received(external_id):
+                results.append(
+                    ReceivedMessageResult(
+                        external_id=external_id,
+                        status=ReceiveStatus.DUPLICATE,
+                        message_id=self._idempotency_filter.message_id(external_id),
+                    )
+                )
+                continue
+
+            receiver_phone_number = incoming.receiver_phone_number
+            if receiver_phone_number not in receivers:
+                receivers[receiver_phone_number] = await self._find_receiver(
+                    receiver_phone_number
+                )
+
+            receiver = receivers[receiver_phone_number]
+            if receiver is None:
+                results.append(
+                    ReceivedMessageResult(
+                        external_id=external_id,
+                        status=ReceiveStatus.RECEIVER_NOT_FOUND,
+                    )
+                )
+                continue
+
+            conversation = await self._get_or_create_conversation(
+                company_id=receiver.company_id,
+                sender_phone_number=incoming.sender_phone_number,
+                sender_name=incoming.sender_name,
+                conversations=conversations,
+            )
+
+            message = Message(
+                id=generate_uuid4(),
+                external_id=external_id,
+                external_timestamp=incoming.timestamp,
+                chat_id=conversation.chat_id,
+                sent_by_user_id=None,  # Message is from contact
+                text=incoming.text,
+                read=False,  # Incoming messages are unread by default
+            )
+            new_messages[external_id] = message
+            results.append(
+                ReceivedMessageResult(
+                    external_id=external_id,
+                    status=ReceiveStatus.CREATED,
+                    message_id=message.id,
+                )
+            )
+
+        if not new_messages:
+            return results
+
+        # Messages already stored by an earlier delivery are skipped by the
+        # insert and come back missing; their stored id is not looked up
+        saved = await self._message_repository.save_many(list(new_messages.values()))
+        received.extend(saved)
+        inserted = {message.id for message in saved}
+        skipped = {message.id for message in new_messages.values()} - inserted
+        return [
+            ReceivedMessageResult(
+                external_id=result.external_id, status=ReceiveStatus.DUPLICATE
+            )
+            if result.message_id in skipped
+            else result
+            for result in results
+        ]
+
+    async def _find_receiver(self, phone_number: str) -> BusinessNumber | None:
+        if self._business_numbers is not None:
+            cached = self._business_numbers.get(phone_number)
+            if cached is not MISSING:
+                return cached
 
         try:
-            receiver_contact = self._contact_repository.get_by_phone_number(
-                phone_number=receiver_phone_number
+            contact = await self._contact_repository.get_by_phone_number(
+                phone_number=phone_number
             )
         except ContactNotFoundError:
-            raise ReceiverContactDoesNotExistError
+            receiver = None
+        else:
+            receiver = BusinessNumber.of(contact)
 
+        if self._business_numbers is not None:
+            self._business_numbers.remember(phone_number, receiver)
+        return receiver
+
+    async def _get_or_create_conversation(
+        self,
+        company_id: str,
+        sender_phone_number: str,
+        sender_name: str,
+        conversations: dict[tuple[str, str], Conversation],
+    ) -> Conversation:
+        """
+        Resolve the sender's contact and chat once per transaction, from the
+        directory when it has them.
+        """
+        key = (company_id, sender_phone_number)
+        conversation = conversations.get(key)
+        if conversation is None and self._conversations is not None:
+            conversation = self._conversations.get(company_id, sender_phone_number)
+        if conversation is None:
+            chat = await self._get_or_create_chat(
+                company_id=company_id,
+                sender_phone_number=sender_phone_number,
+                sender_name=sender_name,
+            )
+            conversation = Conversation(contact_id=chat.contact_id, chat_id=chat.id)
+        conversations[key] = conversation
+        return conversation
+
+    async def _get_or_create_chat(
+        self, company_id: str, sender_phone_number: str, sender_name: str
+    ) -> Chat:
         try:
             sender_contact = (
-                self._contact_repository.get_company_contact_by_phone_number(
-                    company_id=receiver_contact.company_id,
+                await self._contact_repository.get_company_contact_by_phone_number(
+                    company_id=company_id,
                     phone_number=sender_phone_number,
                 )
             )
@@ -58,68 +344,80 @@ class ReceiveMessageUseCase(IMessageUseCase):
                 id=generate_uuid4(),
                 name=sender_name,
                 phone_number=sender_phone_number,
-                company_id=receiver_contact.company_id,
+                company_id=company_id,
             )
-            sender_contact = self._contact_repository.save(sender_contact)
+            sender_contact = await self._contact_repository.save(sender_contact)
 
         try:
-            chat = self._chat_repository.get_company_chat_by_contact_id(
-                company_id=receiver_contact.company_id,
+            return await self._chat_repository.get_company_chat_by_contact_id(
+                company_id=company_id,
                 contact_id=sender_contact.id,
             )
         except ChatNotFoundError:
             chat = Chat(
                 id=generate_uuid4(),
-                company_id=receiver_contact.company_id,
+                company_id=company_id,
                 contact_id=sender_contact.id,
             )
-            chat = self._chat_repository.save(chat)
-
-        message = Message(
-            id=generate_uuid4(),
-            external_id=message_external_id,
-            external_timestamp=message_timestamp,
-            chat_id=chat.id,
-            sent_by_user_id=None,  # Message is from contact
-            text=text,
-            read=False,  # Incoming messages are unread by default
-        )
-        saved_message = self._message_repository.save(message)
-        return saved_message
+            return await self._chat_repository.save(chat)
 
 
 class GetMessageUseCase(IMessageUseCase):
-    def execute(self, message_id: str) -> Message:
-        return self._message_repository.get_by_id(message_id)
+    async def execute(self, message_id: str) -> Message:
+        return await self._message_repository.get_by_id(message_id)
 
 
 class UpdateMessageUseCase(IMessageUseCase):
-    def execute(self, message_id: str, text: str) -> Message:
-        message = self._message_repository.get_by_id(message_id)
+    async def execute(self, message_id: str, text: str) -> Message:
+        message = await self._message_repository.get_by_id(message_id)
         message.text = text
         message.updated_at = get_now()
-        self._message_repository.save(message)
+        await self._message_repository.save(message)
         return message
 
 
 class DeleteMessageUseCase(IMessageUseCase):
-    def execute(self, message_id: str) -> None:
-        self._message_repository.delete(message_id)
+    async def execute(self, message_id: str) -> None:
+        await self._message_repository.delete(message_id)
 
 
 class MarkChatAsReadUseCase(IMessageUseCase):
-    def execute(self, chat_id: str) -> int:
-        updated_count = self._message_repository.mark_chat_messages_as_read(chat_id)
+    async def execute(self, chat_id: str) -> int:
+        updated_count = await self._message_repository.mark_chat_messages_as_read(
+            chat_id
+        )
+        if updated_count and self._events is not None:
+            await publish_chat_event(
+                self._events,
+                self._chat_repository,
+                EventTypes.CHAT_READ,
+                chat_id=chat_id,
+                data={"updated_count": updated_count},
+            )
         return updated_count
 
 
 class GetChatMessagesUseCase(IMessageUseCase):
-    def execute(self, chat_id: str) -> list[Message]:
-        return self._message_repository.get_by_chat_id(chat_id=chat_id)
+    async def execute(
+        self,
+        chat_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: str | None = None,
+    ) -> Page[Message]:
+        # The latest ``limit`` messages, or the ones just older than ``before``
+        return await self._message_repository.get_by_chat_id(
+            chat_id=chat_id, limit=limit, before=before
+        )
+
+
+class StreamChatMessagesUseCase(IMessageUseCase):
+    def execute(self, chat_id: str) -> AsyncIterator[Message]:
+        # The whole history, oldest first, fetched as the caller consumes it
+        return self._message_repository.iter_by_chat_id(chat_id=chat_id)
 
 
 class SendMessageUseCase(IMessageUseCase):
-    def execute(
+    async def execute(
         self,
         chat_id: str,
         text: str,
@@ -142,4 +440,13 @@ class SendMessageUseCase(IMessageUseCase):
             sent_by_user_id=sent_by_user_id,
             read=True,  # User-sent messages are marked as read
         )
-        return self._message_repository.save(message)
+        saved_message = await self._message_repository.save(message)
+        if self._events is not None:
+            await publish_chat_event(
+                self._events,
+                self._chat_repository,
+                EventTypes.MESSAGE_CREATED,
+                chat_id=chat_id,
+                data=serialize_message(saved_message),
+            )
+        return saved_message
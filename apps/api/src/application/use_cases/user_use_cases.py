@@ -1,9 +1,11 @@
+from src.application.caching import TTLCache
 from src.application.exceptions import InvalidUserError
 from src.application.interfaces import IUserUseCase
 from src.domain.entities.base import UNSET, UnsetType
 from src.domain.entities.user import User
 from src.domain.enums import UserTypes
 from src.domain.errors import CompanyNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from src.domain.repositories.company_repository import ICompanyRepository
 from src.domain.repositories.user_repository import IUserRepository
 from src.helpers.helpers import generate_uuid4, get_now
@@ -65,8 +67,9 @@ class UpdateUserUseCase(IUserUseCase):
         self,
         user_repository: IUserRepository,
         company_repository: ICompanyRepository,
+        user_cache: TTLCache | None = None,
     ):
-        super().__init__(user_repository=user_repository)
+        super().__init__(user_repository=user_repository, user_cache=user_cache)
         self._company_repository = company_repository
 
     def execute(
@@ -96,6 +99,8 @@ class UpdateUserUseCase(IUserUseCase):
 
         user.updated_at = get_now()
         self._user_repository.save(user)
+        if self._user_cache is not None:
+            self._user_cache.invalidate(user.id)
         return user
 
 
@@ -107,6 +112,8 @@ class GetUserUseCase(IUserUseCase):
 class DeleteUserUseCase(IUserUseCase):
     def execute(self, user_id: str) -> None:
         self._user_repository.delete(user_id)
+        if self._user_cache is not None:
+            self._user_cache.invalidate(user_id)
 
 
 class ListUserUseCase(IUserUseCase):
@@ -115,14 +122,22 @@ class ListUserUseCase(IUserUseCase):
         company_id: str,
         role: UserTypes | None = None,
         search_query: str | None = None,
-    ) -> list[User]:
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]:
         if search_query:
             return self._user_repository.search_users(
-                company_id=company_id, query=search_query, role=role
+                company_id=company_id,
+                query=search_query,
+                role=role,
+                limit=limit,
+                cursor=cursor,
             )
         elif role:
             return self._user_repository.get_by_company_and_role(
-                company_id=company_id, role=role
+                company_id=company_id, role=role, limit=limit, cursor=cursor
             )
         else:
-            return self._user_repository.get_by_company_id(company_id=company_id)
+            return self._user_repository.get_by_company_id(
+                company_id=company_id, limit=limit, cursor=cursor
+            )
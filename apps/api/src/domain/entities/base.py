@@ -4,6 +4,13 @@ from src.helpers.helpers import get_now
 
 
 class BaseEntity:
+    # Entities are loaded by the million for exports and streamed lists;
+    # __slots__ drops the per-instance __dict__. Subclasses declare their
+    # own fields the same way. The Postgres repositories build entities
+    # from rows with __new__ and fill every slot, bypassing __init__, so a
+    # new field must be set there too.
+    __slots__ = ("created_at", "updated_at")
+
     def __init__(
         self,
         created_at: datetime | None = None,
@@ -5,6 +5,8 @@ from src.domain.enums import ChatStatuses
 
 
 class Chat(BaseEntity):
+    __slots__ = ("id", "company_id", "contact_id", "status", "attached_user_id")
+
     def __init__(
         self,
         id: str,
@@ -4,6 +4,16 @@ from src.domain.entities.base import BaseEntity
 
 
 class Company(BaseEntity):
+    __slots__ = (
+        "id",
+        "name",
+        "email",
+        "phone",
+        "whatsapp_api_key",
+        "is_active",
+        "attendant_sees_all_conversations",
+    )
+
     def __init__(
         self,
         id: str,
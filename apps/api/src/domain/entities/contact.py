@@ -4,6 +4,18 @@ from src.domain.entities.base import BaseEntity
 
 
 class Contact(BaseEntity):
+    __slots__ = (
+        "id",
+        "company_id",
+        "name",
+        "phone_number",
+        "email",
+        "tags",
+        "notes",
+        "last_contact_at",
+        "is_blocked",
+    )
+
     def __init__(
         self,
         id: str,
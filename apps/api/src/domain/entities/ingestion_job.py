@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from src.domain.entities.base import BaseEntity
+
+
+class IngestionJob(BaseEntity):
+    """
+    A webhook delivery waiting to be ingested.
+
+    ``payload`` holds the serialized incoming messages. A job is claimed once
+    ``available_at`` has passed; claiming and retrying push it forward.
+    """
+
+    __slots__ = ("id", "payload", "attempts", "available_at", "last_error")
+
+    def __init__(
+        self,
+        id: str,
+        payload: list[dict],
+        attempts: int = 0,
+        available_at: datetime | None = None,
+        last_error: str | None = None,
+        created_at: datetime | None = None,
+        updated_at: datetime | None = None,
+    ):
+        super().__init__(created_at=created_at, updated_at=updated_at)
+        self.id = id
+        self.payload = payload
+        self.attempts = attempts
+        self.available_at = available_at or self.created_at
+        self.last_error = last_error
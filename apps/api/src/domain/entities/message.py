@@ -4,6 +4,16 @@ from src.domain.entities.base import BaseEntity
 
 
 class Message(BaseEntity):
+    __slots__ = (
+        "id",
+        "external_id",
+        "external_timestamp",
+        "chat_id",
+        "text",
+        "sent_by_user_id",
+        "read",
+    )
+
     def __init__(
         self,
         id: str,
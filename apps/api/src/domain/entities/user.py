@@ -6,6 +6,16 @@ from src.domain.enums import UserTypes
 
 
 class User(BaseEntity):
+    __slots__ = (
+        "id",
+        "name",
+        "email",
+        "type",
+        "password_hash",
+        "company_id",
+        "is_active",
+    )
+
     def __init__(
         self,
         id: str,
@@ -12,3 +12,12 @@ class ChatStatuses(Enum):
     PENDING = "pending"
     REPLIED = "replied"
     CLOSED = "closed"
+
+
+class InboxFilters(Enum):
+    """The chat lists the inbox can show; the same filters as the chat routes."""
+
+    ALL = "all"
+    UNASSIGNED = "unassigned"
+    PENDING = "pending"
+    RESOLVED = "resolved"
@@ -11,3 +11,6 @@ class ContactNotFoundError(Exception): ...
 
 
 class ChatNotFoundError(Exception): ...
+
+
+class InvalidCursorError(Exception): ...
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.entities.chat import Chat
+
+
+@dataclass(frozen=True, slots=True)
+class InboxChat:
+    """
+    One row of the inbox: a chat with what the chat list shows next to it.
+
+    The contact fields are None if the contact was deleted, and the last
+    message fields are None while the chat has no messages.
+    """
+
+    chat: Chat
+    contact_name: str | None
+    contact_phone_number: str | None
+    last_message_text: str | None
+    last_message_at: datetime | None
+    unread_count: int
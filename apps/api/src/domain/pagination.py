@@ -0,0 +1,87 @@
+import base64
+import binascii
+import json
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from src.domain.errors import InvalidCursorError
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    """
+    One page of a keyset-paginated listing.
+
+    ``next_cursor`` is an opaque token holding the sort key of the last item;
+    passing it back returns the rows that follow. It is None on the last page.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None, types: Sequence[type]) -> tuple | None:
+    """
+    Decode a cursor into its keyset values, typed according to ``types``.
+
+    Raises InvalidCursorError if the cursor was not produced by a listing
+    with the same sort key.
+    """
+    if cursor is None:
+        return None
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise InvalidCursorError from e
+
+    if not isinstance(payload, list) or len(payload) != len(types):
+        raise InvalidCursorError
+
+    values = []
+    for value, value_type in zip(payload, types, strict=True):
+        try:
+            if value_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            elif value_type is float and isinstance(value, int | float):
+                values.append(float(value))
+            elif isinstance(value, value_type):
+                values.append(value)
+            else:
+                raise InvalidCursorError
+        except (TypeError, ValueError) as e:
+            raise InvalidCursorError from e
+    return tuple(values)
+
+
+def build_page[R, T](
+    rows: Sequence[R],
+    limit: int,
+    key: Callable[[R], Sequence[Any]],
+    parse: Callable[[R], T],
+) -> Page[T]:
+    """
+    Turn up to ``limit + 1`` sorted rows into a page.
+
+    Fetching one extra row tells whether another page exists without a
+    separate COUNT query.
+    """
+    rows = list(rows)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(key(rows[-1])) if has_more and rows else None
+    return Page(items=[parse(row) for row in rows], next_cursor=next_cursor)
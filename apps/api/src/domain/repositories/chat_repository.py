@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
 
 from src.domain.entities.chat import Chat
+from src.domain.enums import InboxFilters
+from src.domain.inbox import InboxChat
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 
 
 class IChatRepository(ABC):
@@ -14,7 +18,26 @@ class IChatRepository(ABC):
     def get_all(self) -> list[Chat]: ...
 
     @abstractmethod
-    def get_by_company_id(self, company_id: str) -> list[Chat]: ...
+    def iter_all(self) -> Iterator[Chat]:
+        """
+        Yield every stored chat, in no particular order, without loading them
+        all into memory. Meant for exports, migrations and background jobs.
+        """
+
+    @abstractmethod
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
+
+    @abstractmethod
+    def iter_by_company_id(self, company_id: str) -> Iterator[Chat]:
+        """
+        Yield every chat of the company, newest first, without loading them
+        all into memory.
+        """
 
     @abstractmethod
     def get_company_chat_by_contact_id(
@@ -27,18 +50,145 @@ class IChatRepository(ABC):
     def delete(self, chat_id: str) -> None: ...
 
     @abstractmethod
-    def get_unassigned_by_company_id(self, company_id: str) -> list[Chat]: ...
+    def get_unassigned_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
 
     @abstractmethod
-    def get_pending_by_company_id(self, company_id: str) -> list[Chat]: ...
+    def get_pending_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
 
     @abstractmethod
-    def get_resolved_by_company_id(self, company_id: str) -> list[Chat]: ...
+    def get_resolved_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
 
     @abstractmethod
-    def get_by_attendant_id(self, company_id: str, attendant_id: str) -> list[Chat]: ...
+    def get_by_attendant_id(
+        self,
+        company_id: str,
+        attendant_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
 
     @abstractmethod
     def search_chats(
-        self, company_id: str, query: str, user_id: str | None = None
-    ) -> list[Chat]: ...
+        self,
+        company_id: str,
+        query: str,
+        user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
+
+    @abstractmethod
+    def get_inbox(
+        self,
+        company_id: str,
+        inbox_filter: InboxFilters = InboxFilters.ALL,
+        attendant_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[InboxChat]:
+        """
+        List the company's chats, most recent message first (chats without
+        messages by creation time), each with its contact, last message and
+        unread count. ``attendant_id`` narrows the list to the chats attached
+        to that user.
+        """
+
+
+class IAsyncChatRepository(ABC):
+    @abstractmethod
+    async def save(self, chat: Chat) -> Chat: ...
+
+    @abstractmethod
+    async def get_by_id(self, chat_id: str) -> Chat: ...
+
+    @abstractmethod
+    async def get_all(self) -> list[Chat]: ...
+
+    @abstractmethod
+    async def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
+
+    @abstractmethod
+    def iter_by_company_id(self, company_id: str) -> AsyncIterator[Chat]: ...
+
+    @abstractmethod
+    async def get_company_chat_by_contact_id(
+        self,
+        company_id: str,
+        contact_id: str,
+    ) -> Chat: ...
+
+    @abstractmethod
+    async def delete(self, chat_id: str) -> None: ...
+
+    @abstractmethod
+    async def get_unassigned_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
+
+    @abstractmethod
+    async def get_pending_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
+
+    @abstractmethod
+    async def get_resolved_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
+
+    @abstractmethod
+    async def get_by_attendant_id(
+        self,
+        company_id: str,
+        attendant_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
+
+    @abstractmethod
+    async def search_chats(
+        self,
+        company_id: str,
+        query: str,
+        user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]: ...
+
+    @abstractmethod
+    async def get_inbox(
+        self,
+        company_id: str,
+        inbox_filter: InboxFilters = InboxFilters.ALL,
+        attendant_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[InboxChat]: ...
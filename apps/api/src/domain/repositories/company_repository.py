@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from src.domain.entities.company import Company
 
@@ -13,5 +14,12 @@ class ICompanyRepository(ABC):
     @abstractmethod
     def get_all(self) -> list[Company]: ...
 
+    @abstractmethod
+    def iter_all(self) -> Iterator[Company]:
+        """
+        Yield every stored company, in no particular order, without loading them
+        all into memory. Meant for exports, migrations and background jobs.
+        """
+
     @abstractmethod
     def delete(self, company_id: str) -> None: ...
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from src.domain.entities.contact import Contact
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 
 
 class IContactRepository(ABC):
@@ -13,11 +15,30 @@ class IContactRepository(ABC):
     @abstractmethod
     def get_all(self) -> list[Contact]: ...
 
+    @abstractmethod
+    def iter_all(self) -> Iterator[Contact]:
+        """
+        Yield every stored contact, in no particular order, without loading them
+        all into memory. Meant for exports, migrations and background jobs.
+        """
+
+    @abstractmethod
+    def iter_by_company_id(self, company_id: str) -> Iterator[Contact]:
+        """
+        Yield every contact of the company, by name, without loading them all
+        into memory.
+        """
+
     @abstractmethod
     def delete(self, contact_id: str) -> None: ...
 
     @abstractmethod
-    def get_by_company_id(self, company_id: str) -> list[Contact]: ...
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]: ...
 
     @abstractmethod
     def get_by_phone_number(self, phone_number: str) -> Contact: ...
@@ -30,4 +51,51 @@ class IContactRepository(ABC):
     ) -> Contact: ...
 
     @abstractmethod
-    def search_contacts(self, company_id: str, query: str) -> list[Contact]: ...
+    def search_contacts(
+        self,
+        company_id: str,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]: ...
+
+
+class IAsyncContactRepository(ABC):
+    @abstractmethod
+    async def save(self, contact: Contact) -> Contact: ...
+
+    @abstractmethod
+    async def get_by_id(self, contact_id: str) -> Contact: ...
+
+    @abstractmethod
+    async def get_all(self) -> list[Contact]: ...
+
+    @abstractmethod
+    async def delete(self, contact_id: str) -> None: ...
+
+    @abstractmethod
+    async def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]: ...
+
+    @abstractmethod
+    async def get_by_phone_number(self, phone_number: str) -> Contact: ...
+
+    @abstractmethod
+    async def get_company_contact_by_phone_number(
+        self,
+        company_id: str,
+        phone_number: str,
+    ) -> Contact: ...
+
+    @abstractmethod
+    async def search_contacts(
+        self,
+        company_id: str,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]: ...
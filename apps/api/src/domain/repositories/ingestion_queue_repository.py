@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from src.domain.entities.ingestion_job import IngestionJob
+
+
+@dataclass(frozen=True)
+class IngestionQueueStats:
+    pending: int
+    dead_letters: int
+    # Age of the oldest job still in the queue, 0 when it is empty
+    lag_seconds: float
+
+
+class IIngestionQueueRepository(ABC):
+    @abstractmethod
+    def enqueue(self, job: IngestionJob) -> IngestionJob: ...
+
+    @abstractmethod
+    def claim(self, limit: int, lease_seconds: float) -> list[IngestionJob]:
+        """
+        Take up to ``limit`` due jobs, oldest first.
+
+        Claimed jobs become available again after ``lease_seconds`` unless
+        they are completed, retried or dead-lettered first, so a worker that
+        dies mid-batch does not lose them.
+        """
+
+    @abstractmethod
+    def complete(self, job_ids: list[str]) -> None: ...
+
+    @abstractmethod
+    def retry(self, job: IngestionJob) -> None:
+        """Persist the job's attempts, last_error and next available_at."""
+
+    @abstractmethod
+    def dead_letter(self, job: IngestionJob) -> None:
+        """Move the job out of the queue into the dead-letter store."""
+
+    @abstractmethod
+    def stats(self) -> IngestionQueueStats: ...
+
+
+class IAsyncIngestionQueueRepository(ABC):
+    @abstractmethod
+    async def enqueue(self, job: IngestionJob) -> IngestionJob: ...
+
+    @abstractmethod
+    async def claim(self, limit: int, lease_seconds: float) -> list[IngestionJob]: ...
+
+    @abstractmethod
+    async def complete(self, job_ids: list[str]) -> None: ...
+
+    @abstractmethod
+    async def retry(self, job: IngestionJob) -> None: ...
+
+    @abstractmethod
+    async def dead_letter(self, job: IngestionJob) -> None: ...
+
+    @abstractmethod
+    async def stats(self) -> IngestionQueueStats: ...
@@ -1,11 +1,17 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterator
 
 from src.domain.entities.message import Message
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 
 
 class IMessageRepository(ABC):
     @abstractmethod
-    def save(self, message: Message) -> Message: ...
+    def save(self, message: Message) -> Message:
+        """
+        Store the message. If another message already holds its external_id,
+        nothing is written and that stored message is returned.
+        """
 
     @abstractmethod
     def get_by_id(self, message_id: str) -> Message: ...
@@ -13,9 +19,24 @@ class IMessageRepository(ABC):
     @abstractmethod
     def get_by_external_id(self, external_id: str) -> Message | None: ...
 
+    @abstractmethod
+    def save_many(self, messages: list[Message]) -> list[Message]:
+        """
+        Insert new messages, skipping any whose external_id is already stored.
+
+        Only the messages actually inserted are returned.
+        """
+
     @abstractmethod
     def get_all(self) -> list[Message]: ...
 
+    @abstractmethod
+    def iter_all(self) -> Iterator[Message]:
+        """
+        Yield every stored message, in no particular order, without loading them
+        all into memory. Meant for exports, migrations and background jobs.
+        """
+
     @abstractmethod
     def delete(self, message_id: str) -> None: ...
 
@@ -23,4 +44,50 @@ class IMessageRepository(ABC):
     def mark_chat_messages_as_read(self, chat_id: str) -> int: ...
 
     @abstractmethod
-    def get_by_chat_id(self, chat_id: str) -> list[Message]: ...
+    def get_by_chat_id(
+        self,
+        chat_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: str | None = None,
+    ) -> Page[Message]: ...
+
+    @abstractmethod
+    def iter_by_chat_id(self, chat_id: str) -> Iterator[Message]:
+        """
+        Yield every message of the chat, oldest first, without loading them
+        all into memory.
+        """
+
+
+class IAsyncMessageRepository(ABC):
+    @abstractmethod
+    async def save(self, message: Message) -> Message: ...
+
+    @abstractmethod
+    async def get_by_id(self, message_id: str) -> Message: ...
+
+    @abstractmethod
+    async def get_by_external_id(self, external_id: str) -> Message | None: ...
+
+    @abstractmethod
+    async def save_many(self, messages: list[Message]) -> list[Message]: ...
+
+    @abstractmethod
+    async def get_all(self) -> list[Message]: ...
+
+    @abstractmethod
+    async def delete(self, message_id: str) -> None: ...
+
+    @abstractmethod
+    async def mark_chat_messages_as_read(self, chat_id: str) -> int: ...
+
+    @abstractmethod
+    async def get_by_chat_id(
+        self,
+        chat_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: str | None = None,
+    ) -> Page[Message]: ...
+
+    @abstractmethod
+    def iter_by_chat_id(self, chat_id: str) -> AsyncIterator[Message]: ...
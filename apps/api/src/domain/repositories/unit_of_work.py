@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+
+
+class IUnitOfWork(ABC):
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        """
+        Run every repository call made inside ``async with`` atomically.
+
+        Changes are committed when the block exits normally and rolled back
+        when it raises. Nested transactions join the outer one.
+        """
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 
 from src.domain.entities.user import User
 from src.domain.enums import UserTypes
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 
 
 class IUserRepository(ABC):
@@ -17,6 +19,20 @@ class IUserRepository(ABC):
     @abstractmethod
     def get_all(self) -> list[User]: ...
 
+    @abstractmethod
+    def iter_all(self) -> Iterator[User]:
+        """
+        Yield every stored user, in no particular order, without loading them
+        all into memory. Meant for exports, migrations and background jobs.
+        """
+
+    @abstractmethod
+    def iter_by_company_id(self, company_id: str) -> Iterator[User]:
+        """
+        Yield every user of the company, newest first, without loading them all
+        into memory.
+        """
+
     @abstractmethod
     def delete(self, user_id: str) -> None: ...
 
@@ -24,14 +40,28 @@ class IUserRepository(ABC):
     def update_password(self, user_id: str, password_hash: str) -> None: ...
 
     @abstractmethod
-    def get_by_company_id(self, company_id: str) -> list[User]: ...
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]: ...
 
     @abstractmethod
     def get_by_company_and_role(
-        self, company_id: str, role: UserTypes
-    ) -> list[User]: ...
+        self,
+        company_id: str,
+        role: UserTypes,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]: ...
 
     @abstractmethod
     def search_users(
-        self, company_id: str, query: str, role: UserTypes | None = None
-    ) -> list[User]: ...
+        self,
+        company_id: str,
+        query: str,
+        role: UserTypes | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]: ...
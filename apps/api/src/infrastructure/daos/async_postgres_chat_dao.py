@@ -0,0 +1,360 @@
+from collections.abc import AsyncIterator
+
+from asyncpg import Record
+
+from src.infrastructure.daos.postgres_chat_dao import INBOX_FILTERS
+from src.infrastructure.database.async_postgres_pool import (
+    AsyncPostgresConnectionPool,
+)
+from src.infrastructure.database.server_cursors import DEFAULT_ITERSIZE
+
+
+def _keyset(after: tuple | None, position: int) -> tuple[str, tuple]:
+    """Keyset condition for listings sorted by (created_at DESC, id DESC)."""
+    if after is None:
+        return "", ()
+    return f"AND (created_at, id) < (${position}, ${position + 1})", after
+
+
+class AsyncPostgresChatDAO:
+    def __init__(
+        self,
+        connection_pool: AsyncPostgresConnectionPool,
+        itersize: int = DEFAULT_ITERSIZE,
+    ):
+        self._connection_pool = connection_pool
+        self._itersize = itersize
+
+    def _connect(self):
+        return self._connection_pool.connection()
+
+    async def insert(self, chat_data: dict) -> Record:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                INSERT INTO chats (id, company_id, contact_id, status, attached_user_id)
+                VALUES ($1, $2, $3, $4, $5)
+                RETURNING id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                """,
+                chat_data["id"],
+                chat_data["company_id"],
+                chat_data["contact_id"],
+                chat_data["status"],
+                chat_data["attached_user_id"],
+            )
+
+    async def update(self, chat_data: dict) -> Record:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                UPDATE chats
+                SET
+                    company_id = $2,
+                    contact_id = $3,
+                    status = $4,
+                    attached_user_id = $5,
+                    updated_at = $6
+                WHERE id = $1
+                RETURNING id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                """,
+                chat_data["id"],
+                chat_data["company_id"],
+                chat_data["contact_id"],
+                chat_data["status"],
+                chat_data["attached_user_id"],
+                chat_data["updated_at"],
+            )
+
+    async def upsert(self, chat_data: dict) -> Record:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                INSERT INTO chats (id, company_id, contact_id, status, attached_user_id)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (id) DO UPDATE
+                SET
+                    company_id = EXCLUDED.company_id,
+                    contact_id = EXCLUDED.contact_id,
+                    status = EXCLUDED.status,
+                    attached_user_id = EXCLUDED.attached_user_id,
+                    updated_at = $6
+                RETURNING id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                """,
+                chat_data["id"],
+                chat_data["company_id"],
+                chat_data["contact_id"],
+                chat_data["status"],
+                chat_data["attached_user_id"],
+                chat_data["updated_at"],
+            )
+
+    async def get_by_id(self, chat_id: str) -> Record | None:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                WHERE id = $1
+                """,
+                chat_id,
+            )
+
+    async def get_all(self) -> list[Record]:
+        async with self._connect() as conn:
+            return await conn.fetch(
+                """
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                ORDER BY created_at DESC
+                """
+            )
+
+    async def get_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[Record]:
+        keyset, keyset_args = _keyset(after, position=3)
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                WHERE company_id = $1
+                {keyset}
+                ORDER BY created_at DESC, id DESC
+                LIMIT $2
+                """,
+                company_id,
+                limit,
+                *keyset_args,
+            )
+
+    async def iter_by_company_id(
+        self, company_id: str, prefetch: int | None = None
+    ) -> AsyncIterator[Record]:
+        """
+        Yield every chat of the company, newest first, from a server-side
+        cursor fetching ``prefetch`` rows (the DAO's itersize by default)
+        per round trip.
+
+        The connection stays checked out until iteration ends.
+        """
+        async with self._connect() as conn, conn.transaction():
+            async for record in conn.cursor(
+                """
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                WHERE company_id = $1
+                ORDER BY created_at DESC, id DESC
+                """,
+                company_id,
+                prefetch=prefetch or self._itersize,
+            ):
+                yield record
+
+    async def get_company_chat_by_contact_id(
+        self, company_id: str, contact_id: str
+    ) -> Record | None:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                WHERE company_id = $1 AND contact_id = $2
+                ORDER BY created_at DESC
+                """,
+                company_id,
+                contact_id,
+            )
+
+    async def delete(self, chat_id: str) -> None:
+        async with self._connect() as conn:
+            await conn.execute("DELETE FROM chats WHERE id = $1", chat_id)
+
+    async def get_unassigned_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[Record]:
+        keyset, keyset_args = _keyset(after, position=3)
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                WHERE company_id = $1 AND attached_user_id IS NULL
+                {keyset}
+                ORDER BY created_at DESC, id DESC
+                LIMIT $2
+                """,
+                company_id,
+                limit,
+                *keyset_args,
+            )
+
+    async def get_pending_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[Record]:
+        keyset, keyset_args = _keyset(after, position=3)
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                WHERE company_id = $1
+                  AND attached_user_id IS NOT NULL
+                  AND status != 'closed'
+                {keyset}
+                ORDER BY created_at DESC, id DESC
+                LIMIT $2
+                """,
+                company_id,
+                limit,
+                *keyset_args,
+            )
+
+    async def get_resolved_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[Record]:
+        keyset, keyset_args = _keyset(after, position=3)
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                WHERE company_id = $1 AND status = 'closed'
+                {keyset}
+                ORDER BY created_at DESC, id DESC
+                LIMIT $2
+                """,
+                company_id,
+                limit,
+                *keyset_args,
+            )
+
+    async def get_by_attendant_id(
+        self,
+        company_id: str,
+        attendant_id: str,
+        limit: int = 50,
+        after: tuple | None = None,
+    ) -> list[Record]:
+        keyset, keyset_args = _keyset(after, position=4)
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                FROM chats
+                WHERE company_id = $1 AND attached_user_id = $2
+                {keyset}
+                ORDER BY created_at DESC, id DESC
+                LIMIT $3
+                """,
+                company_id,
+                attendant_id,
+                limit,
+                *keyset_args,
+            )
+
+    async def search_chats(
+        self,
+        company_id: str,
+        query: str,
+        user_id: str | None = None,
+        limit: int = 50,
+        after: tuple | None = None,
+    ) -> list[Record]:
+        keyset = (
+            "HAVING (MAX(matches.rank), c.created_at, c.id) < ($6::real, $7, $8)"
+            if after
+            else ""
+        )
+        async with self._connect() as conn:
+            # Contacts match by trigram (name, phone), messages by full text.
+            # Each side is resolved through its own index and narrowed to the
+            # company before it is ranked and grouped.
+            return await conn.fetch(
+                f"""
+                WITH matches AS (
+                    SELECT c.id AS chat_id,
+                           GREATEST(similarity(ct.name, $2), similarity(ct.phone_number, $2)) AS rank
+                    FROM contacts ct
+                    JOIN chats c ON c.contact_id = ct.id
+                    WHERE ct.company_id = $1
+                    AND (ct.name ILIKE $3 OR ct.phone_number ILIKE $3)
+                    UNION ALL
+                    SELECT m.chat_id,
+                           ts_rank(to_tsvector('simple', m.text), plainto_tsquery('simple', $2)) AS rank
+                    FROM messages m
+                    JOIN chats c ON c.id = m.chat_id
+                    WHERE c.company_id = $1
+                    AND to_tsvector('simple', m.text) @@ plainto_tsquery('simple', $2)
+                )
+                SELECT c.id, c.company_id, c.contact_id, c.status, c.attached_user_id, c.created_at, c.updated_at,
+                       MAX(matches.rank) AS rank
+                FROM matches
+                JOIN chats c ON c.id = matches.chat_id
+                WHERE c.company_id = $1
+                AND ($4::text IS NULL OR c.attached_user_id = $4)
+                GROUP BY c.id
+                {keyset}
+                ORDER BY rank DESC, c.created_at DESC, c.id DESC
+                LIMIT $5
+                """,
+                company_id,
+                query,
+                f"%{query}%",
+                user_id,
+                limit,
+                *(after or ()),
+            )
+
+    async def get_inbox(
+        self,
+        company_id: str,
+        inbox_filter: str = "all",
+        attendant_id: str | None = None,
+        limit: int = 50,
+        after: tuple | None = None,
+    ) -> list[Record]:
+        """
+        Return a page of chats, most recent activity first, with their contact
+        name and phone, last message text and timestamp, and unread count, in
+        one statement. The activity time is returned as the last column.
+        """
+        args = [company_id, limit]
+        attendant = ""
+        if attendant_id:
+            args.append(attendant_id)
+            attendant = f"AND attached_user_id = ${len(args)}"
+        keyset = ""
+        if after:
+            args.extend(after)
+            keyset = (
+                "AND (COALESCE(last_message_at, created_at), id)"
+                f" < (${len(args) - 1}, ${len(args)})"
+            )
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                WITH page AS (
+                    SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at,
+                           unread_count, last_message_at, last_message_id,
+                           COALESCE(last_message_at, created_at) AS activity_at
+                    FROM chats
+                    WHERE company_id = $1
+                    {INBOX_FILTERS[inbox_filter]}
+                    {attendant}
+                    {keyset}
+                    ORDER BY COALESCE(last_message_at, created_at) DESC, id DESC
+                    LIMIT $2
+                )
+                SELECT p.id, p.company_id, p.contact_id, p.status, p.attached_user_id, p.created_at, p.updated_at,
+                       ct.name, ct.phone_number,
+                       m.text, p.last_message_at,
+                       p.unread_count,
+                       p.activity_at
+                FROM page p
+                LEFT JOIN contacts ct ON ct.id = p.contact_id
+                LEFT JOIN messages m ON m.id = p.last_message_id
+                ORDER BY p.activity_at DESC, p.id DESC
+                """,
+                *args,
+            )
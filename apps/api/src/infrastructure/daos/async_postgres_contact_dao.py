@@ -0,0 +1,202 @@
+from asyncpg import Record
+
+from src.infrastructure.database.async_postgres_pool import (
+    AsyncPostgresConnectionPool,
+)
+
+
+class AsyncPostgresContactDAO:
+    def __init__(self, connection_pool: AsyncPostgresConnectionPool):
+        self._connection_pool = connection_pool
+
+    def _connect(self):
+        return self._connection_pool.connection()
+
+    async def insert(self, contact_data: dict) -> Record:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                INSERT INTO contacts (
+                    id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at
+                ) VALUES (
+                    $1, $2, $3, $4, $5, $6, $7, $8, $9
+                )
+                RETURNING id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                """,
+                contact_data["id"],
+                contact_data["name"],
+                contact_data["phone_number"],
+                contact_data["email"],
+                contact_data["company_id"],
+                contact_data["is_blocked"],
+                contact_data["tags"],
+                contact_data["notes"],
+                contact_data["last_contact_at"],
+            )
+
+    async def update(self, contact_data: dict) -> Record:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                UPDATE contacts SET
+                    name = $2,
+                    phone_number = $3,
+                    email = $4,
+                    company_id = $5,
+                    is_blocked = $6,
+                    tags = $7,
+                    notes = $8,
+                    last_contact_at = $9,
+                    updated_at = $10
+                WHERE id = $1
+                RETURNING id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                """,
+                contact_data["id"],
+                contact_data["name"],
+                contact_data["phone_number"],
+                contact_data["email"],
+                contact_data["company_id"],
+                contact_data["is_blocked"],
+                contact_data["tags"],
+                contact_data["notes"],
+                contact_data["last_contact_at"],
+                contact_data["updated_at"],
+            )
+
+    async def upsert(self, contact_data: dict) -> Record:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                INSERT INTO contacts (id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                ON CONFLICT (id) DO UPDATE
+                SET
+                    name = EXCLUDED.name,
+                    phone_number = EXCLUDED.phone_number,
+                    email = EXCLUDED.email,
+                    company_id = EXCLUDED.company_id,
+                    is_blocked = EXCLUDED.is_blocked,
+                    tags = EXCLUDED.tags,
+                    notes = EXCLUDED.notes,
+                    last_contact_at = EXCLUDED.last_contact_at,
+                    updated_at = $10
+                RETURNING id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                """,
+                contact_data["id"],
+                contact_data["name"],
+                contact_data["phone_number"],
+                contact_data["email"],
+                contact_data["company_id"],
+                contact_data["is_blocked"],
+                contact_data["tags"],
+                contact_data["notes"],
+                contact_data["last_contact_at"],
+                contact_data["updated_at"],
+            )
+
+    async def get_by_id(self, contact_id: str) -> Record | None:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                FROM contacts
+                WHERE id = $1
+                """,
+                contact_id,
+            )
+
+    async def get_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[Record]:
+        keyset = "AND (name, id) > ($3, $4)" if after else ""
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                FROM contacts
+                WHERE company_id = $1
+                {keyset}
+                ORDER BY name ASC, id ASC
+                LIMIT $2
+                """,
+                company_id,
+                limit,
+                *(after or ()),
+            )
+
+    async def get_by_phone_number(self, phone_number: str) -> Record | None:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                FROM contacts
+                WHERE phone_number = $1
+                """,
+                phone_number,
+            )
+
+    async def get_company_contact_by_phone_number(
+        self, company_id: str, phone_number: str
+    ) -> Record | None:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                FROM contacts
+                WHERE company_id = $1 AND phone_number = $2
+                """,
+                company_id,
+                phone_number,
+            )
+
+    async def get_all(self) -> list[Record]:
+        async with self._connect() as conn:
+            return await conn.fetch(
+                """
+                SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                FROM contacts
+                ORDER BY created_at DESC
+                """
+            )
+
+    async def search_contacts(
+        self,
+        company_id: str,
+        query: str,
+        limit: int = 50,
+        after: tuple | None = None,
+    ) -> list[Record]:
+        keyset = (
+            "WHERE rank < $5::real OR (rank = $5::real AND (name, id) > ($6, $7))"
+            if after
+            else ""
+        )
+        async with self._connect() as conn:
+            # ILIKE with a leading wildcard is served by the trigram indexes
+            return await conn.fetch(
+                f"""
+                SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at, rank
+                FROM (
+                    SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at,
+                           GREATEST(
+                               similarity(name, $2),
+                               similarity(phone_number, $2),
+                               similarity(COALESCE(email, ''), $2)
+                           ) AS rank
+                    FROM contacts
+                    WHERE company_id = $1 AND (name ILIKE $3 OR phone_number ILIKE $3 OR email ILIKE $3)
+                ) ranked
+                {keyset}
+                ORDER BY rank DESC, name ASC, id ASC
+                LIMIT $4
+                """,
+                company_id,
+                query,
+                f"%{query}%",
+                limit,
+                *(after or ()),
+            )
+
+    async def delete(self, contact_id: str) -> None:
+        async with self._connect() as conn:
+            await conn.execute("DELETE FROM contacts WHERE id = $1", contact_id)
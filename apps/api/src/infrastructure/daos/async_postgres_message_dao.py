@@ -0,0 +1,264 @@
+from collections.abc import AsyncIterator
+
+from asyncpg import Record
+
+from src.infrastructure.daos.postgres_message_dao import (
+    INSERTED_ACTIVITY,
+    REWRITTEN_ACTIVITY,
+    UPDATE_CHAT_ACTIVITY,
+)
+from src.infrastructure.database.async_postgres_pool import (
+    AsyncPostgresConnectionPool,
+)
+from src.infrastructure.database.server_cursors import DEFAULT_ITERSIZE
+
+
+class AsyncPostgresMessageDAO:
+    def __init__(
+        self,
+        connection_pool: AsyncPostgresConnectionPool,
+        itersize: int = DEFAULT_ITERSIZE,
+    ):
+        self._connection_pool = connection_pool
+        self._itersize = itersize
+
+    def _connect(self):
+        return self._connection_pool.connection()
+
+    async def insert(self, message_data: dict) -> Record | None:
+        """
+        Insert a message; returns None if its external_id is already stored.
+
+        The chat's unread counter and last-message pointer are updated by the
+        same statement.
+        """
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                f"""
+                WITH written AS (
+                    INSERT INTO messages (id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7)
+                    ON CONFLICT (external_id) DO NOTHING
+                    RETURNING id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                ),
+                {INSERTED_ACTIVITY},
+                {UPDATE_CHAT_ACTIVITY}
+                SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                FROM written
+                """,
+                message_data["id"],
+                message_data["external_id"],
+                message_data["external_timestamp"],
+                message_data["chat_id"],
+                message_data["text"],
+                message_data["sent_by_user_id"],
+                message_data["read"],
+            )
+
+    async def insert_many(self, messages_data: list[dict]) -> list[Record]:
+        """
+        Insert every message with a single INSERT ... SELECT FROM unnest().
+
+        Messages whose external_id is already stored are skipped and left
+        out of the returned rows. Each chat's unread counter and last-message
+        pointer are updated once for the whole batch, in the same statement.
+        """
+        if not messages_data:
+            return []
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                WITH written AS (
+                    INSERT INTO messages (id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read)
+                    SELECT * FROM unnest(
+                        $1::text[], $2::text[], $3::timestamptz[], $4::text[], $5::text[], $6::text[], $7::boolean[]
+                    )
+                    ON CONFLICT (external_id) DO NOTHING
+                    RETURNING id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                ),
+                {INSERTED_ACTIVITY},
+                {UPDATE_CHAT_ACTIVITY}
+                SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                FROM written
+                """,
+                [data["id"] for data in messages_data],
+                [data["external_id"] for data in messages_data],
+                [data["external_timestamp"] for data in messages_data],
+                [data["chat_id"] for data in messages_data],
+                [data["text"] for data in messages_data],
+                [data["sent_by_user_id"] for data in messages_data],
+                [data["read"] for data in messages_data],
+            )
+
+    async def update(self, message_data: dict) -> Record | None:
+        """Update the message; returns None if its id is not stored."""
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                f"""
+                WITH previous AS (
+                    SELECT chat_id, id, external_timestamp, read
+                    FROM messages
+                    WHERE id = $1
+                ),
+                written AS (
+                    UPDATE messages
+                    SET
+                        external_id = $2,
+                        external_timestamp = $3,
+                        chat_id = $4,
+                        text = $5,
+                        sent_by_user_id = $6,
+                        read = $7,
+                        updated_at = $8
+                    WHERE id = $1
+                    RETURNING id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                ),
+                {REWRITTEN_ACTIVITY},
+                {UPDATE_CHAT_ACTIVITY}
+                SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                FROM written
+                """,
+                message_data["id"],
+                message_data["external_id"],
+                message_data["external_timestamp"],
+                message_data["chat_id"],
+                message_data["text"],
+                message_data["sent_by_user_id"],
+                message_data["read"],
+                message_data["updated_at"],
+            )
+
+    async def get_by_id(self, message_id: str) -> Record | None:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                FROM messages
+                WHERE id = $1
+                """,
+                message_id,
+            )
+
+    async def get_by_chat_id(
+        self, chat_id: str, limit: int = 50, before: tuple | None = None
+    ) -> list[Record]:
+        """Return the chat's most recent messages older than ``before``, newest first."""
+        keyset = "AND (external_timestamp, id) < ($3, $4)" if before else ""
+        async with self._connect() as conn:
+            return await conn.fetch(
+                f"""
+                SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                FROM messages
+                WHERE chat_id = $1
+                {keyset}
+                ORDER BY external_timestamp DESC, id DESC
+                LIMIT $2
+                """,
+                chat_id,
+                limit,
+                *(before or ()),
+            )
+
+    async def iter_by_chat_id(
+        self, chat_id: str, prefetch: int | None = None
+    ) -> AsyncIterator[Record]:
+        """
+        Yield every message of the chat, oldest first, from a server-side
+        cursor fetching ``prefetch`` rows (the DAO's itersize by default)
+        per round trip.
+
+        The connection stays checked out until iteration ends.
+        """
+        async with self._connect() as conn, conn.transaction():
+            async for record in conn.cursor(
+                """
+                SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                FROM messages
+                WHERE chat_id = $1
+                ORDER BY external_timestamp, id
+                """,
+                chat_id,
+                prefetch=prefetch or self._itersize,
+            ):
+                yield record
+
+    async def get_by_external_id(self, external_id: str) -> Record | None:
+        async with self._connect() as conn:
+            return await conn.fetchrow(
+                """
+                SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                FROM messages
+                WHERE external_id = $1
+                """,
+                external_id,
+            )
+
+    async def get_all(self) -> list[Record]:
+        async with self._connect() as conn:
+            return await conn.fetch(
+                """
+                SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                FROM messages
+                ORDER BY created_at DESC
+                """
+            )
+
+    async def delete(self, message_id: str) -> None:
+        """
+        Delete a message, taking it out of its chat's unread counter and, if
+        it was the chat's last message, pointing the chat at the one before.
+        """
+        async with self._connect() as conn:
+            await conn.execute(
+                """
+                WITH deleted AS (
+                    DELETE FROM messages
+                    WHERE id = $1
+                    RETURNING id, chat_id, read
+                )
+                UPDATE chats c
+                SET
+                    unread_count = GREATEST(c.unread_count - (NOT d.read)::int, 0),
+                    last_message_id = CASE
+                        WHEN c.last_message_id = d.id THEN newest.id
+                        ELSE c.last_message_id
+                    END,
+                    last_message_at = CASE
+                        WHEN c.last_message_id = d.id THEN newest.external_timestamp
+                        ELSE c.last_message_at
+                    END
+                FROM deleted d
+                LEFT JOIN LATERAL (
+                    SELECT m.id, m.external_timestamp
+                    FROM messages m
+                    WHERE m.chat_id = d.chat_id AND m.id <> d.id
+                    ORDER BY m.external_timestamp DESC, m.id DESC
+                    LIMIT 1
+                ) newest ON TRUE
+                WHERE c.id = d.chat_id
+                """,
+                message_id,
+            )
+
+    async def mark_chat_messages_as_read(self, chat_id: str) -> int:
+        """Mark the chat's unread messages as read and take them off its counter."""
+        async with self._connect() as conn:
+            return await conn.fetchval(
+                """
+                WITH marked AS (
+                    UPDATE messages
+                    SET read = TRUE, updated_at = CURRENT_TIMESTAMP
+                    WHERE chat_id = $1 AND read = FALSE
+                    RETURNING id
+                ),
+                chat_activity AS (
+                    UPDATE chats
+                    SET unread_count = GREATEST(
+                        unread_count - (SELECT COUNT(*) FROM marked), 0
+                    )
+                    WHERE id = $1 AND EXISTS (SELECT 1 FROM marked)
+                )
+                SELECT COUNT(*) FROM marked
+                """,
+                chat_id,
+            )
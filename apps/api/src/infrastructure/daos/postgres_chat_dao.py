@@ -1,17 +1,42 @@
-import psycopg2
+from collections.abc import Iterator
+
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
+from src.infrastructure.database.server_cursors import DEFAULT_ITERSIZE, server_cursor
+
+# Listings are sorted by (created_at DESC, id DESC); the next page starts
+# strictly after the last row of the previous one.
+_KEYSET = "AND (created_at, id) < (%(after_created_at)s, %(after_id)s)"
+
+
+def _page_params(limit: int, after: tuple | None) -> dict:
+    after_created_at, after_id = after or (None, None)
+    return {
+        "limit": limit,
+        "after_created_at": after_created_at,
+        "after_id": after_id,
+    }
+
+
+# Inbox filters, with the same conditions as the dedicated chat listings
+INBOX_FILTERS = {
+    "all": "",
+    "unassigned": "AND attached_user_id IS NULL",
+    "pending": "AND attached_user_id IS NOT NULL AND status != 'closed'",
+    "resolved": "AND status = 'closed'",
+}
 
 
 class PostgresChatDAO:
-    def __init__(self, database_url: str):
-        # Convert SQLAlchemy format to psycopg2 format if needed
-        if database_url.startswith("postgresql+asyncpg://"):
-            database_url = database_url.replace(
-                "postgresql+asyncpg://", "postgresql://"
-            )
-        self.database_url = database_url
+    def __init__(
+        self,
+        connection_pool: PostgresConnectionPool,
+        itersize: int = DEFAULT_ITERSIZE,
+    ):
+        self._connection_pool = connection_pool
+        self._itersize = itersize
 
     def _connect(self):
-        return psycopg2.connect(self.database_url)
+        return self._connection_pool.connection()
 
     def insert(self, chat_data: dict) -> tuple:
         with self._connect() as conn:
@@ -49,6 +74,28 @@ class PostgresChatDAO:
             conn.commit()
             return result
 
+    def upsert(self, chat_data: dict) -> tuple:
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO chats (id, company_id, contact_id, status, attached_user_id)
+                    VALUES (%(id)s, %(company_id)s, %(contact_id)s, %(status)s, %(attached_user_id)s)
+                    ON CONFLICT (id) DO UPDATE
+                    SET
+                        company_id = EXCLUDED.company_id,
+                        contact_id = EXCLUDED.contact_id,
+                        status = EXCLUDED.status,
+                        attached_user_id = EXCLUDED.attached_user_id,
+                        updated_at = %(updated_at)s
+                    RETURNING id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                    """,
+                    chat_data,
+                )
+                result = cursor.fetchone()
+            conn.commit()
+            return result
+
     def get_by_id(self, chat_id: str) -> tuple | None:
         with self._connect() as conn:
             with conn.cursor() as cursor:
@@ -74,20 +121,52 @@ class PostgresChatDAO:
                 )
                 return cursor.fetchall()
 
-    def get_by_company_id(self, company_id: str) -> list[tuple]:
+    def iter_all(self, itersize: int | None = None) -> Iterator[tuple]:
+        """Yield every chat row, in no particular order, from a server-side cursor."""
+        with self._connect() as conn:
+            with server_cursor(conn, itersize or self._itersize) as cursor:
+                cursor.execute(
+                    """
+                    SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                    FROM chats
+                    """,
+                )
+                yield from cursor
+
+    def get_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[tuple]:
         with self._connect() as conn:
             with conn.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
+                    FROM chats
+                    WHERE company_id = %(company_id)s
+                    {_KEYSET if after else ""}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %(limit)s
+                    """,
+                    {"company_id": company_id, **_page_params(limit, after)},
+                )
+                return cursor.fetchall()
+
+    def iter_by_company_id(
+        self, company_id: str, itersize: int | None = None
+    ) -> Iterator[tuple]:
+        """Yield every chat of the company, newest first, from a server-side cursor."""
+        with self._connect() as conn:
+            with server_cursor(conn, itersize or self._itersize) as cursor:
                 cursor.execute(
                     """
                     SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
                     FROM chats
                     WHERE company_id = %s
-                    ORDER BY created_at DESC
+                    ORDER BY created_at DESC, id DESC
                     """,
                     (company_id,),
                 )
-
-                return cursor.fetchall()
+                yield from cursor
 
     def get_company_chat_by_contact_id(
         self, company_id: str, contact_id: str
@@ -112,101 +191,284 @@ class PostgresChatDAO:
                 cursor.execute("DELETE FROM chats WHERE id = %s", (chat_id,))
             conn.commit()
 
-    def get_unassigned_by_company_id(self, company_id: str) -> list[tuple]:
+    def get_unassigned_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[tuple]:
         with self._connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
+                    f"""
                     SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
                     FROM chats
-                    WHERE company_id = %s AND attached_user_id IS NULL
-                    ORDER BY created_at DESC
+                    WHERE company_id = %(company_id)s AND attached_user_id IS NULL
+                    {_KEYSET if after else ""}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %(limit)s
                     """,
-                    (company_id,),
+                    {"company_id": company_id, **_page_params(limit, after)},
                 )
                 return cursor.fetchall()
 
-    def get_pending_by_company_id(self, company_id: str) -> list[tuple]:
+    def get_pending_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[tuple]:
         with self._connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
+                    f"""
                     SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
                     FROM chats
-                    WHERE company_id = %s
+                    WHERE company_id = %(company_id)s
                       AND attached_user_id IS NOT NULL
                       AND status != 'closed'
-                    ORDER BY created_at DESC
+                    {_KEYSET if after else ""}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %(limit)s
                     """,
-                    (company_id,),
+                    {"company_id": company_id, **_page_params(limit, after)},
                 )
                 return cursor.fetchall()
 
-    def get_resolved_by_company_id(self, company_id: str) -> list[tuple]:
+    def get_resolved_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[tuple]:
         with self._connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
+                    f"""
                     SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
                     FROM chats
-                    WHERE company_id = %s AND status = 'closed'
-                    ORDER BY created_at DESC
+                    WHERE company_id = %(company_id)s AND status = 'closed'
+                    {_KEYSET if after else ""}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %(limit)s
                     """,
-                    (company_id,),
+                    {"company_id": company_id, **_page_params(limit, after)},
                 )
                 return cursor.fetchall()
 
-    def get_by_attendant_id(self, company_id: str, attendant_id: str) -> list[tuple]:
+    def get_by_attendant_id(
+        self,
+        company_id: str,
+        attendant_id: str,
+        limit: int = 50,
+        after: tuple | None = None,
+    ) -> list[tuple]:
         with self._connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
+                    f"""
                     SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at
                     FROM chats
-                    WHERE company_id = %s AND attached_user_id = %s
-                    ORDER BY created_at DESC
+                    WHERE company_id = %(company_id)s AND attached_user_id = %(attendant_id)s
+                    {_KEYSET if after else ""}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %(limit)s
                     """,
-                    (company_id, attendant_id),
+                    {
+                        "company_id": company_id,
+                        "attendant_id": attendant_id,
+                        **_page_params(limit, after),
+                    },
                 )
                 return cursor.fetchall()
 
     def search_chats(
-        self, company_id: str, query: str, user_id: str | None = None
+        self,
+        company_id: str,
+        query: str,
+        user_id: str | None = None,
+        limit: int = 50,
+        after: tuple | None = None,
     ) -> list[tuple]:
+        # Search results page on (rank, created_at, id); rank is returned as
+        # the last column so the repository can build the cursor from it.
+        keyset = (
+            """
+            HAVING (MAX(matches.rank), c.created_at, c.id)
+                < (%(after_rank)s::real, %(after_created_at)s, %(after_id)s)
+            """
+            if after
+            else ""
+        )
+        after_rank, after_created_at, after_id = after or (None, None, None)
+
         with self._connect() as conn:
             with conn.cursor() as cursor:
-                # Search in contact name, phone, or message content
-                search_pattern = f"%{query}%"
-                base_query = """
-                    SELECT DISTINCT c.id, c.company_id, c.contact_id, c.status, c.attached_user_id, c.created_at, c.updated_at
-                    FROM chats c
-                    LEFT JOIN contacts ct ON c.contact_id = ct.id
-                    LEFT JOIN messages m ON c.id = m.chat_id
-                    WHERE c.company_id = %s
-                    AND (
-                        ct.name ILIKE %s
-                        OR ct.phone_number ILIKE %s
-                        OR m.text ILIKE %s
-                    )
-                """
-
-                if user_id:
-                    # Filter by user if provided
-                    base_query += " AND c.attached_user_id = %s"
-                    cursor.execute(
-                        base_query + " ORDER BY c.created_at DESC",
-                        (
-                            company_id,
-                            search_pattern,
-                            search_pattern,
-                            search_pattern,
-                            user_id,
-                        ),
-                    )
-                else:
-                    cursor.execute(
-                        base_query + " ORDER BY c.created_at DESC",
-                        (company_id, search_pattern, search_pattern, search_pattern),
+                # Contacts match by trigram (name, phone), messages by full text.
+                # Each side is resolved through its own index and narrowed to
+                # the company before it is ranked and grouped.
+                cursor.execute(
+                    f"""
+                    WITH matches AS (
+                        SELECT c.id AS chat_id,
+                               GREATEST(
+                                   similarity(ct.name, %(query)s),
+                                   similarity(ct.phone_number, %(query)s)
+                               ) AS rank
+                        FROM contacts ct
+                        JOIN chats c ON c.contact_id = ct.id
+                        WHERE ct.company_id = %(company_id)s
+                        AND (ct.name ILIKE %(pattern)s OR ct.phone_number ILIKE %(pattern)s)
+                        UNION ALL
+                        SELECT m.chat_id,
+                               ts_rank(to_tsvector('simple', m.text), plainto_tsquery('simple', %(query)s)) AS rank
+                        FROM messages m
+                        JOIN chats c ON c.id = m.chat_id
+                        WHERE c.company_id = %(company_id)s
+                        AND to_tsvector('simple', m.text) @@ plainto_tsquery('simple', %(query)s)
                     )
+                    SELECT c.id, c.company_id, c.contact_id, c.status, c.attached_user_id, c.created_at, c.updated_at,
+                           MAX(matches.rank) AS rank
+                    FROM matches
+                    JOIN chats c ON c.id = matches.chat_id
+                    WHERE c.company_id = %(company_id)s
+                    AND (%(user_id)s::text IS NULL OR c.attached_user_id = %(user_id)s)
+                    GROUP BY c.id
+                    {keyset}
+                    ORDER BY rank DESC, c.created_at DESC, c.id DESC
+                    LIMIT %(limit)s
+                    """,
+                    {
+                        "company_id": company_id,
+                        "query": query,
+                        "pattern": f"%{query}%",
+                        "user_id": user_id,
+                        "limit": limit,
+                        "after_rank": after_rank,
+                        "after_created_at": after_created_at,
+                        "after_id": after_id,
+                    },
+                )
+                return cursor.fetchall()
+
+    def get_inbox(
+        self,
+        company_id: str,
+        inbox_filter: str = "all",
+        attendant_id: str | None = None,
+        limit: int = 50,
+        after: tuple | None = None,
+    ) -> list[tuple]:
+        """
+        Return a page of chats, most recent activity first, with their contact
+        name and phone, last message text and timestamp, and unread count, in
+        one statement.
 
+        Activity is the last message time, or the creation time for chats
+        without messages. It is returned as the last column for the cursor.
+        Counts and ordering come from the chat row itself; the contact and
+        the last message text are primary key lookups for the page only.
+        """
+        attendant = "AND attached_user_id = %(attendant_id)s" if attendant_id else ""
+        keyset = (
+            """
+            AND (COALESCE(last_message_at, created_at), id)
+                < (%(after_activity_at)s, %(after_id)s)
+            """
+            if after
+            else ""
+        )
+        after_activity_at, after_id = after or (None, None)
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    WITH page AS (
+                        SELECT id, company_id, contact_id, status, attached_user_id, created_at, updated_at,
+                               unread_count, last_message_at, last_message_id,
+                               COALESCE(last_message_at, created_at) AS activity_at
+                        FROM chats
+                        WHERE company_id = %(company_id)s
+                        {INBOX_FILTERS[inbox_filter]}
+                        {attendant}
+                        {keyset}
+                        ORDER BY COALESCE(last_message_at, created_at) DESC, id DESC
+                        LIMIT %(limit)s
+                    )
+                    SELECT p.id, p.company_id, p.contact_id, p.status, p.attached_user_id, p.created_at, p.updated_at,
+                           ct.name, ct.phone_number,
+                           m.text, p.last_message_at,
+                           p.unread_count,
+                           p.activity_at
+                    FROM page p
+                    LEFT JOIN contacts ct ON ct.id = p.contact_id
+                    LEFT JOIN messages m ON m.id = p.last_message_id
+                    ORDER BY p.activity_at DESC, p.id DESC
+                    """,
+                    {
+                        "company_id": company_id,
+                        "attendant_id": attendant_id,
+                        "limit": limit,
+                        "after_activity_at": after_activity_at,
+                        "after_id": after_id,
+                    },
+                )
                 return cursor.fetchall()
+
+    def repair_activity(
+        self, after_id: str | None = None, batch_size: int = 500
+    ) -> tuple[str | None, int]:
+        """
+        Recompute unread_count, last_message_at and last_message_id from the
+        messages for the next ``batch_size`` chats (by id) after ``after_id``.
+
+        The batch is locked first, so messages written meanwhile wait and are
+        counted on top of the recomputed values. Returns the last chat id of
+        the batch (None when there are no chats left) and how many chats had
+        drifted and were fixed.
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT id
+                    FROM chats
+                    WHERE %(after_id)s::text IS NULL OR id > %(after_id)s
+                    ORDER BY id
+                    LIMIT %(batch_size)s
+                    FOR UPDATE
+                    """,
+                    {"after_id": after_id, "batch_size": batch_size},
+                )
+                chat_ids = [row[0] for row in cursor.fetchall()]
+                if not chat_ids:
+                    conn.commit()
+                    return None, 0
+
+                cursor.execute(
+                    """
+                    UPDATE chats c
+                    SET
+                        unread_count = actual.unread_count,
+                        last_message_id = actual.last_message_id,
+                        last_message_at = actual.last_message_at
+                    FROM (
+                        SELECT batch.id,
+                               unread.count AS unread_count,
+                               newest.id AS last_message_id,
+                               newest.external_timestamp AS last_message_at
+                        FROM unnest(%(chat_ids)s::text[]) AS batch(id)
+                        CROSS JOIN LATERAL (
+                            SELECT COUNT(*) AS count
+                            FROM messages m
+                            WHERE m.chat_id = batch.id AND m.read = FALSE
+                        ) unread
+                        LEFT JOIN LATERAL (
+                            SELECT m.id, m.external_timestamp
+                            FROM messages m
+                            WHERE m.chat_id = batch.id
+                            ORDER BY m.external_timestamp DESC, m.id DESC
+                            LIMIT 1
+                        ) newest ON TRUE
+                    ) actual
+                    WHERE c.id = actual.id
+                      AND (c.unread_count, c.last_message_id, c.last_message_at)
+                          IS DISTINCT FROM
+                          (actual.unread_count, actual.last_message_id, actual.last_message_at)
+                    """,
+                    {"chat_ids": chat_ids},
+                )
+                repaired = cursor.rowcount
+            conn.commit()
+        return chat_ids[-1], repaired
@@ -1,17 +1,20 @@
-import psycopg2
+from collections.abc import Iterator
+
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
+from src.infrastructure.database.server_cursors import DEFAULT_ITERSIZE, server_cursor
 
 
 class PostgresCompanyDAO:
-    def __init__(self, database_url: str):
-        # Convert SQLAlchemy format to psycopg2 format if needed
-        if database_url.startswith("postgresql+asyncpg://"):
-            database_url = database_url.replace(
-                "postgresql+asyncpg://", "postgresql://"
-            )
-        self.database_url = database_url
+    def __init__(
+        self,
+        connection_pool: PostgresConnectionPool,
+        itersize: int = DEFAULT_ITERSIZE,
+    ):
+        self._connection_pool = connection_pool
+        self._itersize = itersize
 
     def _connect(self):
-        return psycopg2.connect(self.database_url)
+        return self._connection_pool.connection()
 
     def insert(self, company_data: dict) -> tuple:
         with self._connect() as conn:
@@ -54,6 +57,31 @@ class PostgresCompanyDAO:
             conn.commit()
             return result
 
+    def upsert(self, company_data: dict) -> tuple:
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO companies (id, name, email, phone, is_active, attendant_sees_all_conversations, whatsapp_api_key)
+                    VALUES (%(id)s, %(name)s, %(email)s, %(phone)s, %(is_active)s, %(attendant_sees_all_conversations)s, %(whatsapp_api_key)s)
+                    ON CONFLICT (id) DO UPDATE
+                    SET
+                        name = EXCLUDED.name,
+                        email = EXCLUDED.email,
+                        phone = EXCLUDED.phone,
+                        is_active = EXCLUDED.is_active,
+                        attendant_sees_all_conversations = EXCLUDED.attendant_sees_all_conversations,
+                        whatsapp_api_key = EXCLUDED.whatsapp_api_key,
+                        updated_at = %(updated_at)s
+                    RETURNING id, name, created_at, updated_at, email, phone, is_active,
+                              attendant_sees_all_conversations, whatsapp_api_key
+                    """,
+                    company_data,
+                )
+                result = cursor.fetchone()
+            conn.commit()
+            return result
+
     def get_by_id(self, company_id: str) -> tuple:
         with self._connect() as conn:
             with conn.cursor() as cursor:
@@ -93,6 +121,18 @@ class PostgresCompanyDAO:
                                   """)
                 return cursor.fetchall()
 
+    def iter_all(self, itersize: int | None = None) -> Iterator[tuple]:
+        """Yield every company row, in no particular order, from a server-side cursor."""
+        with self._connect() as conn:
+            with server_cursor(conn, itersize or self._itersize) as cursor:
+                cursor.execute(
+                    """
+                    SELECT id, name, created_at, updated_at, email, phone, is_active, attendant_sees_all_conversations, whatsapp_api_key
+                    FROM companies
+                    """,
+                )
+                yield from cursor
+
     def delete(self, company_id: str) -> None:
         with self._connect() as conn:
             with conn.cursor() as cursor:
@@ -1,17 +1,20 @@
-import psycopg2
+from collections.abc import Iterator
+
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
+from src.infrastructure.database.server_cursors import DEFAULT_ITERSIZE, server_cursor
 
 
 class PostgresContactDAO:
-    def __init__(self, database_url: str):
-        # Convert SQLAlchemy format to psycopg2 format if needed
-        if database_url.startswith("postgresql+asyncpg://"):
-            database_url = database_url.replace(
-                "postgresql+asyncpg://", "postgresql://"
-            )
-        self.database_url = database_url
+    def __init__(
+        self,
+        connection_pool: PostgresConnectionPool,
+        itersize: int = DEFAULT_ITERSIZE,
+    ):
+        self._connection_pool = connection_pool
+        self._itersize = itersize
 
     def _connect(self):
-        return psycopg2.connect(self.database_url)
+        return self._connection_pool.connection()
 
     def insert(self, contact_data: dict) -> tuple:
         with self._connect() as conn:
@@ -55,6 +58,32 @@ class PostgresContactDAO:
             conn.commit()
             return result
 
+    def upsert(self, contact_data: dict) -> tuple:
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO contacts (id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at)
+                    VALUES (%(id)s, %(name)s, %(phone_number)s, %(email)s, %(company_id)s, %(is_blocked)s, %(tags)s, %(notes)s, %(last_contact_at)s)
+                    ON CONFLICT (id) DO UPDATE
+                    SET
+                        name = EXCLUDED.name,
+                        phone_number = EXCLUDED.phone_number,
+                        email = EXCLUDED.email,
+                        company_id = EXCLUDED.company_id,
+                        is_blocked = EXCLUDED.is_blocked,
+                        tags = EXCLUDED.tags,
+                        notes = EXCLUDED.notes,
+                        last_contact_at = EXCLUDED.last_contact_at,
+                        updated_at = %(updated_at)s
+                    RETURNING id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                    """,
+                    contact_data,
+                )
+                result = cursor.fetchone()
+            conn.commit()
+            return result
+
     def get_by_id(self, contact_id: str) -> tuple | None:
         with self._connect() as conn:
             with conn.cursor() as cursor:
@@ -78,19 +107,47 @@ class PostgresContactDAO:
                 )
                 return cursor.fetchone()
 
-    def get_by_company_id(self, company_id: str) -> list[tuple]:
+    def get_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[tuple]:
+        after_name, after_id = after or (None, None)
+        keyset = "AND (name, id) > (%(after_name)s, %(after_id)s)" if after else ""
         with self._connect() as conn:
             with conn.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
+                    FROM contacts
+                    WHERE company_id = %(company_id)s
+                    {keyset}
+                    ORDER BY name ASC, id ASC
+                    LIMIT %(limit)s
+                    """,
+                    {
+                        "company_id": company_id,
+                        "limit": limit,
+                        "after_name": after_name,
+                        "after_id": after_id,
+                    },
+                )
+                return cursor.fetchall()
+
+    def iter_by_company_id(
+        self, company_id: str, itersize: int | None = None
+    ) -> Iterator[tuple]:
+        """Yield every contact of the company, by name, from a server-side cursor."""
+        with self._connect() as conn:
+            with server_cursor(conn, itersize or self._itersize) as cursor:
                 cursor.execute(
                     """
                     SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
                     FROM contacts
                     WHERE company_id = %s
-                    ORDER BY name ASC
+                    ORDER BY name ASC, id ASC
                     """,
                     (company_id,),
                 )
-                return cursor.fetchall()
+                yield from cursor
 
     def get_by_phone_number(self, phone_number: str) -> tuple | None:
         with self._connect() as conn:
@@ -146,18 +203,66 @@ class PostgresContactDAO:
                 )
                 return cursor.fetchall()
 
-    def search_contacts(self, company_id: str, query: str) -> list[tuple]:
+    def iter_all(self, itersize: int | None = None) -> Iterator[tuple]:
+        """Yield every contact row, in no particular order, from a server-side cursor."""
         with self._connect() as conn:
-            with conn.cursor() as cursor:
-                lower_query = f"%{query.lower()}%"
+            with server_cursor(conn, itersize or self._itersize) as cursor:
                 cursor.execute(
                     """
                     SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at
                     FROM contacts
-                    WHERE company_id = %s AND (LOWER(name) LIKE %s OR phone_number LIKE %s OR LOWER(email) LIKE %s)
-                    ORDER BY name ASC
                     """,
-                    (company_id, lower_query, f"%{query}%", lower_query),
+                )
+                yield from cursor
+
+    def search_contacts(
+        self,
+        company_id: str,
+        query: str,
+        limit: int = 50,
+        after: tuple | None = None,
+    ) -> list[tuple]:
+        # Results page on (rank DESC, name ASC, id ASC); rank is returned as
+        # the last column so the repository can build the cursor from it.
+        after_rank, after_name, after_id = after or (None, None, None)
+        keyset = (
+            """
+            WHERE rank < %(after_rank)s::real
+            OR (rank = %(after_rank)s::real AND (name, id) > (%(after_name)s, %(after_id)s))
+            """
+            if after
+            else ""
+        )
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                # ILIKE with a leading wildcard is served by the trigram indexes
+                cursor.execute(
+                    f"""
+                    SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at, rank
+                    FROM (
+                        SELECT id, name, phone_number, email, company_id, is_blocked, tags, notes, last_contact_at, created_at, updated_at,
+                               GREATEST(
+                                   similarity(name, %(query)s),
+                                   similarity(phone_number, %(query)s),
+                                   similarity(COALESCE(email, ''), %(query)s)
+                               ) AS rank
+                        FROM contacts
+                        WHERE company_id = %(company_id)s
+                        AND (name ILIKE %(pattern)s OR phone_number ILIKE %(pattern)s OR email ILIKE %(pattern)s)
+                    ) ranked
+                    {keyset}
+                    ORDER BY rank DESC, name ASC, id ASC
+                    LIMIT %(limit)s
+                    """,
+                    {
+                        "company_id": company_id,
+                        "query": query,
+                        "pattern": f"%{query}%",
+                        "limit": limit,
+                        "after_rank": after_rank,
+                        "after_name": after_name,
+                        "after_id": after_id,
+                    },
                 )
                 return cursor.fetchall()
 
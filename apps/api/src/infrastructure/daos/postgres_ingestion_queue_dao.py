@@ -0,0 +1,119 @@
+from psycopg2.extras import Json
+
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
+
+
+class PostgresIngestionQueueDAO:
+    def __init__(self, connection_pool: PostgresConnectionPool):
+        self._connection_pool = connection_pool
+
+    def _connect(self):
+        return self._connection_pool.connection()
+
+    def insert(self, job_data: dict) -> tuple:
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO ingestion_jobs (id, payload, attempts, available_at, last_error, created_at)
+                    VALUES (%(id)s, %(payload)s, %(attempts)s, %(available_at)s, %(last_error)s, %(created_at)s)
+                    RETURNING id, payload, attempts, available_at, last_error, created_at, updated_at
+                    """,
+                    {**job_data, "payload": Json(job_data["payload"])},
+                )
+                result = cursor.fetchone()
+            conn.commit()
+            return result
+
+    def claim(self, limit: int, lease_seconds: float) -> list[tuple]:
+        """
+        Lease up to ``limit`` due jobs by pushing their available_at forward.
+
+        SKIP LOCKED lets concurrent workers claim disjoint batches without
+        waiting on each other.
+        """
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE ingestion_jobs
+                    SET
+                        available_at = CURRENT_TIMESTAMP + make_interval(secs => %(lease_seconds)s),
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id IN (
+                        SELECT id
+                        FROM ingestion_jobs
+                        WHERE available_at <= CURRENT_TIMESTAMP
+                        ORDER BY available_at, id
+                        LIMIT %(limit)s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    RETURNING id, payload, attempts, available_at, last_error, created_at, updated_at
+                    """,
+                    {"limit": limit, "lease_seconds": lease_seconds},
+                )
+                result = cursor.fetchall()
+            conn.commit()
+            return result
+
+    def delete_many(self, job_ids: list[str]) -> None:
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "DELETE FROM ingestion_jobs WHERE id = ANY(%s)", (list(job_ids),)
+                )
+            conn.commit()
+
+    def update(self, job_data: dict) -> None:
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    UPDATE ingestion_jobs
+                    SET
+                        attempts = %(attempts)s,
+                        available_at = %(available_at)s,
+                        last_error = %(last_error)s,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE id = %(id)s
+                    """,
+                    job_data,
+                )
+            conn.commit()
+
+    def move_to_dead_letters(self, job_data: dict) -> None:
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    WITH moved AS (
+                        DELETE FROM ingestion_jobs
+                        WHERE id = %(id)s
+                        RETURNING id, payload, created_at
+                    )
+                    INSERT INTO ingestion_dead_letters (id, payload, attempts, last_error, created_at)
+                    SELECT id, payload, %(attempts)s, %(last_error)s, created_at
+                    FROM moved
+                    ON CONFLICT (id) DO NOTHING
+                    """,
+                    job_data,
+                )
+            conn.commit()
+
+    def stats(self) -> tuple:
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    SELECT
+                        (SELECT COUNT(*) FROM ingestion_jobs),
+                        (SELECT COUNT(*) FROM ingestion_dead_letters),
+                        (
+                            SELECT COALESCE(
+                                EXTRACT(EPOCH FROM CURRENT_TIMESTAMP - MIN(created_at)), 0
+                            )
+                            FROM ingestion_jobs
+                        )
+                    """
+                )
+                return cursor.fetchone()
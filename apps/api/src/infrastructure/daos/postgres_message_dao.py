@@ -1,26 +1,90 @@
-import psycopg2
+from collections.abc import Iterator
+
+from psycopg2.extras import execute_values
+
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
+from src.infrastructure.database.server_cursors import DEFAULT_ITERSIZE, server_cursor
+
+# What a write did to its chats, one row per message: unread is +1 for every
+# unread message written and -1 for every unread one it replaced (``previous``).
+INSERTED_ACTIVITY = """
+    activity AS (
+        SELECT chat_id, id, external_timestamp, (NOT read)::int AS unread
+        FROM written
+    )
+"""
+REWRITTEN_ACTIVITY = """
+    activity AS (
+        SELECT chat_id, id, external_timestamp, (NOT read)::int AS unread
+        FROM written
+        UNION ALL
+        SELECT chat_id, id, external_timestamp, -(NOT read)::int
+        FROM previous
+    )
+"""
+
+# Folds the activity rows into chats.unread_count and moves last_message_* to
+# the newest message when it is newer than the current one. It is part of the
+# writing statement, so the counters commit or roll back with the messages.
+# Concurrent writers serialize on the chat row and each adds its own delta.
+UPDATE_CHAT_ACTIVITY = """
+    chat_activity AS (
+        UPDATE chats c
+        SET
+            unread_count = GREATEST(c.unread_count + latest.unread, 0),
+            last_message_id = CASE
+                WHEN c.last_message_at IS NULL
+                  OR (latest.external_timestamp, latest.id)
+                     > (c.last_message_at, c.last_message_id)
+                THEN latest.id
+                ELSE c.last_message_id
+            END,
+            last_message_at = GREATEST(c.last_message_at, latest.external_timestamp)
+        FROM (
+            SELECT DISTINCT ON (chat_id)
+                   chat_id, id, external_timestamp,
+                   SUM(unread) OVER (PARTITION BY chat_id) AS unread
+            FROM activity
+            ORDER BY chat_id, external_timestamp DESC, id DESC
+        ) latest
+        WHERE c.id = latest.chat_id
+    )
+"""
 
 
 class PostgresMessageDAO:
-    def __init__(self, database_url: str):
-        # Convert SQLAlchemy format to psycopg2 format if needed
-        if database_url.startswith("postgresql+asyncpg://"):
-            database_url = database_url.replace(
-                "postgresql+asyncpg://", "postgresql://"
-            )
-        self.database_url = database_url
+    def __init__(
+        self,
+        connection_pool: PostgresConnectionPool,
+        itersize: int = DEFAULT_ITERSIZE,
+    ):
+        self._connection_pool = connection_pool
+        self._itersize = itersize
 
     def _connect(self):
-        return psycopg2.connect(self.database_url)
+        return self._connection_pool.connection()
+
+    def insert(self, message_data: dict) -> tuple | None:
+        """
+        Insert a message; returns None if its external_id is already stored.
 
-    def insert(self, message_data: dict) -> tuple:
+        The chat's unread counter and last-message pointer are updated by the
+        same statement.
+        """
         with self._connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
-                    INSERT INTO messages (id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read)
-                    VALUES (%(id)s, %(external_id)s, %(external_timestamp)s, %(chat_id)s, %(text)s, %(sent_by_user_id)s, %(read)s)
-                    RETURNING id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    f"""
+                    WITH written AS (
+                        INSERT INTO messages (id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read)
+                        VALUES (%(id)s, %(external_id)s, %(external_timestamp)s, %(chat_id)s, %(text)s, %(sent_by_user_id)s, %(read)s)
+                        ON CONFLICT (external_id) DO NOTHING
+                        RETURNING id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    ),
+                    {INSERTED_ACTIVITY},
+                    {UPDATE_CHAT_ACTIVITY}
+                    SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    FROM written
                     """,
                     message_data,
                 )
@@ -28,22 +92,69 @@ class PostgresMessageDAO:
             conn.commit()
             return result
 
-    def update(self, message_data: dict) -> tuple:
+    def insert_many(self, messages_data: list[dict]) -> list[tuple]:
+        """
+        Insert every message with a single multi-row INSERT statement.
+
+        Messages whose external_id is already stored are skipped and left
+        out of the returned rows. Each chat's unread counter and last-message
+        pointer are updated once for the whole batch, in the same statement.
+        """
+        if not messages_data:
+            return []
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                result = execute_values(
+                    cursor,
+                    f"""
+                    WITH written AS (
+                        INSERT INTO messages (id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read)
+                        VALUES %s
+                        ON CONFLICT (external_id) DO NOTHING
+                        RETURNING id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    ),
+                    {INSERTED_ACTIVITY},
+                    {UPDATE_CHAT_ACTIVITY}
+                    SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    FROM written
+                    """,
+                    messages_data,
+                    template="(%(id)s, %(external_id)s, %(external_timestamp)s, %(chat_id)s, %(text)s, %(sent_by_user_id)s, %(read)s)",
+                    # One page keeps it to one statement and one round trip
+                    page_size=len(messages_data),
+                    fetch=True,
+                )
+            conn.commit()
+            return result
+
+    def update(self, message_data: dict) -> tuple | None:
+        """Update the message; returns None if its id is not stored."""
         with self._connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
-                    UPDATE messages
-                    SET
-                        external_id = %(external_id)s,
-                        external_timestamp = %(external_timestamp)s,
-                        chat_id = %(chat_id)s,
-                        text = %(text)s,
-                        sent_by_user_id = %(sent_by_user_id)s,
-                        read = %(read)s,
-                        updated_at = %(updated_at)s
-                    WHERE id = %(id)s
-                    RETURNING id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    f"""
+                    WITH previous AS (
+                        SELECT chat_id, id, external_timestamp, read
+                        FROM messages
+                        WHERE id = %(id)s
+                    ),
+                    written AS (
+                        UPDATE messages
+                        SET
+                            external_id = %(external_id)s,
+                            external_timestamp = %(external_timestamp)s,
+                            chat_id = %(chat_id)s,
+                            text = %(text)s,
+                            sent_by_user_id = %(sent_by_user_id)s,
+                            read = %(read)s,
+                            updated_at = %(updated_at)s
+                        WHERE id = %(id)s
+                        RETURNING id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    ),
+                    {REWRITTEN_ACTIVITY},
+                    {UPDATE_CHAT_ACTIVITY}
+                    SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    FROM written
                     """,
                     message_data,
                 )
@@ -64,19 +175,57 @@ class PostgresMessageDAO:
                 )
                 return cursor.fetchone()
 
-    def get_by_chat_id(self, chat_id: str) -> list[tuple]:
+    def get_by_chat_id(
+        self, chat_id: str, limit: int = 50, before: tuple | None = None
+    ) -> list[tuple]:
+        """
+        Return the chat's most recent messages, newest first.
+
+        ``before`` is the (external_timestamp, id) of the oldest message the
+        client already has; only older messages are returned.
+        """
+        before_timestamp, before_id = before or (None, None)
+        keyset = (
+            "AND (external_timestamp, id) < (%(before_timestamp)s, %(before_id)s)"
+            if before
+            else ""
+        )
         with self._connect() as conn:
             with conn.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    FROM messages
+                    WHERE chat_id = %(chat_id)s
+                    {keyset}
+                    ORDER BY external_timestamp DESC, id DESC
+                    LIMIT %(limit)s
+                    """,
+                    {
+                        "chat_id": chat_id,
+                        "limit": limit,
+                        "before_timestamp": before_timestamp,
+                        "before_id": before_id,
+                    },
+                )
+                return cursor.fetchall()
+
+    def iter_by_chat_id(
+        self, chat_id: str, itersize: int | None = None
+    ) -> Iterator[tuple]:
+        """Yield every message of the chat, oldest first, from a server-side cursor."""
+        with self._connect() as conn:
+            with server_cursor(conn, itersize or self._itersize) as cursor:
                 cursor.execute(
                     """
                     SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
                     FROM messages
                     WHERE chat_id = %s
-                    ORDER BY external_timestamp ASC
+                    ORDER BY external_timestamp, id
                     """,
                     (chat_id,),
                 )
-                return cursor.fetchall()
+                yield from cursor
 
     def get_by_external_id(self, external_id: str) -> tuple | None:
         with self._connect() as conn:
@@ -103,23 +252,80 @@ class PostgresMessageDAO:
                 )
                 return cursor.fetchall()
 
+    def iter_all(self, itersize: int | None = None) -> Iterator[tuple]:
+        """Yield every message row, in no particular order, from a server-side cursor."""
+        with self._connect() as conn:
+            with server_cursor(conn, itersize or self._itersize) as cursor:
+                cursor.execute(
+                    """
+                    SELECT id, external_id, external_timestamp, chat_id, text, sent_by_user_id, read, created_at, updated_at
+                    FROM messages
+                    """,
+                )
+                yield from cursor
+
     def delete(self, message_id: str) -> None:
+        """
+        Delete a message, taking it out of its chat's unread counter and, if
+        it was the chat's last message, pointing the chat at the one before.
+        """
         with self._connect() as conn:
             with conn.cursor() as cursor:
-                cursor.execute("DELETE FROM messages WHERE id = %s", (message_id,))
+                cursor.execute(
+                    """
+                    WITH deleted AS (
+                        DELETE FROM messages
+                        WHERE id = %s
+                        RETURNING id, chat_id, read
+                    )
+                    UPDATE chats c
+                    SET
+                        unread_count = GREATEST(c.unread_count - (NOT d.read)::int, 0),
+                        last_message_id = CASE
+                            WHEN c.last_message_id = d.id THEN newest.id
+                            ELSE c.last_message_id
+                        END,
+                        last_message_at = CASE
+                            WHEN c.last_message_id = d.id THEN newest.external_timestamp
+                            ELSE c.last_message_at
+                        END
+                    FROM deleted d
+                    LEFT JOIN LATERAL (
+                        SELECT m.id, m.external_timestamp
+                        FROM messages m
+                        WHERE m.chat_id = d.chat_id AND m.id <> d.id
+                        ORDER BY m.external_timestamp DESC, m.id DESC
+                        LIMIT 1
+                    ) newest ON TRUE
+                    WHERE c.id = d.chat_id
+                    """,
+                    (message_id,),
+                )
             conn.commit()
 
     def mark_chat_messages_as_read(self, chat_id: str) -> int:
+        """Mark the chat's unread messages as read and take them off its counter."""
         with self._connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
                     """
-                    UPDATE messages
-                    SET read = TRUE, updated_at = CURRENT_TIMESTAMP
-                    WHERE chat_id = %s AND read = FALSE
+                    WITH marked AS (
+                        UPDATE messages
+                        SET read = TRUE, updated_at = CURRENT_TIMESTAMP
+                        WHERE chat_id = %(chat_id)s AND read = FALSE
+                        RETURNING id
+                    ),
+                    chat_activity AS (
+                        UPDATE chats
+                        SET unread_count = GREATEST(
+                            unread_count - (SELECT COUNT(*) FROM marked), 0
+                        )
+                        WHERE id = %(chat_id)s AND EXISTS (SELECT 1 FROM marked)
+                    )
+                    SELECT COUNT(*) FROM marked
                     """,
-                    (chat_id,),
+                    {"chat_id": chat_id},
                 )
-                updated_count = cursor.rowcount
+                updated_count = cursor.fetchone()[0]
             conn.commit()
         return updated_count
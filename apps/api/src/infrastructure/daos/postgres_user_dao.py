@@ -1,17 +1,33 @@
-import psycopg2
+from collections.abc import Iterator
+
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
+from src.infrastructure.database.server_cursors import DEFAULT_ITERSIZE, server_cursor
+
+# Listings are sorted by (created_at DESC, id DESC); the next page starts
+# strictly after the last row of the previous one.
+_KEYSET = "AND (created_at, id) < (%(after_created_at)s, %(after_id)s)"
+
+
+def _page_params(limit: int, after: tuple | None) -> dict:
+    after_created_at, after_id = after or (None, None)
+    return {
+        "limit": limit,
+        "after_created_at": after_created_at,
+        "after_id": after_id,
+    }
 
 
 class PostgresUserDAO:
-    def __init__(self, database_url: str):
-        # Convert SQLAlchemy format to psycopg2 format if needed
-        if database_url.startswith("postgresql+asyncpg://"):
-            database_url = database_url.replace(
-                "postgresql+asyncpg://", "postgresql://"
-            )
-        self.database_url = database_url
+    def __init__(
+        self,
+        connection_pool: PostgresConnectionPool,
+        itersize: int = DEFAULT_ITERSIZE,
+    ):
+        self._connection_pool = connection_pool
+        self._itersize = itersize
 
     def _connect(self):
-        return psycopg2.connect(self.database_url)
+        return self._connection_pool.connection()
 
     def insert(self, user_data: dict) -> tuple:
         with self._connect() as conn:
@@ -64,6 +80,30 @@ class PostgresUserDAO:
                 )
             conn.commit()
 
+    def upsert(self, user_data: dict) -> tuple:
+        """Insert or update a user. The password hash is only written on insert."""
+        with self._connect() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    """
+                    INSERT INTO users (id, name, email, type, password_hash, company_id, is_active)
+                    VALUES (%(id)s, %(name)s, %(email)s, %(type)s, %(password_hash)s, %(company_id)s, %(is_active)s)
+                    ON CONFLICT (id) DO UPDATE
+                    SET
+                        name = EXCLUDED.name,
+                        email = EXCLUDED.email,
+                        type = EXCLUDED.type,
+                        company_id = EXCLUDED.company_id,
+                        is_active = EXCLUDED.is_active,
+                        updated_at = %(updated_at)s
+                    RETURNING id, name, email, type, company_id, is_active, created_at, updated_at
+                    """,
+                    user_data,
+                )
+                result = cursor.fetchone()
+            conn.commit()
+            return result
+
     def get_by_id(self, user_id: str) -> tuple:
         with self._connect() as conn:
             with conn.cursor() as cursor:
@@ -87,6 +127,18 @@ class PostgresUserDAO:
                 """)
                 return cursor.fetchall()
 
+    def iter_all(self, itersize: int | None = None) -> Iterator[tuple]:
+        """Yield every user row, in no particular order, from a server-side cursor."""
+        with self._connect() as conn:
+            with server_cursor(conn, itersize or self._itersize) as cursor:
+                cursor.execute(
+                    """
+                    SELECT id, name, email, type, company_id, is_active, created_at, updated_at
+                    FROM users
+                    """,
+                )
+                yield from cursor
+
     def get_by_email(self, email: str) -> tuple:
         with self._connect() as conn:
             with conn.cursor() as cursor:
@@ -106,57 +158,116 @@ class PostgresUserDAO:
                 cursor.execute("DELETE FROM users WHERE id = %s", (user_id,))
             conn.commit()
 
-    def get_by_company_id(self, company_id: str) -> list[tuple]:
+    def get_by_company_id(
+        self, company_id: str, limit: int = 50, after: tuple | None = None
+    ) -> list[tuple]:
         with self._connect() as conn:
             with conn.cursor() as cursor:
+                cursor.execute(
+                    f"""
+                    SELECT id, name, email, type, company_id, is_active, created_at, updated_at
+                    FROM users
+                    WHERE company_id = %(company_id)s
+                    {_KEYSET if after else ""}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %(limit)s
+                    """,
+                    {"company_id": company_id, **_page_params(limit, after)},
+                )
+                return cursor.fetchall()
+
+    def iter_by_company_id(
+        self, company_id: str, itersize: int | None = None
+    ) -> Iterator[tuple]:
+        """Yield every user of the company, newest first, from a server-side cursor."""
+        with self._connect() as conn:
+            with server_cursor(conn, itersize or self._itersize) as cursor:
                 cursor.execute(
                     """
                     SELECT id, name, email, type, company_id, is_active, created_at, updated_at
                     FROM users
                     WHERE company_id = %s
-                    ORDER BY created_at DESC
+                    ORDER BY created_at DESC, id DESC
                     """,
                     (company_id,),
                 )
-                return cursor.fetchall()
+                yield from cursor
 
-    def get_by_company_and_role(self, company_id: str, role: str) -> list[tuple]:
+    def get_by_company_and_role(
+        self,
+        company_id: str,
+        role: str,
+        limit: int = 50,
+        after: tuple | None = None,
+    ) -> list[tuple]:
         with self._connect() as conn:
             with conn.cursor() as cursor:
                 cursor.execute(
-                    """
+                    f"""
                     SELECT id, name, email, type, company_id, is_active, created_at, updated_at
                     FROM users
-                    WHERE company_id = %s AND type = %s
-                    ORDER BY created_at DESC
+                    WHERE company_id = %(company_id)s AND type = %(role)s
+                    {_KEYSET if after else ""}
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %(limit)s
                     """,
-                    (company_id, role),
+                    {
+                        "company_id": company_id,
+                        "role": role,
+                        **_page_params(limit, after),
+                    },
                 )
                 return cursor.fetchall()
 
     def search_users(
-        self, company_id: str, query: str, role: str | None = None
+        self,
+        company_id: str,
+        query: str,
+        role: str | None = None,
+        limit: int = 50,
+        after: tuple | None = None,
     ) -> list[tuple]:
+        # Results page on (rank, created_at, id); rank is returned as the last
+        # column so the repository can build the cursor from it.
+        after_rank, after_created_at, after_id = after or (None, None, None)
+        keyset = (
+            """
+            WHERE (rank, created_at, id)
+                < (%(after_rank)s::real, %(after_created_at)s, %(after_id)s)
+            """
+            if after
+            else ""
+        )
         with self._connect() as conn:
             with conn.cursor() as cursor:
-                search_pattern = f"%{query}%"
-                base_query = """
-                    SELECT id, name, email, type, company_id, is_active, created_at, updated_at
-                    FROM users
-                    WHERE company_id = %s
-                    AND (name ILIKE %s OR email ILIKE %s)
-                """
-
-                if role:
-                    base_query += " AND type = %s"
-                    cursor.execute(
-                        base_query + " ORDER BY created_at DESC",
-                        (company_id, search_pattern, search_pattern, role),
-                    )
-                else:
-                    cursor.execute(
-                        base_query + " ORDER BY created_at DESC",
-                        (company_id, search_pattern, search_pattern),
-                    )
-
+                # ILIKE with a leading wildcard is served by the trigram indexes
+                cursor.execute(
+                    f"""
+                    SELECT id, name, email, type, company_id, is_active, created_at, updated_at, rank
+                    FROM (
+                        SELECT id, name, email, type, company_id, is_active, created_at, updated_at,
+                               GREATEST(
+                                   similarity(name, %(query)s),
+                                   similarity(email, %(query)s)
+                               ) AS rank
+                        FROM users
+                        WHERE company_id = %(company_id)s
+                        AND (name ILIKE %(pattern)s OR email ILIKE %(pattern)s)
+                        AND (%(role)s::text IS NULL OR type = %(role)s)
+                    ) ranked
+                    {keyset}
+                    ORDER BY rank DESC, created_at DESC, id DESC
+                    LIMIT %(limit)s
+                    """,
+                    {
+                        "company_id": company_id,
+                        "query": query,
+                        "pattern": f"%{query}%",
+                        "role": role,
+                        "limit": limit,
+                        "after_rank": after_rank,
+                        "after_created_at": after_created_at,
+                        "after_id": after_id,
+                    },
+                )
                 return cursor.fetchall()
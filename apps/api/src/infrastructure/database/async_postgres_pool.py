@@ -0,0 +1,171 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+
+import asyncpg
+
+from src.infrastructure.database.postgres_pool import (
+    PoolClosedError,
+    PoolStats,
+    PoolTimeoutError,
+)
+
+
+class AsyncPostgresConnectionPool:
+    """
+    asyncpg connection pool shared by all async Postgres DAOs.
+
+    The underlying asyncpg pool is created on first checkout because it must
+    be bound to the running event loop, which does not exist yet when the
+    app factory builds the repositories.
+
+    Like the sync pool, connections older than ``max_lifetime`` seconds are
+    closed when they are returned and replaced on the next checkout, busy
+    or not; asyncpg's own ``max_inactive_connection_lifetime`` only closes
+    connections left idle that long.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_lifetime: float = 1800.0,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(
+                f"Invalid pool sizes: min_size={min_size}, max_size={max_size}"
+            )
+
+        # asyncpg expects a plain postgresql:// DSN
+        if database_url.startswith("postgresql+asyncpg://"):
+            database_url = database_url.replace(
+                "postgresql+asyncpg://", "postgresql://"
+            )
+        self.database_url = database_url
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+
+        self._pool: asyncpg.Pool | None = None
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._recycled = 0
+        # Backend pid -> when the connection was opened
+        self._opened_at: dict[int, float] = {}
+        self._closed = False
+        self._bound: ContextVar[asyncpg.Connection | None] = ContextVar(
+            f"async_postgres_pool_bound_{id(self)}", default=None
+        )
+
+    async def _get_pool(self) -> asyncpg.Pool:
+        if self._closed:
+            raise PoolClosedError
+        if self._pool is None:
+            async with self._lock:
+                if self._pool is None:
+                    self._pool = await asyncpg.create_pool(
+                        dsn=self.database_url,
+                        min_size=self.min_size,
+                        max_size=self.max_size,
+                        max_inactive_connection_lifetime=self.max_lifetime,
+                        init=self._opened,
+                    )
+        return self._pool
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """
+        Check out a connection for the duration of an ``async with`` block.
+
+        When a unit of work is bound to the current context its connection
+        is yielded instead.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted past the timeout
+            PoolClosedError: If the pool has been closed
+        """
+        bound = self._bound.get()
+        if bound is not None:
+            yield bound
+            return
+
+        pool = await self._get_pool()
+
+        self._waiting += 1
+        try:
+            conn = await pool.acquire(timeout=self.timeout)
+        except TimeoutError:
+            self._timeouts += 1
+            raise PoolTimeoutError(
+                f"No connection available after {self.timeout}s "
+                f"(max_size={self.max_size})"
+            )
+        finally:
+            self._waiting -= 1
+
+        self._checkouts += 1
+        try:
+            yield conn
+        finally:
+            if not conn.is_closed() and self._is_expired(conn):
+                # Closing it hands its slot back; the pool reconnects on demand
+                self._opened_at.pop(conn.get_server_pid(), None)
+                self._recycled += 1
+                await conn.close()
+            await pool.release(conn)
+
+    async def _opened(self, conn: asyncpg.Connection) -> None:
+        now = time.monotonic()
+        if self.max_lifetime > 0:
+            # A connection this old was recycled or closed idle by now
+            self._opened_at = {
+                pid: opened_at
+                for pid, opened_at in self._opened_at.items()
+                if now - opened_at < 2 * self.max_lifetime
+            }
+        self._opened_at[conn.get_server_pid()] = now
+
+    def _is_expired(self, conn: asyncpg.Connection) -> bool:
+        if self.max_lifetime <= 0:
+            return False
+        opened_at = self._opened_at.get(conn.get_server_pid())
+        return (
+            opened_at is not None and time.monotonic() - opened_at >= self.max_lifetime
+        )
+
+    def bind(self, conn: asyncpg.Connection) -> Token:
+        """Route every ``connection()`` in the current context to ``conn``."""
+        return self._bound.set(conn)
+
+    def unbind(self, token: Token) -> None:
+        self._bound.reset(token)
+
+    def is_bound(self) -> bool:
+        return self._bound.get() is not None
+
+    def stats(self) -> PoolStats:
+        size = self._pool.get_size() if self._pool else 0
+        idle = self._pool.get_idle_size() if self._pool else 0
+        return PoolStats(
+            min_size=self.min_size,
+            max_size=self.max_size,
+            size=size,
+            idle=idle,
+            in_use=size - idle,
+            waiting=self._waiting,
+            checkouts=self._checkouts,
+            timeouts=self._timeouts,
+            recycled=self._recycled,
+        )
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._pool is not None:
+            await self._pool.close()
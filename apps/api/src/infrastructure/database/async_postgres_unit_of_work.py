@@ -0,0 +1,33 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from src.domain.repositories.unit_of_work import IUnitOfWork
+from src.infrastructure.database.async_postgres_pool import (
+    AsyncPostgresConnectionPool,
+)
+
+
+class AsyncPostgresUnitOfWork(IUnitOfWork):
+    """
+    Unit of work over the shared asyncpg pool.
+
+    One connection is acquired and bound to the current task, so every
+    async DAO call inside the block runs in a single asyncpg transaction.
+    """
+
+    def __init__(self, connection_pool: AsyncPostgresConnectionPool):
+        self._connection_pool = connection_pool
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        if self._connection_pool.is_bound():
+            yield
+            return
+
+        async with self._connection_pool.connection() as conn:
+            async with conn.transaction():
+                token = self._connection_pool.bind(conn)
+                try:
+                    yield
+                finally:
+                    self._connection_pool.unbind(token)
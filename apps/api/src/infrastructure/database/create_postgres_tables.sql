@@ -1,3 +1,5 @@
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 CREATE TABLE IF NOT EXISTS companies (
     id TEXT PRIMARY KEY,
     name TEXT NOT NULL,
@@ -46,6 +48,9 @@ CREATE TABLE IF NOT EXISTS chats (
     contact_id TEXT NOT NULL,
     status TEXT NOT NULL DEFAULT 'open',
     attached_user_id TEXT,
+    unread_count INTEGER NOT NULL DEFAULT 0,
+    last_message_at TIMESTAMP WITH TIME ZONE,
+    last_message_id TEXT,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
     updated_at TIMESTAMP WITH TIME ZONE,
     FOREIGN KEY (company_id) REFERENCES companies(id)
@@ -76,3 +81,73 @@ CREATE TABLE IF NOT EXISTS messages (
         ON DELETE SET NULL
         ON UPDATE CASCADE
 );
+
+CREATE TABLE IF NOT EXISTS ingestion_jobs (
+    id TEXT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS ingestion_dead_letters (
+    id TEXT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    attempts INTEGER NOT NULL,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    dead_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_chats_company_created_at_keyset
+    ON chats (company_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_chats_company_unassigned_keyset
+    ON chats (company_id, created_at DESC, id DESC)
+    WHERE attached_user_id IS NULL;
+CREATE INDEX IF NOT EXISTS idx_chats_company_pending_keyset
+    ON chats (company_id, created_at DESC, id DESC)
+    WHERE attached_user_id IS NOT NULL AND status <> 'closed';
+CREATE INDEX IF NOT EXISTS idx_chats_company_resolved_keyset
+    ON chats (company_id, created_at DESC, id DESC)
+    WHERE status = 'closed';
+CREATE INDEX IF NOT EXISTS idx_chats_company_attendant_keyset
+    ON chats (company_id, attached_user_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_chats_company_contact
+    ON chats (company_id, contact_id);
+CREATE INDEX IF NOT EXISTS idx_chats_company_activity_keyset
+    ON chats (company_id, (COALESCE(last_message_at, created_at)) DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_messages_chat_external_timestamp_keyset
+    ON messages (chat_id, external_timestamp, id);
+CREATE INDEX IF NOT EXISTS idx_messages_chat_unread
+    ON messages (chat_id)
+    WHERE read = FALSE;
+
+CREATE INDEX IF NOT EXISTS idx_contacts_company_phone_number
+    ON contacts (company_id, phone_number);
+CREATE INDEX IF NOT EXISTS idx_contacts_company_name_keyset
+    ON contacts (company_id, name, id);
+CREATE INDEX IF NOT EXISTS idx_contacts_phone_number
+    ON contacts (phone_number);
+
+CREATE INDEX IF NOT EXISTS idx_users_company_created_at_keyset
+    ON users (company_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_users_company_type_keyset
+    ON users (company_id, type, created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_messages_text_search
+    ON messages USING GIN (to_tsvector('simple', text));
+CREATE INDEX IF NOT EXISTS idx_contacts_name_trgm
+    ON contacts USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_contacts_phone_number_trgm
+    ON contacts USING GIN (phone_number gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_contacts_email_trgm
+    ON contacts USING GIN (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_users_name_trgm
+    ON users USING GIN (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_users_email_trgm
+    ON users USING GIN (email gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_available_at
+    ON ingestion_jobs (available_at, id);
@@ -0,0 +1,61 @@
+-- Migration: Add indexes for the DAO query shapes
+-- Date: 2026-10-18
+-- Description: Composite and partial indexes matching the WHERE/ORDER BY of
+-- each DAO query, so listing chats, messages and contacts no longer
+-- sequential-scans. Listing indexes end with the id tie-breaker of the
+-- keyset cursors, so the next page is a single index range scan.
+-- Built CONCURRENTLY so writes are not blocked.
+-- If a build fails, the INVALID index must be dropped before re-running.
+-- migrate: no-transaction
+
+-- get_by_company_id (chats) ORDER BY created_at DESC, id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chats_company_created_at_keyset
+    ON chats (company_id, created_at DESC, id DESC);
+
+-- get_unassigned_by_company_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chats_company_unassigned_keyset
+    ON chats (company_id, created_at DESC, id DESC)
+    WHERE attached_user_id IS NULL;
+
+-- get_pending_by_company_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chats_company_pending_keyset
+    ON chats (company_id, created_at DESC, id DESC)
+    WHERE attached_user_id IS NOT NULL AND status <> 'closed';
+
+-- get_resolved_by_company_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chats_company_resolved_keyset
+    ON chats (company_id, created_at DESC, id DESC)
+    WHERE status = 'closed';
+
+-- get_by_attendant_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chats_company_attendant_keyset
+    ON chats (company_id, attached_user_id, created_at DESC, id DESC);
+
+-- get_company_chat_by_contact_id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chats_company_contact
+    ON chats (company_id, contact_id);
+
+-- get_by_chat_id (messages) ORDER BY external_timestamp, id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_chat_external_timestamp_keyset
+    ON messages (chat_id, external_timestamp, id);
+
+-- mark_chat_messages_as_read
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_chat_unread
+    ON messages (chat_id)
+    WHERE read = FALSE;
+
+-- get_company_contact_by_phone_number
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contacts_company_phone_number
+    ON contacts (company_id, phone_number);
+
+-- get_by_company_id (contacts) ORDER BY name, id
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contacts_company_name_keyset
+    ON contacts (company_id, name, id);
+
+-- get_by_phone_number (webhook receiver lookup)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contacts_phone_number
+    ON contacts (phone_number);
+
+-- get_by_company_id (users) ORDER BY created_at DESC, id DESC
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_company_created_at_keyset
+    ON users (company_id, created_at DESC, id DESC);
@@ -0,0 +1,32 @@
+-- Migration: Add full-text and trigram search
+-- Date: 2026-10-18
+-- Description: Adds a GIN expression index on the messages' tsvector, and
+-- trigram GIN indexes on contact and user name/phone/email, so the search
+-- DAOs can use ranked, index-backed matching instead of scanning with ILIKE.
+-- The tsvector is indexed as an expression rather than stored in a generated
+-- column, which would rewrite the messages table under an exclusive lock; the
+-- queries must use the same to_tsvector('simple', text) expression.
+-- The 'simple' text search configuration is used because messages are in
+-- mixed languages; it lowercases without stemming or stop words.
+-- If an index build fails, the INVALID index must be dropped before re-running.
+-- migrate: no-transaction
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_messages_text_search
+    ON messages USING GIN (to_tsvector('simple', text));
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contacts_name_trgm
+    ON contacts USING GIN (name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contacts_phone_number_trgm
+    ON contacts USING GIN (phone_number gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_contacts_email_trgm
+    ON contacts USING GIN (email gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_name_trgm
+    ON users USING GIN (name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_email_trgm
+    ON users USING GIN (email gin_trgm_ops);
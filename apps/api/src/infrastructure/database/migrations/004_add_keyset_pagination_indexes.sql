@@ -0,0 +1,15 @@
+-- Migration: Add the keyset index for listing users by role
+-- Date: 2026-10-18
+-- Description: List endpoints page with keyset cursors, ordering by
+-- (created_at, id) for chats and users, (external_timestamp, id) for messages
+-- and (name, id) for contacts. The listing indexes of 002 already end with
+-- the id tie-breaker; get_by_company_and_role gets its own so the next page
+-- is a single index range scan.
+-- Migrations are re-applied on every run, so they only create what is
+-- missing and never drop what an earlier file creates.
+-- If an index build fails, the INVALID index must be dropped before re-running.
+-- migrate: no-transaction
+
+-- get_by_company_and_role
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_company_type_keyset
+    ON users (company_id, type, created_at DESC, id DESC);
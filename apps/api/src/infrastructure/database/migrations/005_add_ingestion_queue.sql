@@ -0,0 +1,28 @@
+-- Migration: Add the webhook ingestion queue
+-- Date: 2026-10-18
+-- Description: The webhook route now only validates and enqueues deliveries;
+-- background workers drain ingestion_jobs in batches. Jobs that keep failing
+-- are moved to ingestion_dead_letters for inspection and replay.
+
+CREATE TABLE IF NOT EXISTS ingestion_jobs (
+    id TEXT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE
+);
+
+CREATE TABLE IF NOT EXISTS ingestion_dead_letters (
+    id TEXT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    attempts INTEGER NOT NULL,
+    last_error TEXT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    dead_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+
+-- claim() (due jobs, oldest first)
+CREATE INDEX IF NOT EXISTS idx_ingestion_jobs_available_at
+    ON ingestion_jobs (available_at, id);
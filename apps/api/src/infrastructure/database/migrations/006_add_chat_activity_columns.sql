@@ -0,0 +1,21 @@
+-- Migration: Keep unread counters and last-message pointers on chats
+-- Date: 2026-10-18
+-- Description: chats.unread_count, last_message_at and last_message_id are
+-- maintained by the message DAOs in the same statement as each insert, read
+-- change and delete, so inbox badges and activity ordering no longer scan
+-- messages. Adding the columns only touches the catalog; existing chats start
+-- at 0/NULL until `run_repair_chat_activity.py` backfills them in batches.
+-- migrate: no-transaction
+
+ALTER TABLE chats
+ADD COLUMN IF NOT EXISTS unread_count INTEGER NOT NULL DEFAULT 0;
+
+ALTER TABLE chats
+ADD COLUMN IF NOT EXISTS last_message_at TIMESTAMP WITH TIME ZONE;
+
+ALTER TABLE chats
+ADD COLUMN IF NOT EXISTS last_message_id TEXT;
+
+-- get_inbox (most recent activity first; chats without messages by creation)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chats_company_activity_keyset
+    ON chats (company_id, (COALESCE(last_message_at, created_at)) DESC, id DESC);
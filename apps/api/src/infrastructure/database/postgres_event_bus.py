@@ -0,0 +1,247 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import asyncpg
+import orjson
+
+from src.application.events import Event, EventHub, EventTypes, IEventBus, coalesce
+
+logger = logging.getLogger(__name__)
+
+# Channel every worker listens on
+DEFAULT_EVENTS_CHANNEL = "convo_events"
+# Events queued for sending before new ones are dropped, e.g. while the
+# connection is down
+DEFAULT_MAX_OUTBOX = 10_000
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_NOTIFY_PAYLOAD = 7999
+
+CONNECTION_ERRORS = (OSError, asyncpg.PostgresError, asyncpg.InterfaceError)
+
+# One round trip for a whole burst, notified in the order it was published
+NOTIFY_BATCH = """
+    SELECT pg_notify($1, batch.payload)
+    FROM unnest($2::text[]) WITH ORDINALITY AS batch(payload, position)
+    ORDER BY batch.position
+"""
+
+
+def encode_notification(event: Event) -> str:
+    """
+    The event as a NOTIFY payload, with what other workers need to route it.
+
+    An event too large for NOTIFY is sent with ``{"truncated": true}`` as its
+    data; subscribers refetch the chat instead.
+    """
+    fields = {
+        "type": event.type.value,
+        "company_id": event.company_id,
+        "chat_id": event.chat_id,
+        "attendant_ids": sorted(event.attendant_ids),
+        "data": event.data,
+    }
+    payload = orjson.dumps(fields)
+    if len(payload) > MAX_NOTIFY_PAYLOAD:
+        payload = orjson.dumps({**fields, "data": {"truncated": True}})
+    return payload.decode()
+
+
+def decode_notification(payload: str) -> Event:
+    fields = orjson.loads(payload)
+    return Event(
+        type=EventTypes(fields["type"]),
+        company_id=fields["company_id"],
+        chat_id=fields["chat_id"],
+        attendant_ids=frozenset(fields["attendant_ids"]),
+        data=fields["data"],
+    )
+
+
+@dataclass(frozen=True)
+class EventBusStats:
+    connected: bool
+    published: int
+    # Published but not sent yet
+    pending: int
+    sent_batches: int
+    received: int
+    # Received but superseded or repeated within their burst
+    coalesced: int
+    # Received but not decodable as an event
+    malformed: int
+    # Published while the outbox was full
+    dropped: int
+    reconnects: int
+
+
+class PostgresEventBus(IEventBus):
+    """
+    Event bus over Postgres LISTEN/NOTIFY, so subscribers connected to any
+    worker hear about events produced by every worker.
+
+    Each worker keeps one dedicated connection, outside the pools. It
+    LISTENs on ``channel`` and also sends the worker's own events:
+    ``publish`` only queues them and the bus task sends everything queued
+    in one statement, so a burst costs a single round trip. Own events come
+    back through the channel like everyone else's, which keeps every
+    worker's subscribers seeing the same order.
+
+    Notifications that arrive together are decoded, coalesced and
+    dispatched to the local ``EventHub`` in one pass. When the connection
+    drops the bus reconnects and closes the local subscriptions, since
+    notifications sent meanwhile are lost; clients reconnect and refetch.
+    A batch whose send failed is sent again, so delivery is at least once.
+    Any other error is logged: a notification that fails to decode or
+    dispatch is skipped, and a failure of the bus task reconnects it.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        hub: EventHub,
+        channel: str = DEFAULT_EVENTS_CHANNEL,
+        reconnect_seconds: float = 1.0,
+        max_outbox: int = DEFAULT_MAX_OUTBOX,
+        connect: Callable[[str], Awaitable[asyncpg.Connection]] = asyncpg.connect,
+    ):
+        # asyncpg expects a plain postgresql:// DSN
+        if database_url.startswith("postgresql+asyncpg://"):
+            database_url = database_url.replace(
+                "postgresql+asyncpg://", "postgresql://"
+            )
+        self.database_url = database_url
+        self.channel = channel
+        self._hub = hub
+        self._reconnect_seconds = reconnect_seconds
+        self._max_outbox = max_outbox
+        self._connect = connect
+
+        self._outbox: list[str] = []
+        self._inbox: list[str] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._dispatch_scheduled = False
+        self._connected = False
+        self._published = 0
+        self._sent_batches = 0
+        self._received = 0
+        self._coalesced = 0
+        self._malformed = 0
+        self._dropped = 0
+        self._reconnects = 0
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="event-bus")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def publish(self, event: Event) -> None:
+        if len(self._outbox) >= self._max_outbox:
+            self._dropped += 1
+            return
+        self._outbox.append(encode_notification(event))
+        self._published += 1
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                conn = await self._connect(self.database_url)
+            except CONNECTION_ERRORS:
+                await asyncio.sleep(self._reconnect_seconds)
+                continue
+            except Exception:
+                logger.exception("Event bus could not connect, retrying")
+                await asyncio.sleep(self._reconnect_seconds)
+                continue
+
+            try:
+                await self._serve(conn)
+            except CONNECTION_ERRORS:
+                pass
+            except Exception:
+                logger.exception("Event bus failed, reconnecting")
+            finally:
+                self._connected = False
+                conn.terminate()
+
+            self._reconnects += 1
+            self._hub.close_all()
+            await asyncio.sleep(self._reconnect_seconds)
+
+    async def _serve(self, conn: asyncpg.Connection) -> None:
+        # A dropped connection wakes the loop up to notice it
+        conn.add_termination_listener(lambda _: self._wakeup.set())
+        await conn.add_listener(self.channel, self._on_notification)
+        self._connected = True
+        while not conn.is_closed():
+            await self._flush(conn)
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+    async def _flush(self, conn: asyncpg.Connection) -> None:
+        while self._outbox:
+            batch, self._outbox = self._outbox, []
+            try:
+                await conn.execute(NOTIFY_BATCH, self.channel, batch)
+            except BaseException:
+                self._outbox[:0] = batch
+                raise
+            self._sent_batches += 1
+
+    def _on_notification(
+        self, conn: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        # asyncpg calls back once per notification; everything that arrived
+        # in the same read is dispatched together on the next loop iteration
+        self._inbox.append(payload)
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            asyncio.get_running_loop().call_soon(self._dispatch)
+
+    def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        payloads, self._inbox = self._inbox, []
+        self._received += len(payloads)
+
+        events = []
+        for payload in payloads:
+            # Anything else notified on the channel is not ours to deliver
+            try:
+                events.append(decode_notification(payload))
+            except Exception:
+                self._malformed += 1
+                logger.warning(
+                    "Skipping malformed notification on %s: %.200s",
+                    self.channel,
+                    payload,
+                    exc_info=True,
+                )
+        coalesced = coalesce(events)
+        self._coalesced += len(events) - len(coalesced)
+        for event in coalesced:
+            try:
+                self._hub.dispatch(event)
+            except Exception:
+                logger.exception("Could not dispatch %s event", event.type.value)
+
+    def stats(self) -> EventBusStats:
+        return EventBusStats(
+            connected=self._connected,
+            published=self._published,
+            pending=len(self._outbox),
+            sent_batches=self._sent_batches,
+            received=self._received,
+            coalesced=self._coalesced,
+            malformed=self._malformed,
+            dropped=self._dropped,
+            reconnects=self._reconnects,
+        )
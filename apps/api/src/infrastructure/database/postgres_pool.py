@@ -0,0 +1,283 @@
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+
+import psycopg2
+from psycopg2 import extensions
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+class PoolClosedError(Exception):
+    """Raised when a connection is requested from a closed pool."""
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    min_size: int
+    max_size: int
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    checkouts: int
+    timeouts: int
+    recycled: int
+
+
+class TransactionConnection:
+    """
+    Connection handed to DAOs while a unit of work is bound to the pool.
+
+    DAOs commit after each statement; inside a unit of work those commits
+    are deferred so the whole block lands in one transaction.
+    """
+
+    def __init__(self, conn: extensions.connection):
+        self._conn = conn
+
+    def cursor(self, *args, **kwargs):
+        return self._conn.cursor(*args, **kwargs)
+
+    def commit(self) -> None:
+        # The unit of work commits once, when its block exits
+        pass
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+class PostgresConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections shared by all Postgres DAOs.
+
+    Connections are opened lazily up to ``max_size`` and reused LIFO so the
+    warmest connection is handed out first. A checkout blocks for at most
+    ``timeout`` seconds when the pool is exhausted. Connections older than
+    ``max_lifetime`` seconds, or found broken on return, are closed and
+    replaced on demand.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_lifetime: float = 1800.0,
+        connection_factory: Callable[[str], extensions.connection] = psycopg2.connect,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError(
+                f"Invalid pool sizes: min_size={min_size}, max_size={max_size}"
+            )
+
+        # Convert SQLAlchemy format to psycopg2 format if needed
+        if database_url.startswith("postgresql+asyncpg://"):
+            database_url = database_url.replace(
+                "postgresql+asyncpg://", "postgresql://"
+            )
+        self.database_url = database_url
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self._connection_factory = connection_factory
+
+        self._condition = threading.Condition()
+        self._idle: deque[extensions.connection] = deque()
+        self._opened_at: dict[int, float] = {}
+        self._size = 0
+        self._in_use = 0
+        self._waiting = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._recycled = 0
+        self._closed = False
+        self._bound: ContextVar[TransactionConnection | None] = ContextVar(
+            f"postgres_pool_bound_{id(self)}", default=None
+        )
+
+        for _ in range(min_size):
+            self._idle.append(self._open())
+            self._size += 1
+
+    def _open(self) -> extensions.connection:
+        conn = self._connection_factory(self.database_url)
+        self._opened_at[id(conn)] = time.monotonic()
+        return conn
+
+    def _discard(self, conn: extensions.connection) -> None:
+        self._opened_at.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_expired(self, conn: extensions.connection) -> bool:
+        if self.max_lifetime <= 0:
+            return False
+        opened_at = self._opened_at.get(id(conn), 0.0)
+        return time.monotonic() - opened_at >= self.max_lifetime
+
+    def _is_usable(self, conn: extensions.connection) -> bool:
+        if conn.closed:
+            return False
+        status = conn.get_transaction_status()
+        if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if status != extensions.TRANSACTION_STATUS_IDLE:
+            # Never hand back a connection with a dangling transaction
+            try:
+                conn.rollback()
+            except Exception:
+                return False
+        return True
+
+    def getconn(self) -> extensions.connection:
+        """
+        Check out a connection, waiting up to ``timeout`` seconds.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted past the timeout
+            PoolClosedError: If the pool has been closed
+        """
+        deadline = time.monotonic() + self.timeout
+        conn = None
+
+        with self._condition:
+            self._waiting += 1
+            try:
+                while True:
+                    if self._closed:
+                        raise PoolClosedError
+                    if self._idle:
+                        conn = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        # Reserve the slot; the connection is opened unlocked
+                        self._size += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"No connection available after {self.timeout}s "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._condition.wait(remaining)
+            finally:
+                self._waiting -= 1
+
+        recycled = False
+        try:
+            if conn is None:
+                conn = self._open()
+            elif conn.closed or self._is_expired(conn):
+                self._discard(conn)
+                conn = self._open()
+                recycled = True
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._in_use += 1
+            self._checkouts += 1
+            if recycled:
+                self._recycled += 1
+
+        return conn
+
+    def putconn(self, conn: extensions.connection) -> None:
+        """Return a connection to the pool, discarding it if it is unusable."""
+        keep = not self._closed and not self._is_expired(conn)
+        keep = keep and self._is_usable(conn)
+
+        if not keep:
+            self._discard(conn)
+
+        with self._condition:
+            self._in_use -= 1
+            if keep:
+                self._idle.append(conn)
+            else:
+                self._size -= 1
+                if not self._closed:
+                    self._recycled += 1
+            self._condition.notify()
+
+    def bind(self, conn: extensions.connection) -> Token:
+        """
+        Route every ``connection()`` in the current context to ``conn``.
+
+        Used by the unit of work so several DAO calls share one connection
+        and one transaction. Returns a token for ``unbind``.
+        """
+        return self._bound.set(TransactionConnection(conn))
+
+    def unbind(self, token: Token) -> None:
+        self._bound.reset(token)
+
+    def is_bound(self) -> bool:
+        return self._bound.get() is not None
+
+    @contextmanager
+    def connection(self) -> Iterator[extensions.connection]:
+        """
+        Check out a connection for the duration of a ``with`` block.
+
+        Mirrors psycopg2's connection context manager: the transaction is
+        committed on success and rolled back on error. The connection is
+        returned to the pool instead of being left open.
+
+        When a unit of work is bound to the current context its connection
+        is yielded instead, and committing is left to the unit of work.
+        """
+        bound = self._bound.get()
+        if bound is not None:
+            yield bound
+            return
+
+        conn = self.getconn()
+        try:
+            yield conn
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            self.putconn(conn)
+
+    def stats(self) -> PoolStats:
+        with self._condition:
+            return PoolStats(
+                min_size=self.min_size,
+                max_size=self.max_size,
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._in_use,
+                waiting=self._waiting,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                recycled=self._recycled,
+            )
+
+    def close(self) -> None:
+        """Close idle connections and refuse further checkouts."""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+                self._size -= 1
+            self._condition.notify_all()
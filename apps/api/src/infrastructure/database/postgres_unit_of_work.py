@@ -0,0 +1,55 @@
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from typing import Any
+
+from src.domain.repositories.unit_of_work import IUnitOfWork
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
+
+
+class PostgresUnitOfWork(IUnitOfWork):
+    """
+    Unit of work over the shared psycopg2 pool.
+
+    One connection is checked out and bound to the current context, so
+    every DAO call inside the block reuses it and the block commits once.
+    The blocking checkout, commit and return run on ``executor`` when given.
+    """
+
+    def __init__(
+        self,
+        connection_pool: PostgresConnectionPool,
+        executor: Executor | None = None,
+    ):
+        self._connection_pool = connection_pool
+        self._executor = executor
+
+    async def _run(self, method: Callable[..., Any], *args) -> Any:
+        if self._executor is None:
+            return method(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(method, *args)
+        )
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        if self._connection_pool.is_bound():
+            yield
+            return
+
+        conn = await self._run(self._connection_pool.getconn)
+        token = self._connection_pool.bind(conn)
+        try:
+            yield
+        except BaseException:
+            if not conn.closed:
+                await self._run(conn.rollback)
+            raise
+        else:
+            await self._run(conn.commit)
+        finally:
+            self._connection_pool.unbind(token)
+            await self._run(self._connection_pool.putconn, conn)
@@ -0,0 +1,25 @@
+from src.infrastructure.daos.postgres_chat_dao import PostgresChatDAO
+
+DEFAULT_REPAIR_BATCH_SIZE = 500
+
+
+def repair_chat_activity(
+    chat_dao: PostgresChatDAO, batch_size: int = DEFAULT_REPAIR_BATCH_SIZE
+) -> int:
+    """
+    Recompute every chat's unread_count, last_message_at and last_message_id
+    from its messages, ``batch_size`` chats per transaction.
+
+    The message DAOs keep these columns up to date as they write; this job
+    backfills them after the migration and fixes any drift. Only the chats of
+    the batch being repaired are locked. Returns how many chats were fixed.
+    """
+    after_id = None
+    repaired = 0
+    while True:
+        after_id, batch_repaired = chat_dao.repair_activity(
+            after_id=after_id, batch_size=batch_size
+        )
+        if after_id is None:
+            return repaired
+        repaired += batch_repaired
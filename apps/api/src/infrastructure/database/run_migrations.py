@@ -3,11 +3,32 @@ from pathlib import Path
 
 from src.infrastructure.database.postgres_setup import create_connection
 
+NO_TRANSACTION_MARKER = "-- migrate: no-transaction"
+
+
+def split_statements(migration_sql: str) -> list[str]:
+    """
+    Split a migration into individual statements.
+
+    Comment lines are dropped first; statements are then split on ``;``.
+    Only meant for simple DDL such as ``CREATE INDEX CONCURRENTLY``.
+    """
+    lines = [
+        line for line in migration_sql.splitlines() if not line.strip().startswith("--")
+    ]
+    statements = "\n".join(lines).split(";")
+    return [statement.strip() for statement in statements if statement.strip()]
+
 
 def run_migrations(database_url: str) -> None:
     """
     Run all SQL migration files in the migrations directory.
 
+    Each file runs in its own transaction, unless it contains the
+    ``-- migrate: no-transaction`` marker. Those files run statement by
+    statement in autocommit mode, which ``CREATE INDEX CONCURRENTLY``
+    requires.
+
     Args:
         database_url: PostgreSQL connection URL
 
@@ -39,8 +60,14 @@ def run_migrations(database_url: str) -> None:
             with open(migration_file) as f:
                 migration_sql = f.read()
 
-            cursor.execute(migration_sql)
-            conn.commit()
+            if NO_TRANSACTION_MARKER in migration_sql:
+                conn.autocommit = True
+                for statement in split_statements(migration_sql):
+                    cursor.execute(statement)
+                conn.autocommit = False
+            else:
+                cursor.execute(migration_sql)
+                conn.commit()
             print(f"✓ Completed: {migration_file.name}")
 
         cursor.close()
@@ -0,0 +1,21 @@
+import uuid
+
+from psycopg2 import extensions
+
+# Rows fetched per round trip while iterating a server-side cursor
+DEFAULT_ITERSIZE = 1000
+
+
+def server_cursor(
+    conn: extensions.connection, itersize: int = DEFAULT_ITERSIZE
+) -> extensions.cursor:
+    """
+    Open a named (server-side) cursor on ``conn``.
+
+    Iterating it pulls ``itersize`` rows at a time from Postgres instead of
+    buffering the whole result client-side. It only lives as long as the
+    transaction it was opened in.
+    """
+    cursor = conn.cursor(name=f"stream_{uuid.uuid4().hex}")
+    cursor.itersize = itersize
+    return cursor
@@ -6,3 +6,4 @@ class DatabaseType(str, Enum):
 
     INMEMORY = "inmemory"
     POSTGRES = "postgres"
+    ASYNC_POSTGRES = "async_postgres"
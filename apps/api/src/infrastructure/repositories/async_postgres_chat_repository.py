@@ -0,0 +1,174 @@
+from collections.abc import AsyncIterator
+
+from src.domain.entities.chat import Chat
+from src.domain.enums import InboxFilters
+from src.domain.errors import ChatNotFoundError
+from src.domain.inbox import InboxChat
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page, decode_cursor
+from src.domain.repositories.chat_repository import IAsyncChatRepository
+from src.infrastructure.daos.async_postgres_chat_dao import AsyncPostgresChatDAO
+from src.infrastructure.repositories.postgres_chat_repository import (
+    CHAT_CURSOR_TYPES,
+    CHAT_SEARCH_CURSOR_TYPES,
+    PostgresChatRepository,
+)
+
+
+class AsyncPostgresChatRepository(IAsyncChatRepository):
+    def __init__(self, chat_dao: AsyncPostgresChatDAO):
+        self._chat_dao = chat_dao
+
+    # asyncpg records support positional access just like psycopg2 tuples
+    _parse_row = staticmethod(PostgresChatRepository._parse_row)
+    _page = staticmethod(PostgresChatRepository._page)
+    _search_page = staticmethod(PostgresChatRepository._search_page)
+    _inbox_page = staticmethod(PostgresChatRepository._inbox_page)
+
+    async def save(self, chat: Chat) -> Chat:
+        chat_data = {
+            "id": chat.id,
+            "contact_id": chat.contact_id,
+            "status": chat.status.value,
+            "company_id": chat.company_id,
+            "attached_user_id": chat.attached_user_id,
+            "created_at": chat.created_at,
+            "updated_at": chat.updated_at,
+        }
+
+        row = await self._chat_dao.upsert(chat_data)
+
+        return self._parse_row(row=row)
+
+    async def get_by_id(self, chat_id: str) -> Chat:
+        row = await self._chat_dao.get_by_id(chat_id)
+        if not row:
+            raise ChatNotFoundError
+
+        return self._parse_row(row=row)
+
+    async def get_all(self) -> list[Chat]:
+        rows = await self._chat_dao.get_all()
+        return [self._parse_row(row=row) for row in rows]
+
+    async def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = await self._chat_dao.get_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    async def iter_by_company_id(self, company_id: str) -> AsyncIterator[Chat]:
+        async for row in self._chat_dao.iter_by_company_id(company_id=company_id):
+            yield self._parse_row(row=row)
+
+    async def get_company_chat_by_contact_id(
+        self,
+        company_id: str,
+        contact_id: str,
+    ) -> Chat:
+        row = await self._chat_dao.get_company_chat_by_contact_id(
+            company_id=company_id,
+            contact_id=contact_id,
+        )
+        if not row:
+            raise ChatNotFoundError
+
+        return self._parse_row(row=row)
+
+    async def delete(self, chat_id: str) -> None:
+        await self.get_by_id(chat_id=chat_id)
+        await self._chat_dao.delete(chat_id)
+
+    async def get_unassigned_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = await self._chat_dao.get_unassigned_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    async def get_pending_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = await self._chat_dao.get_pending_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    async def get_resolved_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = await self._chat_dao.get_resolved_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    async def get_by_attendant_id(
+        self,
+        company_id: str,
+        attendant_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = await self._chat_dao.get_by_attendant_id(
+            company_id=company_id,
+            attendant_id=attendant_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    async def search_chats(
+        self,
+        company_id: str,
+        query: str,
+        user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = await self._chat_dao.search_chats(
+            company_id=company_id,
+            query=query,
+            user_id=user_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_SEARCH_CURSOR_TYPES),
+        )
+        return self._search_page(rows=rows, limit=limit)
+
+    async def get_inbox(
+        self,
+        company_id: str,
+        inbox_filter: InboxFilters = InboxFilters.ALL,
+        attendant_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[InboxChat]:
+        rows = await self._chat_dao.get_inbox(
+            company_id=company_id,
+            inbox_filter=inbox_filter.value,
+            attendant_id=attendant_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._inbox_page(rows=rows, limit=limit)
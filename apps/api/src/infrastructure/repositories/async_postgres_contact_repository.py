@@ -0,0 +1,101 @@
+from src.domain.entities.contact import Contact
+from src.domain.errors import ContactNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page, decode_cursor
+from src.domain.repositories.contact_repository import IAsyncContactRepository
+from src.infrastructure.daos.async_postgres_contact_dao import (
+    AsyncPostgresContactDAO,
+)
+from src.infrastructure.repositories.postgres_contact_repository import (
+    CONTACT_CURSOR_TYPES,
+    CONTACT_SEARCH_CURSOR_TYPES,
+    PostgresContactRepository,
+)
+
+
+class AsyncPostgresContactRepository(IAsyncContactRepository):
+    def __init__(self, contact_dao: AsyncPostgresContactDAO):
+        self._contact_dao = contact_dao
+
+    # asyncpg records support positional access just like psycopg2 tuples
+    _parse_row = staticmethod(PostgresContactRepository._parse_row)
+    _page = staticmethod(PostgresContactRepository._page)
+    _search_page = staticmethod(PostgresContactRepository._search_page)
+
+    async def save(self, contact: Contact) -> Contact:
+        contact_data = {
+            "id": contact.id,
+            "name": contact.name,
+            "phone_number": contact.phone_number,
+            "email": contact.email,
+            "company_id": contact.company_id,
+            "is_blocked": contact.is_blocked,
+            "tags": ",".join(contact.tags) if contact.tags else None,
+            "notes": contact.notes,
+            "last_contact_at": contact.last_contact_at,
+            "updated_at": contact.updated_at,
+        }
+
+        row = await self._contact_dao.upsert(contact_data)
+
+        return self._parse_row(row=row)
+
+    async def get_by_id(self, contact_id: str) -> Contact:
+        row = await self._contact_dao.get_by_id(contact_id=contact_id)
+        if not row:
+            raise ContactNotFoundError
+
+        return self._parse_row(row=row)
+
+    async def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
+        rows = await self._contact_dao.get_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CONTACT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    async def get_by_phone_number(self, phone_number: str) -> Contact:
+        row = await self._contact_dao.get_by_phone_number(phone_number=phone_number)
+        if not row:
+            raise ContactNotFoundError
+
+        return self._parse_row(row=row)
+
+    async def get_company_contact_by_phone_number(
+        self, company_id: str, phone_number: str
+    ) -> Contact:
+        row = await self._contact_dao.get_company_contact_by_phone_number(
+            company_id=company_id, phone_number=phone_number
+        )
+        if not row:
+            raise ContactNotFoundError
+
+        return self._parse_row(row=row)
+
+    async def get_all(self) -> list[Contact]:
+        rows = await self._contact_dao.get_all()
+        return [self._parse_row(row=row) for row in rows]
+
+    async def search_contacts(
+        self,
+        company_id: str,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
+        rows = await self._contact_dao.search_contacts(
+            company_id=company_id,
+            query=query,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CONTACT_SEARCH_CURSOR_TYPES),
+        )
+        return self._search_page(rows=rows, limit=limit)
+
+    async def delete(self, contact_id: str) -> None:
+        await self.get_by_id(contact_id=contact_id)
+        await self._contact_dao.delete(contact_id=contact_id)
@@ -0,0 +1,105 @@
+from collections.abc import AsyncIterator
+
+from src.domain.entities.message import Message
+from src.domain.errors import MessageNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page, decode_cursor
+from src.domain.repositories.message_repository import IAsyncMessageRepository
+from src.infrastructure.daos.async_postgres_message_dao import (
+    AsyncPostgresMessageDAO,
+)
+from src.infrastructure.repositories.postgres_message_repository import (
+    MESSAGE_CURSOR_TYPES,
+    PostgresMessageRepository,
+)
+
+
+class AsyncPostgresMessageRepository(IAsyncMessageRepository):
+    def __init__(self, message_dao: AsyncPostgresMessageDAO):
+        self.message_dao = message_dao
+
+    # asyncpg records support positional access just like psycopg2 tuples
+    _parse_row = staticmethod(PostgresMessageRepository._parse_row)
+    _page = staticmethod(PostgresMessageRepository._page)
+
+    async def save(self, message: Message) -> Message:
+        # Insert first: see PostgresMessageRepository.save
+        message_data = {
+            "id": message.id,
+            "external_id": message.external_id,
+            "external_timestamp": message.external_timestamp,
+            "chat_id": message.chat_id,
+            "text": message.text,
+            "sent_by_user_id": message.sent_by_user_id,
+            "read": message.read,
+            "created_at": message.created_at,
+            "updated_at": message.updated_at,
+        }
+
+        row = await self.message_dao.insert(message_data)
+        if row is None:
+            row = await self.message_dao.update(message_data)
+        if row is None:
+            row = await self.message_dao.get_by_external_id(
+                external_id=message.external_id
+            )
+
+        return self._parse_row(row=row)
+
+    async def get_by_id(self, message_id: str) -> Message:
+        row = await self.message_dao.get_by_id(message_id=message_id)
+        if not row:
+            raise MessageNotFoundError
+
+        return self._parse_row(row=row)
+
+    async def get_by_external_id(self, external_id: str) -> Message | None:
+        row = await self.message_dao.get_by_external_id(external_id=external_id)
+        if not row:
+            return None
+
+        return self._parse_row(row=row)
+
+    async def save_many(self, messages: list[Message]) -> list[Message]:
+        rows = await self.message_dao.insert_many(
+            [
+                {
+                    "id": message.id,
+                    "external_id": message.external_id,
+                    "external_timestamp": message.external_timestamp,
+                    "chat_id": message.chat_id,
+                    "text": message.text,
+                    "sent_by_user_id": message.sent_by_user_id,
+                    "read": message.read,
+                }
+                for message in messages
+            ]
+        )
+        return [self._parse_row(row=row) for row in rows]
+
+    async def get_all(self) -> list[Message]:
+        rows = await self.message_dao.get_all()
+        return [self._parse_row(row=row) for row in rows]
+
+    async def delete(self, message_id: str) -> None:
+        await self.get_by_id(message_id=message_id)
+        await self.message_dao.delete(message_id=message_id)
+
+    async def mark_chat_messages_as_read(self, chat_id: str) -> int:
+        return await self.message_dao.mark_chat_messages_as_read(chat_id=chat_id)
+
+    async def get_by_chat_id(
+        self,
+        chat_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: str | None = None,
+    ) -> Page[Message]:
+        rows = await self.message_dao.get_by_chat_id(
+            chat_id=chat_id,
+            limit=limit + 1,
+            before=decode_cursor(before, MESSAGE_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    async def iter_by_chat_id(self, chat_id: str) -> AsyncIterator[Message]:
+        async for row in self.message_dao.iter_by_chat_id(chat_id=chat_id):
+            yield self._parse_row(row=row)
@@ -0,0 +1,68 @@
+import asyncio
+import contextvars
+import functools
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Any
+
+# Items pulled from a sync iterator per executor call
+ITER_BATCH_SIZE = 500
+
+
+class AsyncRepositoryAdapter:
+    """
+    Expose a synchronous repository through the async repository interface.
+
+    Every method call returns an awaitable. With an executor the call runs on
+    that executor (carrying the caller's context variables along), otherwise
+    it runs inline, which is what in-memory repositories want.
+
+    ``iter_*`` methods return async iterators instead; the sync iterator is
+    advanced ``ITER_BATCH_SIZE`` items per call.
+    """
+
+    def __init__(self, repository: Any, executor: Executor | None = None):
+        self._repository = repository
+        self._executor = executor
+
+    @property
+    def repository(self) -> Any:
+        return self._repository
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        if self._executor is None:
+            return func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(context.run, func, *args, **kwargs),
+        )
+
+    async def _iterate(self, iterator: Iterator[Any]) -> AsyncIterator[Any]:
+        try:
+            while batch := await self._run(
+                lambda: list(islice(iterator, ITER_BATCH_SIZE))
+            ):
+                for item in batch:
+                    yield item
+        finally:
+            # Release whatever the iterator holds, e.g. a server-side cursor
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                await self._run(close)
+
+    def __getattr__(
+        self, name: str
+    ) -> Callable[..., Awaitable[Any] | AsyncIterator[Any]]:
+        method = getattr(self._repository, name)
+
+        if name.startswith("iter_"):
+            return lambda *args, **kwargs: self._iterate(method(*args, **kwargs))
+
+        async def call(*args, **kwargs):
+            return await self._run(method, *args, **kwargs)
+
+        return call
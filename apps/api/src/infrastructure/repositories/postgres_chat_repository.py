@@ -1,9 +1,21 @@
+from collections.abc import Iterator
+from datetime import datetime
+
 from src.domain.entities.chat import Chat
-from src.domain.enums import ChatStatuses
+from src.domain.enums import ChatStatuses, InboxFilters
 from src.domain.errors import ChatNotFoundError
+from src.domain.inbox import InboxChat
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
 from src.domain.repositories.chat_repository import IChatRepository
 from src.infrastructure.daos.postgres_chat_dao import PostgresChatDAO
 
+# Chat listings page on (created_at, id), search results on (rank, created_at, id)
+CHAT_CURSOR_TYPES = (datetime, str)
+CHAT_SEARCH_CURSOR_TYPES = (float, datetime, str)
+
+# Looking a stored value up is cheaper than calling ChatStatuses(value)
+CHAT_STATUSES = {status.value: status for status in ChatStatuses}
+
 
 class PostgresChatRepository(IChatRepository):
     def __init__(self, chat_dao: PostgresChatDAO):
@@ -11,18 +23,58 @@ class PostgresChatRepository(IChatRepository):
 
     @staticmethod
     def _parse_row(row: tuple) -> Chat:
-        return Chat(
-            id=row[0],
-            company_id=row[1],
-            contact_id=row[2],
-            status=ChatStatuses(row[3]),
-            attached_user_id=row[4],
-            created_at=row[5],
-            updated_at=row[6],
+        chat = Chat.__new__(Chat)
+        chat.id = row[0]
+        chat.company_id = row[1]
+        chat.contact_id = row[2]
+        chat.status = CHAT_STATUSES[row[3]]
+        chat.attached_user_id = row[4]
+        chat.created_at = row[5]
+        chat.updated_at = row[6]
+        return chat
+
+    @staticmethod
+    def _parse_inbox_row(row: tuple) -> InboxChat:
+        # The DAO appends the contact, last message and unread columns
+        return InboxChat(
+            chat=PostgresChatRepository._parse_row(row),
+            contact_name=row[7],
+            contact_phone_number=row[8],
+            last_message_text=row[9],
+            last_message_at=row[10],
+            unread_count=row[11],
+        )
+
+    @staticmethod
+    def _page(rows: list[tuple], limit: int) -> Page[Chat]:
+        return build_page(
+            rows,
+            limit,
+            key=lambda row: (row[5], row[0]),
+            parse=PostgresChatRepository._parse_row,
+        )
+
+    @staticmethod
+    def _search_page(rows: list[tuple], limit: int) -> Page[Chat]:
+        # The DAO appends the match rank as the last column
+        return build_page(
+            rows,
+            limit,
+            key=lambda row: (row[7], row[5], row[0]),
+            parse=PostgresChatRepository._parse_row,
+        )
+
+    @staticmethod
+    def _inbox_page(rows: list[tuple], limit: int) -> Page[InboxChat]:
+        # The inbox pages on (activity, id); the DAO appends activity last
+        return build_page(
+            rows,
+            limit,
+            key=lambda row: (row[12], row[0]),
+            parse=PostgresChatRepository._parse_inbox_row,
         )
 
     def save(self, chat: Chat) -> Chat:
-        existing = self._chat_dao.get_by_id(chat_id=chat.id)
         chat_data = {
             "id": chat.id,
             "contact_id": chat.contact_id,
@@ -33,10 +85,7 @@ class PostgresChatRepository(IChatRepository):
             "updated_at": chat.updated_at,
         }
 
-        if existing:
-            row = self._chat_dao.update(chat_data)
-        else:
-            row = self._chat_dao.insert(chat_data)
+        row = self._chat_dao.upsert(chat_data)
 
         return self._parse_row(row=row)
 
@@ -51,9 +100,26 @@ class PostgresChatRepository(IChatRepository):
         rows = self._chat_dao.get_all()
         return [self._parse_row(row=row) for row in rows]
 
-    def get_by_company_id(self, company_id: str) -> list[Chat]:
-        rows = self._chat_dao.get_by_company_id(company_id=company_id)
-        return [self._parse_row(row=row) for row in rows]
+    def iter_all(self) -> Iterator[Chat]:
+        for row in self._chat_dao.iter_all():
+            yield self._parse_row(row=row)
+
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = self._chat_dao.get_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    def iter_by_company_id(self, company_id: str) -> Iterator[Chat]:
+        for row in self._chat_dao.iter_by_company_id(company_id=company_id):
+            yield self._parse_row(row=row)
 
     def get_company_chat_by_contact_id(
         self,
@@ -73,28 +139,90 @@ class PostgresChatRepository(IChatRepository):
         self.get_by_id(chat_id=chat_id)
         self._chat_dao.delete(chat_id)
 
-    def get_unassigned_by_company_id(self, company_id: str) -> list[Chat]:
-        rows = self._chat_dao.get_unassigned_by_company_id(company_id=company_id)
-        return [self._parse_row(row=row) for row in rows]
+    def get_unassigned_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = self._chat_dao.get_unassigned_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
 
-    def get_pending_by_company_id(self, company_id: str) -> list[Chat]:
-        rows = self._chat_dao.get_pending_by_company_id(company_id=company_id)
-        return [self._parse_row(row=row) for row in rows]
+    def get_pending_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = self._chat_dao.get_pending_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
 
-    def get_resolved_by_company_id(self, company_id: str) -> list[Chat]:
-        rows = self._chat_dao.get_resolved_by_company_id(company_id=company_id)
-        return [self._parse_row(row=row) for row in rows]
+    def get_resolved_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        rows = self._chat_dao.get_resolved_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
 
-    def get_by_attendant_id(self, company_id: str, attendant_id: str) -> list[Chat]:
+    def get_by_attendant_id(
+        self,
+        company_id: str,
+        attendant_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
         rows = self._chat_dao.get_by_attendant_id(
-            company_id=company_id, attendant_id=attendant_id
+            company_id=company_id,
+            attendant_id=attendant_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
         )
-        return [self._parse_row(row=row) for row in rows]
+        return self._page(rows=rows, limit=limit)
 
     def search_chats(
-        self, company_id: str, query: str, user_id: str | None = None
-    ) -> list[Chat]:
+        self,
+        company_id: str,
+        query: str,
+        user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
         rows = self._chat_dao.search_chats(
-            company_id=company_id, query=query, user_id=user_id
+            company_id=company_id,
+            query=query,
+            user_id=user_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_SEARCH_CURSOR_TYPES),
         )
-        return [self._parse_row(row=row) for row in rows]
+        return self._search_page(rows=rows, limit=limit)
+
+    def get_inbox(
+        self,
+        company_id: str,
+        inbox_filter: InboxFilters = InboxFilters.ALL,
+        attendant_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[InboxChat]:
+        rows = self._chat_dao.get_inbox(
+            company_id=company_id,
+            inbox_filter=inbox_filter.value,
+            attendant_id=attendant_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CHAT_CURSOR_TYPES),
+        )
+        return self._inbox_page(rows=rows, limit=limit)
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+
 from src.domain.entities.company import Company
 from src.domain.errors import CompanyNotFoundError
 from src.domain.repositories.company_repository import ICompanyRepository
@@ -10,20 +12,19 @@ class PostgresCompanyRepository(ICompanyRepository):
 
     @staticmethod
     def _parse_row(row: tuple) -> Company:
-        return Company(
-            id=row[0],
-            name=row[1],
-            created_at=row[2],
-            updated_at=row[3],
-            email=row[4],
-            phone=row[5],
-            is_active=row[6],
-            attendant_sees_all_conversations=row[7],
-            whatsapp_api_key=row[8],
-        )
+        company = Company.__new__(Company)
+        company.id = row[0]
+        company.name = row[1]
+        company.created_at = row[2]
+        company.updated_at = row[3]
+        company.email = row[4]
+        company.phone = row[5]
+        company.is_active = row[6]
+        company.attendant_sees_all_conversations = row[7]
+        company.whatsapp_api_key = row[8]
+        return company
 
     def save(self, company: Company) -> Company:
-        existing = self._company_dao.get_by_id(company_id=company.id)
         company_data = {
             "id": company.id,
             "name": company.name,
@@ -36,10 +37,7 @@ class PostgresCompanyRepository(ICompanyRepository):
             "updated_at": company.updated_at,
         }
 
-        if existing:
-            row = self._company_dao.update(company_data)
-        else:
-            row = self._company_dao.insert(company_data)
+        row = self._company_dao.upsert(company_data)
 
         return self._parse_row(row=row)
 
@@ -54,6 +52,10 @@ class PostgresCompanyRepository(ICompanyRepository):
         rows = self._company_dao.get_all()
         return [self._parse_row(row=row) for row in rows]
 
+    def iter_all(self) -> Iterator[Company]:
+        for row in self._company_dao.iter_all():
+            yield self._parse_row(row=row)
+
     def delete(self, company_id: str) -> None:
         self.get_by_id(company_id=company_id)
         self._company_dao.delete(company_id=company_id)
@@ -1,8 +1,15 @@
+from collections.abc import Iterator
+
 from src.domain.entities.contact import Contact
 from src.domain.errors import ContactNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
 from src.domain.repositories.contact_repository import IContactRepository
 from src.infrastructure.daos.postgres_contact_dao import PostgresContactDAO
 
+# Contact listings page on (name, id), search results on (rank, name, id)
+CONTACT_CURSOR_TYPES = (str, str)
+CONTACT_SEARCH_CURSOR_TYPES = (float, str, str)
+
 
 class PostgresContactRepository(IContactRepository):
     def __init__(self, contact_dao: PostgresContactDAO):
@@ -10,22 +17,40 @@ class PostgresContactRepository(IContactRepository):
 
     @staticmethod
     def _parse_row(row: tuple) -> Contact:
-        return Contact(
-            id=row[0],
-            name=row[1],
-            phone_number=row[2],
-            email=row[3],
-            company_id=row[4],
-            is_blocked=row[5],
-            tags=row[6].split(",") if row[6] else [],
-            notes=row[7],
-            last_contact_at=row[8],
-            created_at=row[9],
-            updated_at=row[10],
+        contact = Contact.__new__(Contact)
+        contact.id = row[0]
+        contact.name = row[1]
+        contact.phone_number = row[2]
+        contact.email = row[3]
+        contact.company_id = row[4]
+        contact.is_blocked = row[5]
+        contact.tags = row[6].split(",") if row[6] else []
+        contact.notes = row[7]
+        contact.last_contact_at = row[8]
+        contact.created_at = row[9]
+        contact.updated_at = row[10]
+        return contact
+
+    @staticmethod
+    def _page(rows: list[tuple], limit: int) -> Page[Contact]:
+        return build_page(
+            rows,
+            limit,
+            key=lambda row: (row[1], row[0]),
+            parse=PostgresContactRepository._parse_row,
+        )
+
+    @staticmethod
+    def _search_page(rows: list[tuple], limit: int) -> Page[Contact]:
+        # The DAO appends the match rank as the last column
+        return build_page(
+            rows,
+            limit,
+            key=lambda row: (row[11], row[1], row[0]),
+            parse=PostgresContactRepository._parse_row,
         )
 
     def save(self, contact: Contact) -> Contact:
-        existing = self._contact_dao.get_by_id(contact_id=contact.id)
         contact_data = {
             "id": contact.id,
             "name": contact.name,
@@ -39,10 +64,7 @@ class PostgresContactRepository(IContactRepository):
             "updated_at": contact.updated_at,
         }
 
-        if existing:
-            row = self._contact_dao.update(contact_data)
-        else:
-            row = self._contact_dao.insert(contact_data)
+        row = self._contact_dao.upsert(contact_data)
 
         return self._parse_row(row=row)
 
@@ -53,9 +75,18 @@ class PostgresContactRepository(IContactRepository):
 
         return self._parse_row(row=row)
 
-    def get_by_company_id(self, company_id: str) -> list[Contact]:
-        rows = self._contact_dao.get_by_company_id(company_id=company_id)
-        return [self._parse_row(row=row) for row in rows]
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
+        rows = self._contact_dao.get_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CONTACT_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
 
     def get_by_phone_number(self, phone_number: str) -> Contact:
         row = self._contact_dao.get_by_phone_number(phone_number=phone_number)
@@ -79,9 +110,28 @@ class PostgresContactRepository(IContactRepository):
         rows = self._contact_dao.get_all()
         return [self._parse_row(row=row) for row in rows]
 
-    def search_contacts(self, company_id: str, query: str) -> list[Contact]:
-        rows = self._contact_dao.search_contacts(company_id=company_id, query=query)
-        return [self._parse_row(row=row) for row in rows]
+    def iter_all(self) -> Iterator[Contact]:
+        for row in self._contact_dao.iter_all():
+            yield self._parse_row(row=row)
+
+    def iter_by_company_id(self, company_id: str) -> Iterator[Contact]:
+        for row in self._contact_dao.iter_by_company_id(company_id=company_id):
+            yield self._parse_row(row=row)
+
+    def search_contacts(
+        self,
+        company_id: str,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
+        rows = self._contact_dao.search_contacts(
+            company_id=company_id,
+            query=query,
+            limit=limit + 1,
+            after=decode_cursor(cursor, CONTACT_SEARCH_CURSOR_TYPES),
+        )
+        return self._search_page(rows=rows, limit=limit)
 
     def delete(self, contact_id: str) -> None:
         self.get_by_id(contact_id=contact_id)
@@ -0,0 +1,73 @@
+from src.domain.entities.ingestion_job import IngestionJob
+from src.domain.repositories.ingestion_queue_repository import (
+    IIngestionQueueRepository,
+    IngestionQueueStats,
+)
+from src.infrastructure.daos.postgres_ingestion_queue_dao import (
+    PostgresIngestionQueueDAO,
+)
+
+
+class PostgresIngestionQueueRepository(IIngestionQueueRepository):
+    def __init__(self, ingestion_queue_dao: PostgresIngestionQueueDAO):
+        self._ingestion_queue_dao = ingestion_queue_dao
+
+    @staticmethod
+    def _parse_row(row: tuple) -> IngestionJob:
+        return IngestionJob(
+            id=row[0],
+            payload=row[1],
+            attempts=row[2],
+            available_at=row[3],
+            last_error=row[4],
+            created_at=row[5],
+            updated_at=row[6],
+        )
+
+    def enqueue(self, job: IngestionJob) -> IngestionJob:
+        row = self._ingestion_queue_dao.insert(
+            {
+                "id": job.id,
+                "payload": job.payload,
+                "attempts": job.attempts,
+                "available_at": job.available_at,
+                "last_error": job.last_error,
+                "created_at": job.created_at,
+            }
+        )
+        return self._parse_row(row=row)
+
+    def claim(self, limit: int, lease_seconds: float) -> list[IngestionJob]:
+        rows = self._ingestion_queue_dao.claim(limit=limit, lease_seconds=lease_seconds)
+        # UPDATE ... RETURNING does not keep the subquery's order
+        return sorted(
+            (self._parse_row(row=row) for row in rows),
+            key=lambda job: (job.created_at, job.id),
+        )
+
+    def complete(self, job_ids: list[str]) -> None:
+        if job_ids:
+            self._ingestion_queue_dao.delete_many(job_ids=job_ids)
+
+    def retry(self, job: IngestionJob) -> None:
+        self._ingestion_queue_dao.update(
+            {
+                "id": job.id,
+                "attempts": job.attempts,
+                "available_at": job.available_at,
+                "last_error": job.last_error,
+            }
+        )
+
+    def dead_letter(self, job: IngestionJob) -> None:
+        self._ingestion_queue_dao.move_to_dead_letters(
+            {"id": job.id, "attempts": job.attempts, "last_error": job.last_error}
+        )
+
+    def stats(self) -> IngestionQueueStats:
+        pending, dead_letters, lag_seconds = self._ingestion_queue_dao.stats()
+        return IngestionQueueStats(
+            pending=pending,
+            dead_letters=dead_letters,
+            lag_seconds=float(lag_seconds),
+        )
@@ -1,8 +1,15 @@
+from collections.abc import Iterator
+from datetime import datetime
+
 from src.domain.entities.message import Message
 from src.domain.errors import MessageNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
 from src.domain.repositories.message_repository import IMessageRepository
 from src.infrastructure.daos.postgres_message_dao import PostgresMessageDAO
 
+# Chat history pages backwards on (external_timestamp, id)
+MESSAGE_CURSOR_TYPES = (datetime, str)
+
 
 class PostgresMessageRepository(IMessageRepository):
     def __init__(self, message_dao: PostgresMessageDAO):
@@ -10,20 +17,38 @@ class PostgresMessageRepository(IMessageRepository):
 
     @staticmethod
     def _parse_row(row: tuple) -> Message:
-        return Message(
-            id=row[0],
-            external_id=row[1],
-            external_timestamp=row[2],
-            chat_id=row[3],
-            text=row[4],
-            sent_by_user_id=row[5],
-            read=row[6],
-            created_at=row[7],
-            updated_at=row[8],
+        message = Message.__new__(Message)
+        message.id = row[0]
+        message.external_id = row[1]
+        message.external_timestamp = row[2]
+        message.chat_id = row[3]
+        message.text = row[4]
+        message.sent_by_user_id = row[5]
+        message.read = row[6]
+        message.created_at = row[7]
+        message.updated_at = row[8]
+        return message
+
+    @staticmethod
+    def _page(rows: list[tuple], limit: int) -> Page[Message]:
+        # Rows come newest first; the cursor points at the oldest message of
+        # the page and the page itself is handed back in chronological order.
+        page = build_page(
+            rows,
+            limit,
+            key=lambda row: (row[2], row[0]),
+            parse=PostgresMessageRepository._parse_row,
         )
+        return Page(items=page.items[::-1], next_cursor=page.next_cursor)
 
     def save(self, message: Message) -> Message:
-        existing = self.message_dao.get_by_id(message_id=message.id)
+        """
+        Insert the message, or update it if it is already stored.
+
+        The insert skips an external_id that is already stored, so a
+        redelivery saved under a new id returns the stored message instead
+        of failing. A message's external_id never changes.
+        """
         message_data = {
             "id": message.id,
             "external_id": message.external_id,
@@ -36,10 +61,11 @@ class PostgresMessageRepository(IMessageRepository):
             "updated_at": message.updated_at,
         }
 
-        if existing:
+        row = self.message_dao.insert(message_data)
+        if row is None:
             row = self.message_dao.update(message_data)
-        else:
-            row = self.message_dao.insert(message_data)
+        if row is None:
+            row = self.message_dao.get_by_external_id(external_id=message.external_id)
 
         return self._parse_row(row=row)
 
@@ -57,10 +83,31 @@ class PostgresMessageRepository(IMessageRepository):
 
         return self._parse_row(row=row)
 
+    def save_many(self, messages: list[Message]) -> list[Message]:
+        rows = self.message_dao.insert_many(
+            [
+                {
+                    "id": message.id,
+                    "external_id": message.external_id,
+                    "external_timestamp": message.external_timestamp,
+                    "chat_id": message.chat_id,
+                    "text": message.text,
+                    "sent_by_user_id": message.sent_by_user_id,
+                    "read": message.read,
+                }
+                for message in messages
+            ]
+        )
+        return [self._parse_row(row=row) for row in rows]
+
     def get_all(self) -> list[Message]:
         rows = self.message_dao.get_all()
         return [self._parse_row(row=row) for row in rows]
 
+    def iter_all(self) -> Iterator[Message]:
+        for row in self.message_dao.iter_all():
+            yield self._parse_row(row=row)
+
     def delete(self, message_id: str) -> None:
         self.get_by_id(message_id=message_id)
         self.message_dao.delete(message_id=message_id)
@@ -69,6 +116,19 @@ class PostgresMessageRepository(IMessageRepository):
         updated_count = self.message_dao.mark_chat_messages_as_read(chat_id=chat_id)
         return updated_count
 
-    def get_by_chat_id(self, chat_id: str) -> list[Message]:
-        rows = self.message_dao.get_by_chat_id(chat_id=chat_id)
-        return [self._parse_row(row=row) for row in rows]
+    def get_by_chat_id(
+        self,
+        chat_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: str | None = None,
+    ) -> Page[Message]:
+        rows = self.message_dao.get_by_chat_id(
+            chat_id=chat_id,
+            limit=limit + 1,
+            before=decode_cursor(before, MESSAGE_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    def iter_by_chat_id(self, chat_id: str) -> Iterator[Message]:
+        for row in self.message_dao.iter_by_chat_id(chat_id=chat_id):
+            yield self._parse_row(row=row)
@@ -1,9 +1,20 @@
+from collections.abc import Iterator
+from datetime import datetime
+
 from src.domain.entities.user import User
 from src.domain.enums import UserTypes
 from src.domain.errors import UserNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page, build_page, decode_cursor
 from src.domain.repositories.user_repository import IUserRepository
 from src.infrastructure.daos.postgres_user_dao import PostgresUserDAO
 
+# User listings page on (created_at, id), search results on (rank, created_at, id)
+USER_CURSOR_TYPES = (datetime, str)
+USER_SEARCH_CURSOR_TYPES = (float, datetime, str)
+
+# Looking a stored value up is cheaper than calling UserTypes(value)
+USER_TYPES = {user_type.value: user_type for user_type in UserTypes}
+
 
 class PostgresUserRepository(IUserRepository):
     def __init__(self, user_dao: PostgresUserDAO):
@@ -12,35 +23,53 @@ class PostgresUserRepository(IUserRepository):
     @staticmethod
     def _parse_row(row: tuple) -> User:
         """Parse row from get_by_id or get_all (without password_hash)."""
-        return User(
-            id=row[0],
-            name=row[1],
-            email=row[2],
-            type=UserTypes(row[3]),
-            password_hash=None,
-            company_id=row[4],
-            is_active=row[5],
-            created_at=row[6],
-            updated_at=row[7],
+        user = User.__new__(User)
+        user.id = row[0]
+        user.name = row[1]
+        user.email = row[2]
+        user.type = USER_TYPES[row[3]]
+        user.password_hash = None
+        user.company_id = row[4]
+        user.is_active = row[5]
+        user.created_at = row[6]
+        user.updated_at = row[7]
+        return user
+
+    @staticmethod
+    def _page(rows: list[tuple], limit: int) -> Page[User]:
+        return build_page(
+            rows,
+            limit,
+            key=lambda row: (row[6], row[0]),
+            parse=PostgresUserRepository._parse_row,
+        )
+
+    @staticmethod
+    def _search_page(rows: list[tuple], limit: int) -> Page[User]:
+        # The DAO appends the match rank as the last column
+        return build_page(
+            rows,
+            limit,
+            key=lambda row: (row[8], row[6], row[0]),
+            parse=PostgresUserRepository._parse_row,
         )
 
     @staticmethod
     def _parse_row_with_password(row: tuple) -> User:
         """Parse row from get_by_email (with password_hash)."""
-        return User(
-            id=row[0],
-            name=row[1],
-            email=row[2],
-            type=UserTypes(row[3]),
-            password_hash=row[4],
-            company_id=row[5],
-            is_active=row[6],
-            created_at=row[7],
-            updated_at=row[8],
-        )
+        user = User.__new__(User)
+        user.id = row[0]
+        user.name = row[1]
+        user.email = row[2]
+        user.type = USER_TYPES[row[3]]
+        user.password_hash = row[4]
+        user.company_id = row[5]
+        user.is_active = row[6]
+        user.created_at = row[7]
+        user.updated_at = row[8]
+        return user
 
     def save(self, user: User) -> User:
-        existing = self.user_dao.get_by_id(user_id=user.id)
         user_data = {
             "id": user.id,
             "name": user.name,
@@ -53,10 +82,7 @@ class PostgresUserRepository(IUserRepository):
             "updated_at": user.updated_at,
         }
 
-        if existing:
-            row = self.user_dao.update(user_data)
-        else:
-            row = self.user_dao.insert(user_data)
+        row = self.user_dao.upsert(user_data)
 
         return self._parse_row(row=row)
 
@@ -78,6 +104,14 @@ class PostgresUserRepository(IUserRepository):
         rows = self.user_dao.get_all()
         return [self._parse_row(row=row) for row in rows]
 
+    def iter_all(self) -> Iterator[User]:
+        for row in self.user_dao.iter_all():
+            yield self._parse_row(row=row)
+
+    def iter_by_company_id(self, company_id: str) -> Iterator[User]:
+        for row in self.user_dao.iter_by_company_id(company_id=company_id):
+            yield self._parse_row(row=row)
+
     def delete(self, user_id: str) -> None:
         self.get_by_id(user_id=user_id)
         self.user_dao.delete(user_id=user_id)
@@ -87,22 +121,47 @@ class PostgresUserRepository(IUserRepository):
         self.get_by_id(user_id=user_id)  # Verify user exists
         self.user_dao.update_password(user_id=user_id, password_hash=password_hash)
 
-    def get_by_company_id(self, company_id: str) -> list[User]:
-        rows = self.user_dao.get_by_company_id(company_id=company_id)
-        return [self._parse_row(row=row) for row in rows]
-
-    def get_by_company_and_role(self, company_id: str, role: UserTypes) -> list[User]:
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]:
+        rows = self.user_dao.get_by_company_id(
+            company_id=company_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor, USER_CURSOR_TYPES),
+        )
+        return self._page(rows=rows, limit=limit)
+
+    def get_by_company_and_role(
+        self,
+        company_id: str,
+        role: UserTypes,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]:
         rows = self.user_dao.get_by_company_and_role(
-            company_id=company_id, role=role.value
+            company_id=company_id,
+            role=role.value,
+            limit=limit + 1,
+            after=decode_cursor(cursor, USER_CURSOR_TYPES),
         )
-        return [self._parse_row(row=row) for row in rows]
+        return self._page(rows=rows, limit=limit)
 
     def search_users(
-        self, company_id: str, query: str, role: UserTypes | None = None
-    ) -> list[User]:
+        self,
+        company_id: str,
+        query: str,
+        role: UserTypes | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]:
         rows = self.user_dao.search_users(
             company_id=company_id,
             query=query,
             role=role.value if role else None,
+            limit=limit + 1,
+            after=decode_cursor(cursor, USER_SEARCH_CURSOR_TYPES),
         )
-        return [self._parse_row(row=row) for row in rows]
+        return self._search_page(rows=rows, limit=limit)
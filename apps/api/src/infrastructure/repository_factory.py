@@ -1,9 +1,35 @@
+from src.infrastructure.daos.async_postgres_chat_dao import AsyncPostgresChatDAO
+from src.infrastructure.daos.async_postgres_contact_dao import (
+    AsyncPostgresContactDAO,
+)
+from src.infrastructure.daos.async_postgres_message_dao import (
+    AsyncPostgresMessageDAO,
+)
 from src.infrastructure.daos.postgres_chat_dao import PostgresChatDAO
 from src.infrastructure.daos.postgres_company_dao import PostgresCompanyDAO
 from src.infrastructure.daos.postgres_contact_dao import PostgresContactDAO
+from src.infrastructure.daos.postgres_ingestion_queue_dao import (
+    PostgresIngestionQueueDAO,
+)
 from src.infrastructure.daos.postgres_message_dao import PostgresMessageDAO
 from src.infrastructure.daos.postgres_user_dao import PostgresUserDAO
+from src.infrastructure.database.async_postgres_pool import (
+    AsyncPostgresConnectionPool,
+)
+from src.infrastructure.database.async_postgres_unit_of_work import (
+    AsyncPostgresUnitOfWork,
+)
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
 from src.infrastructure.enums import DatabaseType
+from src.infrastructure.repositories.async_postgres_chat_repository import (
+    AsyncPostgresChatRepository,
+)
+from src.infrastructure.repositories.async_postgres_contact_repository import (
+    AsyncPostgresContactRepository,
+)
+from src.infrastructure.repositories.async_postgres_message_repository import (
+    AsyncPostgresMessageRepository,
+)
 from src.infrastructure.repositories.postgres_chat_repository import (
     PostgresChatRepository,
 )
@@ -13,6 +39,9 @@ from src.infrastructure.repositories.postgres_company_repository import (
 from src.infrastructure.repositories.postgres_contact_repository import (
     PostgresContactRepository,
 )
+from src.infrastructure.repositories.postgres_ingestion_queue_repository import (
+    PostgresIngestionQueueRepository,
+)
 from src.infrastructure.repositories.postgres_message_repository import (
     PostgresMessageRepository,
 )
@@ -20,6 +49,7 @@ from src.infrastructure.repositories.postgres_user_repository import (
     PostgresUserRepository,
 )
 from src.infrastructure.settings import AppSettings
+from tests.fakes.fake_in_memory_unit_of_work import InMemoryUnitOfWork
 from tests.fakes.repositories.fake_in_memory_chat_repository import (
     InMemoryChatRepository,
 )
@@ -29,6 +59,9 @@ from tests.fakes.repositories.fake_in_memory_company_repository import (
 from tests.fakes.repositories.fake_in_memory_contact_repository import (
     InMemoryContactRepository,
 )
+from tests.fakes.repositories.fake_in_memory_ingestion_queue_repository import (
+    InMemoryIngestionQueueRepository,
+)
 from tests.fakes.repositories.fake_in_memory_message_repository import (
     InMemoryMessageRepository,
 )
@@ -37,6 +70,18 @@ from tests.fakes.repositories.fake_in_memory_user_repository import (
 )
 
 
+def split_pool_size(max_size: int) -> tuple[int, int]:
+    """
+    Split a worker's connection budget between the psycopg2 and asyncpg pools.
+
+    Returns (sync, async) sizes adding up to ``max_size``, with at least one
+    connection each. The asyncpg pool gets the odd connection: it serves the
+    chat and message routes and ingestion.
+    """
+    sync_size = max(1, max_size // 2)
+    return sync_size, max(1, max_size - sync_size)
+
+
 def create_repositories(settings: AppSettings) -> dict:
     """
     Factory function to create all repositories based on database type.
@@ -52,35 +97,120 @@ def create_repositories(settings: AppSettings) -> dict:
             "company": ICompanyRepository,
             "contact": IContactRepository,
             "chat": IChatRepository,
-            "message": IMessageRepository
+            "message": IMessageRepository,
+            "ingestion_queue": IIngestionQueueRepository,
+            "connection_pool": PostgresConnectionPool | None,
+            "async_contact": IAsyncContactRepository | None,
+            "async_chat": IAsyncChatRepository | None,
+            "async_message": IAsyncMessageRepository | None,
+            "async_connection_pool": AsyncPostgresConnectionPool | None,
+            "unit_of_work": IUnitOfWork | None
         }
+
+        All Postgres DAOs share a single connection pool, which is also
+        returned so the app can expose its stats and close it on shutdown.
+        The async_postgres backend splits DATABASE_POOL_MAX_SIZE between
+        that pool and its asyncpg pool (see split_pool_size).
+
+        The async_* repositories are only created for the async_postgres
+        backend. It keeps the sync repositories for the routes that have not
+        moved to async controllers yet.
+
+        unit_of_work is None for the postgres backend: its unit of work is
+        bound to a route group's thread pool, so the web layer builds it per
+        request from connection_pool.
     """
     database_type = settings.DATABASE_TYPE
 
-    if database_type == DatabaseType.POSTGRES:
-        database_url = settings.DATABASE_URL
+    if database_type in (DatabaseType.POSTGRES, DatabaseType.ASYNC_POSTGRES):
+        pool_size = async_pool_size = settings.DATABASE_POOL_MAX_SIZE
+        if database_type == DatabaseType.ASYNC_POSTGRES:
+            pool_size, async_pool_size = split_pool_size(pool_size)
 
-        user_dao = PostgresUserDAO(database_url)
-        company_dao = PostgresCompanyDAO(database_url)
-        contact_dao = PostgresContactDAO(database_url)
-        chat_dao = PostgresChatDAO(database_url)
-        message_dao = PostgresMessageDAO(database_url)
+        connection_pool = PostgresConnectionPool(
+            database_url=settings.DATABASE_URL,
+            min_size=min(settings.DATABASE_POOL_MIN_SIZE, pool_size),
+            max_size=pool_size,
+            timeout=settings.DATABASE_POOL_TIMEOUT,
+            max_lifetime=settings.DATABASE_POOL_MAX_LIFETIME,
+        )
 
-        return {
+        itersize = settings.DATABASE_ITERSIZE
+        user_dao = PostgresUserDAO(connection_pool, itersize=itersize)
+        company_dao = PostgresCompanyDAO(connection_pool, itersize=itersize)
+        contact_dao = PostgresContactDAO(connection_pool, itersize=itersize)
+        chat_dao = PostgresChatDAO(connection_pool, itersize=itersize)
+        message_dao = PostgresMessageDAO(connection_pool, itersize=itersize)
+
+        repositories = {
             "user": PostgresUserRepository(user_dao),
             "company": PostgresCompanyRepository(company_dao),
             "contact": PostgresContactRepository(contact_dao),
             "chat": PostgresChatRepository(chat_dao),
             "message": PostgresMessageRepository(message_dao),
+            "ingestion_queue": PostgresIngestionQueueRepository(
+                PostgresIngestionQueueDAO(connection_pool)
+            ),
+            "connection_pool": connection_pool,
+            "async_contact": None,
+            "async_chat": None,
+            "async_message": None,
+            "async_connection_pool": None,
+            "unit_of_work": None,
         }
 
+        if database_type == DatabaseType.ASYNC_POSTGRES:
+            async_connection_pool = AsyncPostgresConnectionPool(
+                database_url=settings.DATABASE_URL,
+                min_size=min(settings.DATABASE_POOL_MIN_SIZE, async_pool_size),
+                max_size=async_pool_size,
+                timeout=settings.DATABASE_POOL_TIMEOUT,
+                max_lifetime=settings.DATABASE_POOL_MAX_LIFETIME,
+            )
+
+            repositories.update(
+                {
+                    "async_contact": AsyncPostgresContactRepository(
+                        AsyncPostgresContactDAO(async_connection_pool)
+                    ),
+                    "async_chat": AsyncPostgresChatRepository(
+                        AsyncPostgresChatDAO(
+                            async_connection_pool,
+                            itersize=itersize,
+                        )
+                    ),
+                    "async_message": AsyncPostgresMessageRepository(
+                        AsyncPostgresMessageDAO(
+                            async_connection_pool,
+                            itersize=itersize,
+                        )
+                    ),
+                    "async_connection_pool": async_connection_pool,
+                    "unit_of_work": AsyncPostgresUnitOfWork(async_connection_pool),
+                }
+            )
+
+        return repositories
+
     elif database_type == DatabaseType.INMEMORY:
+        contact_repository = InMemoryContactRepository()
+        message_repository = InMemoryMessageRepository()
         return {
             "user": InMemoryUserRepository(),
             "company": InMemoryCompanyRepository(),
-            "contact": InMemoryContactRepository(),
-            "chat": InMemoryChatRepository(),
-            "message": InMemoryMessageRepository(),
+            "contact": contact_repository,
+            "chat": InMemoryChatRepository(
+                contact_repository=contact_repository,
+                message_repository=message_repository,
+            ),
+            "message": message_repository,
+            "ingestion_queue": InMemoryIngestionQueueRepository(),
+            "connection_pool": None,
+            "async_contact": None,
+            "async_chat": None,
+            "async_message": None,
+            "async_connection_pool": None,
+            "unit_of_work": InMemoryUnitOfWork(),
         }
 
     else:
@@ -2,15 +2,25 @@ import re
 
 import bcrypt
 
+DEFAULT_BCRYPT_ROUNDS = 12
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
+
+def hash_password(password: str, rounds: int = DEFAULT_BCRYPT_ROUNDS) -> str:
+    """Hash a password using bcrypt with a cost factor of ``rounds``."""
     password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
 
+def password_needs_rehash(hashed_password: str, rounds: int) -> bool:
+    """Whether a bcrypt hash ($2b$<rounds>$...) was made with another cost."""
+    try:
+        return int(hashed_password.split("$")[2]) != rounds
+    except (IndexError, ValueError):
+        return True
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
     password_bytes = plain_password.encode("utf-8")
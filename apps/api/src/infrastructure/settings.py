@@ -18,6 +18,35 @@ class AppSettings:
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_DAYS: int
     SECURE_COOKIES: bool
+    DATABASE_POOL_MIN_SIZE: int = 1
+    DATABASE_POOL_MAX_SIZE: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30.0
+    DATABASE_POOL_MAX_LIFETIME: float = 1800.0
+    THREAD_POOL_WEBHOOK_SIZE: int = 8
+    THREAD_POOL_READS_SIZE: int = 16
+    THREAD_POOL_AUTH_SIZE: int = 4
+    INGESTION_SHARDS: int = 4
+    INGESTION_BATCH_SIZE: int = 100
+    INGESTION_POLL_INTERVAL: float = 1.0
+    INGESTION_LEASE_SECONDS: float = 60.0
+    INGESTION_MAX_ATTEMPTS: int = 5
+    INGESTION_RETRY_BASE_SECONDS: float = 1.0
+    INGESTION_RETRY_MAX_SECONDS: float = 300.0
+    IDEMPOTENCY_CACHE_SIZE: int = 100_000
+    IDEMPOTENCY_BLOOM_BITS: int = 0
+    BUSINESS_NUMBER_CACHE_TTL_SECONDS: float = 300.0
+    BUSINESS_NUMBER_CACHE_SIZE: int = 10_000
+    CONVERSATION_CACHE_TTL_SECONDS: float = 3600.0
+    CONVERSATION_CACHE_SIZE: int = 100_000
+    USER_CACHE_TTL_SECONDS: float = 60.0
+    USER_CACHE_SIZE: int = 10_000
+    BCRYPT_ROUNDS: int = 12
+    DATABASE_ITERSIZE: int = 1000
+    EVENTS_MAX_PENDING: int = 100
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    EVENTS_CHANNEL: str = "convo_events"
+    EVENTS_RECONNECT_SECONDS: float = 1.0
+    STREAMING_MAX_CONCURRENT: int = 4
 
 
 def load_settings() -> AppSettings:
@@ -43,4 +72,45 @@ def load_settings() -> AppSettings:
         ACCESS_TOKEN_EXPIRE_MINUTES=int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15")),
         REFRESH_TOKEN_EXPIRE_DAYS=int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7")),
         SECURE_COOKIES=os.getenv("SECURE_COOKIES", "false").lower() == "true",
+        DATABASE_POOL_MIN_SIZE=int(os.getenv("DATABASE_POOL_MIN_SIZE", "1")),
+        DATABASE_POOL_MAX_SIZE=int(os.getenv("DATABASE_POOL_MAX_SIZE", "10")),
+        DATABASE_POOL_TIMEOUT=float(os.getenv("DATABASE_POOL_TIMEOUT", "30")),
+        DATABASE_POOL_MAX_LIFETIME=float(
+            os.getenv("DATABASE_POOL_MAX_LIFETIME", "1800")
+        ),
+        THREAD_POOL_WEBHOOK_SIZE=int(os.getenv("THREAD_POOL_WEBHOOK_SIZE", "8")),
+        THREAD_POOL_READS_SIZE=int(os.getenv("THREAD_POOL_READS_SIZE", "16")),
+        THREAD_POOL_AUTH_SIZE=int(os.getenv("THREAD_POOL_AUTH_SIZE", "4")),
+        INGESTION_SHARDS=int(os.getenv("INGESTION_SHARDS", "4")),
+        INGESTION_BATCH_SIZE=int(os.getenv("INGESTION_BATCH_SIZE", "100")),
+        INGESTION_POLL_INTERVAL=float(os.getenv("INGESTION_POLL_INTERVAL", "1")),
+        INGESTION_LEASE_SECONDS=float(os.getenv("INGESTION_LEASE_SECONDS", "60")),
+        INGESTION_MAX_ATTEMPTS=int(os.getenv("INGESTION_MAX_ATTEMPTS", "5")),
+        INGESTION_RETRY_BASE_SECONDS=float(
+            os.getenv("INGESTION_RETRY_BASE_SECONDS", "1")
+        ),
+        INGESTION_RETRY_MAX_SECONDS=float(
+            os.getenv("INGESTION_RETRY_MAX_SECONDS", "300")
+        ),
+        IDEMPOTENCY_CACHE_SIZE=int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "100000")),
+        IDEMPOTENCY_BLOOM_BITS=int(os.getenv("IDEMPOTENCY_BLOOM_BITS", "0")),
+        BUSINESS_NUMBER_CACHE_TTL_SECONDS=float(
+            os.getenv("BUSINESS_NUMBER_CACHE_TTL_SECONDS", "300")
+        ),
+        BUSINESS_NUMBER_CACHE_SIZE=int(
+            os.getenv("BUSINESS_NUMBER_CACHE_SIZE", "10000")
+        ),
+        CONVERSATION_CACHE_TTL_SECONDS=float(
+            os.getenv("CONVERSATION_CACHE_TTL_SECONDS", "3600")
+        ),
+        CONVERSATION_CACHE_SIZE=int(os.getenv("CONVERSATION_CACHE_SIZE", "100000")),
+        USER_CACHE_TTL_SECONDS=float(os.getenv("USER_CACHE_TTL_SECONDS", "60")),
+        USER_CACHE_SIZE=int(os.getenv("USER_CACHE_SIZE", "10000")),
+        BCRYPT_ROUNDS=int(os.getenv("BCRYPT_ROUNDS", "12")),
+        DATABASE_ITERSIZE=int(os.getenv("DATABASE_ITERSIZE", "1000")),
+        EVENTS_MAX_PENDING=int(os.getenv("EVENTS_MAX_PENDING", "100")),
+        EVENTS_HEARTBEAT_SECONDS=float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15")),
+        EVENTS_CHANNEL=os.getenv("EVENTS_CHANNEL", "convo_events"),
+        EVENTS_RECONNECT_SECONDS=float(os.getenv("EVENTS_RECONNECT_SECONDS", "1")),
+        STREAMING_MAX_CONCURRENT=int(os.getenv("STREAMING_MAX_CONCURRENT", "4")),
     )
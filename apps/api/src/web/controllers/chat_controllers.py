@@ -1,21 +1,42 @@
+from src.application.dtos.serializers import (
+    serialize_chat,
+    serialize_inbox_chat,
+    serialize_message,
+)
 from src.application.use_cases.chat_use_cases import (
     AssignAttendantToChatUseCase,
+    DeleteChatUseCase,
     GetChatsByAttendantUseCase,
     GetChatUseCase,
+    GetInboxUseCase,
     GetPendingChatsUseCase,
     GetResolvedChatsUseCase,
     GetUnassignedChatsUseCase,
     ListChatsByCompanyUseCase,
     SearchChatsUseCase,
+    StreamChatsByCompanyUseCase,
 )
 from src.application.use_cases.message_use_cases import (
     GetChatMessagesUseCase,
     MarkChatAsReadUseCase,
     SendMessageUseCase,
+    StreamChatMessagesUseCase,
 )
-from src.domain.errors import ChatNotFoundError
+from src.domain.enums import InboxFilters
+from src.domain.errors import ChatNotFoundError, InvalidCursorError
 from src.web.controllers.interfaces import IChatHttpController, IMessageHttpController
-from src.web.http_types import HttpRequest, HttpResponse, StatusCodes
+from src.web.controllers.pagination import (
+    InvalidPageParamsError,
+    page_body,
+    page_params,
+)
+from src.web.controllers.streaming import stream_format
+from src.web.http_types import (
+    HttpRequest,
+    HttpResponse,
+    HttpStreamResponse,
+    StatusCodes,
+)
 
 # class CreateCompanyHttpController(ICompanyHttpController):
 #     def handle(self, request: HttpRequest) -> HttpResponse:
@@ -83,12 +104,12 @@ from src.web.http_types import HttpRequest, HttpResponse, StatusCodes
 
 
 class GetChatHttpController(IChatHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = GetChatUseCase(chat_repository=self._chat_repository)
         chat_id = request.path_params["chat_id"]
 
         try:
-            chat = use_case.execute(chat_id=chat_id)
+            chat = await use_case.execute(chat_id=chat_id)
         except ChatNotFoundError:
             return HttpResponse(
                 status_code=StatusCodes.NOT_FOUND.value,
@@ -97,50 +118,52 @@ class GetChatHttpController(IChatHttpController):
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body={
-                "id": chat.id,
-                "company_id": chat.company_id,
-                "contact_id": chat.contact_id,
-                "status": chat.status.value,
-                "attached_user_id": chat.attached_user_id,
-                "created_at": chat.created_at.isoformat(),
-                "updated_at": chat.updated_at.isoformat() if chat.updated_at else None,
-            },
+            body=serialize_chat(chat),
         )
 
 
 class ListChatsByCompanyHttpController(IChatHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse | HttpStreamResponse:
+        stream = stream_format(request)
+        if stream is not None:
+            chats = StreamChatsByCompanyUseCase(
+                chat_repository=self._chat_repository
+            ).execute(company_id=request.query_params["company_id"])
+            return HttpStreamResponse(
+                status_code=StatusCodes.OK.value,
+                items=(serialize_chat(chat) async for chat in chats),
+                format=stream,
+            )
+
         use_case = ListChatsByCompanyUseCase(chat_repository=self._chat_repository)
-        chats = use_case.execute(company_id=request.query_params["company_id"])
-        body = {
-            "results": [
-                {
-                    "id": chat.id,
-                    "company_id": chat.company_id,
-                    "contact_id": chat.contact_id,
-                    "status": chat.status.value,
-                    "attached_user_id": chat.attached_user_id,
-                    "created_at": chat.created_at.isoformat(),
-                    "updated_at": chat.updated_at.isoformat()
-                    if chat.updated_at
-                    else None,
-                }
-                for chat in chats
-            ],
-        }
+        try:
+            limit, cursor = page_params(request)
+            page = await use_case.execute(
+                company_id=request.query_params["company_id"],
+                limit=limit,
+                cursor=cursor,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=body,
+            body=page_body(page, serialize_chat),
         )
 
 
 class MarkChatAsReadHttpController(IMessageHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
-        use_case = MarkChatAsReadUseCase(message_repository=self._message_repository)
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        use_case = MarkChatAsReadUseCase(
+            message_repository=self._message_repository,
+            chat_repository=self._chat_repository,
+            events=self._events,
+        )
         chat_id = request.path_params["chat_id"]
-        updated_count = use_case.execute(chat_id=chat_id)
+        updated_count = await use_case.execute(chat_id=chat_id)
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
@@ -149,155 +172,162 @@ class MarkChatAsReadHttpController(IMessageHttpController):
 
 
 class GetUnassignedChatsHttpController(IChatHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = GetUnassignedChatsUseCase(chat_repository=self._chat_repository)
-        chats = use_case.execute(company_id=request.query_params["company_id"])
-        body = {
-            "results": [
-                {
-                    "id": chat.id,
-                    "company_id": chat.company_id,
-                    "contact_id": chat.contact_id,
-                    "status": chat.status.value,
-                    "attached_user_id": chat.attached_user_id,
-                    "created_at": chat.created_at.isoformat(),
-                    "updated_at": chat.updated_at.isoformat()
-                    if chat.updated_at
-                    else None,
-                }
-                for chat in chats
-            ],
-        }
+        try:
+            limit, cursor = page_params(request)
+            page = await use_case.execute(
+                company_id=request.query_params["company_id"],
+                limit=limit,
+                cursor=cursor,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=body,
+            body=page_body(page, serialize_chat),
         )
 
 
 class GetPendingChatsHttpController(IChatHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = GetPendingChatsUseCase(chat_repository=self._chat_repository)
-        chats = use_case.execute(company_id=request.query_params["company_id"])
-        body = {
-            "results": [
-                {
-                    "id": chat.id,
-                    "company_id": chat.company_id,
-                    "contact_id": chat.contact_id,
-                    "status": chat.status.value,
-                    "attached_user_id": chat.attached_user_id,
-                    "created_at": chat.created_at.isoformat(),
-                    "updated_at": chat.updated_at.isoformat()
-                    if chat.updated_at
-                    else None,
-                }
-                for chat in chats
-            ],
-        }
+        try:
+            limit, cursor = page_params(request)
+            page = await use_case.execute(
+                company_id=request.query_params["company_id"],
+                limit=limit,
+                cursor=cursor,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=body,
+            body=page_body(page, serialize_chat),
         )
 
 
 class GetResolvedChatsHttpController(IChatHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = GetResolvedChatsUseCase(chat_repository=self._chat_repository)
-        chats = use_case.execute(company_id=request.query_params["company_id"])
-        body = {
-            "results": [
-                {
-                    "id": chat.id,
-                    "company_id": chat.company_id,
-                    "contact_id": chat.contact_id,
-                    "status": chat.status.value,
-                    "attached_user_id": chat.attached_user_id,
-                    "created_at": chat.created_at.isoformat(),
-                    "updated_at": chat.updated_at.isoformat()
-                    if chat.updated_at
-                    else None,
-                }
-                for chat in chats
-            ],
-        }
+        try:
+            limit, cursor = page_params(request)
+            page = await use_case.execute(
+                company_id=request.query_params["company_id"],
+                limit=limit,
+                cursor=cursor,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=body,
+            body=page_body(page, serialize_chat),
         )
 
 
 class GetChatsByAttendantHttpController(IChatHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = GetChatsByAttendantUseCase(chat_repository=self._chat_repository)
-        chats = use_case.execute(
-            company_id=request.query_params["company_id"],
-            attendant_id=request.query_params["attendant_id"],
+        try:
+            limit, cursor = page_params(request)
+            page = await use_case.execute(
+                company_id=request.query_params["company_id"],
+                attendant_id=request.query_params["attendant_id"],
+                limit=limit,
+                cursor=cursor,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
+
+        return HttpResponse(
+            status_code=StatusCodes.OK.value,
+            body=page_body(page, serialize_chat),
         )
-        body = {
-            "results": [
-                {
-                    "id": chat.id,
-                    "company_id": chat.company_id,
-                    "contact_id": chat.contact_id,
-                    "status": chat.status.value,
-                    "attached_user_id": chat.attached_user_id,
-                    "created_at": chat.created_at.isoformat(),
-                    "updated_at": chat.updated_at.isoformat()
-                    if chat.updated_at
-                    else None,
-                }
-                for chat in chats
-            ],
-        }
+
+
+class GetInboxHttpController(IChatHttpController):
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        use_case = GetInboxUseCase(chat_repository=self._chat_repository)
+        try:
+            inbox_filter = InboxFilters(
+                request.query_params.get("filter", InboxFilters.ALL.value)
+            )
+        except ValueError:
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid filter"},
+            )
+
+        try:
+            limit, cursor = page_params(request)
+            page = await use_case.execute(
+                company_id=request.query_params["company_id"],
+                inbox_filter=inbox_filter,
+                attendant_id=request.query_params.get("attendant_id"),
+                limit=limit,
+                cursor=cursor,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=body,
+            body=page_body(page, serialize_inbox_chat),
         )
 
 
 class SearchChatsHttpController(IChatHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = SearchChatsUseCase(chat_repository=self._chat_repository)
-        chats = use_case.execute(
-            company_id=request.query_params["company_id"],
-            query=request.query_params["query"],
-            user_id=request.query_params.get("user_id"),
-        )
-        body = {
-            "results": [
-                {
-                    "id": chat.id,
-                    "company_id": chat.company_id,
-                    "contact_id": chat.contact_id,
-                    "status": chat.status.value,
-                    "attached_user_id": chat.attached_user_id,
-                    "created_at": chat.created_at.isoformat(),
-                    "updated_at": chat.updated_at.isoformat()
-                    if chat.updated_at
-                    else None,
-                }
-                for chat in chats
-            ],
-        }
+        try:
+            limit, cursor = page_params(request)
+            page = await use_case.execute(
+                company_id=request.query_params["company_id"],
+                query=request.query_params["query"],
+                user_id=request.query_params.get("user_id"),
+                limit=limit,
+                cursor=cursor,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=body,
+            body=page_body(page, serialize_chat),
         )
 
 
 class AssignAttendantToChatHttpController(IChatHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
-        use_case = AssignAttendantToChatUseCase(chat_repository=self._chat_repository)
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        use_case = AssignAttendantToChatUseCase(
+            chat_repository=self._chat_repository, events=self._events
+        )
         chat_id = request.path_params["chat_id"]
         attendant_id = request.body.get("attendant_id")
 
         try:
-            chat = use_case.execute(chat_id=chat_id, attendant_id=attendant_id)
+            chat = await use_case.execute(chat_id=chat_id, attendant_id=attendant_id)
         except ChatNotFoundError:
             return HttpResponse(
                 status_code=StatusCodes.NOT_FOUND.value,
@@ -306,57 +336,73 @@ class AssignAttendantToChatHttpController(IChatHttpController):
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body={
-                "id": chat.id,
-                "company_id": chat.company_id,
-                "contact_id": chat.contact_id,
-                "status": chat.status.value,
-                "attached_user_id": chat.attached_user_id,
-                "created_at": chat.created_at.isoformat(),
-                "updated_at": chat.updated_at.isoformat() if chat.updated_at else None,
-            },
+            body=serialize_chat(chat),
         )
 
 
+class DeleteChatHttpController(IChatHttpController):
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        use_case = DeleteChatUseCase(
+            chat_repository=self._chat_repository, conversations=self._conversations
+        )
+        chat_id = request.path_params["chat_id"]
+
+        try:
+            await use_case.execute(chat_id=chat_id)
+        except ChatNotFoundError:
+            return HttpResponse(
+                status_code=StatusCodes.NOT_FOUND.value,
+                body={"detail": "chat not found"},
+            )
+
+        return HttpResponse(status_code=StatusCodes.NO_CONTENT.value)
+
+
 class GetChatMessagesHttpController(IMessageHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse | HttpStreamResponse:
+        stream = stream_format(request)
+        if stream is not None:
+            messages = StreamChatMessagesUseCase(
+                message_repository=self._message_repository
+            ).execute(chat_id=request.path_params["chat_id"])
+            return HttpStreamResponse(
+                status_code=StatusCodes.OK.value,
+                items=(serialize_message(message) async for message in messages),
+                format=stream,
+            )
+
         use_case = GetChatMessagesUseCase(message_repository=self._message_repository)
-        chat_id = request.path_params["chat_id"]
-        messages = use_case.execute(chat_id=chat_id)
-
-        body = {
-            "results": [
-                {
-                    "id": message.id,
-                    "external_id": message.external_id,
-                    "external_timestamp": message.external_timestamp.isoformat(),
-                    "chat_id": message.chat_id,
-                    "text": message.text,
-                    "sent_by_user_id": message.sent_by_user_id,
-                    "read": message.read,
-                    "created_at": message.created_at.isoformat(),
-                    "updated_at": message.updated_at.isoformat()
-                    if message.updated_at
-                    else None,
-                }
-                for message in messages
-            ],
-        }
+        try:
+            limit, before = page_params(request, cursor_param="before")
+            page = await use_case.execute(
+                chat_id=request.path_params["chat_id"],
+                limit=limit,
+                before=before,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=body,
+            body=page_body(page, serialize_message),
         )
 
 
 class SendMessageHttpController(IMessageHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
-        use_case = SendMessageUseCase(message_repository=self._message_repository)
+    async def handle(self, request: HttpRequest) -> HttpResponse:
+        use_case = SendMessageUseCase(
+            message_repository=self._message_repository,
+            chat_repository=self._chat_repository,
+            events=self._events,
+        )
         chat_id = request.path_params["chat_id"]
         text = request.body["text"]
         sent_by_user_id = request.body["sent_by_user_id"]
 
-        message = use_case.execute(
+        message = await use_case.execute(
             chat_id=chat_id,
             text=text,
             sent_by_user_id=sent_by_user_id,
@@ -364,17 +410,5 @@ class SendMessageHttpController(IMessageHttpController):
 
         return HttpResponse(
             status_code=StatusCodes.CREATED.value,
-            body={
-                "id": message.id,
-                "external_id": message.external_id,
-                "external_timestamp": message.external_timestamp.isoformat(),
-                "chat_id": message.chat_id,
-                "text": message.text,
-                "sent_by_user_id": message.sent_by_user_id,
-                "read": message.read,
-                "created_at": message.created_at.isoformat(),
-                "updated_at": message.updated_at.isoformat()
-                if message.updated_at
-                else None,
-            },
+            body=serialize_message(message),
         )
@@ -1,3 +1,4 @@
+from src.application.dtos.serializers import serialize_company
 from src.application.use_cases.company_use_cases import (
     CreateCompanyUseCase,
     DeleteCompanyUseCase,
@@ -5,26 +6,11 @@ from src.application.use_cases.company_use_cases import (
     ListCompanyUseCase,
     UpdateCompanyUseCase,
 )
-from src.domain.entities.company import Company
 from src.domain.errors import CompanyNotFoundError
 from src.web.controllers.interfaces import ICompanyHttpController
 from src.web.http_types import HttpRequest, HttpResponse, StatusCodes
 
 
-def format_company(company: Company) -> dict:
-    return {
-        "id": company.id,
-        "name": company.name,
-        "email": company.email,
-        "phone": company.phone,
-        "is_active": company.is_active,
-        "attendant_sees_all_conversations": company.attendant_sees_all_conversations,
-        "whatsapp_api_key": company.whatsapp_api_key,
-        "created_at": company.created_at.isoformat() if company.created_at else None,
-        "updated_at": company.updated_at.isoformat() if company.updated_at else None,
-    }
-
-
 class CreateCompanyHttpController(ICompanyHttpController):
     def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = CreateCompanyUseCase(company_repository=self._repository)
@@ -40,7 +26,7 @@ class CreateCompanyHttpController(ICompanyHttpController):
         )
         return HttpResponse(
             status_code=StatusCodes.CREATED.value,
-            body=format_company(company),
+            body=serialize_company(company),
         )
 
 
@@ -56,13 +42,16 @@ class GetCompanyHttpController(ICompanyHttpController):
             )
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=format_company(company),
+            body=serialize_company(company),
         )
 
 
 class UpdateCompanyHttpController(ICompanyHttpController):
     def handle(self, request: HttpRequest) -> HttpResponse:
-        use_case = UpdateCompanyUseCase(company_repository=self._repository)
+        use_case = UpdateCompanyUseCase(
+            company_repository=self._repository,
+            business_numbers=self._business_numbers,
+        )
         kwargs = {
             "company_id": request.path_params["id"],
             "name": request.body["name"],
@@ -84,13 +73,17 @@ class UpdateCompanyHttpController(ICompanyHttpController):
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=format_company(company),
+            body=serialize_company(company),
         )
 
 
 class DeleteCompanyHttpController(ICompanyHttpController):
     def handle(self, request: HttpRequest) -> HttpResponse:
-        use_case = DeleteCompanyUseCase(company_repository=self._repository)
+        use_case = DeleteCompanyUseCase(
+            company_repository=self._repository,
+            business_numbers=self._business_numbers,
+            conversations=self._conversations,
+        )
         try:
             use_case.execute(company_id=request.path_params["id"])
         except CompanyNotFoundError:
@@ -106,7 +99,7 @@ class ListCompanyHttpController(ICompanyHttpController):
         use_case = ListCompanyUseCase(company_repository=self._repository)
         companies = use_case.execute()
         body = {
-            "results": [format_company(company) for company in companies],
+            "results": [serialize_company(company) for company in companies],
         }
 
         return HttpResponse(
@@ -1,3 +1,4 @@
+from src.application.dtos.serializers import serialize_contact
 from src.application.use_cases.contact_use_cases import (
     CreateContactUseCase,
     GetCompanyContactByPhoneUseCase,
@@ -5,33 +6,22 @@ from src.application.use_cases.contact_use_cases import (
     GetContactUseCase,
     SearchContactsUseCase,
 )
-from src.domain.entities.contact import Contact
-from src.domain.errors import ContactNotFoundError
+from src.domain.errors import ContactNotFoundError, InvalidCursorError
 from src.web.controllers.interfaces import IContactHttpController
+from src.web.controllers.pagination import (
+    InvalidPageParamsError,
+    page_body,
+    page_params,
+)
 from src.web.http_types import HttpRequest, HttpResponse, StatusCodes
 
 
-def format_contact(contact: Contact) -> dict:
-    return {
-        "id": contact.id,
-        "name": contact.name,
-        "phone_number": contact.phone_number,
-        "email": contact.email,
-        "company_id": contact.company_id,
-        "is_blocked": contact.is_blocked,
-        "tags": contact.tags,
-        "notes": contact.notes,
-        "last_contact_at": contact.last_contact_at.isoformat()
-        if contact.last_contact_at
-        else None,
-        "created_at": contact.created_at.isoformat(),
-        "updated_at": contact.updated_at.isoformat() if contact.updated_at else None,
-    }
-
-
 class CreateCompanyContactHttpController(IContactHttpController):
     def handle(self, request: HttpRequest) -> HttpResponse:
-        use_case = CreateContactUseCase(contact_repository=self._contact_repository)
+        use_case = CreateContactUseCase(
+            contact_repository=self._contact_repository,
+            business_numbers=self._business_numbers,
+        )
         contact = use_case.execute(
             company_id=request.body["company_id"],
             name=request.body["name"],
@@ -43,7 +33,7 @@ class CreateCompanyContactHttpController(IContactHttpController):
 
         return HttpResponse(
             status_code=StatusCodes.CREATED.value,
-            body=format_contact(contact),
+            body=serialize_contact(contact),
         )
 
 
@@ -60,7 +50,7 @@ class GetContactHttpController(IContactHttpController):
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=format_contact(contact),
+            body=serialize_contact(contact),
         )
 
 
@@ -70,11 +60,18 @@ class GetCompanyContactsHttpController(IContactHttpController):
         use_case = GetCompanyContactsUseCase(
             contact_repository=self._contact_repository
         )
-        contacts = use_case.execute(company_id=company_id)
+        try:
+            limit, cursor = page_params(request)
+            page = use_case.execute(company_id=company_id, limit=limit, cursor=cursor)
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body={"results": [format_contact(c) for c in contacts]},
+            body=page_body(page, serialize_contact),
         )
 
 
@@ -96,7 +93,7 @@ class GetCompanyContactByPhoneHttpController(IContactHttpController):
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=format_contact(contact),
+            body=serialize_contact(contact),
         )
 
 
@@ -105,9 +102,18 @@ class SearchContactsHttpController(IContactHttpController):
         company_id = request.query_params.get("company_id")
         query = request.query_params.get("query", "")
         use_case = SearchContactsUseCase(contact_repository=self._contact_repository)
-        contacts = use_case.execute(company_id=company_id, query=query)
+        try:
+            limit, cursor = page_params(request)
+            page = use_case.execute(
+                company_id=company_id, query=query, limit=limit, cursor=cursor
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
 
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body={"results": [format_contact(c) for c in contacts]},
+            body=page_body(page, serialize_contact),
         )
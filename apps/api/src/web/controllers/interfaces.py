@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
 
-from src.domain.repositories.chat_repository import IChatRepository
+from src.application.business_numbers import BusinessNumberDirectory
+from src.application.caching import TTLCache
+from src.application.conversations import ConversationDirectory
+from src.application.events import IEventBus
+from src.domain.repositories.chat_repository import IAsyncChatRepository
 from src.domain.repositories.company_repository import ICompanyRepository
 from src.domain.repositories.contact_repository import IContactRepository
-from src.domain.repositories.message_repository import IMessageRepository
+from src.domain.repositories.ingestion_queue_repository import (
+    IAsyncIngestionQueueRepository,
+)
+from src.domain.repositories.message_repository import IAsyncMessageRepository
 from src.domain.repositories.user_repository import IUserRepository
 from src.web.http_types import HttpRequest, HttpResponse
 
@@ -14,40 +21,77 @@ class IHttpController(ABC):
 
 
 class IUserHttpController(ABC):
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self, user_repository: IUserRepository, user_cache: TTLCache | None = None
+    ):
         self._repository = user_repository
+        self._user_cache = user_cache
 
     @abstractmethod
     def handle(self, request: HttpRequest) -> HttpResponse: ...
 
 
 class ICompanyHttpController(ABC):
-    def __init__(self, company_repository: ICompanyRepository):
+    def __init__(
+        self,
+        company_repository: ICompanyRepository,
+        business_numbers: BusinessNumberDirectory | None = None,
+        conversations: ConversationDirectory | None = None,
+    ):
         self._repository = company_repository
+        self._business_numbers = business_numbers
+        self._conversations = conversations
 
     @abstractmethod
     def handle(self, request: HttpRequest) -> HttpResponse: ...
 
 
 class IContactHttpController(ABC):
-    def __init__(self, contact_repository: IContactRepository):
+    def __init__(
+        self,
+        contact_repository: IContactRepository,
+        business_numbers: BusinessNumberDirectory | None = None,
+    ):
         self._contact_repository = contact_repository
+        self._business_numbers = business_numbers
 
     @abstractmethod
     def handle(self, request: HttpRequest) -> HttpResponse: ...
 
 
 class IChatHttpController(ABC):
-    def __init__(self, chat_repository: IChatRepository):
+    def __init__(
+        self,
+        chat_repository: IAsyncChatRepository,
+        events: IEventBus | None = None,
+        conversations: ConversationDirectory | None = None,
+    ):
         self._chat_repository = chat_repository
+        self._events = events
+        self._conversations = conversations
 
     @abstractmethod
-    def handle(self, request: HttpRequest) -> HttpResponse: ...
+    async def handle(self, request: HttpRequest) -> HttpResponse: ...
 
 
 class IMessageHttpController(ABC):
-    def __init__(self, message_repository: IMessageRepository):
+    def __init__(
+        self,
+        message_repository: IAsyncMessageRepository,
+        chat_repository: IAsyncChatRepository | None = None,
+        events: IEventBus | None = None,
+    ):
         self._message_repository = message_repository
+        self._chat_repository = chat_repository
+        self._events = events
 
     @abstractmethod
-    def handle(self, request: HttpRequest) -> HttpResponse: ...
+    async def handle(self, request: HttpRequest) -> HttpResponse: ...
+
+
+class IIngestionHttpController(ABC):
+    def __init__(self, ingestion_queue_repository: IAsyncIngestionQueueRepository):
+        self._ingestion_queue_repository = ingestion_queue_repository
+
+    @abstractmethod
+    async def handle(self, request: HttpRequest) -> HttpResponse: ...
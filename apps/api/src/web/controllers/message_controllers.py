@@ -1,43 +1,65 @@
 from datetime import UTC, datetime
-from typing import Any
 
-from src.application.exceptions import ReceiverContactDoesNotExistError
-from src.application.use_cases.message_use_cases import (
-    GetMessageUseCase,
-    ReceiveMessageUseCase,
-)
+from src.application.dtos.message_dtos import IncomingMessage
+from src.application.dtos.serializers import serialize_message
+from src.application.use_cases.ingestion_use_cases import EnqueueMessagesUseCase
+from src.application.use_cases.message_use_cases import GetMessageUseCase
 from src.domain.errors import MessageNotFoundError
-from src.domain.repositories.chat_repository import IChatRepository
-from src.domain.repositories.contact_repository import IContactRepository
-from src.domain.repositories.message_repository import IMessageRepository
-from src.web.controllers.interfaces import IMessageHttpController
+from src.web.controllers.interfaces import (
+    IIngestionHttpController,
+    IMessageHttpController,
+)
 from src.web.http_types import HttpRequest, HttpResponse, StatusCodes
 
 
-class ReceiveMessageHttpController(IMessageHttpController):
-    def __init__(
-        self,
-        message_repository: IMessageRepository,
-        contact_repository: IContactRepository,
-        chat_repository: IChatRepository,
-    ):
-        super().__init__(message_repository=message_repository)
-        self._contact_repository = contact_repository
-        self._chat_repository = chat_repository
-
-    def _extract_data_from_body(self, body: dict) -> dict[str, Any]:
-        payload = body["entry"][0]["changes"][0]["value"]
-        return {
-            "sender_phone_number": payload["contacts"][0]["wa_id"],
-            "sender_name": payload["contacts"][0]["profile"]["name"],
-            "message_external_id": payload["messages"][0]["id"],
-            "message_timestamp": datetime.fromtimestamp(
-                timestamp=float(payload["messages"][0]["timestamp"]),
-                tz=UTC,
-            ),
-            "receiver_phone_number": payload["metadata"]["display_phone_number"],
-            "text": payload["messages"][0]["text"]["body"],
-        }
+class ReceiveMessageHttpController(IIngestionHttpController):
+    """
+    Acknowledge a webhook delivery once its messages are safely queued.
+
+    Persisting contacts, chats and messages happens later in the ingestion
+    workers, so a slow database does not make Meta time out and redeliver.
+    """
+
+    def _extract_data_from_body(self, body: dict) -> list[IncomingMessage]:
+        """
+        Lift every message out of the payload, across all entries and changes.
+
+        Changes without messages (e.g. delivery statuses) are skipped. The
+        sender's name comes from the contact whose wa_id matches the message's
+        ``from``, falling back to the change's first contact.
+        """
+        incoming = []
+        for entry in body["entry"]:
+            for change in entry["changes"]:
+                value = change["value"]
+                if "messages" not in value:
+                    continue
+
+                names = {
+                    contact["wa_id"]: contact["profile"]["name"]
+                    for contact in value["contacts"]
+                }
+                first_contact = value["contacts"][0]
+                for message in value["messages"]:
+                    sender_phone_number = message.get("from", first_contact["wa_id"])
+                    incoming.append(
+                        IncomingMessage(
+                            sender_phone_number=sender_phone_number,
+                            sender_name=names.get(
+                                sender_phone_number, first_contact["profile"]["name"]
+                            ),
+                            external_id=message["id"],
+                            timestamp=datetime.fromtimestamp(
+                                timestamp=float(message["timestamp"]),
+                                tz=UTC,
+                            ),
+                            receiver_phone_number=value["metadata"][
+                                "display_phone_number"
+                            ],
+                            text=message["text"]["body"],
+                        )
+                    )
+        return incoming
 
     def _validate_body(self, body: dict) -> list[str]:
         errors = []
@@ -55,41 +77,54 @@ class ReceiveMessageHttpController(IMessageHttpController):
             errors.append("Empty 'entry' array")
             return errors
 
+        message_count = 0
         try:
-            entry = body["entry"][0]
-            if "changes" not in entry or not isinstance(entry["changes"], list):
-                errors.append("Missing or invalid 'changes' field")
-                return errors
-
-            if not entry["changes"]:
-                errors.append("Empty 'changes' array")
-                return errors
-
-            change = entry["changes"][0]
-            if "value" not in change or not isinstance(change["value"], dict):
-                errors.append("Missing or invalid 'value' field")
-                return errors
-
-            value = change["value"]
-
-            # Validate required fields in value
-            if "contacts" not in value or not isinstance(value["contacts"], list):
-                errors.append("Missing or invalid 'contacts' field")
-            elif not value["contacts"]:
-                errors.append("Empty 'contacts' array")
-            else:
-                contact = value["contacts"][0]
-                if "wa_id" not in contact:
-                    errors.append("Missing 'wa_id' in contact")
-                if "profile" not in contact or "name" not in contact.get("profile", {}):
-                    errors.append("Missing 'profile.name' in contact")
+            for entry_index, entry in enumerate(body["entry"]):
+                location = f"entry[{entry_index}]"
+                if "changes" not in entry or not isinstance(entry["changes"], list):
+                    errors.append(f"{location}: Missing or invalid 'changes' field")
+                    continue
+
+                if not entry["changes"]:
+                    errors.append(f"{location}: Empty 'changes' array")
+                    continue
+
+                for change_index, change in enumerate(entry["changes"]):
+                    change_errors, change_messages = self._validate_change(change)
+                    errors.extend(
+                        f"{location}.changes[{change_index}]: {error}"
+                        for error in change_errors
+                    )
+                    message_count += change_messages
+
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            errors.append(f"Invalid webhook payload structure: {str(e)}")
+            return errors
+
+        if not errors and not message_count:
+            errors.append("No messages in payload")
+
+        return errors
+
+    @staticmethod
+    def _validate_change(change: dict) -> tuple[list[str], int]:
+        """Validate one change, returning its errors and message count."""
+        errors = []
+        if "value" not in change or not isinstance(change["value"], dict):
+            return ["Missing or invalid 'value' field"], 0
+
+        value = change["value"]
 
-            if "messages" not in value or not isinstance(value["messages"], list):
-                errors.append("Missing or invalid 'messages' field")
-            elif not value["messages"]:
-                errors.append("Empty 'messages' array")
-            else:
-                message = value["messages"][0]
+        # Status updates and other notifications carry no messages
+        if "messages" not in value:
+            return errors, 0
+
+        if not isinstance(value["messages"], list):
+            errors.append("Missing or invalid 'messages' field")
+        elif not value["messages"]:
+            errors.append("Empty 'messages' array")
+        else:
+            for message in value["messages"]:
                 if "id" not in message:
                     errors.append("Missing 'id' in message")
                 if "timestamp" not in message:
@@ -97,75 +132,58 @@ class ReceiveMessageHttpController(IMessageHttpController):
                 if "text" not in message or "body" not in message.get("text", {}):
                     errors.append("Missing 'text.body' in message")
 
-            if "metadata" not in value or not isinstance(value["metadata"], dict):
-                errors.append("Missing or invalid 'metadata' field")
-            elif "display_phone_number" not in value["metadata"]:
-                errors.append("Missing 'display_phone_number' in metadata")
+        # Validate required fields in value
+        if "contacts" not in value or not isinstance(value["contacts"], list):
+            errors.append("Missing or invalid 'contacts' field")
+        elif not value["contacts"]:
+            errors.append("Empty 'contacts' array")
+        else:
+            for contact in value["contacts"]:
+                if "wa_id" not in contact:
+                    errors.append("Missing 'wa_id' in contact")
+                if "profile" not in contact or "name" not in contact.get("profile", {}):
+                    errors.append("Missing 'profile.name' in contact")
 
-        except (KeyError, IndexError, TypeError) as e:
-            errors.append(f"Invalid webhook payload structure: {str(e)}")
+        if "metadata" not in value or not isinstance(value["metadata"], dict):
+            errors.append("Missing or invalid 'metadata' field")
+        elif "display_phone_number" not in value["metadata"]:
+            errors.append("Missing 'display_phone_number' in metadata")
 
-        return errors
+        messages = value["messages"] if isinstance(value["messages"], list) else []
+        return errors, len(messages)
 
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse:
         if errors := self._validate_body(request.body):
             return HttpResponse(
                 status_code=StatusCodes.BAD_REQUEST.value,
                 body={"detail": errors},
             )
 
-        extracted_data = self._extract_data_from_body(request.body)
+        incoming = self._extract_data_from_body(request.body)
 
-        use_case = ReceiveMessageUseCase(
-            message_repository=self._message_repository,
-            contact_repository=self._contact_repository,
-            chat_repository=self._chat_repository,
+        use_case = EnqueueMessagesUseCase(
+            ingestion_queue_repository=self._ingestion_queue_repository
         )
-        try:
-            message = use_case.execute(
-                sender_phone_number=extracted_data["sender_phone_number"],
-                sender_name=extracted_data["sender_name"],
-                message_external_id=extracted_data["message_external_id"],
-                message_timestamp=extracted_data["message_timestamp"],
-                receiver_phone_number=extracted_data["receiver_phone_number"],
-                text=extracted_data["text"],
-            )
-        except ReceiverContactDoesNotExistError:
-            return HttpResponse(
-                status_code=StatusCodes.BAD_REQUEST.value,
-                body={"detail": "receiver contact does not exist"},
-            )
+        job = await use_case.execute(incoming)
 
         return HttpResponse(
-            status_code=StatusCodes.CREATED.value,
-            body={"message_id": message.id},
+            status_code=StatusCodes.OK.value,
+            body={"job_id": job.id, "queued_messages": len(incoming)},
         )
 
 
 class GetMessageHttpController(IMessageHttpController):
-    def handle(self, request: HttpRequest) -> HttpResponse:
+    async def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = GetMessageUseCase(message_repository=self._message_repository)
         try:
-            message = use_case.execute(request.path_params["id"])
+            message = await use_case.execute(request.path_params["id"])
         except MessageNotFoundError:
             return HttpResponse(
                 status_code=StatusCodes.NOT_FOUND.value,
                 body={"detail": "message not found"},
             )
 
-        body = {
-            "id": message.id,
-            "external_id": message.external_id,
-            "external_timestamp": message.external_timestamp.isoformat(),
-            "chat_id": message.chat_id,
-            "sent_by_user_id": message.sent_by_user_id,
-            "text": message.text,
-            "created_at": message.created_at.isoformat(),
-            "updated_at": message.updated_at.isoformat()
-            if message.updated_at
-            else None,
-        }
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body=body,
+            body=serialize_message(message),
         )
@@ -0,0 +1,38 @@
+from collections.abc import Callable
+from typing import Any
+
+from src.domain.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page
+from src.web.http_types import HttpRequest
+
+
+class InvalidPageParamsError(Exception): ...
+
+
+def page_params(
+    request: HttpRequest, cursor_param: str = "cursor"
+) -> tuple[int, str | None]:
+    """
+    Read ``limit`` and the cursor (``cursor`` unless told otherwise) from the
+    query string.
+
+    The cursor is passed through untouched; the repository rejects it with
+    InvalidCursorError if it does not decode.
+    """
+    raw_limit = request.query_params.get("limit")
+    limit = DEFAULT_PAGE_SIZE
+    if raw_limit is not None:
+        try:
+            limit = int(raw_limit)
+        except ValueError as e:
+            raise InvalidPageParamsError from e
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise InvalidPageParamsError
+
+    return limit, request.query_params.get(cursor_param) or None
+
+
+def page_body(page: Page, format_item: Callable[[Any], dict]) -> dict:
+    return {
+        "results": [format_item(item) for item in page.items],
+        "next_cursor": page.next_cursor,
+    }
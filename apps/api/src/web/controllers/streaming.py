@@ -0,0 +1,16 @@
+from src.web.http_types import HttpRequest, StreamFormats
+
+
+def stream_format(request: HttpRequest) -> StreamFormats | None:
+    """
+    Return the streaming format the client asked for, or None for a page.
+
+    ``Accept: application/x-ndjson`` streams one item per line and
+    ``?stream=true`` streams the usual list body as a chunked JSON array.
+    Either way every item is returned, not just one page.
+    """
+    if StreamFormats.NDJSON.value in request.headers.get("accept", ""):
+        return StreamFormats.NDJSON
+    if request.query_params.get("stream") in ("1", "true"):
+        return StreamFormats.JSON
+    return None
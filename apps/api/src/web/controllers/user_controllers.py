@@ -1,3 +1,5 @@
+from src.application.caching import TTLCache
+from src.application.dtos.serializers import serialize_user
 from src.application.exceptions import InvalidUserError
 from src.application.use_cases.user_use_cases import (
     CreateUserUseCase,
@@ -7,10 +9,15 @@ from src.application.use_cases.user_use_cases import (
     UpdateUserUseCase,
 )
 from src.domain.enums import UserTypes
-from src.domain.errors import UserNotFoundError
+from src.domain.errors import InvalidCursorError, UserNotFoundError
 from src.domain.repositories.company_repository import ICompanyRepository
 from src.domain.repositories.user_repository import IUserRepository
 from src.web.controllers.interfaces import IUserHttpController
+from src.web.controllers.pagination import (
+    InvalidPageParamsError,
+    page_body,
+    page_params,
+)
 from src.web.http_types import HttpRequest, HttpResponse, StatusCodes
 
 
@@ -43,16 +50,7 @@ class CreateUserHttpController(IUserHttpController):
             )
         return HttpResponse(
             status_code=StatusCodes.CREATED.value,
-            body={
-                "id": user.id,
-                "name": user.name,
-                "email": user.email,
-                "company_id": user.company_id,
-                "type": user.type.value,
-                "is_active": user.is_active,
-                "created_at": user.created_at.isoformat(),
-                "updated_at": user.updated_at.isoformat() if user.updated_at else None,
-            },
+            body=serialize_user(user),
         )
 
 
@@ -68,30 +66,25 @@ class GetUserHttpController(IUserHttpController):
             )
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body={
-                "id": user.id,
-                "name": user.name,
-                "email": user.email,
-                "company_id": user.company_id,
-                "type": user.type.value,
-                "is_active": user.is_active,
-                "created_at": user.created_at.isoformat(),
-                "updated_at": user.updated_at.isoformat() if user.updated_at else None,
-            },
+            body=serialize_user(user),
         )
 
 
 class UpdateUserHttpController(IUserHttpController):
     def __init__(
-        self, user_repository: IUserRepository, company_repository: ICompanyRepository
+        self,
+        user_repository: IUserRepository,
+        company_repository: ICompanyRepository,
+        user_cache: TTLCache | None = None,
     ):
-        super().__init__(user_repository=user_repository)
+        super().__init__(user_repository=user_repository, user_cache=user_cache)
         self._company_repository = company_repository
 
     def handle(self, request: HttpRequest) -> HttpResponse:
         use_case = UpdateUserUseCase(
             user_repository=self._repository,
             company_repository=self._company_repository,
+            user_cache=self._user_cache,
         )
         kwargs = {
             "user_id": request.path_params["id"],
@@ -111,22 +104,15 @@ class UpdateUserHttpController(IUserHttpController):
             )
         return HttpResponse(
             status_code=StatusCodes.OK.value,
-            body={
-                "id": user.id,
-                "name": user.name,
-                "email": user.email,
-                "company_id": user.company_id,
-                "type": user.type.value,
-                "is_active": user.is_active,
-                "created_at": user.created_at.isoformat(),
-                "updated_at": user.updated_at.isoformat(),
-            },
+            body=serialize_user(user),
         )
 
 
 class DeleteUserHttpController(IUserHttpController):
     def handle(self, request: HttpRequest) -> HttpResponse:
-        use_case = DeleteUserUseCase(user_repository=self._repository)
+        use_case = DeleteUserUseCase(
+            user_repository=self._repository, user_cache=self._user_cache
+        )
         try:
             use_case.execute(user_id=request.path_params["id"])
         except UserNotFoundError:
@@ -160,23 +146,21 @@ class ListUserHttpController(IUserHttpController):
                 )
 
         use_case = ListUserUseCase(user_repository=self._repository)
-        users = use_case.execute(company_id=company_id, role=role, search_query=search)
-        data = {
-            "results": [
-                {
-                    "id": user.id,
-                    "name": user.name,
-                    "email": user.email,
-                    "company_id": user.company_id,
-                    "type": user.type.value,
-                    "is_active": user.is_active,
-                    "created_at": user.created_at.isoformat(),
-                    "updated_at": user.updated_at.isoformat()
-                    if user.updated_at
-                    else None,
-                }
-                for user in users
-            ]
-        }
+        try:
+            limit, cursor = page_params(request)
+            page = use_case.execute(
+                company_id=company_id,
+                role=role,
+                search_query=search,
+                limit=limit,
+                cursor=cursor,
+            )
+        except (InvalidPageParamsError, InvalidCursorError):
+            return HttpResponse(
+                status_code=StatusCodes.BAD_REQUEST.value,
+                body={"detail": "invalid limit or cursor"},
+            )
+
+        data = page_body(page, serialize_user)
 
         return HttpResponse(status_code=StatusCodes.OK.value, body=data)
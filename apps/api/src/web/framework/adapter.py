@@ -1,7 +1,21 @@
+import asyncio
 from json import JSONDecodeError
 
 from fastapi import Request
 
+from src.application.events import IEventBus
+from src.domain.repositories.chat_repository import IAsyncChatRepository
+from src.domain.repositories.contact_repository import IAsyncContactRepository
+from src.domain.repositories.ingestion_queue_repository import (
+    IAsyncIngestionQueueRepository,
+)
+from src.domain.repositories.message_repository import IAsyncMessageRepository
+from src.domain.repositories.unit_of_work import IUnitOfWork
+from src.infrastructure.database.postgres_unit_of_work import PostgresUnitOfWork
+from src.infrastructure.repositories.async_repository_adapter import (
+    AsyncRepositoryAdapter,
+)
+from src.web.framework.thread_pools import READS_POOL, BoundedThreadPool
 from src.web.http_types import HttpRequest
 
 
@@ -25,3 +39,66 @@ async def request_adapter(request: Request) -> HttpRequest:
         cookies=dict(request.cookies),
         context=context,
     )
+
+
+def thread_pool(request: Request, name: str) -> BoundedThreadPool:
+    """Return the thread pool serving the given route group."""
+    return request.app.state.thread_pools[name]
+
+
+def async_chat_repository(
+    request: Request, pool: str = READS_POOL
+) -> IAsyncChatRepository:
+    """Return the native async chat repository, or adapt the sync one."""
+    repository = request.app.state.async_chat_repository
+    return repository or AsyncRepositoryAdapter(
+        request.app.state.chat_repository, executor=thread_pool(request, pool)
+    )
+
+
+def async_contact_repository(
+    request: Request, pool: str = READS_POOL
+) -> IAsyncContactRepository:
+    """Return the native async contact repository, or adapt the sync one."""
+    repository = request.app.state.async_contact_repository
+    return repository or AsyncRepositoryAdapter(
+        request.app.state.contact_repository, executor=thread_pool(request, pool)
+    )
+
+
+def async_message_repository(
+    request: Request, pool: str = READS_POOL
+) -> IAsyncMessageRepository:
+    """Return the native async message repository, or adapt the sync one."""
+    repository = request.app.state.async_message_repository
+    return repository or AsyncRepositoryAdapter(
+        request.app.state.message_repository, executor=thread_pool(request, pool)
+    )
+
+
+def async_ingestion_queue_repository(
+    request: Request, pool: str = READS_POOL
+) -> IAsyncIngestionQueueRepository:
+    """Adapt the sync ingestion queue; it has no asyncpg implementation."""
+    return AsyncRepositoryAdapter(
+        request.app.state.ingestion_queue_repository,
+        executor=thread_pool(request, pool),
+    )
+
+
+def unit_of_work(request: Request, pool: str = READS_POOL) -> IUnitOfWork:
+    """Return the native unit of work, or one over the sync connection pool."""
+    unit_of_work = request.app.state.unit_of_work
+    return unit_of_work or PostgresUnitOfWork(
+        request.app.state.connection_pool, executor=thread_pool(request, pool)
+    )
+
+
+def event_bus(request: Request) -> IEventBus:
+    """Return the cross-worker event bus, or this process's hub without one."""
+    return request.app.state.event_bus or request.app.state.events
+
+
+def stream_slots(request: Request) -> asyncio.Semaphore:
+    """Return the slots shared by the responses that stream from the database."""
+    return request.app.state.stream_slots
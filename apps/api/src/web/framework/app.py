@@ -1,22 +1,54 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.application.business_numbers import BusinessNumberDirectory
+from src.application.caching import TTLCache
+from src.application.conversations import ConversationDirectory
+from src.application.events import EventHub
+from src.application.idempotency import IdempotencyFilter
+from src.infrastructure.database.postgres_event_bus import PostgresEventBus
+from src.infrastructure.enums import DatabaseType
 from src.infrastructure.repository_factory import create_repositories
 from src.infrastructure.security.jwt_service import JWTService
 from src.infrastructure.settings import AppSettings, load_settings
+from src.web.framework.ingestion_workers import IngestionWorkers
 from src.web.framework.routes.auth_routes import auth_routes
 from src.web.framework.routes.chat_routes import chat_routes
 from src.web.framework.routes.company_routes import company_routes
 from src.web.framework.routes.contact_routes import contact_routes
+from src.web.framework.routes.event_routes import event_routes
 from src.web.framework.routes.message_routes import message_routes
 from src.web.framework.routes.readiness_routes import readiness_routes
 from src.web.framework.routes.user_routes import user_routes
 from src.web.framework.routes.webhook_routes import webhook_routes
+from src.web.framework.thread_pools import create_thread_pools
 from src.web.middleware.auth_middleware import auth_middleware
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ingestion_workers.start()
+    if app.state.event_bus is not None:
+        app.state.event_bus.start()
+
+    yield
+
+    await app.state.ingestion_workers.stop()
+    if app.state.event_bus is not None:
+        await app.state.event_bus.stop()
+    for pool in app.state.thread_pools.values():
+        pool.shutdown(wait=True)
+    if app.state.connection_pool is not None:
+        app.state.connection_pool.close()
+    if app.state.async_connection_pool is not None:
+        await app.state.async_connection_pool.close()
+
+
 def create_app(settings: AppSettings | None = None) -> FastAPI:
-    app = FastAPI(title="Convo API")
+    app = FastAPI(title="Convo API", lifespan=lifespan)
 
     app.include_router(readiness_routes)
     app.include_router(auth_routes)
@@ -26,6 +58,7 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
     app.include_router(chat_routes)
     app.include_router(message_routes)
     app.include_router(webhook_routes)
+    app.include_router(event_routes)
 
     # Load settings from environment if not provided
     if settings is None:
@@ -33,6 +66,11 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
 
     app.state.settings = settings
     app.state.jwt_service = JWTService(settings=settings)
+    app.state.thread_pools = create_thread_pools(settings=settings)
+    app.state.user_cache = TTLCache(
+        ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+        capacity=settings.USER_CACHE_SIZE,
+    )
 
     repositories = create_repositories(settings=settings)
 
@@ -41,6 +79,50 @@ def create_app(settings: AppSettings | None = None) -> FastAPI:
     app.state.contact_repository = repositories["contact"]
     app.state.chat_repository = repositories["chat"]
     app.state.message_repository = repositories["message"]
+    app.state.ingestion_queue_repository = repositories["ingestion_queue"]
+    app.state.connection_pool = repositories["connection_pool"]
+    app.state.async_contact_repository = repositories["async_contact"]
+    app.state.async_chat_repository = repositories["async_chat"]
+    app.state.async_message_repository = repositories["async_message"]
+    app.state.async_connection_pool = repositories["async_connection_pool"]
+    app.state.unit_of_work = repositories["unit_of_work"]
+    app.state.idempotency_filter = IdempotencyFilter(
+        capacity=settings.IDEMPOTENCY_CACHE_SIZE,
+        bloom_bits=settings.IDEMPOTENCY_BLOOM_BITS,
+    )
+    app.state.business_numbers = BusinessNumberDirectory(
+        TTLCache(
+            ttl_seconds=settings.BUSINESS_NUMBER_CACHE_TTL_SECONDS,
+            capacity=settings.BUSINESS_NUMBER_CACHE_SIZE,
+        )
+    )
+    app.state.conversations = ConversationDirectory(
+        TTLCache(
+            ttl_seconds=settings.CONVERSATION_CACHE_TTL_SECONDS,
+            capacity=settings.CONVERSATION_CACHE_SIZE,
+        )
+    )
+    app.state.events = EventHub(max_pending=settings.EVENTS_MAX_PENDING)
+    # Without Postgres there is a single process: the hub is the bus
+    app.state.event_bus = (
+        None
+        if settings.DATABASE_TYPE == DatabaseType.INMEMORY
+        else PostgresEventBus(
+            database_url=settings.DATABASE_URL,
+            hub=app.state.events,
+            channel=settings.EVENTS_CHANNEL,
+            reconnect_seconds=settings.EVENTS_RECONNECT_SECONDS,
+        )
+    )
+    app.state.ingestion_workers = IngestionWorkers(app=app, settings=settings)
+    # A stream holds a pool connection until it ends: always leave one free
+    stream_pool = app.state.async_connection_pool or app.state.connection_pool
+    stream_pool_size = (
+        stream_pool.max_size if stream_pool else settings.DATABASE_POOL_MAX_SIZE
+    )
+    app.state.stream_slots = asyncio.Semaphore(
+        max(1, min(settings.STREAMING_MAX_CONCURRENT, stream_pool_size - 1))
+    )
 
     origins = settings.CORS_ORIGINS
 
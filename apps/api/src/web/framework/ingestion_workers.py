@@ -0,0 +1,135 @@
+import asyncio
+import contextlib
+from dataclasses import dataclass
+
+from fastapi import FastAPI
+
+from src.application.ingestion_scheduler import (
+    ShardedIngestionScheduler,
+    ShardStats,
+)
+from src.application.use_cases.ingestion_use_cases import DrainIngestionQueueUseCase
+from src.application.use_cases.message_use_cases import ReceiveMessageUseCase
+from src.infrastructure.database.postgres_unit_of_work import PostgresUnitOfWork
+from src.infrastructure.repositories.async_repository_adapter import (
+    AsyncRepositoryAdapter,
+)
+from src.infrastructure.settings import AppSettings
+from src.web.framework.thread_pools import WEBHOOK_POOL
+
+
+@dataclass(frozen=True)
+class IngestionWorkersStats:
+    running: bool
+    busy: bool
+    drained_jobs: int
+    failed_drains: int
+    shards: list[ShardStats]
+
+
+class IngestionWorkers:
+    """
+    Background tasks draining the webhook ingestion queue.
+
+    A single dispatcher claims batches in queue order and hands their
+    messages to the ShardedIngestionScheduler, whose per-chat shards receive
+    them concurrently. Once a batch is done the dispatcher goes straight for
+    the next one. When the queue is empty it sleeps until ``wake()`` is
+    called for a new delivery or the poll interval passes, which also picks
+    up retries whose backoff has elapsed. Repositories are resolved from
+    ``app.state`` on every batch, like the routes do per request, and
+    blocking calls run on the webhook thread pool.
+    """
+
+    def __init__(self, app: FastAPI, settings: AppSettings):
+        self._app = app
+        self._settings = settings
+        self._scheduler = ShardedIngestionScheduler(shards=settings.INGESTION_SHARDS)
+        self._wakeup = asyncio.Event()
+        self._dispatcher: asyncio.Task | None = None
+        self._busy = False
+        self._drained_jobs = 0
+        self._failed_drains = 0
+
+    def start(self) -> None:
+        self._scheduler.start()
+        self._dispatcher = asyncio.create_task(self._run(), name="ingestion-dispatcher")
+
+    async def stop(self) -> None:
+        # A batch cut short here is claimed again once its lease expires
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            await asyncio.gather(self._dispatcher, return_exceptions=True)
+            self._dispatcher = None
+        await self._scheduler.stop()
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    async def drain(self) -> int:
+        """Process one batch; returns the number of jobs claimed."""
+        self._busy = True
+        try:
+            drained = await self._drain_use_case().execute()
+        finally:
+            self._busy = False
+        self._drained_jobs += drained
+        return drained
+
+    def stats(self) -> IngestionWorkersStats:
+        return IngestionWorkersStats(
+            running=self._dispatcher is not None,
+            busy=self._busy,
+            drained_jobs=self._drained_jobs,
+            failed_drains=self._failed_drains,
+            shards=self._scheduler.stats(),
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                drained = await self.drain()
+            except Exception:
+                # e.g. the database is unreachable; back off and try again
+                self._failed_drains += 1
+                drained = 0
+
+            if drained:
+                continue
+            self._wakeup.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(), self._settings.INGESTION_POLL_INTERVAL
+                )
+
+    def _drain_use_case(self) -> DrainIngestionQueueUseCase:
+        state = self._app.state
+        executor = state.thread_pools[WEBHOOK_POOL]
+        settings = self._settings
+
+        receive_message_use_case = ReceiveMessageUseCase(
+            message_repository=state.async_message_repository
+            or AsyncRepositoryAdapter(state.message_repository, executor=executor),
+            contact_repository=state.async_contact_repository
+            or AsyncRepositoryAdapter(state.contact_repository, executor=executor),
+            chat_repository=state.async_chat_repository
+            or AsyncRepositoryAdapter(state.chat_repository, executor=executor),
+            unit_of_work=state.unit_of_work
+            or PostgresUnitOfWork(state.connection_pool, executor=executor),
+            idempotency_filter=state.idempotency_filter,
+            business_numbers=state.business_numbers,
+            conversations=state.conversations,
+            events=state.event_bus or state.events,
+        )
+        return DrainIngestionQueueUseCase(
+            ingestion_queue_repository=AsyncRepositoryAdapter(
+                state.ingestion_queue_repository, executor=executor
+            ),
+            receive_message_use_case=receive_message_use_case,
+            batch_size=settings.INGESTION_BATCH_SIZE,
+            lease_seconds=settings.INGESTION_LEASE_SECONDS,
+            max_attempts=settings.INGESTION_MAX_ATTEMPTS,
+            retry_base_seconds=settings.INGESTION_RETRY_BASE_SECONDS,
+            retry_max_seconds=settings.INGESTION_RETRY_MAX_SECONDS,
+            scheduler=self._scheduler,
+        )
@@ -0,0 +1,86 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.web.http_types import StreamFormats
+
+# Encoded items are buffered up to this many bytes before a chunk is sent
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+
+    orjson encodes datetimes natively as ISO 8601 strings, so serializers
+    hand them over untouched instead of calling ``isoformat`` per field.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+async def _ndjson_chunks(items: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    buffer = bytearray()
+    async for item in items:
+        buffer += orjson.dumps(item, option=orjson.OPT_APPEND_NEWLINE)
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _json_array_chunks(items: AsyncIterator[dict]) -> AsyncIterator[bytes]:
+    buffer = bytearray(b'{"results":[')
+    separator = b""
+    async for item in items:
+        buffer += separator
+        buffer += orjson.dumps(item)
+        separator = b","
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b'],"next_cursor":null}'
+    yield bytes(buffer)
+
+
+async def _holding(
+    slots: asyncio.Semaphore, chunks: AsyncIterator[bytes]
+) -> AsyncIterator[bytes]:
+    async with slots:
+        async for chunk in chunks:
+            yield chunk
+
+
+class StreamingJSONResponse(StreamingResponse):
+    """
+    Chunked response encoding list items as they are produced.
+
+    Memory stays bounded by ``STREAM_CHUNK_SIZE`` whatever the number of
+    items. The status is sent before the first item is read, so a failure
+    mid-stream can only cut the body short.
+
+    The items usually hold a database connection until the last one is read.
+    With ``slots``, the body takes one of them for as long as it is sent, so
+    at most that many responses stream at once.
+    """
+
+    def __init__(
+        self,
+        items: AsyncIterator[dict],
+        format: StreamFormats = StreamFormats.JSON,
+        status_code: int = 200,
+        slots: asyncio.Semaphore | None = None,
+    ):
+        chunks = (
+            _ndjson_chunks(items)
+            if format == StreamFormats.NDJSON
+            else _json_array_chunks(items)
+        )
+        if slots is not None:
+            chunks = _holding(slots, chunks)
+        super().__init__(chunks, status_code=status_code, media_type=format.value)
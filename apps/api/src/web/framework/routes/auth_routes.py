@@ -13,7 +13,8 @@ from src.web.controllers.auth_controllers import (
     RefreshTokenHttpController,
     SetPasswordHttpController,
 )
-from src.web.framework.adapter import request_adapter
+from src.web.framework.adapter import request_adapter, thread_pool
+from src.web.framework.thread_pools import AUTH_POOL
 
 auth_routes = APIRouter(prefix="/auth")
 
@@ -24,10 +25,14 @@ async def login(request: Request) -> JSONResponse:
     user_repository = request.app.state.user_repository
 
     login_use_case = LoginUseCase(
-        user_repository=user_repository, jwt_service=jwt_service
+        user_repository=user_repository,
+        jwt_service=jwt_service,
+        bcrypt_rounds=request.app.state.settings.BCRYPT_ROUNDS,
     )
     controller = LoginHttpController(login_use_case=login_use_case)
-    response = controller.handle(request=await request_adapter(request))
+    response = await thread_pool(request, AUTH_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
 
     json_response = JSONResponse(
         content=response.body, status_code=response.status_code
@@ -69,7 +74,9 @@ async def refresh_token(request: Request) -> JSONResponse:
     controller = RefreshTokenHttpController(
         refresh_token_use_case=refresh_token_use_case
     )
-    response = controller.handle(request=await request_adapter(request))
+    response = await thread_pool(request, AUTH_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
 
     json_response = JSONResponse(
         content=response.body, status_code=response.status_code
@@ -117,7 +124,13 @@ async def get_current_user(request: Request) -> JSONResponse:
 async def set_password(request: Request) -> JSONResponse:
     user_repository = request.app.state.user_repository
 
-    set_password_use_case = SetPasswordUseCase(user_repository=user_repository)
+    set_password_use_case = SetPasswordUseCase(
+        user_repository=user_repository,
+        user_cache=request.app.state.user_cache,
+        bcrypt_rounds=request.app.state.settings.BCRYPT_ROUNDS,
+    )
     controller = SetPasswordHttpController(set_password_use_case=set_password_use_case)
-    response = controller.handle(request=await request_adapter(request))
+    response = await thread_pool(request, AUTH_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
     return JSONResponse(content=response.body, status_code=response.status_code)
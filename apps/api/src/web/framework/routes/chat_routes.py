@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request, Response
 
 from src.web.controllers.chat_controllers import (
     AssignAttendantToChatHttpController,
+    DeleteChatHttpController,
     GetChatHttpController,
     GetChatMessagesHttpController,
     GetChatsByAttendantHttpController,
+    GetInboxHttpController,
     GetPendingChatsHttpController,
     GetResolvedChatsHttpController,
     GetUnassignedChatsHttpController,
@@ -14,94 +15,151 @@ from src.web.controllers.chat_controllers import (
     SearchChatsHttpController,
     SendMessageHttpController,
 )
-from src.web.framework.adapter import request_adapter
+from src.web.framework.adapter import (
+    async_chat_repository,
+    async_message_repository,
+    event_bus,
+    request_adapter,
+    stream_slots,
+)
+from src.web.framework.responses import FastJSONResponse, StreamingJSONResponse
+from src.web.http_types import HttpStreamResponse, StatusCodes
 
 chat_routes = APIRouter(prefix="/chats")
 
 
+def _streaming_response(request: Request, response: HttpStreamResponse) -> Response:
+    slots = stream_slots(request)
+    # Refuse rather than queue: a waiting stream would still hold its request
+    if slots.locked():
+        return FastJSONResponse(
+            content={"error": "Too many streams in progress, retry later"},
+            status_code=StatusCodes.SERVICE_UNAVAILABLE.value,
+            headers={"Retry-After": "1"},
+        )
+    return StreamingJSONResponse(
+        response.items,
+        format=response.format,
+        status_code=response.status_code,
+        slots=slots,
+    )
+
+
 @chat_routes.get("/")
-async def list_company_chats(request: Request) -> JSONResponse:
-    repository = request.app.state.chat_repository
+async def list_company_chats(request: Request) -> Response:
+    repository = async_chat_repository(request)
     controller = ListChatsByCompanyHttpController(chat_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    if isinstance(response, HttpStreamResponse):
+        return _streaming_response(request, response)
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.get("/unassigned")
-async def get_unassigned_chats(request: Request) -> JSONResponse:
-    repository = request.app.state.chat_repository
+async def get_unassigned_chats(request: Request) -> FastJSONResponse:
+    repository = async_chat_repository(request)
     controller = GetUnassignedChatsHttpController(chat_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.get("/pending")
-async def get_pending_chats(request: Request) -> JSONResponse:
-    repository = request.app.state.chat_repository
+async def get_pending_chats(request: Request) -> FastJSONResponse:
+    repository = async_chat_repository(request)
     controller = GetPendingChatsHttpController(chat_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.get("/resolved")
-async def get_resolved_chats(request: Request) -> JSONResponse:
-    repository = request.app.state.chat_repository
+async def get_resolved_chats(request: Request) -> FastJSONResponse:
+    repository = async_chat_repository(request)
     controller = GetResolvedChatsHttpController(chat_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.get("/by-attendant")
-async def get_chats_by_attendant(request: Request) -> JSONResponse:
-    repository = request.app.state.chat_repository
+async def get_chats_by_attendant(request: Request) -> FastJSONResponse:
+    repository = async_chat_repository(request)
     controller = GetChatsByAttendantHttpController(chat_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
+
+
+@chat_routes.get("/inbox")
+async def get_inbox(request: Request) -> FastJSONResponse:
+    repository = async_chat_repository(request)
+    controller = GetInboxHttpController(chat_repository=repository)
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.get("/search")
-async def search_chats(request: Request) -> JSONResponse:
-    repository = request.app.state.chat_repository
+async def search_chats(request: Request) -> FastJSONResponse:
+    repository = async_chat_repository(request)
     controller = SearchChatsHttpController(chat_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.get("/{chat_id}")
-async def get_chat(request: Request, chat_id: str) -> JSONResponse:
-    repository = request.app.state.chat_repository
+async def get_chat(request: Request, chat_id: str) -> FastJSONResponse:
+    repository = async_chat_repository(request)
     controller = GetChatHttpController(chat_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
+
+
+@chat_routes.delete("/{chat_id}")
+async def delete_chat(request: Request, chat_id: str) -> FastJSONResponse:
+    repository = async_chat_repository(request)
+    controller = DeleteChatHttpController(
+        chat_repository=repository, conversations=request.app.state.conversations
+    )
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.patch("/{chat_id}/assign")
-async def assign_attendant_to_chat(request: Request, chat_id: str) -> JSONResponse:
-    repository = request.app.state.chat_repository
-    controller = AssignAttendantToChatHttpController(chat_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+async def assign_attendant_to_chat(request: Request, chat_id: str) -> FastJSONResponse:
+    repository = async_chat_repository(request)
+    controller = AssignAttendantToChatHttpController(
+        chat_repository=repository, events=event_bus(request)
+    )
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.get("/{chat_id}/messages")
-async def get_chat_messages(request: Request, chat_id: str) -> JSONResponse:
-    message_repository = request.app.state.message_repository
+async def get_chat_messages(request: Request, chat_id: str) -> Response:
+    message_repository = async_message_repository(request)
     controller = GetChatMessagesHttpController(message_repository=message_repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    if isinstance(response, HttpStreamResponse):
+        return _streaming_response(request, response)
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.post("/{chat_id}/messages")
-async def send_message(request: Request, chat_id: str) -> JSONResponse:
-    message_repository = request.app.state.message_repository
-    controller = SendMessageHttpController(message_repository=message_repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+async def send_message(request: Request, chat_id: str) -> FastJSONResponse:
+    message_repository = async_message_repository(request)
+    controller = SendMessageHttpController(
+        message_repository=message_repository,
+        chat_repository=async_chat_repository(request),
+        events=event_bus(request),
+    )
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @chat_routes.patch("/{chat_id}/read")
-async def mark_chat_as_read(request: Request, chat_id: str) -> JSONResponse:
-    message_repository = request.app.state.message_repository
-    controller = MarkChatAsReadHttpController(message_repository=message_repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+async def mark_chat_as_read(request: Request, chat_id: str) -> FastJSONResponse:
+    message_repository = async_message_repository(request)
+    controller = MarkChatAsReadHttpController(
+        message_repository=message_repository,
+        chat_repository=async_chat_repository(request),
+        events=event_bus(request),
+    )
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
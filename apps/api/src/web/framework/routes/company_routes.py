@@ -1,5 +1,4 @@
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
 from src.web.controllers.company_controllers import (
     CreateCompanyHttpController,
@@ -8,46 +7,65 @@ from src.web.controllers.company_controllers import (
     ListCompanyHttpController,
     UpdateCompanyHttpController,
 )
-from src.web.framework.adapter import request_adapter
+from src.web.framework.adapter import request_adapter, thread_pool
+from src.web.framework.responses import FastJSONResponse
+from src.web.framework.thread_pools import READS_POOL
 
 company_routes = APIRouter(prefix="/companies")
 
 
 @company_routes.get("/")
-async def list_companies(request: Request) -> JSONResponse:
+async def list_companies(request: Request) -> FastJSONResponse:
     repository = request.app.state.company_repository
     controller = ListCompanyHttpController(company_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @company_routes.post("/")
-async def create_company(request: Request) -> JSONResponse:
+async def create_company(request: Request) -> FastJSONResponse:
     repository = request.app.state.company_repository
     controller = CreateCompanyHttpController(company_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @company_routes.get("/{id}")
-async def get_company(request: Request, id: str) -> JSONResponse:
+async def get_company(request: Request, id: str) -> FastJSONResponse:
     repository = request.app.state.company_repository
     controller = GetCompanyHttpController(company_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @company_routes.patch("/{id}")
-async def update_company(request: Request, id: str) -> JSONResponse:
+async def update_company(request: Request, id: str) -> FastJSONResponse:
     repository = request.app.state.company_repository
-    controller = UpdateCompanyHttpController(company_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    controller = UpdateCompanyHttpController(
+        company_repository=repository,
+        business_numbers=request.app.state.business_numbers,
+    )
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @company_routes.delete("/{id}")
-async def delete_company(request: Request, id: str) -> JSONResponse:
+async def delete_company(request: Request, id: str) -> FastJSONResponse:
     repository = request.app.state.company_repository
-    controller = DeleteCompanyHttpController(company_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    controller = DeleteCompanyHttpController(
+        company_repository=repository,
+        business_numbers=request.app.state.business_numbers,
+        conversations=request.app.state.conversations,
+    )
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
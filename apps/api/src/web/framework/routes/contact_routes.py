@@ -1,5 +1,4 @@
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
 from src.web.controllers.contact_controllers import (
     CreateCompanyContactHttpController,
@@ -8,48 +7,63 @@ from src.web.controllers.contact_controllers import (
     GetContactHttpController,
     SearchContactsHttpController,
 )
-from src.web.framework.adapter import request_adapter
+from src.web.framework.adapter import request_adapter, thread_pool
+from src.web.framework.responses import FastJSONResponse
+from src.web.framework.thread_pools import READS_POOL
 
 contact_routes = APIRouter(prefix="/contacts")
 
 
 @contact_routes.post("/")
-async def create_company_contact(request: Request) -> JSONResponse:
+async def create_company_contact(request: Request) -> FastJSONResponse:
     repository = request.app.state.contact_repository
-    controller = CreateCompanyContactHttpController(contact_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    controller = CreateCompanyContactHttpController(
+        contact_repository=repository,
+        business_numbers=request.app.state.business_numbers,
+    )
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @contact_routes.get("/search")
-async def search_contacts(request: Request) -> JSONResponse:
+async def search_contacts(request: Request) -> FastJSONResponse:
     repository = request.app.state.contact_repository
     controller = SearchContactsHttpController(contact_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @contact_routes.get("/{id}")
-async def get_contact(request: Request, id: str) -> JSONResponse:
+async def get_contact(request: Request, id: str) -> FastJSONResponse:
     repository = request.app.state.contact_repository
     controller = GetContactHttpController(contact_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @contact_routes.get("/company/{company_id}")
-async def get_company_contacts(request: Request, company_id: str) -> JSONResponse:
+async def get_company_contacts(request: Request, company_id: str) -> FastJSONResponse:
     repository = request.app.state.contact_repository
     controller = GetCompanyContactsHttpController(contact_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @contact_routes.get("/company/{company_id}/phone/{phone_number}")
 async def get_company_contact_by_phone(
     request: Request, company_id: str, phone_number: str
-) -> JSONResponse:
+) -> FastJSONResponse:
     repository = request.app.state.contact_repository
     controller = GetCompanyContactByPhoneHttpController(contact_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
@@ -0,0 +1,131 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, FastAPI, Request, Response, WebSocket
+from fastapi.responses import StreamingResponse
+
+from src.application.events import Subscription
+from src.domain.entities.user import User
+from src.domain.enums import UserTypes
+from src.domain.errors import CompanyNotFoundError
+from src.web.framework.responses import FastJSONResponse
+from src.web.framework.thread_pools import READS_POOL
+from src.web.http_types import StatusCodes
+from src.web.middleware.auth_middleware import get_current_user
+
+event_routes = APIRouter(prefix="/events")
+
+# Policy violation: the socket was opened without a session, or by a user
+# who belongs to no company
+CLOSE_NOT_AUTHENTICATED = 1008
+# Try again later: the client fell behind and should reconnect and refetch
+CLOSE_FELL_BEHIND = 1013
+
+
+async def subscribe(app: FastAPI, user: User) -> Subscription:
+    """
+    Subscribe ``user`` to their company's events. Managers and administrators
+    get the whole company, and so does staff when the company lets attendants
+    see every conversation; otherwise staff only get the chats they could
+    pick up or are assigned to.
+    """
+    attendant_id = None
+    if user.type == UserTypes.STAFF and not await attendant_sees_all(
+        app, user.company_id
+    ):
+        attendant_id = user.id
+    return app.state.events.subscribe(user.company_id, attendant_id=attendant_id)
+
+
+async def attendant_sees_all(app: FastAPI, company_id: str) -> bool:
+    repository = app.state.company_repository
+    try:
+        company = await app.state.thread_pools[READS_POOL].run(
+            repository.get_by_id, company_id=company_id
+        )
+    except CompanyNotFoundError:
+        return False
+    return company.attendant_sees_all_conversations
+
+
+@event_routes.websocket("/ws")
+async def event_socket(websocket: WebSocket) -> None:
+    # The auth middleware only runs for HTTP requests: check the session here
+    user = await get_current_user(websocket)
+    if user is None or user.company_id is None:
+        await websocket.close(code=CLOSE_NOT_AUTHENTICATED)
+        return
+
+    await websocket.accept()
+    subscription = await subscribe(websocket.app, user)
+
+    async def forward() -> None:
+        while (payload := await subscription.get()) is not None:
+            await websocket.send_text(payload)
+
+    async def listen() -> None:
+        # Clients only listen; whatever they send is ignored until they leave
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    forwarding = asyncio.create_task(forward())
+    listening = asyncio.create_task(listen())
+    try:
+        done, _ = await asyncio.wait(
+            {forwarding, listening}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if forwarding in done and forwarding.exception() is None:
+            await websocket.close(code=CLOSE_FELL_BEHIND)
+    finally:
+        forwarding.cancel()
+        listening.cancel()
+        subscription.close()
+
+
+@event_routes.get("/")
+async def event_stream(request: Request) -> Response:
+    """Server-sent events, for clients that cannot hold a WebSocket open."""
+    user: User | None = getattr(request.state, "current_user", None)
+    if user is None:
+        return FastJSONResponse(
+            content={"error": "Not authenticated"},
+            status_code=StatusCodes.UNAUTHORIZED.value,
+        )
+    if user.company_id is None:
+        return FastJSONResponse(
+            content={"error": "User does not belong to a company"},
+            status_code=StatusCodes.FORBIDDEN.value,
+        )
+
+    subscription = await subscribe(request.app, user)
+    return StreamingResponse(
+        server_sent_events(
+            subscription, request.app.state.settings.EVENTS_HEARTBEAT_SECONDS
+        ),
+        media_type="text/event-stream",
+        # Keep proxies from caching or buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def server_sent_events(
+    subscription: Subscription, heartbeat_seconds: float
+) -> AsyncIterator[str]:
+    """
+    Render a subscription as an event stream, with a comment line whenever
+    it has been idle for ``heartbeat_seconds`` so proxies keep it open.
+    """
+    try:
+        # Flushes the headers before the first event
+        yield ": connected\n\n"
+        while True:
+            try:
+                payload = await asyncio.wait_for(subscription.get(), heartbeat_seconds)
+            except TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if payload is None:
+                return
+            yield f"data: {payload}\n\n"
+    finally:
+        subscription.close()
@@ -1,32 +1,37 @@
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
 from src.web.controllers.message_controllers import (
     GetMessageHttpController,
     ReceiveMessageHttpController,
 )
-from src.web.framework.adapter import request_adapter
+from src.web.framework.adapter import (
+    async_ingestion_queue_repository,
+    async_message_repository,
+    request_adapter,
+)
+from src.web.framework.responses import FastJSONResponse
+from src.web.framework.thread_pools import WEBHOOK_POOL
+from src.web.http_types import StatusCodes
 
 message_routes = APIRouter(prefix="/messages")
 
 
 @message_routes.post("/receive")
-async def receive_message(request: Request) -> JSONResponse:
-    message_repository = request.app.state.message_repository
-    contact_repository = request.app.state.contact_repository
-    chat_repository = request.app.state.chat_repository
+async def receive_message(request: Request) -> FastJSONResponse:
     controller = ReceiveMessageHttpController(
-        message_repository=message_repository,
-        contact_repository=contact_repository,
-        chat_repository=chat_repository,
+        ingestion_queue_repository=async_ingestion_queue_repository(
+            request, pool=WEBHOOK_POOL
+        )
     )
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    if response.status_code == StatusCodes.OK.value:
+        request.app.state.ingestion_workers.wake()
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @message_routes.get("/{id}")
-async def get_message(request: Request, id: str) -> JSONResponse:
-    repository = request.app.state.message_repository
+async def get_message(request: Request, id: str) -> FastJSONResponse:
+    repository = async_message_repository(request)
     controller = GetMessageHttpController(message_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await controller.handle(request=await request_adapter(request))
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
@@ -1,4 +1,11 @@
-from fastapi import APIRouter
+from dataclasses import asdict
+
+from fastapi import APIRouter, Request, Response
+
+from src.domain.entities.user import User
+from src.domain.enums import UserTypes
+from src.web.framework.responses import FastJSONResponse
+from src.web.http_types import StatusCodes
 
 readiness_routes = APIRouter(prefix="/ready")
 
@@ -6,3 +13,47 @@ readiness_routes = APIRouter(prefix="/ready")
 @readiness_routes.get("/")
 def ready() -> dict:
     return {"status": "ready"}
+
+
+@readiness_routes.get("/stats")
+def stats(request: Request) -> Response:
+    # Process internals, and a live queue query: administrators only
+    user: User | None = getattr(request.state, "current_user", None)
+    if user is None:
+        return FastJSONResponse(
+            content={"error": "Not authenticated"},
+            status_code=StatusCodes.UNAUTHORIZED.value,
+        )
+    if user.type != UserTypes.ADMINISTRATOR:
+        return FastJSONResponse(
+            content={"error": "Administrators only"},
+            status_code=StatusCodes.FORBIDDEN.value,
+        )
+
+    connection_pool = request.app.state.connection_pool
+    async_connection_pool = request.app.state.async_connection_pool
+    event_bus = request.app.state.event_bus
+    return FastJSONResponse(
+        content={
+            "database_pool": asdict(connection_pool.stats())
+            if connection_pool
+            else None,
+            "async_database_pool": asdict(async_connection_pool.stats())
+            if async_connection_pool
+            else None,
+            "ingestion_queue": asdict(
+                request.app.state.ingestion_queue_repository.stats()
+            ),
+            "ingestion_workers": asdict(request.app.state.ingestion_workers.stats()),
+            "idempotency_filter": asdict(request.app.state.idempotency_filter.stats()),
+            "business_numbers": asdict(request.app.state.business_numbers.stats()),
+            "conversations": asdict(request.app.state.conversations.stats()),
+            "user_cache": asdict(request.app.state.user_cache.stats()),
+            "events": asdict(request.app.state.events.stats()),
+            "event_bus": asdict(event_bus.stats()) if event_bus else None,
+            "thread_pools": {
+                name: asdict(pool.stats())
+                for name, pool in request.app.state.thread_pools.items()
+            },
+        }
+    )
@@ -1,5 +1,4 @@
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
 
 from src.web.controllers.user_controllers import (
     CreateUserHttpController,
@@ -8,54 +7,69 @@ from src.web.controllers.user_controllers import (
     ListUserHttpController,
     UpdateUserHttpController,
 )
-from src.web.framework.adapter import request_adapter
+from src.web.framework.adapter import request_adapter, thread_pool
+from src.web.framework.responses import FastJSONResponse
+from src.web.framework.thread_pools import READS_POOL
 
 user_routes = APIRouter(prefix="/users")
 
 
 @user_routes.get("/")
-async def list_users(request: Request) -> JSONResponse:
+async def list_users(request: Request) -> FastJSONResponse:
     repository = request.app.state.user_repository
     controller = ListUserHttpController(user_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @user_routes.post("/")
-async def create_user(request: Request) -> JSONResponse:
+async def create_user(request: Request) -> FastJSONResponse:
     user_repository = request.app.state.user_repository
     company_repository = request.app.state.company_repository
     controller = CreateUserHttpController(
         user_repository=user_repository,
         company_repository=company_repository,
     )
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @user_routes.get("/{id}")
-async def get_user(request: Request, id: str) -> JSONResponse:
+async def get_user(request: Request, id: str) -> FastJSONResponse:
     repository = request.app.state.user_repository
     controller = GetUserHttpController(user_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @user_routes.put("/{id}")
-async def update_user(request: Request, id: str) -> JSONResponse:
+async def update_user(request: Request, id: str) -> FastJSONResponse:
     user_repository = request.app.state.user_repository
     company_repository = request.app.state.company_repository
     controller = UpdateUserHttpController(
         user_repository=user_repository,
         company_repository=company_repository,
+        user_cache=request.app.state.user_cache,
     )
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
 
 
 @user_routes.delete("/{id}")
-async def delete_user(request: Request, id: str) -> JSONResponse:
+async def delete_user(request: Request, id: str) -> FastJSONResponse:
     repository = request.app.state.user_repository
-    controller = DeleteUserHttpController(user_repository=repository)
-    response = controller.handle(request=await request_adapter(request))
-    return JSONResponse(content=response.body, status_code=response.status_code)
+    controller = DeleteUserHttpController(
+        user_repository=repository, user_cache=request.app.state.user_cache
+    )
+    response = await thread_pool(request, READS_POOL).run(
+        controller.handle, request=await request_adapter(request)
+    )
+    return FastJSONResponse(content=response.body, status_code=response.status_code)
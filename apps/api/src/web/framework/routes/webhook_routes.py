@@ -5,7 +5,12 @@ from src.web.controllers.message_controllers import ReceiveMessageHttpController
 from src.web.controllers.webhook_controllers import (
     VerifyWebhookHttpController,
 )
-from src.web.framework.adapter import request_adapter
+from src.web.framework.adapter import (
+    async_ingestion_queue_repository,
+    request_adapter,
+)
+from src.web.framework.thread_pools import WEBHOOK_POOL
+from src.web.http_types import StatusCodes
 
 webhook_routes = APIRouter(prefix="/webhook")
 
@@ -21,13 +26,12 @@ async def verify(request: Request):
 
 @webhook_routes.post("/")
 async def receive_messages(request: Request):
-    message_repository = request.app.state.message_repository
-    contact_repository = request.app.state.contact_repository
-    chat_repository = request.app.state.chat_repository
     controller = ReceiveMessageHttpController(
-        message_repository=message_repository,
-        contact_repository=contact_repository,
-        chat_repository=chat_repository,
+        ingestion_queue_repository=async_ingestion_queue_repository(
+            request, pool=WEBHOOK_POOL
+        )
     )
-    response = controller.handle(request=await request_adapter(request))
+    response = await controller.handle(request=await request_adapter(request))
+    if response.status_code == StatusCodes.OK.value:
+        request.app.state.ingestion_workers.wake()
     return JSONResponse(content=response.body, status_code=response.status_code)
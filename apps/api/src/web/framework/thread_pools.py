@@ -0,0 +1,107 @@
+import asyncio
+import contextvars
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+from src.infrastructure.settings import AppSettings
+
+T = TypeVar("T")
+
+WEBHOOK_POOL = "webhook"
+READS_POOL = "reads"
+AUTH_POOL = "auth"
+
+
+@dataclass(frozen=True)
+class ThreadPoolStats:
+    max_workers: int
+    active: int
+    queued: int
+    completed: int
+    saturated: bool
+    peak_queued: int
+
+
+class BoundedThreadPool(ThreadPoolExecutor):
+    """
+    Fixed-size thread pool that keeps track of how busy it is.
+
+    Blocking controller and repository calls are offloaded here so they do
+    not run on the event loop. Each route group gets its own pool, so a
+    burst in one group (e.g. bcrypt on login) queues up behind its own
+    workers instead of starving the others.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        if max_workers < 1:
+            raise ValueError(f"Invalid max_workers for {name}: {max_workers}")
+
+        super().__init__(max_workers=max_workers, thread_name_prefix=f"{name}-pool")
+        self.name = name
+        self.max_workers = max_workers
+
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._peak_queued = 0
+
+    def submit(self, fn: Callable[..., T], /, *args, **kwargs) -> Future[T]:
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        try:
+            return super().submit(self._track, fn, *args, **kwargs)
+        except RuntimeError:
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    def _track(self, fn: Callable[..., T], *args, **kwargs) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+
+    async def run(self, fn: Callable[..., T], /, *args, **kwargs) -> T:
+        """Run ``fn`` on the pool, carrying the caller's context variables."""
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self, functools.partial(context.run, fn, *args, **kwargs)
+        )
+
+    def stats(self) -> ThreadPoolStats:
+        with self._lock:
+            return ThreadPoolStats(
+                max_workers=self.max_workers,
+                active=self._active,
+                queued=self._queued,
+                completed=self._completed,
+                saturated=self._active >= self.max_workers,
+                peak_queued=self._peak_queued,
+            )
+
+
+def create_thread_pools(settings: AppSettings) -> dict[str, BoundedThreadPool]:
+    """Create one pool per route group, sized from the settings."""
+    return {
+        WEBHOOK_POOL: BoundedThreadPool(
+            name=WEBHOOK_POOL, max_workers=settings.THREAD_POOL_WEBHOOK_SIZE
+        ),
+        READS_POOL: BoundedThreadPool(
+            name=READS_POOL, max_workers=settings.THREAD_POOL_READS_SIZE
+        ),
+        AUTH_POOL: BoundedThreadPool(
+            name=AUTH_POOL, max_workers=settings.THREAD_POOL_AUTH_SIZE
+        ),
+    }
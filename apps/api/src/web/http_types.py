@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from enum import Enum
 
 
@@ -7,9 +8,19 @@ class StatusCodes(Enum):
     NO_CONTENT = 204
 
     BAD_REQUEST = 400
+    UNAUTHORIZED = 401
     FORBIDDEN = 403
     NOT_FOUND = 404
 
+    SERVICE_UNAVAILABLE = 503
+
+
+class StreamFormats(Enum):
+    # One JSON object per line
+    NDJSON = "application/x-ndjson"
+    # The paginated list body, {"results": [...], "next_cursor": null}
+    JSON = "application/json"
+
 
 class HttpRequest:
     def __init__(
@@ -39,3 +50,22 @@ class HttpResponse:
     ):
         self.status_code = status_code
         self.body = body
+
+
+class HttpStreamResponse:
+    """
+    A list response whose items are produced while the body is sent.
+
+    ``items`` is consumed once, by the framework, after the controller has
+    returned.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        items: AsyncIterator[dict],
+        format: StreamFormats = StreamFormats.JSON,
+    ):
+        self.status_code = status_code
+        self.items = items
+        self.format = format
@@ -1,16 +1,42 @@
 import jwt
 from fastapi import Request
+from fastapi.requests import HTTPConnection
 
+from src.application.caching import MISSING, TTLCache
 from src.domain.entities.user import User
 from src.domain.repositories.user_repository import IUserRepository
 from src.infrastructure.security.jwt_service import JWTService
+from src.web.framework.thread_pools import READS_POOL
 
+# Served without looking at the session cookie. These match exactly, so
+# /ready/stats still needs a session
+PUBLIC_PATHS = ("/ready", "/ready/")
+# Public along with everything under them
+PUBLIC_ROUTES = (
+    "/webhook",
+    "/auth/login",
+    "/auth/refresh",
+    "/auth/logout",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+)
 
-async def get_current_user(request: Request) -> User | None:
+
+def is_public_route(path: str) -> bool:
+    return path in PUBLIC_PATHS or any(
+        path == route or path.startswith(f"{route}/") for route in PUBLIC_ROUTES
+    )
+
+
+async def get_current_user(request: HTTPConnection) -> User | None:
     """
     Extract and verify JWT from cookies, return current user.
 
-    Returns None if token is missing, invalid, or user not found.
+    Returns None if token is missing, invalid, or user not found. Active
+    users are cached by id; user updates, deletes and password changes
+    invalidate their entry. Takes a WebSocket too, which the middleware
+    never sees.
     """
     access_token = request.cookies.get("access_token")
 
@@ -20,14 +46,20 @@ async def get_current_user(request: Request) -> User | None:
     try:
         jwt_service: JWTService = request.app.state.jwt_service
         user_repository: IUserRepository = request.app.state.user_repository
+        user_cache: TTLCache = request.app.state.user_cache
 
         payload = jwt_service.verify_token(access_token, token_type="access")
         user_id = payload["sub"]
 
-        user = user_repository.get_by_id(user_id=user_id)
-
-        if not user.is_active:
-            return None
+        user = user_cache.get(user_id)
+        if user is MISSING:
+            # The lookup is a blocking repository call, keep it off the event loop
+            user = await request.app.state.thread_pools[READS_POOL].run(
+                user_repository.get_by_id, user_id=user_id
+            )
+            if not user.is_active:
+                return None
+            user_cache.set(user_id, user)
 
         return user
 
@@ -38,7 +70,12 @@ async def get_current_user(request: Request) -> User | None:
 async def auth_middleware(request: Request, call_next):
     """
     Middleware to extract current user from JWT and attach to request state.
+
+    Public routes skip the lookup and never have a current user.
     """
+    if is_public_route(request.url.path):
+        return await call_next(request)
+
     user = await get_current_user(request)
 
     if user:
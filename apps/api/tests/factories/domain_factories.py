@@ -91,9 +91,11 @@ def chat_factory(company, sender_contact, chat_repository):
 @pytest.fixture
 def message_factory(chat, message_repository):
     def _create_message(**kwargs):
+        message_id = generate_uuid4()
         message_data = {
-            "id": generate_uuid4(),
-            "external_id": "wamid.HBgLNTUxMTk4ODg4Nzc3NhUCABIYFDNFNkA1NkUwRjIyNUEzQTZEMTAA",
+            "id": message_id,
+            # External ids are unique, like the column they are stored in
+            "external_id": f"wamid.{message_id}",
             "external_timestamp": datetime(2025, 11, 2, tzinfo=UTC),
             "chat_id": chat.id,
             "sent_by_user_id": None,  # Default to contact-sent messages
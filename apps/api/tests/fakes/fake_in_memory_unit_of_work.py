@@ -0,0 +1,20 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from src.domain.repositories.unit_of_work import IUnitOfWork
+
+
+class InMemoryUnitOfWork(IUnitOfWork):
+    def __init__(self):
+        self.commits = 0
+        self.rollbacks = 0
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        try:
+            yield
+        except BaseException:
+            self.rollbacks += 1
+            raise
+        else:
+            self.commits += 1
@@ -1,11 +1,40 @@
+from collections.abc import Iterator
+from datetime import datetime
+
 from src.domain.entities.chat import Chat
+from src.domain.enums import InboxFilters
 from src.domain.errors import ChatNotFoundError
+from src.domain.inbox import InboxChat
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from src.domain.repositories.chat_repository import IChatRepository
+from tests.fakes.repositories.fake_in_memory_contact_repository import (
+    InMemoryContactRepository,
+)
+from tests.fakes.repositories.fake_in_memory_message_repository import (
+    InMemoryMessageRepository,
+)
+from tests.fakes.repositories.fake_in_memory_pagination import paginate
+
+INBOX_FILTERS = {
+    InboxFilters.ALL: lambda chat: True,
+    InboxFilters.UNASSIGNED: lambda chat: chat.attached_user_id is None,
+    InboxFilters.PENDING: lambda chat: (
+        chat.attached_user_id is not None and chat.status.value != "closed"
+    ),
+    InboxFilters.RESOLVED: lambda chat: chat.status.value == "closed",
+}
 
 
 class InMemoryChatRepository(IChatRepository):
-    def __init__(self):
+    def __init__(
+        self,
+        contact_repository: InMemoryContactRepository | None = None,
+        message_repository: InMemoryMessageRepository | None = None,
+    ):
         self.chats = {}
+        # The inbox reads contacts and messages from these, when given
+        self._contact_repository = contact_repository
+        self._message_repository = message_repository
 
     def save(self, chat: Chat) -> Chat:
         self.chats[chat.id] = chat
@@ -20,56 +49,192 @@ class InMemoryChatRepository(IChatRepository):
     def get_all(self) -> list[Chat]:
         return list(self.chats.values())
 
-    def get_by_company_id(self, company_id: str) -> list[Chat]:
-        return [chat for chat in self.chats.values() if chat.company_id == company_id]
+    def iter_all(self) -> Iterator[Chat]:
+        yield from list(self.chats.values())
+
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return self._page(
+            [chat for chat in self.chats.values() if chat.company_id == company_id],
+            limit=limit,
+            cursor=cursor,
+        )
 
     def delete(self, chat_id: str) -> None:
         self.get_by_id(chat_id=chat_id)
         self.chats.pop(chat_id)
 
+    def iter_by_company_id(self, company_id: str) -> Iterator[Chat]:
+        chats = [chat for chat in self.chats.values() if chat.company_id == company_id]
+        yield from sorted(
+            chats, key=lambda chat: (chat.created_at, chat.id), reverse=True
+        )
+
     def get_company_chat_by_contact_id(self, company_id: str, contact_id: str) -> Chat:
         for chat in self.chats.values():
             if chat.company_id == company_id and chat.contact_id == contact_id:
                 return chat
         raise ChatNotFoundError
 
-    def get_unassigned_by_company_id(self, company_id: str) -> list[Chat]:
-        return [
-            chat
-            for chat in self.chats.values()
-            if chat.company_id == company_id and chat.attached_user_id is None
-        ]
+    def get_unassigned_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return self._page(
+            [
+                chat
+                for chat in self.chats.values()
+                if chat.company_id == company_id and chat.attached_user_id is None
+            ],
+            limit=limit,
+            cursor=cursor,
+        )
 
-    def get_pending_by_company_id(self, company_id: str) -> list[Chat]:
-        return [
-            chat
-            for chat in self.chats.values()
-            if chat.company_id == company_id
-            and chat.attached_user_id is not None
-            and chat.status.value != "closed"
-        ]
+    def get_pending_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return self._page(
+            [
+                chat
+                for chat in self.chats.values()
+                if chat.company_id == company_id
+                and chat.attached_user_id is not None
+                and chat.status.value != "closed"
+            ],
+            limit=limit,
+            cursor=cursor,
+        )
 
-    def get_resolved_by_company_id(self, company_id: str) -> list[Chat]:
-        return [
-            chat
-            for chat in self.chats.values()
-            if chat.company_id == company_id and chat.status.value == "closed"
-        ]
+    def get_resolved_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return self._page(
+            [
+                chat
+                for chat in self.chats.values()
+                if chat.company_id == company_id and chat.status.value == "closed"
+            ],
+            limit=limit,
+            cursor=cursor,
+        )
 
-    def get_by_attendant_id(self, company_id: str, attendant_id: str) -> list[Chat]:
-        return [
-            chat
-            for chat in self.chats.values()
-            if chat.company_id == company_id and chat.attached_user_id == attendant_id
-        ]
+    def get_by_attendant_id(
+        self,
+        company_id: str,
+        attendant_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        return self._page(
+            [
+                chat
+                for chat in self.chats.values()
+                if chat.company_id == company_id
+                and chat.attached_user_id == attendant_id
+            ],
+            limit=limit,
+            cursor=cursor,
+        )
 
     def search_chats(
-        self, company_id: str, query: str, user_id: str | None = None
-    ) -> list[Chat]:
-        # Simple search implementation for testing
+        self,
+        company_id: str,
+        query: str,
+        user_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Chat]:
+        # Simple search implementation for testing: every match ranks the same
         results = [
             chat for chat in self.chats.values() if chat.company_id == company_id
         ]
         if user_id:
             results = [chat for chat in results if chat.attached_user_id == user_id]
-        return results
+        return paginate(
+            results,
+            key=lambda chat: (0.0, chat.created_at, chat.id),
+            types=(float, datetime, str),
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
+
+    def get_inbox(
+        self,
+        company_id: str,
+        inbox_filter: InboxFilters = InboxFilters.ALL,
+        attendant_id: str | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[InboxChat]:
+        matches = INBOX_FILTERS[inbox_filter]
+        # Most recent activity first: the last message, or the chat's creation
+        return paginate(
+            [
+                self._inbox_chat(chat)
+                for chat in self.chats.values()
+                if chat.company_id == company_id
+                and matches(chat)
+                and (attendant_id is None or chat.attached_user_id == attendant_id)
+            ],
+            key=lambda entry: (
+                entry.last_message_at or entry.chat.created_at,
+                entry.chat.id,
+            ),
+            types=(datetime, str),
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
+
+    def _inbox_chat(self, chat: Chat) -> InboxChat:
+        contact = (
+            self._contact_repository.contacts.get(chat.contact_id)
+            if self._contact_repository
+            else None
+        )
+        messages = (
+            [
+                message
+                for message in self._message_repository.messages.values()
+                if message.chat_id == chat.id
+            ]
+            if self._message_repository
+            else []
+        )
+        last_message = max(
+            messages,
+            key=lambda message: (message.external_timestamp, message.id),
+            default=None,
+        )
+        return InboxChat(
+            chat=chat,
+            contact_name=contact.name if contact else None,
+            contact_phone_number=contact.phone_number if contact else None,
+            last_message_text=last_message.text if last_message else None,
+            last_message_at=last_message.external_timestamp if last_message else None,
+            unread_count=sum(not message.read for message in messages),
+        )
+
+    @staticmethod
+    def _page(chats: list[Chat], limit: int, cursor: str | None) -> Page[Chat]:
+        return paginate(
+            chats,
+            key=lambda chat: (chat.created_at, chat.id),
+            types=(datetime, str),
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
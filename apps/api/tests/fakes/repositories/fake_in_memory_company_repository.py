@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from datetime import datetime
 
 from src.domain.entities.company import Company
@@ -47,6 +48,9 @@ class InMemoryCompanyRepository(ICompanyRepository):
     def get_all(self) -> list[Company]:
         return list(self.companies.values())
 
+    def iter_all(self) -> Iterator[Company]:
+        yield from list(self.companies.values())
+
     def delete(self, company_id: str) -> None:
         self.get_by_id(company_id=company_id)
         self.companies.pop(company_id)
@@ -1,8 +1,11 @@
+from collections.abc import Iterator
 from datetime import datetime
 
 from src.domain.entities.contact import Contact
 from src.domain.errors import ContactNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from src.domain.repositories.contact_repository import IContactRepository
+from tests.fakes.repositories.fake_in_memory_pagination import paginate
 
 
 class InMemoryContactRepository(IContactRepository):
@@ -95,16 +98,38 @@ class InMemoryContactRepository(IContactRepository):
     def get_all(self) -> list[Contact]:
         return list(self.contacts.values())
 
-    def delete(self, contact_id: str) -> None:
-        self.get_by_id(contact_id=contact_id)
-        self.contacts.pop(contact_id)
+    def iter_all(self) -> Iterator[Contact]:
+        yield from list(self.contacts.values())
 
-    def get_by_company_id(self, company_id) -> list[Contact]:
-        return [
+    def iter_by_company_id(self, company_id: str) -> Iterator[Contact]:
+        contacts = [
             contact
             for contact in self.contacts.values()
             if contact.company_id == company_id
         ]
+        yield from sorted(contacts, key=lambda contact: (contact.name, contact.id))
+
+    def delete(self, contact_id: str) -> None:
+        self.get_by_id(contact_id=contact_id)
+        self.contacts.pop(contact_id)
+
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
+        return paginate(
+            [
+                contact
+                for contact in self.contacts.values()
+                if contact.company_id == company_id
+            ],
+            key=lambda contact: (contact.name, contact.id),
+            types=(str, str),
+            limit=limit,
+            cursor=cursor,
+        )
 
     def get_by_phone_number(self, phone_number: str) -> Contact:
         for contact in self.contacts.values():
@@ -125,7 +150,13 @@ class InMemoryContactRepository(IContactRepository):
                 return contact
         raise ContactNotFoundError
 
-    def search_contacts(self, company_id: str, query: str) -> list[Contact]:
+    def search_contacts(
+        self,
+        company_id: str,
+        query: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
         lower_query = query.lower()
         results = [
             contact
@@ -138,5 +169,11 @@ class InMemoryContactRepository(IContactRepository):
                 or lower_query in [tag.lower() for tag in contact.tags]
             )
         ]
-        results.sort(key=lambda x: x.name)
-        return results
+        # Every match ranks the same, so results come back by name
+        return paginate(
+            results,
+            key=lambda contact: (0.0, contact.name, contact.id),
+            types=(float, str, str),
+            limit=limit,
+            cursor=cursor,
+        )
@@ -0,0 +1,57 @@
+import threading
+from datetime import timedelta
+
+from src.domain.entities.ingestion_job import IngestionJob
+from src.domain.repositories.ingestion_queue_repository import (
+    IIngestionQueueRepository,
+    IngestionQueueStats,
+)
+from src.helpers.helpers import get_now
+
+
+class InMemoryIngestionQueueRepository(IIngestionQueueRepository):
+    def __init__(self):
+        self.jobs: dict[str, IngestionJob] = {}
+        self.dead_letters: dict[str, IngestionJob] = {}
+        # Workers call in from several threads; claims must not overlap
+        self._lock = threading.Lock()
+
+    def enqueue(self, job: IngestionJob) -> IngestionJob:
+        with self._lock:
+            self.jobs[job.id] = job
+        return job
+
+    def claim(self, limit: int, lease_seconds: float) -> list[IngestionJob]:
+        now = get_now()
+        with self._lock:
+            due = sorted(
+                (job for job in self.jobs.values() if job.available_at <= now),
+                key=lambda job: (job.available_at, job.id),
+            )[:limit]
+            for job in due:
+                job.available_at = now + timedelta(seconds=lease_seconds)
+        return sorted(due, key=lambda job: (job.created_at, job.id))
+
+    def complete(self, job_ids: list[str]) -> None:
+        with self._lock:
+            for job_id in job_ids:
+                self.jobs.pop(job_id, None)
+
+    def retry(self, job: IngestionJob) -> None:
+        with self._lock:
+            if job.id in self.jobs:
+                self.jobs[job.id] = job
+
+    def dead_letter(self, job: IngestionJob) -> None:
+        with self._lock:
+            self.jobs.pop(job.id, None)
+            self.dead_letters[job.id] = job
+
+    def stats(self) -> IngestionQueueStats:
+        with self._lock:
+            oldest = min((job.created_at for job in self.jobs.values()), default=None)
+            return IngestionQueueStats(
+                pending=len(self.jobs),
+                dead_letters=len(self.dead_letters),
+                lag_seconds=(get_now() - oldest).total_seconds() if oldest else 0.0,
+            )
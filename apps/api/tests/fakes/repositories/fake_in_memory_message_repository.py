@@ -1,7 +1,12 @@
+from collections.abc import Iterator
+from datetime import datetime
+
 from src.domain.entities.message import Message
 from src.domain.errors import MessageNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from src.domain.repositories.message_repository import IMessageRepository
 from src.helpers.helpers import get_now
+from tests.fakes.repositories.fake_in_memory_pagination import paginate
 
 
 class InMemoryMessageRepository(IMessageRepository):
@@ -9,6 +14,10 @@ class InMemoryMessageRepository(IMessageRepository):
         self.messages = {}
 
     def save(self, message: Message) -> Message:
+        # Like the insert, a stored external_id under another id wins
+        for stored in self.messages.values():
+            if stored.external_id == message.external_id and stored.id != message.id:
+                return stored
         self.messages[message.id] = message
         return message
 
@@ -24,9 +33,22 @@ class InMemoryMessageRepository(IMessageRepository):
                 return message
         return None
 
+    def save_many(self, messages: list[Message]) -> list[Message]:
+        stored = {message.external_id for message in self.messages.values()}
+        inserted = []
+        for message in messages:
+            if message.external_id not in stored:
+                stored.add(message.external_id)
+                self.messages[message.id] = message
+                inserted.append(message)
+        return inserted
+
     def get_all(self) -> list[Message]:
         return list(self.messages.values())
 
+    def iter_all(self) -> Iterator[Message]:
+        yield from list(self.messages.values())
+
     def delete(self, message_id: str) -> None:
         self.get_by_id(message_id=message_id)
         self.messages.pop(message_id)
@@ -40,7 +62,30 @@ class InMemoryMessageRepository(IMessageRepository):
                 updated_count += 1
         return updated_count
 
-    def get_by_chat_id(self, chat_id: str) -> list[Message]:
-        return [
+    def get_by_chat_id(
+        self,
+        chat_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        before: str | None = None,
+    ) -> Page[Message]:
+        page = paginate(
+            [
+                message
+                for message in self.messages.values()
+                if message.chat_id == chat_id
+            ],
+            key=lambda message: (message.external_timestamp, message.id),
+            types=(datetime, str),
+            limit=limit,
+            cursor=before,
+            descending=True,
+        )
+        return Page(items=page.items[::-1], next_cursor=page.next_cursor)
+
+    def iter_by_chat_id(self, chat_id: str) -> Iterator[Message]:
+        messages = [
             message for message in self.messages.values() if message.chat_id == chat_id
         ]
+        yield from sorted(
+            messages, key=lambda message: (message.external_timestamp, message.id)
+        )
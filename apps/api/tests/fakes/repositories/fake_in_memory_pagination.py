@@ -0,0 +1,24 @@
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from src.domain.pagination import Page, build_page, decode_cursor
+
+
+def paginate(
+    items: Iterable[Any],
+    key: Callable[[Any], tuple],
+    types: Sequence[type],
+    limit: int,
+    cursor: str | None = None,
+    descending: bool = False,
+) -> Page:
+    """Keyset-paginate in-memory entities the way the Postgres DAOs do."""
+    after = decode_cursor(cursor, types)
+    items = sorted(items, key=key, reverse=descending)
+    if after is not None:
+        items = [
+            item
+            for item in items
+            if (key(item) < after if descending else key(item) > after)
+        ]
+    return build_page(items[: limit + 1], limit, key=key, parse=lambda item: item)
@@ -1,7 +1,12 @@
+from collections.abc import Iterator
+from datetime import datetime
+
 from src.domain.entities.user import User
 from src.domain.enums import UserTypes
 from src.domain.errors import UserNotFoundError
+from src.domain.pagination import DEFAULT_PAGE_SIZE, Page
 from src.domain.repositories.user_repository import IUserRepository
+from tests.fakes.repositories.fake_in_memory_pagination import paginate
 
 
 class InMemoryUserRepository(IUserRepository):
@@ -27,6 +32,15 @@ class InMemoryUserRepository(IUserRepository):
     def get_all(self) -> list[User]:
         return list(self.users.values())
 
+    def iter_all(self) -> Iterator[User]:
+        yield from list(self.users.values())
+
+    def iter_by_company_id(self, company_id: str) -> Iterator[User]:
+        users = [user for user in self.users.values() if user.company_id == company_id]
+        yield from sorted(
+            users, key=lambda user: (user.created_at, user.id), reverse=True
+        )
+
     def delete(self, user_id: str) -> None:
         self.get_by_id(user_id=user_id)
         self.users.pop(user_id)
@@ -36,19 +50,43 @@ class InMemoryUserRepository(IUserRepository):
         user.password_hash = password_hash
         self.save(user)
 
-    def get_by_company_id(self, company_id: str) -> list[User]:
-        return [user for user in self.users.values() if user.company_id == company_id]
+    def get_by_company_id(
+        self,
+        company_id: str,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]:
+        return self._page(
+            [user for user in self.users.values() if user.company_id == company_id],
+            limit=limit,
+            cursor=cursor,
+        )
 
-    def get_by_company_and_role(self, company_id: str, role: UserTypes) -> list[User]:
-        return [
-            user
-            for user in self.users.values()
-            if user.company_id == company_id and user.type == role
-        ]
+    def get_by_company_and_role(
+        self,
+        company_id: str,
+        role: UserTypes,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]:
+        return self._page(
+            [
+                user
+                for user in self.users.values()
+                if user.company_id == company_id and user.type == role
+            ],
+            limit=limit,
+            cursor=cursor,
+        )
 
     def search_users(
-        self, company_id: str, query: str, role: UserTypes | None = None
-    ) -> list[User]:
+        self,
+        company_id: str,
+        query: str,
+        role: UserTypes | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> Page[User]:
         results = []
         query_lower = query.lower()
         for user in self.users.values():
@@ -58,4 +96,23 @@ class InMemoryUserRepository(IUserRepository):
                 continue
             if query_lower in user.name.lower() or query_lower in user.email.lower():
                 results.append(user)
-        return results
+        # Every match ranks the same, so results come back newest first
+        return paginate(
+            results,
+            key=lambda user: (0.0, user.created_at, user.id),
+            types=(float, datetime, str),
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
+
+    @staticmethod
+    def _page(users: list[User], limit: int, cursor: str | None) -> Page[User]:
+        return paginate(
+            users,
+            key=lambda user: (user.created_at, user.id),
+            types=(datetime, str),
+            limit=limit,
+            cursor=cursor,
+            descending=True,
+        )
@@ -1,12 +1,31 @@
 import pytest
 
 from fixtures.database_fixtures import TestConnectionWrapper
+from src.infrastructure.daos.postgres_chat_dao import PostgresChatDAO
 from src.infrastructure.daos.postgres_company_dao import PostgresCompanyDAO
+from src.infrastructure.daos.postgres_ingestion_queue_dao import (
+    PostgresIngestionQueueDAO,
+)
+from src.infrastructure.daos.postgres_message_dao import PostgresMessageDAO
 from src.infrastructure.daos.postgres_user_dao import PostgresUserDAO
+from src.infrastructure.database.postgres_pool import PostgresConnectionPool
 
 
 @pytest.fixture
-def company_dao(test_database_url, db_connection, monkeypatch):
+def connection_pool(test_database_url):
+    """
+    Provide a lazily-connecting pool for DAO construction.
+
+    DAO fixtures replace _connect with the test connection, so the pool
+    itself is never checked out from during tests.
+    """
+    pool = PostgresConnectionPool(test_database_url, min_size=0, max_size=1)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def company_dao(connection_pool, db_connection, monkeypatch):
     """
     Provide PostgresCompanyDAO using test database connection.
 
@@ -16,14 +35,14 @@ def company_dao(test_database_url, db_connection, monkeypatch):
     DAO explicitly calls commit().
 
     Args:
-        test_database_url: Test database URL from session fixture
+        connection_pool: Connection pool from fixture
         db_connection: Test database connection from fixture
         monkeypatch: Pytest monkeypatch fixture for patching _connect method
 
     Returns:
         PostgresCompanyDAO: Company DAO instance configured for testing
     """
-    dao = PostgresCompanyDAO(test_database_url)
+    dao = PostgresCompanyDAO(connection_pool)
 
     # Wrap the connection to prevent commits during tests
     wrapped_connection = TestConnectionWrapper(db_connection)
@@ -36,7 +55,7 @@ def company_dao(test_database_url, db_connection, monkeypatch):
 
 
 @pytest.fixture
-def user_dao(test_database_url, db_connection, monkeypatch):
+def user_dao(connection_pool, db_connection, monkeypatch):
     """
     Provide PostgresUserDAO using test database connection.
 
@@ -45,14 +64,14 @@ def user_dao(test_database_url, db_connection, monkeypatch):
     transaction and are rolled back after the test completes.
 
     Args:
-        test_database_url: Test database URL from session fixture
+        connection_pool: Connection pool from fixture
         db_connection: Test database connection from fixture
         monkeypatch: Pytest monkeypatch fixture for patching _connect method
 
     Returns:
         PostgresUserDAO: User DAO instance configured for testing
     """
-    dao = PostgresUserDAO(test_database_url)
+    dao = PostgresUserDAO(connection_pool)
 
     # Wrap the connection to prevent commits during tests
     wrapped_connection = TestConnectionWrapper(db_connection)
@@ -63,32 +82,49 @@ def user_dao(test_database_url, db_connection, monkeypatch):
     return dao
 
 
+@pytest.fixture
+def message_dao(connection_pool, db_connection, monkeypatch):
+    """Provide PostgresMessageDAO bound to the rolled-back test connection."""
+    dao = PostgresMessageDAO(connection_pool)
+    monkeypatch.setattr(dao, "_connect", lambda: TestConnectionWrapper(db_connection))
+    return dao
+
+
+@pytest.fixture
+def chat_dao(connection_pool, db_connection, monkeypatch):
+    """Provide PostgresChatDAO bound to the rolled-back test connection."""
+    dao = PostgresChatDAO(connection_pool)
+    monkeypatch.setattr(dao, "_connect", lambda: TestConnectionWrapper(db_connection))
+    return dao
+
+
+@pytest.fixture
+def ingestion_queue_dao(connection_pool, db_connection, monkeypatch):
+    """Provide PostgresIngestionQueueDAO bound to the rolled-back test connection."""
+    dao = PostgresIngestionQueueDAO(connection_pool)
+    monkeypatch.setattr(dao, "_connect", lambda: TestConnectionWrapper(db_connection))
+    return dao
+
+
 # Additional DAO fixtures can be added following the same pattern:
 #
 # @pytest.fixture
-# def user_dao(test_database_url, db_connection, monkeypatch):
+# def user_dao(connection_pool, db_connection, monkeypatch):
 #     """Provide PostgresUserDAO using test database connection."""
-#     dao = PostgresUserDAO(test_database_url)
+#     dao = PostgresUserDAO(connection_pool)
 #     monkeypatch.setattr(dao, "_connect", lambda: db_connection)
 #     return dao
 #
 # @pytest.fixture
-# def contact_dao(test_database_url, db_connection, monkeypatch):
+# def contact_dao(connection_pool, db_connection, monkeypatch):
 #     """Provide PostgresContactDAO using test database connection."""
-#     dao = PostgresContactDAO(test_database_url)
+#     dao = PostgresContactDAO(connection_pool)
 #     monkeypatch.setattr(dao, "_connect", lambda: db_connection)
 #     return dao
 #
 # @pytest.fixture
-# def chat_dao(test_database_url, db_connection, monkeypatch):
+# def chat_dao(connection_pool, db_connection, monkeypatch):
 #     """Provide PostgresChatDAO using test database connection."""
-#     dao = PostgresChatDAO(test_database_url)
-#     monkeypatch.setattr(dao, "_connect", lambda: db_connection)
-#     return dao
-#
-# @pytest.fixture
-# def message_dao(test_database_url, db_connection, monkeypatch):
-#     """Provide PostgresMessageDAO using test database connection."""
-#     dao = PostgresMessageDAO(test_database_url)
+#     dao = PostgresChatDAO(connection_pool)
 #     monkeypatch.setattr(dao, "_connect", lambda: db_connection)
 #     return dao
@@ -1,5 +1,9 @@
 import pytest
 
+from src.infrastructure.repositories.async_repository_adapter import (
+    AsyncRepositoryAdapter,
+)
+from tests.fakes.fake_in_memory_unit_of_work import InMemoryUnitOfWork
 from tests.fakes.repositories.fake_in_memory_chat_repository import (
     InMemoryChatRepository,
 )
@@ -9,6 +13,9 @@ from tests.fakes.repositories.fake_in_memory_company_repository import (
 from tests.fakes.repositories.fake_in_memory_contact_repository import (
     InMemoryContactRepository,
 )
+from tests.fakes.repositories.fake_in_memory_ingestion_queue_repository import (
+    InMemoryIngestionQueueRepository,
+)
 from tests.fakes.repositories.fake_in_memory_message_repository import (
     InMemoryMessageRepository,
 )
@@ -33,10 +40,43 @@ def contact_repository():
 
 
 @pytest.fixture
-def chat_repository():
-    return InMemoryChatRepository()
+def chat_repository(contact_repository, message_repository):
+    return InMemoryChatRepository(
+        contact_repository=contact_repository,
+        message_repository=message_repository,
+    )
 
 
 @pytest.fixture
 def message_repository():
     return InMemoryMessageRepository()
+
+
+@pytest.fixture
+def ingestion_queue_repository():
+    return InMemoryIngestionQueueRepository()
+
+
+@pytest.fixture
+def async_contact_repository(contact_repository):
+    return AsyncRepositoryAdapter(contact_repository)
+
+
+@pytest.fixture
+def async_chat_repository(chat_repository):
+    return AsyncRepositoryAdapter(chat_repository)
+
+
+@pytest.fixture
+def async_message_repository(message_repository):
+    return AsyncRepositoryAdapter(message_repository)
+
+
+@pytest.fixture
+def async_ingestion_queue_repository(ingestion_queue_repository):
+    return AsyncRepositoryAdapter(ingestion_queue_repository)
+
+
+@pytest.fixture
+def unit_of_work():
+    return InMemoryUnitOfWork()
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -33,3 +35,17 @@ def app(app_settings):
 def client(app):
     with TestClient(app) as client:
         yield client
+
+
+@pytest.fixture
+def wait_for_ingestion(client):
+    """Return a function that blocks until the ingestion workers drain the queue."""
+
+    def wait(timeout: float = 2.0) -> None:
+        queue = client.app.state.ingestion_queue_repository
+        deadline = time.monotonic() + timeout
+        while queue.stats().pending:
+            assert time.monotonic() < deadline, "ingestion queue was not drained"
+            time.sleep(0.01)
+
+    return wait
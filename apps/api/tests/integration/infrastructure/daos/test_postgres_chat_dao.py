@@ -0,0 +1,125 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from src.infrastructure.database.repair_chat_activity import repair_chat_activity
+
+
+@pytest.mark.integration
+@pytest.mark.dao
+class TestPostgresChatDAO:
+    """Integration tests for PostgresChatDAO, rolled back after each test."""
+
+    @staticmethod
+    def _create_chat(db_cursor, company_id: str | None = None) -> str:
+        if company_id is None:
+            company_id = str(uuid.uuid4())
+            db_cursor.execute(
+                """
+                INSERT INTO companies (id, name, email, phone, is_active,
+                                       attendant_sees_all_conversations, whatsapp_api_key)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    company_id,
+                    "Company",
+                    f"{company_id[:8]}@test.com",
+                    "+1234567890",
+                    True,
+                    False,
+                    "api_key",
+                ),
+            )
+        contact_id = str(uuid.uuid4())
+        chat_id = str(uuid.uuid4())
+        db_cursor.execute(
+            """
+            INSERT INTO contacts (id, name, phone_number, company_id)
+            VALUES (%s, %s, %s, %s)
+            """,
+            (contact_id, "Contact", contact_id[:12], company_id),
+        )
+        db_cursor.execute(
+            "INSERT INTO chats (id, company_id, contact_id) VALUES (%s, %s, %s)",
+            (chat_id, company_id, contact_id),
+        )
+        return chat_id
+
+    @staticmethod
+    def _insert_message(db_cursor, chat_id: str, minute: int, read: bool) -> str:
+        # Written behind the DAO's back, so the chat counters drift
+        message_id = str(uuid.uuid4())
+        db_cursor.execute(
+            """
+            INSERT INTO messages (id, external_id, external_timestamp, chat_id, text, read)
+            VALUES (%s, %s, %s, %s, %s, %s)
+            """,
+            (
+                message_id,
+                f"wamid.{message_id}",
+                datetime(2025, 11, 2, 12, minute, tzinfo=UTC),
+                chat_id,
+                f"message {minute}",
+                read,
+            ),
+        )
+        return message_id
+
+    def test_repair_recomputes_drifted_chats_in_batches(self, chat_dao, db_cursor):
+        # Arrange
+        chat_ids = [self._create_chat(db_cursor) for _ in range(3)]
+        self._insert_message(db_cursor, chat_ids[0], 0, read=False)
+        last_id = self._insert_message(db_cursor, chat_ids[0], 1, read=True)
+
+        # Act
+        repaired = repair_chat_activity(chat_dao, batch_size=2)
+
+        # Assert
+        assert repaired >= 1
+        db_cursor.execute(
+            "SELECT unread_count, last_message_id FROM chats WHERE id = %s",
+            (chat_ids[0],),
+        )
+        assert db_cursor.fetchone() == (1, last_id)
+        assert repair_chat_activity(chat_dao, batch_size=2) == 0
+
+    def test_get_inbox_orders_by_last_message(self, chat_dao, message_dao, db_cursor):
+        # Arrange
+        older_chat = self._create_chat(db_cursor)
+        db_cursor.execute("SELECT company_id FROM chats WHERE id = %s", (older_chat,))
+        company_id = db_cursor.fetchone()[0]
+        newer_chat = self._create_chat(db_cursor, company_id=company_id)
+        message_dao.insert(
+            {
+                "id": str(uuid.uuid4()),
+                "external_id": f"wamid.{older_chat}",
+                "external_timestamp": datetime(2099, 1, 1, tzinfo=UTC),
+                "chat_id": older_chat,
+                "text": "latest",
+                "sent_by_user_id": None,
+                "read": False,
+            }
+        )
+
+        # Act
+        rows = chat_dao.get_inbox(company_id=company_id)
+
+        # Assert - the chat with the latest message comes first
+        assert [row[0] for row in rows] == [older_chat, newer_chat]
+        assert rows[0][9:12] == ("latest", datetime(2099, 1, 1, tzinfo=UTC), 1)
+
+    def test_search_chats_only_matches_the_company_messages(self, chat_dao, db_cursor):
+        # Arrange - the same text in another company's chat
+        own_chat = self._create_chat(db_cursor)
+        other_chat = self._create_chat(db_cursor)
+        self._insert_message(db_cursor, own_chat, 7, read=False)
+        self._insert_message(db_cursor, other_chat, 7, read=False)
+        db_cursor.execute("SELECT company_id FROM chats WHERE id = %s", (own_chat,))
+        company_id = db_cursor.fetchone()[0]
+
+        # Act
+        rows = chat_dao.search_chats(company_id=company_id, query="message 7")
+
+        # Assert
+        assert [row[0] for row in rows] == [own_chat]
@@ -172,6 +172,69 @@ class TestPostgresCompanyDAO:
         assert row[1] == "updated@company.com"
         assert row[2] is False
 
+    def test_upsert_inserts_new_company(self, company_dao, db_cursor):
+        """Test upserting a company that does not exist yet."""
+        # Arrange
+        company_data = {
+            "id": str(uuid.uuid4()),
+            "name": "Upserted Company",
+            "email": "upsert@company.com",
+            "phone": "+1234567890",
+            "is_active": True,
+            "attendant_sees_all_conversations": False,
+            "whatsapp_api_key": "upsert_key",
+            "updated_at": None,
+        }
+
+        # Act
+        result = company_dao.upsert(company_data)
+
+        # Assert
+        assert result[0] == company_data["id"]
+        assert result[1] == "Upserted Company"
+        db_cursor.execute(
+            "SELECT COUNT(*) FROM companies WHERE id = %s", (company_data["id"],)
+        )
+        assert db_cursor.fetchone()[0] == 1
+
+    def test_upsert_updates_existing_company(self, company_dao, db_cursor):
+        """Test upserting a company that already exists updates it in place."""
+        # Arrange
+        company_id = str(uuid.uuid4())
+        company_dao.insert(
+            {
+                "id": company_id,
+                "name": "Original Name",
+                "email": "original@company.com",
+                "phone": "+1111111111",
+                "is_active": True,
+                "attendant_sees_all_conversations": False,
+                "whatsapp_api_key": "original_key",
+            }
+        )
+        updated_at = datetime.now()
+
+        # Act
+        result = company_dao.upsert(
+            {
+                "id": company_id,
+                "name": "Updated Name",
+                "email": "updated@company.com",
+                "phone": "+2222222222",
+                "is_active": False,
+                "attendant_sees_all_conversations": True,
+                "whatsapp_api_key": "updated_key",
+                "updated_at": updated_at,
+            }
+        )
+
+        # Assert
+        assert result[1] == "Updated Name"
+        assert result[3] is not None  # updated_at
+        assert result[6] is False  # is_active
+        db_cursor.execute("SELECT COUNT(*) FROM companies WHERE id = %s", (company_id,))
+        assert db_cursor.fetchone()[0] == 1
+
     def test_delete_company(self, company_dao, db_cursor):
         """Test deleting a company."""
         # Arrange - Insert company first
@@ -0,0 +1,68 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+
+from src.helpers.helpers import get_now
+
+
+@pytest.mark.integration
+@pytest.mark.dao
+class TestPostgresIngestionQueueDAO:
+    """Integration tests for PostgresIngestionQueueDAO, rolled back after each test."""
+
+    @staticmethod
+    def _job_data(available_at=None) -> dict:
+        now = get_now()
+        return {
+            "id": str(uuid.uuid4()),
+            "payload": [{"external_id": "wamid.1", "text": "hi"}],
+            "attempts": 0,
+            "available_at": available_at or now,
+            "last_error": None,
+            "created_at": now,
+        }
+
+    def test_claim_leases_only_due_jobs(self, ingestion_queue_dao):
+        """Claimed jobs are pushed past the lease; future jobs are left alone."""
+        # Arrange
+        # CURRENT_TIMESTAMP is frozen at the start of the test transaction
+        due = ingestion_queue_dao.insert(
+            self._job_data(available_at=get_now() - timedelta(minutes=1))
+        )
+        ingestion_queue_dao.insert(
+            self._job_data(available_at=get_now() + timedelta(minutes=5))
+        )
+
+        # Act
+        claimed = ingestion_queue_dao.claim(limit=10, lease_seconds=60)
+        claimed_again = ingestion_queue_dao.claim(limit=10, lease_seconds=60)
+
+        # Assert
+        assert [row[0] for row in claimed] == [due[0]]
+        assert claimed[0][1] == [{"external_id": "wamid.1", "text": "hi"}]
+        assert claimed_again == []
+
+    def test_move_to_dead_letters_and_stats(self, ingestion_queue_dao, db_cursor):
+        """A dead-lettered job leaves the queue and shows up in the stats."""
+        # Arrange
+        db_cursor.execute("DELETE FROM ingestion_jobs")
+        db_cursor.execute("DELETE FROM ingestion_dead_letters")
+        kept = ingestion_queue_dao.insert(self._job_data())
+        dead = ingestion_queue_dao.insert(self._job_data())
+
+        # Act
+        ingestion_queue_dao.move_to_dead_letters(
+            {"id": dead[0], "attempts": 5, "last_error": "RuntimeError: boom"}
+        )
+        pending, dead_letters, lag_seconds = ingestion_queue_dao.stats()
+
+        # Assert
+        assert (pending, dead_letters) == (1, 1)
+        assert lag_seconds >= 0
+        db_cursor.execute(
+            "SELECT attempts, last_error FROM ingestion_dead_letters WHERE id = %s",
+            (dead[0],),
+        )
+        assert db_cursor.fetchone() == (5, "RuntimeError: boom")
+        assert kept[0] != dead[0]
@@ -0,0 +1,167 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+
+@pytest.mark.integration
+@pytest.mark.dao
+class TestPostgresMessageDAO:
+    """Integration tests for PostgresMessageDAO, rolled back after each test."""
+
+    @staticmethod
+    def _create_chat(db_cursor) -> str:
+        company_id = str(uuid.uuid4())
+        contact_id = str(uuid.uuid4())
+        chat_id = str(uuid.uuid4())
+        db_cursor.execute(
+            """
+            INSERT INTO companies (id, name, email, phone, is_active,
+                                   attendant_sees_all_conversations, whatsapp_api_key)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """,
+            (
+                company_id,
+                "Company",
+                f"{company_id[:8]}@test.com",
+                "+1234567890",
+                True,
+                False,
+                "api_key",
+            ),
+        )
+        db_cursor.execute(
+            """
+            INSERT INTO contacts (id, name, phone_number, company_id)
+            VALUES (%s, %s, %s, %s)
+            """,
+            (contact_id, "Contact", "5588999030001", company_id),
+        )
+        db_cursor.execute(
+            "INSERT INTO chats (id, company_id, contact_id) VALUES (%s, %s, %s)",
+            (chat_id, company_id, contact_id),
+        )
+        return chat_id
+
+    @staticmethod
+    def _message_data(chat_id: str, index: int) -> dict:
+        return {
+            "id": str(uuid.uuid4()),
+            "external_id": f"wamid.{index}.{chat_id}",
+            "external_timestamp": datetime(2025, 11, 2, 12, index, tzinfo=UTC),
+            "chat_id": chat_id,
+            "text": f"message {index}",
+            "sent_by_user_id": None,
+            "read": False,
+        }
+
+    def test_insert_many_skips_stored_external_ids(self, message_dao, db_cursor):
+        """One statement inserts the batch; redelivered external ids are skipped."""
+        # Arrange
+        chat_id = self._create_chat(db_cursor)
+        first_batch = [self._message_data(chat_id, index) for index in range(2)]
+        message_dao.insert_many(first_batch)
+        redelivered = {**first_batch[1], "id": str(uuid.uuid4())}
+        new = self._message_data(chat_id, 2)
+
+        # Act
+        inserted = message_dao.insert_many([redelivered, new])
+
+        # Assert
+        assert [row[0] for row in inserted] == [new["id"]]
+        db_cursor.execute(
+            "SELECT COUNT(*) FROM messages WHERE chat_id = %s", (chat_id,)
+        )
+        assert db_cursor.fetchone()[0] == 3
+
+    def test_insert_returns_none_for_stored_external_id(self, message_dao, db_cursor):
+        """ON CONFLICT (external_id) DO NOTHING makes the insert the idempotency check."""
+        # Arrange
+        chat_id = self._create_chat(db_cursor)
+        message_data = self._message_data(chat_id, 0)
+        message_dao.insert(message_data)
+
+        # Act
+        row = message_dao.insert({**message_data, "id": str(uuid.uuid4())})
+
+        # Assert
+        assert row is None
+
+    def test_insert_many_with_no_messages(self, message_dao):
+        """An empty batch is a no-op rather than an invalid statement."""
+        # Act/Assert
+        assert message_dao.insert_many([]) == []
+
+    def test_iter_by_chat_id_streams_oldest_first(self, message_dao, db_cursor):
+        """A server-side cursor yields the whole history across several fetches."""
+        # Arrange
+        chat_id = self._create_chat(db_cursor)
+        messages = [self._message_data(chat_id, index) for index in range(5)]
+        message_dao.insert_many(messages[::-1])
+
+        # Act
+        rows = list(message_dao.iter_by_chat_id(chat_id=chat_id, itersize=2))
+
+        # Assert
+        assert [row[0] for row in rows] == [message["id"] for message in messages]
+
+    @staticmethod
+    def _chat_activity(db_cursor, chat_id: str) -> tuple:
+        db_cursor.execute(
+            "SELECT unread_count, last_message_id FROM chats WHERE id = %s",
+            (chat_id,),
+        )
+        return db_cursor.fetchone()
+
+    def test_insert_many_updates_chat_activity(self, message_dao, db_cursor):
+        """The batch insert bumps the unread counter and moves the pointer."""
+        # Arrange
+        chat_id = self._create_chat(db_cursor)
+        messages = [self._message_data(chat_id, index) for index in range(3)]
+        messages[0]["read"] = True
+
+        # Act
+        message_dao.insert_many(messages[::-1])
+        message_dao.insert_many([messages[2]])  # redelivery, not counted twice
+
+        # Assert
+        assert self._chat_activity(db_cursor, chat_id) == (2, messages[2]["id"])
+
+    def test_mark_as_read_and_delete_update_chat_activity(self, message_dao, db_cursor):
+        """Reading clears the counter; deleting the last message repoints the chat."""
+        # Arrange
+        chat_id = self._create_chat(db_cursor)
+        messages = [self._message_data(chat_id, index) for index in range(2)]
+        message_dao.insert_many(messages)
+
+        # Act
+        marked = message_dao.mark_chat_messages_as_read(chat_id=chat_id)
+        message_dao.delete(message_id=messages[1]["id"])
+
+        # Assert
+        assert marked == 2
+        assert self._chat_activity(db_cursor, chat_id) == (0, messages[0]["id"])
+
+    def test_update_counts_read_changes_once(self, message_dao, db_cursor):
+        """Updating a message only adjusts the counter by the read change."""
+        # Arrange
+        chat_id = self._create_chat(db_cursor)
+        message = {**self._message_data(chat_id, 0), "updated_at": None}
+        message_dao.insert(message)
+
+        # Act
+        message_dao.update({**message, "text": "edited"})
+        unread_after_edit = self._chat_activity(db_cursor, chat_id)[0]
+        message_dao.update({**message, "read": True})
+
+        # Assert
+        assert unread_after_edit == 1
+        assert self._chat_activity(db_cursor, chat_id) == (0, message["id"])
+
+    def test_update_returns_none_for_unknown_id(self, message_dao, db_cursor):
+        # Arrange
+        chat_id = self._create_chat(db_cursor)
+        message = {**self._message_data(chat_id, 0), "updated_at": None}
+
+        # Act/Assert
+        assert message_dao.update(message) is None
@@ -466,3 +466,142 @@ class TestPostgresUserDAO:
         # Assert - Only company1 users are in search results
         assert len(search_results) == 1
         assert search_results[0][0] == user1_id
+
+    def test_upsert_keeps_password_hash_on_update(self, user_dao, db_cursor):
+        """Test that upserting an existing user never overwrites its password."""
+        # Arrange
+        company_id = str(uuid.uuid4())
+        db_cursor.execute(
+            """
+            INSERT INTO companies (id, name, email, phone, is_active,
+                                   attendant_sees_all_conversations, whatsapp_api_key)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """,
+            (
+                company_id,
+                "Company",
+                "company@test.com",
+                "+1234567890",
+                True,
+                False,
+                "key",
+            ),
+        )
+        user_data = {
+            "id": str(uuid.uuid4()),
+            "name": "Original Name",
+            "email": "user@test.com",
+            "type": "administrator",
+            "password_hash": "original_hash",
+            "company_id": company_id,
+            "is_active": True,
+            "updated_at": None,
+        }
+        user_dao.upsert(user_data)
+
+        # Act
+        result = user_dao.upsert(
+            {**user_data, "name": "Updated Name", "password_hash": "other_hash"}
+        )
+
+        # Assert
+        assert result[1] == "Updated Name"
+        db_cursor.execute(
+            "SELECT password_hash FROM users WHERE id = %s", (user_data["id"],)
+        )
+        assert db_cursor.fetchone()[0] == "original_hash"
+
+    def test_search_users_ranks_and_limits_results(self, user_dao, db_cursor):
+        """Test that search returns the closest matches first, up to the limit."""
+        # Arrange
+        company_id = str(uuid.uuid4())
+        db_cursor.execute(
+            """
+            INSERT INTO companies (id, name, email, phone, is_active,
+                                   attendant_sees_all_conversations, whatsapp_api_key)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """,
+            (
+                company_id,
+                "Company",
+                "company@test.com",
+                "+1234567890",
+                True,
+                False,
+                "key",
+            ),
+        )
+        for name in ["Ana", "Ana Maria Souza", "Mariana"]:
+            db_cursor.execute(
+                """
+                INSERT INTO users (id, name, email, type, password_hash, company_id, is_active)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    str(uuid.uuid4()),
+                    name,
+                    f"{uuid.uuid4()}@test.com",
+                    "attendant",
+                    "hash",
+                    company_id,
+                    True,
+                ),
+            )
+
+        # Act
+        results = user_dao.search_users(company_id=company_id, query="ana", limit=2)
+
+        # Assert
+        assert len(results) == 2
+        assert results[0][1] == "Ana"
+
+    def test_get_by_company_id_pages_with_keyset(self, user_dao, db_cursor):
+        """Test that passing the last row's (created_at, id) returns the next page."""
+        # Arrange
+        company_id = str(uuid.uuid4())
+        db_cursor.execute(
+            """
+            INSERT INTO companies (id, name, email, phone, is_active,
+                                   attendant_sees_all_conversations, whatsapp_api_key)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """,
+            (
+                company_id,
+                "Company",
+                "company@test.com",
+                "+1234567890",
+                True,
+                False,
+                "key",
+            ),
+        )
+        for index in range(3):
+            db_cursor.execute(
+                """
+                INSERT INTO users (id, name, email, type, password_hash, company_id, is_active)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """,
+                (
+                    str(uuid.uuid4()),
+                    f"User {index}",
+                    f"{uuid.uuid4()}@test.com",
+                    "staff",
+                    "hash",
+                    company_id,
+                    True,
+                ),
+            )
+
+        # Act
+        first_page = user_dao.get_by_company_id(company_id=company_id, limit=2)
+        last_row = first_page[-1]
+        second_page = user_dao.get_by_company_id(
+            company_id=company_id, limit=2, after=(last_row[6], last_row[0])
+        )
+
+        # Assert
+        assert len(first_page) == 2
+        assert len(second_page) == 1
+        assert {row[0] for row in first_page}.isdisjoint(
+            {row[0] for row in second_page}
+        )
@@ -0,0 +1,54 @@
+import asyncio
+import json
+
+import pytest
+
+from src.application.events import Event, EventHub, EventTypes
+from src.infrastructure.database.postgres_event_bus import PostgresEventBus
+
+
+@pytest.mark.integration
+def test_event_reaches_another_worker_through_postgres(test_database_url):
+    # Arrange - two workers, each with its own listener connection
+    producer_hub, consumer_hub = EventHub(), EventHub()
+    producer = PostgresEventBus(
+        test_database_url, hub=producer_hub, channel="convo_events_test"
+    )
+    consumer = PostgresEventBus(
+        test_database_url, hub=consumer_hub, channel="convo_events_test"
+    )
+    subscription = consumer_hub.subscribe("company-1", attendant_id="user-1")
+    events = [
+        Event(
+            type=EventTypes.MESSAGE_CREATED,
+            company_id="company-1",
+            chat_id="chat-1",
+            attendant_ids=frozenset({"user-1"}),
+            data={"text": text},
+        )
+        for text in ("one", "two", "three")
+    ]
+
+    async def work():
+        producer.start()
+        consumer.start()
+        while not (producer.stats().connected and consumer.stats().connected):
+            await asyncio.sleep(0.01)
+        for event in events:
+            await producer.publish(event)
+        received = [
+            await asyncio.wait_for(subscription.get(), timeout=5) for _ in events
+        ]
+        await producer.stop()
+        await consumer.stop()
+        return received
+
+    # Act
+    received = asyncio.run(work())
+
+    # Assert
+    assert [json.loads(payload)["data"]["text"] for payload in received] == [
+        "one",
+        "two",
+        "three",
+    ]
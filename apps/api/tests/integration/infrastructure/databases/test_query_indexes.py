@@ -0,0 +1,265 @@
+import json
+
+import pytest
+
+
+def _index_names(plan: dict) -> set[str]:
+    names = set()
+    if "Index Name" in plan:
+        names.add(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+QUERY_INDEXES = [
+    pytest.param(
+        """
+        SELECT id FROM chats
+        WHERE company_id = %s
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id",),
+        "idx_chats_company_created_at_keyset",
+        id="chats_by_company",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM chats
+        WHERE company_id = %s AND attached_user_id IS NULL
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id",),
+        "idx_chats_company_unassigned_keyset",
+        id="unassigned_chats",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM chats
+        WHERE company_id = %s
+          AND attached_user_id IS NOT NULL
+          AND status != 'closed'
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id",),
+        "idx_chats_company_pending_keyset",
+        id="pending_chats",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM chats
+        WHERE company_id = %s AND status = 'closed'
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id",),
+        "idx_chats_company_resolved_keyset",
+        id="resolved_chats",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM chats
+        WHERE company_id = %s AND attached_user_id = %s
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id", "user-id"),
+        "idx_chats_company_attendant_keyset",
+        id="chats_by_attendant",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM chats
+        WHERE company_id = %s AND contact_id = %s
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id", "contact-id"),
+        "idx_chats_company_contact",
+        id="company_chat_by_contact",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM messages
+        WHERE chat_id = %s
+        ORDER BY external_timestamp DESC, id DESC
+        LIMIT 51
+        """,
+        ("chat-id",),
+        "idx_messages_chat_external_timestamp_keyset",
+        id="latest_messages_by_chat",
+    ),
+    pytest.param(
+        """
+        UPDATE messages
+        SET read = TRUE, updated_at = CURRENT_TIMESTAMP
+        WHERE chat_id = %s AND read = FALSE
+        """,
+        ("chat-id",),
+        "idx_messages_chat_unread",
+        id="mark_chat_messages_as_read",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM contacts
+        WHERE company_id = %s AND phone_number = %s
+        """,
+        ("company-id", "5588999999999"),
+        "idx_contacts_company_phone_number",
+        id="company_contact_by_phone_number",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM contacts
+        WHERE company_id = %s
+        ORDER BY name ASC, id ASC
+        LIMIT 51
+        """,
+        ("company-id",),
+        "idx_contacts_company_name_keyset",
+        id="contacts_by_company",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM contacts
+        WHERE phone_number = %s
+        """,
+        ("5588999999999",),
+        "idx_contacts_phone_number",
+        id="contact_by_phone_number",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM users
+        WHERE company_id = %s
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id",),
+        "idx_users_company_created_at_keyset",
+        id="users_by_company",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM chats
+        WHERE company_id = %s
+        AND (created_at, id) < (%s, %s)
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id", "2026-01-01T00:00:00+00:00", "chat-id"),
+        "idx_chats_company_created_at_keyset",
+        id="chats_by_company_next_page",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM chats
+        WHERE company_id = %s
+        ORDER BY COALESCE(last_message_at, created_at) DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id",),
+        "idx_chats_company_activity_keyset",
+        id="inbox_by_activity",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM messages
+        WHERE chat_id = %s
+        AND (external_timestamp, id) < (%s, %s)
+        ORDER BY external_timestamp DESC, id DESC
+        LIMIT 51
+        """,
+        ("chat-id", "2026-01-01T00:00:00+00:00", "message-id"),
+        "idx_messages_chat_external_timestamp_keyset",
+        id="older_messages_by_chat",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM users
+        WHERE company_id = %s AND type = %s
+        ORDER BY created_at DESC, id DESC
+        LIMIT 51
+        """,
+        ("company-id", "staff"),
+        "idx_users_company_type_keyset",
+        id="users_by_company_and_role",
+    ),
+    pytest.param(
+        """
+        SELECT chat_id FROM messages
+        WHERE to_tsvector('simple', text) @@ plainto_tsquery('simple', %s)
+        """,
+        ("hello",),
+        "idx_messages_text_search",
+        id="message_full_text_search",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM contacts
+        WHERE name ILIKE %s
+        """,
+        ("%silva%",),
+        "idx_contacts_name_trgm",
+        id="contact_name_trigram_search",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM contacts
+        WHERE phone_number ILIKE %s
+        """,
+        ("%9990%",),
+        "idx_contacts_phone_number_trgm",
+        id="contact_phone_trigram_search",
+    ),
+    pytest.param(
+        """
+        SELECT id FROM users
+        WHERE email ILIKE %s
+        """,
+        ("%maria%",),
+        "idx_users_email_trgm",
+        id="user_email_trigram_search",
+    ),
+]
+
+
+@pytest.mark.integration
+class TestQueryIndexes:
+    """
+    EXPLAIN-based checks that each DAO query shape is served by its index.
+
+    The test tables are tiny, so sequential scans are disabled for the
+    transaction; the planner then has to pick an index that actually
+    matches the predicate and ordering.
+    """
+
+    @pytest.mark.parametrize(("query", "params", "index_name"), QUERY_INDEXES)
+    def test_query_uses_index(self, db_cursor, query, params, index_name):
+        # Arrange
+        db_cursor.execute("SET LOCAL enable_seqscan = off")
+
+        # Act
+        db_cursor.execute(f"EXPLAIN (FORMAT JSON) {query}", params)
+        plan = db_cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        # Assert
+        assert index_name in _index_names(plan[0]["Plan"])
+
+    def test_migration_indexes_exist_in_schema(self, db_cursor):
+        # Arrange
+        expected = {param.values[2] for param in QUERY_INDEXES}
+
+        # Act
+        db_cursor.execute(
+            "SELECT indexname FROM pg_indexes WHERE indexname = ANY(%s)",
+            (list(expected),),
+        )
+
+        # Assert
+        assert {row[0] for row in db_cursor.fetchall()} == expected
@@ -0,0 +1,67 @@
+from src.domain.enums import UserTypes
+from src.web.http_types import StatusCodes
+from tests.fakes.repositories.fake_in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+
+
+class CountingUserRepository(InMemoryUserRepository):
+    def __init__(self):
+        super().__init__()
+        self.get_by_id_calls = 0
+
+    def get_by_id(self, user_id):
+        self.get_by_id_calls += 1
+        return super().get_by_id(user_id)
+
+
+def _authenticate(client, user):
+    token = client.app.state.jwt_service.create_access_token(user_id=user.id)
+    client.cookies.set("access_token", token)
+
+
+def test_current_user_is_cached_until_updated(client, company_repository, user_factory):
+    # Arrange
+    user_repository = CountingUserRepository()
+    user = user_factory()
+    user_repository.save(user)
+    client.app.state.user_repository = user_repository
+    client.app.state.company_repository = company_repository
+    _authenticate(client, user)
+
+    # Act
+    first = client.get("/auth/me")
+    second = client.get("/auth/me")
+    lookups_before_update = user_repository.get_by_id_calls
+    client.put(
+        f"/users/{user.id}",
+        json={
+            "name": user.name,
+            "email": user.email,
+            "type": UserTypes.STAFF.value,
+            "is_active": False,
+        },
+    )
+    after_update = client.get("/auth/me")
+
+    # Assert
+    assert first.status_code == second.status_code == StatusCodes.OK.value
+    assert lookups_before_update == 1
+    assert after_update.status_code == 401
+
+
+def test_public_routes_skip_authentication(client, user_factory):
+    # Arrange
+    user_repository = CountingUserRepository()
+    user = user_factory()
+    user_repository.save(user)
+    client.app.state.user_repository = user_repository
+    _authenticate(client, user)
+
+    # Act
+    response = client.get("/ready")
+
+    # Assert
+    assert response.status_code == StatusCodes.OK.value
+    assert user_repository.get_by_id_calls == 0
+    assert len(client.app.state.user_cache) == 0
@@ -1,5 +1,12 @@
+import asyncio
+import json
+from datetime import UTC, datetime
+
 import pytest
 
+from src.application.conversations import Conversation
+from src.domain.enums import ChatStatuses
+from src.domain.errors import ChatNotFoundError
 from src.web.http_types import StatusCodes
 
 
@@ -22,6 +29,27 @@ def test_list_company_chats_endpoint(
     assert len(response_2.json().get("results")) == len(chats_2)
 
 
+def test_list_company_chats_endpoint_streams_ndjson(
+    client, company_factory, chat_repository, chat_factory
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+    company = company_factory()
+    chats = [chat_factory(company_id=company.id) for _ in range(3)]
+
+    # Act
+    response = client.get(
+        f"/chats/?company_id={company.id}&limit=1",
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    # Assert - every chat, one per line, regardless of limit
+    assert response.status_code == StatusCodes.OK.value
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = response.text.splitlines()
+    assert {json.loads(line)["id"] for line in lines} == {chat.id for chat in chats}
+
+
 @pytest.mark.integration
 def test_mark_chat_as_read_endpoint(
     client,
@@ -91,3 +119,230 @@ def test_mark_chat_as_read_endpoint_nonexistent_chat(
     # Assert - Should succeed with count 0
     assert response.status_code == StatusCodes.OK.value
     assert response.json()["updated_count"] == 0
+
+
+def test_list_company_chats_endpoint_paginates_with_cursor(
+    client, company, chat_repository, chat_factory
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+    chats = [chat_factory(company_id=company.id) for _ in range(3)]
+
+    # Act
+    first = client.get(f"/chats/?company_id={company.id}&limit=2").json()
+    second = client.get(
+        f"/chats/?company_id={company.id}&limit=2&cursor={first['next_cursor']}"
+    ).json()
+
+    # Assert
+    assert len(first["results"]) == 2
+    assert first["next_cursor"] is not None
+    assert len(second["results"]) == 1
+    assert second["next_cursor"] is None
+    returned_ids = {chat["id"] for chat in first["results"] + second["results"]}
+    assert returned_ids == {chat.id for chat in chats}
+
+
+@pytest.mark.parametrize("query", ["limit=0", "limit=abc", "cursor=bogus"])
+def test_list_company_chats_endpoint_rejects_invalid_page_params(
+    client, company, chat_repository, query
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+
+    # Act
+    response = client.get(f"/chats/?company_id={company.id}&{query}")
+
+    # Assert
+    assert response.status_code == StatusCodes.BAD_REQUEST.value
+    assert response.json() == {"detail": "invalid limit or cursor"}
+
+
+def test_get_chat_messages_endpoint_loads_older_messages_with_before(
+    client, chat, message_factory, message_repository
+):
+    # Arrange
+    client.app.state.message_repository = message_repository
+    messages = [
+        message_factory(
+            external_id=f"wamid.{minute}",
+            external_timestamp=datetime(2025, 11, 2, 10, minute, tzinfo=UTC),
+        )
+        for minute in range(3)
+    ]
+
+    # Act
+    latest = client.get(f"/chats/{chat.id}/messages?limit=2").json()
+    older = client.get(
+        f"/chats/{chat.id}/messages?limit=2&before={latest['next_cursor']}"
+    ).json()
+
+    # Assert
+    assert [m["id"] for m in latest["results"]] == [m.id for m in messages[1:]]
+    assert [m["id"] for m in older["results"]] == [messages[0].id]
+    assert older["next_cursor"] is None
+
+
+def test_get_chat_messages_endpoint_streams_json_array(
+    client, chat, message_factory, message_repository
+):
+    # Arrange
+    client.app.state.message_repository = message_repository
+    messages = [
+        message_factory(
+            external_id=f"wamid.{minute}",
+            external_timestamp=datetime(2025, 11, 2, 10, minute, tzinfo=UTC),
+        )
+        for minute in range(3)
+    ]
+
+    # Act
+    response = client.get(f"/chats/{chat.id}/messages?stream=true")
+
+    # Assert - the whole history, oldest first, in the usual list body
+    assert response.status_code == StatusCodes.OK.value
+    body = response.json()
+    assert [m["id"] for m in body["results"]] == [m.id for m in messages]
+    assert body["next_cursor"] is None
+
+
+def test_streaming_endpoint_refuses_when_every_stream_slot_is_taken(
+    client, chat, message_factory, message_repository
+):
+    # Arrange
+    client.app.state.message_repository = message_repository
+    message_factory()
+    client.app.state.stream_slots = asyncio.Semaphore(0)
+
+    # Act
+    streamed = client.get(f"/chats/{chat.id}/messages?stream=true")
+    paginated = client.get(f"/chats/{chat.id}/messages")
+
+    # Assert - only streams are limited
+    assert streamed.status_code == StatusCodes.SERVICE_UNAVAILABLE.value
+    assert streamed.headers["retry-after"] == "1"
+    assert paginated.status_code == StatusCodes.OK.value
+
+
+def test_get_inbox_endpoint_returns_contact_last_message_and_unread_count(
+    client, company, chat, sender_contact, message_factory, chat_repository
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+    message_factory(
+        external_timestamp=datetime(2025, 11, 2, 10, 0, tzinfo=UTC), read=True
+    )
+    message_factory(external_timestamp=datetime(2025, 11, 2, 10, 5, tzinfo=UTC))
+    last = message_factory(
+        text="See you tomorrow",
+        external_timestamp=datetime(2025, 11, 2, 10, 9, tzinfo=UTC),
+    )
+
+    # Act
+    response = client.get(f"/chats/inbox?company_id={company.id}")
+
+    # Assert
+    assert response.status_code == StatusCodes.OK.value
+    [entry] = response.json()["results"]
+    assert entry["id"] == chat.id
+    assert entry["contact_name"] == sender_contact.name
+    assert entry["contact_phone_number"] == sender_contact.phone_number
+    assert entry["last_message_text"] == last.text
+    assert entry["last_message_at"] == last.external_timestamp.isoformat()
+    assert entry["unread_count"] == 2
+
+
+def test_get_inbox_endpoint_applies_the_chat_list_filters(
+    client, company, chat_factory, chat_repository
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+    unassigned = chat_factory()
+    pending = chat_factory(attached_user_id="attendant-1")
+    resolved = chat_factory(attached_user_id="attendant-2", status=ChatStatuses.CLOSED)
+
+    def inbox_ids(query: str) -> set[str]:
+        response = client.get(f"/chats/inbox?company_id={company.id}&{query}")
+        return {entry["id"] for entry in response.json()["results"]}
+
+    # Act/Assert
+    assert inbox_ids("filter=unassigned") == {unassigned.id}
+    assert inbox_ids("filter=pending") == {pending.id}
+    assert inbox_ids("filter=resolved") == {resolved.id}
+    assert inbox_ids("attendant_id=attendant-2") == {resolved.id}
+    assert inbox_ids("") == {unassigned.id, pending.id, resolved.id}
+
+
+def test_get_inbox_endpoint_paginates_and_rejects_unknown_filters(
+    client, company, chat_factory, chat_repository
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+    chats = [chat_factory() for _ in range(3)]
+
+    # Act
+    first = client.get(f"/chats/inbox?company_id={company.id}&limit=2").json()
+    second = client.get(
+        f"/chats/inbox?company_id={company.id}&limit=2&cursor={first['next_cursor']}"
+    ).json()
+    invalid = client.get(f"/chats/inbox?company_id={company.id}&filter=archived")
+
+    # Assert
+    returned_ids = {entry["id"] for entry in first["results"] + second["results"]}
+    assert returned_ids == {chat.id for chat in chats}
+    assert second["next_cursor"] is None
+    assert invalid.status_code == StatusCodes.BAD_REQUEST.value
+    assert invalid.json() == {"detail": "invalid filter"}
+
+
+def test_get_inbox_endpoint_lists_most_recent_activity_first(
+    client, company, chat, chat_factory, message_factory, chat_repository
+):
+    # Arrange - ``chat`` was created just now and has no messages
+    client.app.state.chat_repository = chat_repository
+    older = chat_factory(created_at=datetime(2025, 11, 1, tzinfo=UTC))
+    newer = chat_factory(created_at=datetime(2025, 11, 2, tzinfo=UTC))
+    message_factory(
+        chat_id=older.id, external_timestamp=datetime(2099, 1, 1, tzinfo=UTC)
+    )
+
+    # Act
+    response = client.get(f"/chats/inbox?company_id={company.id}")
+
+    # Assert - a new message moves the oldest chat to the top
+    assert [entry["id"] for entry in response.json()["results"]] == [
+        older.id,
+        chat.id,
+        newer.id,
+    ]
+
+
+def test_delete_chat_endpoint_forgets_the_conversation(
+    client, company, chat, chat_repository
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+    conversations = client.app.state.conversations
+    conversation = Conversation(contact_id=chat.contact_id, chat_id=chat.id)
+    conversations.remember(company.id, "5511999999999", conversation)
+
+    # Act
+    response = client.delete(f"/chats/{chat.id}")
+
+    # Assert
+    assert response.status_code == StatusCodes.NO_CONTENT.value
+    with pytest.raises(ChatNotFoundError):
+        chat_repository.get_by_id(chat_id=chat.id)
+    assert conversations.get(company.id, "5511999999999") is None
+
+
+def test_delete_chat_endpoint_non_existing_chat(client, chat_repository):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+
+    # Act
+    response = client.delete("/chats/invalid_id")
+
+    # Assert
+    assert response.status_code == StatusCodes.NOT_FOUND.value
+    assert response.json().get("detail") == "chat not found"
@@ -0,0 +1,174 @@
+import asyncio
+import json
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from src.application.events import Event, EventHub, EventTypes
+from src.domain.enums import UserTypes
+from src.web.framework.routes.event_routes import (
+    CLOSE_NOT_AUTHENTICATED,
+    server_sent_events,
+)
+from src.web.http_types import StatusCodes
+
+
+def _authenticate(client, user_repository, user):
+    client.app.state.user_repository = user_repository
+    token = client.app.state.jwt_service.create_access_token(user_id=user.id)
+    client.cookies.set("access_token", token)
+
+
+def test_event_socket_receives_sent_messages(
+    client, chat, chat_repository, message_repository, user_repository, user_factory
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+    client.app.state.message_repository = message_repository
+    _authenticate(client, user_repository, user_factory(type=UserTypes.MANAGER))
+
+    with client.websocket_connect("/events/ws") as websocket:
+        # Act
+        response = client.post(
+            f"/chats/{chat.id}/messages",
+            json={"text": "Hello", "sent_by_user_id": "user-1"},
+        )
+
+        # Assert
+        event = websocket.receive_json()
+
+    assert response.status_code == StatusCodes.CREATED.value
+    assert event["type"] == "message.created"
+    assert event["chat_id"] == chat.id
+    assert event["data"]["id"] == response.json()["id"]
+
+
+def test_event_socket_receives_assignments(
+    client, chat, chat_repository, user_repository, staff_user
+):
+    # Arrange
+    client.app.state.chat_repository = chat_repository
+    _authenticate(client, user_repository, staff_user)
+
+    with client.websocket_connect("/events/ws") as websocket:
+        # Act
+        client.patch(f"/chats/{chat.id}/assign", json={"attendant_id": staff_user.id})
+
+        # Assert
+        event = websocket.receive_json()
+
+    assert event["type"] == "chat.assigned"
+    assert event["data"]["attached_user_id"] == staff_user.id
+    assert client.app.state.events.stats().subscribers == 0
+
+
+def _subscriptions(client):
+    return [
+        subscription
+        for attendants in client.app.state.events._subscriptions.values()
+        for subscriptions in attendants.values()
+        for subscription in subscriptions
+    ]
+
+
+def test_event_socket_is_scoped_by_the_session_not_the_query(
+    client, chat, company, company_repository, user_repository, staff_user
+):
+    # Arrange
+    company.attendant_sees_all_conversations = False
+    client.app.state.company_repository = company_repository
+    _authenticate(client, user_repository, staff_user)
+
+    # Act
+    with client.websocket_connect(
+        "/events/ws?company_id=other-company&attendant_id=other-user"
+    ):
+        [subscription] = _subscriptions(client)
+
+    # Assert
+    assert subscription.company_id == chat.company_id
+    assert subscription.attendant_id == staff_user.id
+
+
+def test_event_socket_gives_staff_every_chat_when_the_company_allows_it(
+    client, company, company_repository, user_repository, staff_user
+):
+    # Arrange
+    company.attendant_sees_all_conversations = True
+    client.app.state.company_repository = company_repository
+    _authenticate(client, user_repository, staff_user)
+
+    # Act
+    with client.websocket_connect("/events/ws"):
+        [subscription] = _subscriptions(client)
+
+    # Assert - the same visibility as the company's chat lists
+    assert subscription.company_id == company.id
+    assert subscription.attendant_id is None
+
+
+def test_event_socket_requires_a_session(client):
+    # Act/Assert - closed before it is accepted
+    with pytest.raises(WebSocketDisconnect) as disconnect:
+        with client.websocket_connect("/events/ws?company_id=company-1") as websocket:
+            websocket.receive_text()
+    assert disconnect.value.code == CLOSE_NOT_AUTHENTICATED
+    assert client.app.state.events.stats().subscribers == 0
+
+
+def test_event_stream_requires_a_session(client):
+    # Act
+    response = client.get("/events/?company_id=company-1")
+
+    # Assert
+    assert response.status_code == StatusCodes.UNAUTHORIZED.value
+
+
+def test_event_stream_refuses_users_without_a_company(
+    client, user_repository, user_factory
+):
+    # Arrange
+    _authenticate(
+        client,
+        user_repository,
+        user_factory(type=UserTypes.ADMINISTRATOR, company_id=None),
+    )
+
+    # Act
+    response = client.get("/events/")
+
+    # Assert
+    assert response.status_code == StatusCodes.FORBIDDEN.value
+
+
+def test_server_sent_events_render_events_and_heartbeats():
+    # Arrange
+    hub = EventHub(max_pending=1)
+    subscription = hub.subscribe("company-1")
+
+    async def read():
+        stream = server_sent_events(subscription, heartbeat_seconds=0.01)
+        chunks = [await anext(stream), await anext(stream)]
+        event = Event(EventTypes.CHAT_READ, "company-1", "chat-1")
+        hub.dispatch(event)
+        chunks.append(await anext(stream))
+        # Falling behind ends the stream
+        hub.dispatch(event)
+        hub.dispatch(event)
+        chunks.extend([chunk async for chunk in stream])
+        return chunks
+
+    # Act
+    chunks = asyncio.run(read())
+
+    # Assert
+    assert chunks[:2] == [": connected\n\n", ": keepalive\n\n"]
+    assert chunks[2].startswith("data: ")
+    assert json.loads(chunks[2].removeprefix("data: ")) == {
+        "type": "chat.read",
+        "chat_id": "chat-1",
+        "data": {},
+    }
+    assert chunks[3:] == [chunks[2]]
+    assert subscription.closed
+    assert hub.stats().subscribers == 0
@@ -38,6 +38,7 @@ def test_receive_message_endpoint(
     message_repository,
     contact_repository,
     chat_repository,
+    wait_for_ingestion,
 ):
     # Arrange
     client.app.state.message_repository = message_repository
@@ -85,8 +86,9 @@ def test_receive_message_endpoint(
     response = client.post("/messages/receive", json=data)
 
     # Assert
-    assert response.status_code == StatusCodes.CREATED.value
-    received_message = message_repository.get_by_id(
-        message_id=response.json().get("message_id")
+    assert response.status_code == StatusCodes.OK.value
+    wait_for_ingestion()
+    received_message = message_repository.get_by_external_id(
+        external_id="<WHATSAPP_MESSAGE_ID>"
     )
     assert received_message.text == message_text
@@ -1,6 +1,18 @@
+import pytest
+
+from src.domain.enums import UserTypes
 from src.web.http_types import StatusCodes
 
 
+@pytest.fixture
+def administrator(client, user_repository, user_factory):
+    user = user_factory(type=UserTypes.ADMINISTRATOR)
+    client.app.state.user_repository = user_repository
+    token = client.app.state.jwt_service.create_access_token(user_id=user.id)
+    client.cookies.set("access_token", token)
+    return user
+
+
 def test_readiness_endpoint(client):
     # Act
     response = client.get("/ready")
@@ -8,3 +20,80 @@ def test_readiness_endpoint(client):
     # Assert
     assert response.status_code == StatusCodes.OK.value
     assert response.json() == {"status": "ready"}
+
+
+def test_readiness_stats_endpoint_requires_a_session(client):
+    # Act
+    response = client.get("/ready/stats")
+
+    # Assert - only the probe itself is public
+    assert response.status_code == StatusCodes.UNAUTHORIZED.value
+
+
+def test_readiness_stats_endpoint_is_for_administrators(
+    client, user_repository, staff_user
+):
+    # Arrange
+    client.app.state.user_repository = user_repository
+    token = client.app.state.jwt_service.create_access_token(user_id=staff_user.id)
+    client.cookies.set("access_token", token)
+
+    # Act
+    response = client.get("/ready/stats")
+
+    # Assert
+    assert response.status_code == StatusCodes.FORBIDDEN.value
+
+
+def test_readiness_stats_endpoint_without_database_pool(client, administrator):
+    # Act
+    response = client.get("/ready/stats")
+
+    # Assert
+    assert response.status_code == StatusCodes.OK.value
+    assert response.json()["database_pool"] is None
+
+
+def test_readiness_stats_endpoint_reports_thread_pools(client, administrator):
+    # Act
+    response = client.get("/ready/stats")
+
+    # Assert
+    assert response.status_code == StatusCodes.OK.value
+    thread_pools = response.json()["thread_pools"]
+    assert set(thread_pools) == {"webhook", "reads", "auth"}
+    assert thread_pools["auth"]["max_workers"] == 4
+    assert thread_pools["webhook"]["saturated"] is False
+
+
+def test_readiness_stats_endpoint_reports_ingestion_queue(client, administrator):
+    # Act
+    response = client.get("/ready/stats")
+
+    # Assert
+    assert response.status_code == StatusCodes.OK.value
+    body = response.json()
+    assert body["ingestion_queue"] == {
+        "pending": 0,
+        "dead_letters": 0,
+        "lag_seconds": 0.0,
+    }
+    workers = body["ingestion_workers"]
+    assert workers["running"] is True
+    assert [shard["shard"] for shard in workers["shards"]] == [0, 1, 2, 3]
+    assert all(shard["backlog"] == 0 for shard in workers["shards"])
+    assert body["idempotency_filter"]["capacity"] == 100_000
+    assert body["business_numbers"]["capacity"] == 10_000
+    assert body["conversations"]["capacity"] == 100_000
+    assert body["user_cache"]["capacity"] == 10_000
+
+
+def test_readiness_stats_endpoint_reports_events(client, administrator):
+    # Act
+    response = client.get("/ready/stats")
+
+    # Assert - the in-memory backend publishes to the hub, without a bus
+    assert response.status_code == StatusCodes.OK.value
+    body = response.json()
+    assert body["events"]["subscribers"] == 0
+    assert body["event_bus"] is None
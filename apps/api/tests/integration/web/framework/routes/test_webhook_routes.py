@@ -85,5 +85,114 @@ def test_receive_messages_webhook_endpoint(
     response = client.post("/webhook/", json=fake_message)
 
     # Assert
-    assert response.status_code == StatusCodes.CREATED.value
-    assert "message_id" in response.json()
+    assert response.status_code == StatusCodes.OK.value
+    assert response.json()["queued_messages"] == 1
+    assert "job_id" in response.json()
+
+
+def _change(receiver_phone_number, contacts, messages):
+    return {
+        "value": {
+            "messaging_product": "whatsapp",
+            "metadata": {"display_phone_number": receiver_phone_number},
+            "contacts": [
+                {"profile": {"name": name}, "wa_id": wa_id} for wa_id, name in contacts
+            ],
+            "messages": [
+                {
+                    "from": sender,
+                    "id": external_id,
+                    "timestamp": "1770814438",
+                    "text": {"body": text},
+                    "type": "text",
+                }
+                for sender, external_id, text in messages
+            ],
+        },
+        "field": "messages",
+    }
+
+
+def test_receive_messages_webhook_endpoint_ingests_every_message(
+    client, receiver_contact, contact_repository, message_repository, wait_for_ingestion
+):
+    # Arrange
+    client.app.state.contact_repository = contact_repository
+    client.app.state.message_repository = message_repository
+    receiver_contact.phone_number = "15551581534"
+    contact_repository.save(receiver_contact)
+    payload = {
+        "object": "whatsapp_business_account",
+        "entry": [
+            {
+                "id": "1",
+                "changes": [
+                    _change(
+                        "15551581534",
+                        [("558899030001", "Ana"), ("558899030002", "Bruno")],
+                        [
+                            ("558899030001", "wamid.a1", "hi"),
+                            ("558899030002", "wamid.b1", "hello"),
+                        ],
+                    ),
+                    # Delivery statuses carry no messages and are skipped
+                    {"value": {"statuses": [{"id": "wamid.x"}]}, "field": "messages"},
+                ],
+            },
+            {
+                "id": "2",
+                "changes": [
+                    _change(
+                        "15551581534",
+                        [("558899030001", "Ana")],
+                        [
+                            ("558899030001", "wamid.a2", "anyone?"),
+                            ("558899030001", "wamid.a1", "hi"),
+                        ],
+                    ),
+                    _change(
+                        "0000000000000",
+                        [("558899030003", "Caio")],
+                        [("558899030003", "wamid.c1", "hey")],
+                    ),
+                ],
+            },
+        ],
+    }
+
+    # Act
+    response = client.post("/webhook/", json=payload)
+
+    # Assert
+    assert response.status_code == StatusCodes.OK.value
+    assert response.json()["queued_messages"] == 5
+    wait_for_ingestion()
+    stored = {message.external_id: message for message in message_repository.get_all()}
+    assert set(stored) == {"wamid.a1", "wamid.b1", "wamid.a2"}
+    assert stored["wamid.a1"].chat_id == stored["wamid.a2"].chat_id
+    assert stored["wamid.a1"].chat_id != stored["wamid.b1"].chat_id
+
+
+def test_receive_messages_webhook_endpoint_rejects_invalid_message(client):
+    # Arrange
+    payload = {
+        "entry": [
+            {
+                "changes": [
+                    _change(
+                        "15551581534",
+                        [("558899030001", "Ana")],
+                        [("558899030001", "wamid.a1", "hi")],
+                    )
+                ]
+            },
+            {"changes": [_change("15551581534", [("558899030001", "Ana")], [])]},
+        ]
+    }
+
+    # Act
+    response = client.post("/webhook/", json=payload)
+
+    # Assert
+    assert response.status_code == StatusCodes.BAD_REQUEST.value
+    assert response.json()["detail"] == ["entry[1].changes[0]: Empty 'messages' array"]
@@ -0,0 +1,96 @@
+import pytest
+
+from src.application.business_numbers import BusinessNumber, BusinessNumberDirectory
+from src.application.caching import MISSING, TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    # Arrange
+    clock = FakeClock()
+    cache = TTLCache(ttl_seconds=10, capacity=10, clock=clock)
+    cache.set("key", "value")
+
+    # Act
+    clock.now = 9.9
+    fresh = cache.get("key")
+    clock.now = 10
+    expired = cache.get("key")
+
+    # Assert
+    assert fresh == "value"
+    assert expired is MISSING
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_caches_none():
+    # Arrange
+    cache = TTLCache(ttl_seconds=10, capacity=10)
+
+    # Act
+    cache.set("key", None)
+
+    # Assert
+    assert cache.get("key") is None
+    assert cache.get("other") is MISSING
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    # Arrange
+    cache = TTLCache(ttl_seconds=10, capacity=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("a") == 1
+    assert cache.get("b") is MISSING
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_invalidate_where():
+    # Arrange
+    cache = TTLCache(ttl_seconds=10, capacity=10)
+    for key in range(4):
+        cache.set(key, key * 10)
+
+    # Act
+    cache.invalidate_where(lambda key, value: value >= 20)
+
+    # Assert
+    assert [cache.get(key) for key in range(4)] == [0, 10, MISSING, MISSING]
+
+
+@pytest.mark.parametrize("ttl_seconds, capacity", [(0, 10), (10, 0)])
+def test_ttl_cache_rejects_invalid_size(ttl_seconds, capacity):
+    # Act/Assert
+    with pytest.raises(ValueError):
+        TTLCache(ttl_seconds=ttl_seconds, capacity=capacity)
+
+
+def test_business_number_directory_forgets_by_company_and_contact():
+    # Arrange
+    directory = BusinessNumberDirectory(TTLCache(ttl_seconds=60, capacity=10))
+    directory.remember("1", BusinessNumber("1", "company-1", "contact-1"))
+    directory.remember("2", BusinessNumber("2", "company-1", "contact-2"))
+    directory.remember("3", BusinessNumber("3", "company-2", "contact-3"))
+    directory.remember("4", None)
+
+    # Act
+    directory.forget_company("company-1")
+    directory.forget_contact("contact-3")
+
+    # Assert
+    assert [directory.get(phone) for phone in "123"] == [MISSING] * 3
+    assert directory.get("4") is None
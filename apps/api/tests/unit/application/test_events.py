@@ -0,0 +1,123 @@
+import asyncio
+import json
+
+from src.application.events import Event, EventHub, EventTypes, coalesce
+
+
+def make_event(
+    company_id: str = "company-1",
+    attendant_ids=(),
+    event_type=EventTypes.MESSAGE_CREATED,
+    data=None,
+) -> Event:
+    return Event(
+        type=event_type,
+        company_id=company_id,
+        chat_id="chat-1",
+        attendant_ids=frozenset(attendant_ids),
+        data=data if data is not None else {"text": "Hello"},
+    )
+
+
+def test_event_hub_fans_out_to_thousands_of_idle_subscribers():
+    # Arrange - 5000 connected clients that never read, across two companies
+    hub = EventHub(max_pending=10)
+    subscriptions = [hub.subscribe("company-1") for _ in range(5000)]
+    other_company = [hub.subscribe("company-2") for _ in range(100)]
+
+    # Act
+    delivered = sum(hub.dispatch(make_event()) for _ in range(3))
+
+    # Assert - every subscriber holds the three events, encoded once
+    assert delivered == 15000
+    payloads = {
+        subscription._queue.get_nowait()
+        for subscription in subscriptions
+        for _ in range(3)
+    }
+    assert len(payloads) == 1
+    assert json.loads(payloads.pop()) == {
+        "type": "message.created",
+        "chat_id": "chat-1",
+        "data": {"text": "Hello"},
+    }
+    assert all(subscription._queue.empty() for subscription in other_company)
+    assert hub.stats().subscribers == 5100
+
+
+def test_event_hub_scopes_events_by_attendant():
+    # Arrange
+    hub = EventHub()
+    company_wide = hub.subscribe("company-1")
+    attendant_1 = hub.subscribe("company-1", attendant_id="user-1")
+    attendant_2 = hub.subscribe("company-1", attendant_id="user-2")
+
+    # Act/Assert - unassigned chats reach every attendant
+    assert hub.dispatch(make_event()) == 3
+    # Assigned chats reach the company-wide feed and their attendants only
+    assert hub.dispatch(make_event(attendant_ids={"user-1"})) == 2
+    assert hub.dispatch(make_event(attendant_ids={"user-1", "user-2"})) == 3
+    assert company_wide._queue.qsize() == 3
+    assert attendant_1._queue.qsize() == 3
+    assert attendant_2._queue.qsize() == 2
+
+
+def test_event_hub_closes_subscribers_that_fall_behind():
+    # Arrange
+    hub = EventHub(max_pending=2)
+    slow = hub.subscribe("company-1")
+
+    async def drain():
+        return [await slow.get() for _ in range(4)]
+
+    # Act
+    for _ in range(3):
+        hub.dispatch(make_event())
+
+    # Assert - the queued events are still read, then the end of the feed
+    payloads = asyncio.run(drain())
+    assert payloads[2:] == [None, None]
+    assert slow.closed
+    assert hub.stats().subscribers == 0
+    assert hub.stats().overflowed == 1
+    assert hub.dispatch(make_event()) == 0
+
+
+def test_subscription_close_wakes_a_waiting_reader():
+    # Arrange
+    hub = EventHub()
+
+    async def wait_then_close():
+        subscription = hub.subscribe("company-1")
+        reader = asyncio.create_task(subscription.get())
+        await asyncio.sleep(0)
+        subscription.close()
+        return await reader
+
+    # Act/Assert
+    assert asyncio.run(wait_then_close()) is None
+    assert hub.stats().subscribers == 0
+
+
+def test_coalesce_drops_repeats_and_superseded_assignments():
+    # Arrange
+    first = make_event(data={"text": "one"})
+    second = make_event(data={"text": "two"})
+    assigned = [
+        make_event(
+            attendant_ids={"user-1"},
+            event_type=EventTypes.CHAT_ASSIGNED,
+            data={"status": status},
+        )
+        for status in ("pending", "resolved")
+    ]
+    # Reaches another set of attendants, so it supersedes nothing
+    reassigned = make_event(
+        attendant_ids={"user-1", "user-2"}, event_type=EventTypes.CHAT_ASSIGNED
+    )
+
+    # Act
+    events = coalesce([first, assigned[0], second, reassigned, first, assigned[1]])
+
+    # Assert
+    assert events == [first, second, reassigned, assigned[1]]
@@ -0,0 +1,79 @@
+import pytest
+
+from src.application.idempotency import BloomFilter, IdempotencyFilter
+
+
+def test_idempotency_filter_remembers_recent_ids():
+    # Arrange
+    idempotency_filter = IdempotencyFilter(capacity=2)
+    idempotency_filter.add("wamid.1", "message-1")
+
+    # Act/Assert
+    assert idempotency_filter.seen("wamid.1")
+    assert idempotency_filter.message_id("wamid.1") == "message-1"
+    assert not idempotency_filter.seen("wamid.2")
+    assert (idempotency_filter.hits, idempotency_filter.misses) == (1, 1)
+
+
+def test_idempotency_filter_evicts_least_recently_seen():
+    # Arrange
+    idempotency_filter = IdempotencyFilter(capacity=2)
+    idempotency_filter.add("wamid.1")
+    idempotency_filter.add("wamid.2")
+    idempotency_filter.seen("wamid.1")
+
+    # Act
+    idempotency_filter.add("wamid.3")
+
+    # Assert
+    assert len(idempotency_filter) == 2
+    assert idempotency_filter.seen("wamid.1")
+    assert not idempotency_filter.seen("wamid.2")
+    assert idempotency_filter.seen("wamid.3")
+
+
+def test_idempotency_filter_keeps_known_message_id():
+    # Arrange
+    idempotency_filter = IdempotencyFilter(capacity=2)
+    idempotency_filter.add("wamid.1", "message-1")
+
+    # Act
+    idempotency_filter.add("wamid.1")
+
+    # Assert
+    assert idempotency_filter.message_id("wamid.1") == "message-1"
+
+
+def test_idempotency_filter_with_bloom_filter():
+    # Arrange
+    idempotency_filter = IdempotencyFilter(capacity=1, bloom_bits=1024)
+    idempotency_filter.add("wamid.1")
+    idempotency_filter.add("wamid.2")
+
+    # Act/Assert
+    assert idempotency_filter.seen("wamid.2")
+    # Evicted from the LRU: the Bloom filter alone never short-circuits
+    assert not idempotency_filter.seen("wamid.1")
+    assert not idempotency_filter.seen("wamid.3")
+
+
+def test_bloom_filter_has_no_false_negatives():
+    # Arrange
+    bloom = BloomFilter(bits=8192, hashes=4)
+    keys = [f"wamid.{index}" for index in range(500)]
+
+    # Act
+    for key in keys:
+        bloom.add(key)
+
+    # Assert
+    assert all(bloom.might_contain(key) for key in keys)
+    false_positives = sum(bloom.might_contain(f"other.{index}") for index in range(500))
+    assert false_positives < 50
+
+
+@pytest.mark.parametrize("capacity", [0, -1])
+def test_idempotency_filter_rejects_invalid_capacity(capacity):
+    # Act/Assert
+    with pytest.raises(ValueError):
+        IdempotencyFilter(capacity=capacity)
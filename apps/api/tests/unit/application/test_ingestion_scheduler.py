@@ -0,0 +1,147 @@
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from src.application.dtos.message_dtos import (
+    IncomingMessage,
+    ReceivedMessageResult,
+    ReceiveStatus,
+)
+from src.application.ingestion_scheduler import ShardedIngestionScheduler
+
+
+def _incoming(external_id, sender_phone_number, receiver_phone_number="15551581534"):
+    return IncomingMessage(
+        sender_phone_number=sender_phone_number,
+        sender_name="Sender",
+        external_id=external_id,
+        timestamp=datetime(2025, 11, 2, tzinfo=UTC),
+        receiver_phone_number=receiver_phone_number,
+        text="Hi",
+    )
+
+
+class RecordingReceiveMessageUseCase:
+    """Records which messages run, in what order and how many at once."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.received: list[str] = []
+        self.running: dict[str, int] = {}
+        self.max_running_per_sender = 0
+        self.max_running = 0
+        self._fail_on = fail_on
+
+    async def execute_batch(self, messages):
+        senders = {message.sender_phone_number for message in messages}
+        for sender in senders:
+            self.running[sender] = self.running.get(sender, 0) + 1
+        self.max_running_per_sender = max(
+            self.max_running_per_sender, *self.running.values()
+        )
+        self.max_running = max(self.max_running, sum(self.running.values()))
+        try:
+            await asyncio.sleep(0.01)
+            if any(message.external_id == self._fail_on for message in messages):
+                raise RuntimeError("boom")
+            self.received.extend(message.external_id for message in messages)
+            return [
+                ReceivedMessageResult(
+                    external_id=message.external_id,
+                    status=ReceiveStatus.CREATED,
+                    message_id=f"id-{message.external_id}",
+                )
+                for message in messages
+            ]
+        finally:
+            for sender in senders:
+                self.running[sender] -= 1
+
+
+def _senders_on_distinct_shards(scheduler, count):
+    senders, shards = [], set()
+    phone = 5588999030000
+    while len(senders) < count:
+        phone += 1
+        shard = scheduler.shard_of(_incoming("probe", str(phone)))
+        if shard not in shards:
+            shards.add(shard)
+            senders.append(str(phone))
+    return senders
+
+
+def test_scheduler_keeps_chat_order_and_runs_chats_concurrently():
+    # Arrange
+    use_case = RecordingReceiveMessageUseCase()
+
+    async def run():
+        scheduler = ShardedIngestionScheduler(shards=4)
+        first, second = _senders_on_distinct_shards(scheduler, 2)
+        scheduler.start()
+        try:
+            batches = [
+                [_incoming("a1", first), _incoming("b1", second)],
+                [_incoming("a2", first), _incoming("a3", first)],
+                [_incoming("b2", second), _incoming("a4", first)],
+            ]
+            # Hand the batches over back to back, as the dispatcher would
+            results = await asyncio.gather(
+                *(scheduler.execute_batch(use_case, batch) for batch in batches)
+            )
+        finally:
+            await scheduler.stop()
+        return results
+
+    # Act
+    results = asyncio.run(run())
+
+    # Assert
+    received = use_case.received
+    assert [i for i in received if i.startswith("a")] == ["a1", "a2", "a3", "a4"]
+    assert [i for i in received if i.startswith("b")] == ["b1", "b2"]
+    assert use_case.max_running_per_sender == 1
+    assert use_case.max_running == 2
+    assert [result.external_id for result in results[2]] == ["b2", "a4"]
+    assert results[2][1].message_id == "id-a4"
+
+
+def test_scheduler_raises_shard_error_and_counts_it():
+    # Arrange
+    use_case = RecordingReceiveMessageUseCase(fail_on="a1")
+
+    async def run():
+        scheduler = ShardedIngestionScheduler(shards=2)
+        scheduler.start()
+        try:
+            with pytest.raises(RuntimeError):
+                await scheduler.execute_batch(use_case, [_incoming("a1", "1")])
+            return scheduler.stats()
+        finally:
+            await scheduler.stop()
+
+    # Act
+    stats = asyncio.run(run())
+
+    # Assert
+    assert sum(shard.failed_batches for shard in stats) == 1
+    assert all(shard.backlog == 0 and not shard.busy for shard in stats)
+
+
+def test_scheduler_shard_of_is_stable_per_chat():
+    # Arrange
+    scheduler = ShardedIngestionScheduler(shards=8)
+    message = _incoming("a1", "5588999030001")
+
+    # Act
+    shard = scheduler.shard_of(message)
+
+    # Assert
+    assert 0 <= shard < 8
+    assert scheduler.shard_of(_incoming("a2", "5588999030001")) == shard
+    assert ShardedIngestionScheduler(shards=8).shard_of(message) == shard
+
+
+def test_scheduler_rejects_invalid_shard_count():
+    # Act/Assert
+    with pytest.raises(ValueError):
+        ShardedIngestionScheduler(shards=0)
@@ -0,0 +1,49 @@
+from datetime import UTC, datetime
+
+from src.application.dtos.serializers import serialize_chat, serialize_user
+from src.domain.entities.chat import Chat
+from src.domain.enums import ChatStatuses, UserTypes
+
+
+def test_serialize_chat_keeps_datetimes_and_unwraps_enums():
+    # Arrange
+    created_at = datetime(2025, 11, 2, 12, tzinfo=UTC)
+    chat = Chat(
+        id="chat-1",
+        company_id="company-1",
+        contact_id="contact-1",
+        status=ChatStatuses.CLOSED,
+        created_at=created_at,
+    )
+
+    # Act
+    data = serialize_chat(chat)
+
+    # Assert
+    assert data == {
+        "id": "chat-1",
+        "company_id": "company-1",
+        "contact_id": "contact-1",
+        "status": ChatStatuses.CLOSED.value,
+        "attached_user_id": None,
+        "created_at": created_at,
+        "updated_at": None,
+    }
+
+
+def test_serialize_user(staff_user):
+    # Act
+    data = serialize_user(staff_user)
+
+    # Assert
+    assert data["type"] == UserTypes.STAFF.value
+    assert set(data) == {
+        "id",
+        "name",
+        "email",
+        "company_id",
+        "type",
+        "is_active",
+        "created_at",
+        "updated_at",
+    }
@@ -0,0 +1,72 @@
+import pytest
+
+from src.application.use_cases.auth_use_cases import LoginUseCase, SetPasswordUseCase
+from src.infrastructure.security.jwt_service import JWTService
+from src.infrastructure.security.password_service import (
+    hash_password,
+    password_needs_rehash,
+)
+
+PASSWORD = "secret123"
+
+
+@pytest.fixture
+def jwt_service(app_settings):
+    return JWTService(settings=app_settings)
+
+
+def test_login_rehashes_password_when_cost_changes(
+    user_factory, user_repository, jwt_service
+):
+    # Arrange
+    user = user_factory(password_hash=hash_password(PASSWORD, rounds=4))
+    use_case = LoginUseCase(
+        user_repository=user_repository, jwt_service=jwt_service, bcrypt_rounds=5
+    )
+
+    # Act
+    result = use_case.execute(email=user.email, password=PASSWORD)
+
+    # Assert
+    assert result.user.id == user.id
+    password_hash = user_repository.get_by_id(user.id).password_hash
+    assert password_hash.startswith("$2b$05$")
+
+
+def test_login_keeps_password_hash_with_current_cost(
+    user_factory, user_repository, jwt_service
+):
+    # Arrange
+    password_hash = hash_password(PASSWORD, rounds=4)
+    user = user_factory(password_hash=password_hash)
+    use_case = LoginUseCase(
+        user_repository=user_repository, jwt_service=jwt_service, bcrypt_rounds=4
+    )
+
+    # Act
+    use_case.execute(email=user.email, password=PASSWORD)
+
+    # Assert
+    assert user_repository.get_by_id(user.id).password_hash == password_hash
+
+
+def test_set_password_uses_configured_cost(user_factory, user_repository):
+    # Arrange
+    user = user_factory()
+    use_case = SetPasswordUseCase(user_repository=user_repository, bcrypt_rounds=4)
+
+    # Act
+    use_case.execute(user_id=user.id, password=PASSWORD)
+
+    # Assert
+    password_hash = user_repository.get_by_id(user.id).password_hash
+    assert not password_needs_rehash(password_hash, rounds=4)
+
+
+@pytest.mark.parametrize(
+    "password_hash, expected",
+    [("$2b$12$abc", False), ("$2b$10$abc", True), ("not-a-hash", True)],
+)
+def test_password_needs_rehash(password_hash, expected):
+    # Act/Assert
+    assert password_needs_rehash(password_hash, rounds=12) is expected
@@ -1,8 +1,24 @@
-from src.application.use_cases.chat_use_cases import ListChatsByCompanyUseCase
+import asyncio
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from src.application.caching import TTLCache
+from src.application.conversations import Conversation, ConversationDirectory
+from src.application.events import EventHub
+from src.application.use_cases.chat_use_cases import (
+    AssignAttendantToChatUseCase,
+    DeleteChatUseCase,
+    ListChatsByCompanyUseCase,
+)
+from src.domain.errors import ChatNotFoundError
 from src.helpers.helpers import generate_uuid4
 
 
-def test_list_chats_by_company_use_case(chat_factory, chat_repository):
+def test_list_chats_by_company_use_case(
+    chat_factory, chat_repository, async_chat_repository
+):
     # Arrage
     company_id_1 = generate_uuid4()
     company_id_2 = generate_uuid4()
@@ -13,12 +29,90 @@ def test_list_chats_by_company_use_case(chat_factory, chat_repository):
     chat_3 = chat_factory(company_id=company_id_2)
     chat_repository.save(chat_3)
 
-    use_case = ListChatsByCompanyUseCase(chat_repository=chat_repository)
+    use_case = ListChatsByCompanyUseCase(chat_repository=async_chat_repository)
+
+    # Act
+    chats_company_1 = asyncio.run(use_case.execute(company_id=company_id_1))
+    chats_company_2 = asyncio.run(use_case.execute(company_id=company_id_2))
+
+    # Assert
+    assert len(chats_company_1.items) == 2
+    assert len(chats_company_2.items) == 1
+
+
+def test_list_chats_by_company_use_case_pages_newest_first(
+    chat_factory, async_chat_repository
+):
+    # Arrange
+    company_id = generate_uuid4()
+    chats = [
+        chat_factory(
+            company_id=company_id, created_at=datetime(2025, 1, day, tzinfo=UTC)
+        )
+        for day in range(1, 6)
+    ]
+    use_case = ListChatsByCompanyUseCase(chat_repository=async_chat_repository)
+
+    # Act
+    pages = [asyncio.run(use_case.execute(company_id=company_id, limit=2))]
+    while pages[-1].next_cursor:
+        pages.append(
+            asyncio.run(
+                use_case.execute(
+                    company_id=company_id, limit=2, cursor=pages[-1].next_cursor
+                )
+            )
+        )
+
+    # Assert
+    assert [len(page.items) for page in pages] == [2, 2, 1]
+    assert [chat.id for page in pages for chat in page.items] == [
+        chat.id for chat in reversed(chats)
+    ]
+
+
+def test_delete_chat_use_case_forgets_conversation(
+    chat, chat_repository, async_chat_repository
+):
+    # Arrange
+    conversations = ConversationDirectory(TTLCache(ttl_seconds=60, capacity=10))
+    conversations.remember(
+        chat.company_id,
+        "5588999034445",
+        Conversation(contact_id=chat.contact_id, chat_id=chat.id),
+    )
+    use_case = DeleteChatUseCase(
+        chat_repository=async_chat_repository, conversations=conversations
+    )
+
+    # Act
+    asyncio.run(use_case.execute(chat_id=chat.id))
+
+    # Assert
+    assert conversations.get(chat.company_id, "5588999034445") is None
+    with pytest.raises(ChatNotFoundError):
+        chat_repository.get_by_id(chat.id)
+
+
+def test_assign_attendant_use_case_notifies_previous_and_new_attendant(
+    chat_factory, async_chat_repository
+):
+    # Arrange
+    chat = chat_factory(attached_user_id="user-1")
+    events = EventHub()
+    previous = events.subscribe(chat.company_id, attendant_id="user-1")
+    assigned = events.subscribe(chat.company_id, attendant_id="user-2")
+    bystander = events.subscribe(chat.company_id, attendant_id="user-3")
+    use_case = AssignAttendantToChatUseCase(
+        chat_repository=async_chat_repository, events=events
+    )
 
     # Act
-    chats_company_1 = use_case.execute(company_id=company_id_1)
-    chats_company_2 = use_case.execute(company_id=company_id_2)
+    asyncio.run(use_case.execute(chat_id=chat.id, attendant_id="user-2"))
 
     # Assert
-    assert len(chats_company_1) == 2
-    assert len(chats_company_2) == 1
+    for subscription in (previous, assigned):
+        payload = json.loads(subscription._queue.get_nowait())
+        assert payload["type"] == "chat.assigned"
+        assert payload["data"]["attached_user_id"] == "user-2"
+    assert bystander._queue.empty()
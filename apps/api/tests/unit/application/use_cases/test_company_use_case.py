@@ -1,5 +1,7 @@
 import pytest
 
+from src.application.business_numbers import BusinessNumber, BusinessNumberDirectory
+from src.application.caching import MISSING, TTLCache
 from src.application.use_cases.company_use_cases import (
     CreateCompanyUseCase,
     DeleteCompanyUseCase,
@@ -100,3 +102,23 @@ def test_delete_company_use_case(company, company_repository):
     # Act/Assert
     with pytest.raises(CompanyNotFoundError):
         company_repository.get_by_id(company.id)
+
+
+def test_update_company_use_case_invalidates_business_numbers(
+    company, company_repository
+):
+    # Arrange
+    company_repository.save(company)
+    directory = BusinessNumberDirectory(TTLCache(ttl_seconds=60, capacity=10))
+    directory.remember(
+        "5588999034444", BusinessNumber("5588999034444", company.id, "c")
+    )
+    use_case = UpdateCompanyUseCase(
+        company_repository=company_repository, business_numbers=directory
+    )
+
+    # Act
+    use_case.execute(company_id=company.id, is_active=False)
+
+    # Assert
+    assert directory.get("5588999034444") is MISSING
@@ -1,5 +1,7 @@
 import pytest
 
+from src.application.business_numbers import BusinessNumber, BusinessNumberDirectory
+from src.application.caching import MISSING, TTLCache
 from src.application.use_cases.contact_use_cases import (
     CreateContactUseCase,
     DeleteContactUseCase,
@@ -95,7 +97,7 @@ def test_get_company_contacts_use_case(contact, contact_repository):
     use_case = GetCompanyContactsUseCase(contact_repository=contact_repository)
 
     # Act
-    contacts = use_case.execute(company_id=company_id)
+    contacts = use_case.execute(company_id=company_id).items
 
     # Assert
     assert len(contacts) >= 1
@@ -134,13 +136,13 @@ def test_search_contacts_use_case(contact_factory, contact_repository, company):
     use_case = SearchContactsUseCase(contact_repository=contact_repository)
 
     # Act - Search by name (case-insensitive)
-    results_name = use_case.execute(company_id=company.id, query="JOHN")
+    results_name = use_case.execute(company_id=company.id, query="JOHN").items
 
     # Act - Search by phone
-    results_phone = use_case.execute(company_id=company.id, query="9876")
+    results_phone = use_case.execute(company_id=company.id, query="9876").items
 
     # Act - Search by email
-    results_email = use_case.execute(company_id=company.id, query="EXAMPLE")
+    results_email = use_case.execute(company_id=company.id, query="EXAMPLE").items
 
     # Assert
     assert len(results_name) == 1
@@ -152,3 +154,26 @@ def test_search_contacts_use_case(contact_factory, contact_repository, company):
     assert len(results_email) == 2
     assert any(c.name == "John Doe" for c in results_email)
     assert any(c.name == "Jane Smith" for c in results_email)
+
+
+def test_contact_writes_invalidate_business_numbers(contact, contact_repository):
+    # Arrange
+    directory = BusinessNumberDirectory(TTLCache(ttl_seconds=60, capacity=10))
+    directory.remember(contact.phone_number, BusinessNumber.of(contact))
+    directory.remember("+5500000000000", None)
+
+    # Act
+    CreateContactUseCase(
+        contact_repository=contact_repository, business_numbers=directory
+    ).execute(
+        name="Business",
+        phone_number="+5500000000000",
+        company_id=contact.company_id,
+    )
+    DeleteContactUseCase(
+        contact_repository=contact_repository, business_numbers=directory
+    ).execute(contact.id)
+
+    # Assert
+    assert directory.get("+5500000000000") is MISSING
+    assert directory.get(contact.phone_number) is MISSING
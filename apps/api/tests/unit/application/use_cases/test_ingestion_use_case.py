@@ -0,0 +1,181 @@
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from src.application.dtos.message_dtos import IncomingMessage
+from src.application.use_cases.ingestion_use_cases import (
+    DrainIngestionQueueUseCase,
+    EnqueueMessagesUseCase,
+)
+from src.application.use_cases.message_use_cases import ReceiveMessageUseCase
+from src.helpers.helpers import get_now
+
+
+def _incoming(external_id, receiver_phone_number, text="Hi"):
+    return IncomingMessage(
+        sender_phone_number="5588999030001",
+        sender_name="Sender",
+        external_id=external_id,
+        timestamp=datetime(2025, 11, 2, tzinfo=UTC),
+        receiver_phone_number=receiver_phone_number,
+        text=text,
+    )
+
+
+class FailingReceiveMessageUseCase:
+    """Fails every batch that contains a message with the given text."""
+
+    def __init__(self, receive_message_use_case, poison_text):
+        self._receive_message_use_case = receive_message_use_case
+        self._poison_text = poison_text
+
+    async def execute_batch(self, messages):
+        if any(message.text == self._poison_text for message in messages):
+            raise RuntimeError("boom")
+        return await self._receive_message_use_case.execute_batch(messages)
+
+
+@pytest.fixture
+def receive_message_use_case(
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+):
+    return ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+    )
+
+
+def test_incoming_message_round_trips_through_queue_payload():
+    # Arrange
+    incoming = _incoming("wamid.1", "15551581534")
+
+    # Act/Assert
+    assert IncomingMessage.from_dict(incoming.to_dict()) == incoming
+
+
+def test_drain_ingestion_queue_receives_queued_messages(
+    message_repository,
+    ingestion_queue_repository,
+    async_ingestion_queue_repository,
+    receive_message_use_case,
+    receiver_contact,
+):
+    # Arrange
+    enqueue = EnqueueMessagesUseCase(
+        ingestion_queue_repository=async_ingestion_queue_repository
+    )
+    for external_id in ("wamid.1", "wamid.2"):
+        asyncio.run(
+            enqueue.execute([_incoming(external_id, receiver_contact.phone_number)])
+        )
+    use_case = DrainIngestionQueueUseCase(
+        ingestion_queue_repository=async_ingestion_queue_repository,
+        receive_message_use_case=receive_message_use_case,
+    )
+
+    # Act
+    drained = asyncio.run(use_case.execute())
+
+    # Assert
+    assert drained == 2
+    assert ingestion_queue_repository.stats().pending == 0
+    assert {message.external_id for message in message_repository.get_all()} == {
+        "wamid.1",
+        "wamid.2",
+    }
+    assert asyncio.run(use_case.execute()) == 0
+
+
+def test_drain_ingestion_queue_retries_failing_job_with_backoff(
+    message_repository,
+    ingestion_queue_repository,
+    async_ingestion_queue_repository,
+    receive_message_use_case,
+    receiver_contact,
+):
+    # Arrange
+    enqueue = EnqueueMessagesUseCase(
+        ingestion_queue_repository=async_ingestion_queue_repository
+    )
+    bad_job = asyncio.run(
+        enqueue.execute([_incoming("wamid.bad", receiver_contact.phone_number, "x")])
+    )
+    asyncio.run(enqueue.execute([_incoming("wamid.ok", receiver_contact.phone_number)]))
+    use_case = DrainIngestionQueueUseCase(
+        ingestion_queue_repository=async_ingestion_queue_repository,
+        receive_message_use_case=FailingReceiveMessageUseCase(
+            receive_message_use_case, poison_text="x"
+        ),
+        retry_base_seconds=10.0,
+    )
+    before = get_now()
+
+    # Act
+    asyncio.run(use_case.execute())
+
+    # Assert
+    assert [message.external_id for message in message_repository.get_all()] == [
+        "wamid.ok"
+    ]
+    assert list(ingestion_queue_repository.jobs) == [bad_job.id]
+    assert bad_job.attempts == 1
+    assert bad_job.last_error == "RuntimeError: boom"
+    assert (bad_job.available_at - before).total_seconds() >= 10.0
+    assert asyncio.run(use_case.execute()) == 0
+
+
+def test_drain_ingestion_queue_dead_letters_after_max_attempts(
+    ingestion_queue_repository,
+    async_ingestion_queue_repository,
+    receive_message_use_case,
+    receiver_contact,
+):
+    # Arrange
+    enqueue = EnqueueMessagesUseCase(
+        ingestion_queue_repository=async_ingestion_queue_repository
+    )
+    job = asyncio.run(
+        enqueue.execute([_incoming("wamid.bad", receiver_contact.phone_number, "x")])
+    )
+    use_case = DrainIngestionQueueUseCase(
+        ingestion_queue_repository=async_ingestion_queue_repository,
+        receive_message_use_case=FailingReceiveMessageUseCase(
+            receive_message_use_case, poison_text="x"
+        ),
+        max_attempts=3,
+        retry_base_seconds=0.0,
+    )
+
+    # Act
+    for _ in range(3):
+        asyncio.run(use_case.execute())
+
+    # Assert
+    stats = ingestion_queue_repository.stats()
+    assert stats.pending == 0
+    assert stats.dead_letters == 1
+    assert ingestion_queue_repository.dead_letters[job.id].attempts == 3
+
+
+@pytest.mark.parametrize(
+    ("attempts", "expected"), [(1, 2.0), (2, 4.0), (3, 8.0), (10, 30.0)]
+)
+def test_drain_ingestion_queue_backoff_is_exponential_and_capped(
+    async_ingestion_queue_repository, receive_message_use_case, attempts, expected
+):
+    # Arrange
+    use_case = DrainIngestionQueueUseCase(
+        ingestion_queue_repository=async_ingestion_queue_repository,
+        receive_message_use_case=receive_message_use_case,
+        retry_base_seconds=2.0,
+        retry_max_seconds=30.0,
+    )
+
+    # Act/Assert
+    assert use_case.backoff(attempts) == expected
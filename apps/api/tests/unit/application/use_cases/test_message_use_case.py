@@ -1,17 +1,36 @@
+import asyncio
+import json
 from datetime import UTC, datetime
 
 import pytest
 
+from src.application.business_numbers import BusinessNumberDirectory
+from src.application.caching import TTLCache
+from src.application.conversations import ConversationDirectory
+from src.application.dtos.message_dtos import IncomingMessage, ReceiveStatus
+from src.application.events import EventHub
 from src.application.exceptions import ReceiverContactDoesNotExistError
+from src.application.idempotency import IdempotencyFilter
 from src.application.use_cases.message_use_cases import (
     DeleteMessageUseCase,
+    GetChatMessagesUseCase,
     GetMessageUseCase,
     MarkChatAsReadUseCase,
     ReceiveMessageUseCase,
+    SendMessageUseCase,
     UpdateMessageUseCase,
 )
 from src.domain.entities.message import Message
 from src.domain.errors import ContactNotFoundError, MessageNotFoundError
+from src.infrastructure.repositories.async_repository_adapter import (
+    AsyncRepositoryAdapter,
+)
+from tests.fakes.repositories.fake_in_memory_chat_repository import (
+    InMemoryChatRepository,
+)
+from tests.fakes.repositories.fake_in_memory_contact_repository import (
+    InMemoryContactRepository,
+)
 from tests.fakes.repositories.fake_in_memory_message_repository import (
     InMemoryMessageRepository,
 )
@@ -21,6 +40,10 @@ def test_receive_message_use_case(
     message_repository,
     contact_repository,
     chat_repository,
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
     receiver_contact,
 ):
     # Arrange
@@ -32,19 +55,22 @@ def test_receive_message_use_case(
     text = "Hello"
 
     use_case = ReceiveMessageUseCase(
-        message_repository=message_repository,
-        contact_repository=contact_repository,
-        chat_repository=chat_repository,
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
     )
 
     # Act
-    message = use_case.execute(
-        sender_phone_number=sender_phone_number,
-        sender_name=sender_name,
-        message_external_id=message_external_id,
-        message_timestamp=message_timestamp,
-        receiver_phone_number=receiver_phone_number,
-        text=text,
+    message = asyncio.run(
+        use_case.execute(
+            sender_phone_number=sender_phone_number,
+            sender_name=sender_name,
+            message_external_id=message_external_id,
+            message_timestamp=message_timestamp,
+            receiver_phone_number=receiver_phone_number,
+            text=text,
+        )
     )
 
     # Assert
@@ -52,10 +78,62 @@ def test_receive_message_use_case(
     assert fetched_message.text == text
 
 
+def test_receive_message_use_case_absorbs_redeliveries_without_a_pre_select(
+    message_repository,
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+    receiver_contact,
+    monkeypatch,
+):
+    # Arrange
+    lookups = []
+    monkeypatch.setattr(
+        message_repository, "get_by_external_id", lambda external_id: lookups.append(1)
+    )
+    hub = EventHub()
+    subscription = hub.subscribe(receiver_contact.company_id)
+    use_case = ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+        events=hub,
+    )
+
+    def receive():
+        return asyncio.run(
+            use_case.execute(
+                sender_phone_number="5588999034445",
+                sender_name="Sender Name",
+                message_external_id="wamid.redelivered",
+                message_timestamp=datetime(2025, 11, 2, tzinfo=UTC),
+                receiver_phone_number=receiver_contact.phone_number,
+                text="Hello",
+            )
+        )
+
+    # Act
+    first = receive()
+    second = receive()
+
+    # Assert - stored and announced once, the insert catching the replay
+    assert lookups == []
+    assert second.id == first.id
+    assert len(message_repository.get_all()) == 1
+    assert hub.stats().delivered == 1
+    assert subscription._queue.qsize() == 1
+
+
 def test_receive_message_use_case_receiver_not_found(
     message_repository,
     contact_repository,
     chat_repository,
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
 ):
     # Arrange
     sender_phone_number = "5588999034445"
@@ -65,20 +143,23 @@ def test_receive_message_use_case_receiver_not_found(
     receiver_phone_number = "0000000000000"
     text = "Hello"
     use_case = ReceiveMessageUseCase(
-        message_repository=message_repository,
-        contact_repository=contact_repository,
-        chat_repository=chat_repository,
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
     )
 
     # Act/Assert
     with pytest.raises(ReceiverContactDoesNotExistError):
-        use_case.execute(
-            sender_phone_number=sender_phone_number,
-            sender_name=sender_name,
-            message_external_id=message_external_id,
-            message_timestamp=message_timestamp,
-            receiver_phone_number=receiver_phone_number,
-            text=text,
+        asyncio.run(
+            use_case.execute(
+                sender_phone_number=sender_phone_number,
+                sender_name=sender_name,
+                message_external_id=message_external_id,
+                message_timestamp=message_timestamp,
+                receiver_phone_number=receiver_phone_number,
+                text=text,
+            )
         )
 
 
@@ -87,6 +168,10 @@ def test_receive_message_use_case_create_company_contact(
     message_repository,
     contact_repository,
     chat_repository,
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
 ):
     # Arrange
     sender_phone_number = "5588999034446"
@@ -96,9 +181,10 @@ def test_receive_message_use_case_create_company_contact(
     receiver_phone_number = receiver_contact.phone_number
     text = "Hello"
     use_case = ReceiveMessageUseCase(
-        message_repository=message_repository,
-        contact_repository=contact_repository,
-        chat_repository=chat_repository,
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
     )
 
     with pytest.raises(ContactNotFoundError):
@@ -108,13 +194,15 @@ def test_receive_message_use_case_create_company_contact(
         )
 
     # Act
-    use_case.execute(
-        sender_phone_number=sender_phone_number,
-        sender_name=sender_name,
-        message_external_id=message_external_id,
-        message_timestamp=message_timestamp,
-        receiver_phone_number=receiver_phone_number,
-        text=text,
+    asyncio.run(
+        use_case.execute(
+            sender_phone_number=sender_phone_number,
+            sender_name=sender_name,
+            message_external_id=message_external_id,
+            message_timestamp=message_timestamp,
+            receiver_phone_number=receiver_phone_number,
+            text=text,
+        )
     )
 
     # Assert
@@ -126,47 +214,428 @@ def test_receive_message_use_case_create_company_contact(
     assert fetched_contact.name == sender_name
 
 
-def test_get_message_use_case(message, message_repository):
+def test_receive_message_use_case_commits_one_unit_of_work(
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+    receiver_contact,
+):
     # Arrange
-    use_case = GetMessageUseCase(message_repository=message_repository)
+    use_case = ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+    )
 
     # Act
-    fetched_message = use_case.execute(message_id=message.id)
+    asyncio.run(
+        use_case.execute(
+            sender_phone_number="5588999034445",
+            sender_name="Sender Name",
+            message_external_id="176273512356123",
+            message_timestamp=datetime(2025, 11, 2, tzinfo=UTC),
+            receiver_phone_number=receiver_contact.phone_number,
+            text="Hello",
+        )
+    )
+
+    # Assert
+    assert unit_of_work.commits == 1
+    assert unit_of_work.rollbacks == 0
+
+
+def test_receive_message_use_case_rolls_back_when_receiver_not_found(
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+):
+    # Arrange
+    use_case = ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+    )
+
+    # Act
+    with pytest.raises(ReceiverContactDoesNotExistError):
+        asyncio.run(
+            use_case.execute(
+                sender_phone_number="5588999034445",
+                sender_name="Sender Name",
+                message_external_id="176273512356123",
+                message_timestamp=datetime(2025, 11, 2, tzinfo=UTC),
+                receiver_phone_number="0000000000000",
+                text="Hello",
+            )
+        )
+
+    # Assert
+    assert unit_of_work.commits == 0
+    assert unit_of_work.rollbacks == 1
+
+
+def _incoming(external_id, sender_phone_number, receiver_phone_number, text="Hi"):
+    return IncomingMessage(
+        sender_phone_number=sender_phone_number,
+        sender_name=f"Sender {sender_phone_number}",
+        external_id=external_id,
+        timestamp=datetime(2025, 11, 2, tzinfo=UTC),
+        receiver_phone_number=receiver_phone_number,
+        text=text,
+    )
+
+
+def test_receive_message_batch_resolves_each_sender_once(
+    message_repository,
+    chat_repository,
+    contact_repository,
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+    receiver_contact,
+):
+    # Arrange
+    receiver = receiver_contact.phone_number
+    incoming = [
+        _incoming("wamid.1", "5588999030001", receiver, text="one"),
+        _incoming("wamid.2", "5588999030002", receiver, text="two"),
+        _incoming("wamid.3", "5588999030001", receiver, text="three"),
+        _incoming("wamid.1", "5588999030001", receiver, text="one"),
+        _incoming("wamid.4", "5588999030003", "0000000000000"),
+    ]
+    use_case = ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+    )
+
+    # Act
+    results = asyncio.run(use_case.execute_batch(incoming))
+
+    # Assert
+    assert [result.status for result in results] == [
+        ReceiveStatus.CREATED,
+        ReceiveStatus.CREATED,
+        ReceiveStatus.CREATED,
+        ReceiveStatus.DUPLICATE,
+        ReceiveStatus.RECEIVER_NOT_FOUND,
+    ]
+    assert results[3].message_id == results[0].message_id
+    assert results[4].message_id is None
+    first = message_repository.get_by_id(results[0].message_id)
+    third = message_repository.get_by_id(results[2].message_id)
+    second = message_repository.get_by_id(results[1].message_id)
+    assert first.chat_id == third.chat_id != second.chat_id
+    assert len(message_repository.get_all()) == 3
+    assert len(chat_repository.get_all()) == 2
+    assert unit_of_work.commits == 1
+
+
+def test_receive_message_batch_publishes_new_messages_after_commit(
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+    receiver_contact,
+):
+    # Arrange
+    events = EventHub()
+    subscription = events.subscribe(receiver_contact.company_id)
+    receiver = receiver_contact.phone_number
+    use_case = ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+        events=events,
+    )
+
+    # Act - the redelivery is stored once and announced once
+    results = asyncio.run(
+        use_case.execute_batch(
+            [
+                _incoming("wamid.1", "5588999030001", receiver, text="one"),
+                _incoming("wamid.2", "5588999030002", receiver, text="two"),
+            ]
+        )
+    )
+    asyncio.run(
+        use_case.execute_batch([_incoming("wamid.1", "5588999030001", receiver)])
+    )
+
+    # Assert
+    payloads = [json.loads(subscription._queue.get_nowait()) for _ in range(2)]
+    assert subscription._queue.empty()
+    assert [payload["type"] for payload in payloads] == ["message.created"] * 2
+    assert [payload["data"]["id"] for payload in payloads] == [
+        result.message_id for result in results
+    ]
+    assert payloads[0]["data"]["text"] == "one"
+
+
+def test_receive_message_batch_reports_already_stored_messages(
+    message,
+    message_repository,
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+    receiver_contact,
+):
+    # Arrange
+    message_repository.save(message)
+    use_case = ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+    )
+
+    # Act
+    results = asyncio.run(
+        use_case.execute_batch(
+            [
+                _incoming(
+                    message.external_id, "5588999030001", receiver_contact.phone_number
+                )
+            ]
+        )
+    )
+
+    # Assert
+    # The insert skips the stored external_id; its id is not looked up
+    assert results[0].status == ReceiveStatus.DUPLICATE
+    assert results[0].message_id is None
+    assert message_repository.get_all() == [message]
+
+
+class CountingMessageRepository(InMemoryMessageRepository):
+    def __init__(self):
+        super().__init__()
+        self.save_many_calls = 0
+
+    def save_many(self, messages):
+        self.save_many_calls += 1
+        return super().save_many(messages)
+
+
+def test_receive_message_batch_short_circuits_redeliveries(
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+    receiver_contact,
+):
+    # Arrange
+    message_repository = CountingMessageRepository()
+    use_case = ReceiveMessageUseCase(
+        message_repository=AsyncRepositoryAdapter(message_repository),
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+        idempotency_filter=IdempotencyFilter(capacity=10),
+    )
+    delivery = [_incoming("wamid.1", "5588999030001", receiver_contact.phone_number)]
+    first = asyncio.run(use_case.execute_batch(delivery))
+
+    # Act
+    redelivered = asyncio.run(use_case.execute_batch(delivery))
+
+    # Assert
+    assert redelivered[0].status == ReceiveStatus.DUPLICATE
+    assert redelivered[0].message_id == first[0].message_id
+    assert message_repository.save_many_calls == 1
+
+
+class CountingContactRepository(InMemoryContactRepository):
+    def __init__(self):
+        super().__init__()
+        self.phone_number_lookups = 0
+
+    def get_by_phone_number(self, phone_number):
+        self.phone_number_lookups += 1
+        return super().get_by_phone_number(phone_number)
+
+
+def test_receive_message_batch_caches_receiver_company(
+    async_message_repository,
+    async_chat_repository,
+    unit_of_work,
+    receiver_contact,
+):
+    # Arrange
+    contact_repository = CountingContactRepository()
+    contact_repository.save(receiver_contact)
+    use_case = ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=AsyncRepositoryAdapter(contact_repository),
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+        business_numbers=BusinessNumberDirectory(TTLCache(ttl_seconds=60, capacity=10)),
+    )
+    asyncio.run(
+        use_case.execute_batch(
+            [
+                _incoming("wamid.1", "5588999030001", receiver_contact.phone_number),
+                _incoming("wamid.2", "5588999030001", "0000000000000"),
+            ]
+        )
+    )
+
+    # Act
+    results = asyncio.run(
+        use_case.execute_batch(
+            [
+                _incoming("wamid.3", "5588999030001", receiver_contact.phone_number),
+                _incoming("wamid.4", "5588999030001", "0000000000000"),
+            ]
+        )
+    )
+
+    # Assert
+    assert [result.status for result in results] == [
+        ReceiveStatus.CREATED,
+        ReceiveStatus.RECEIVER_NOT_FOUND,
+    ]
+    assert contact_repository.phone_number_lookups == 2
+
+
+class CountingChatRepository(InMemoryChatRepository):
+    def __init__(self):
+        super().__init__()
+        self.contact_lookups = 0
+
+    def get_company_chat_by_contact_id(self, company_id, contact_id):
+        self.contact_lookups += 1
+        return super().get_company_chat_by_contact_id(company_id, contact_id)
+
+
+def test_receive_message_batch_caches_sender_conversation(
+    message_repository,
+    async_message_repository,
+    async_contact_repository,
+    unit_of_work,
+    receiver_contact,
+):
+    # Arrange
+    chat_repository = CountingChatRepository()
+    conversations = ConversationDirectory(TTLCache(ttl_seconds=60, capacity=10))
+    use_case = ReceiveMessageUseCase(
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=AsyncRepositoryAdapter(chat_repository),
+        unit_of_work=unit_of_work,
+        conversations=conversations,
+    )
+    sender = "5588999030001"
+    first = asyncio.run(
+        use_case.execute_batch(
+            [_incoming("wamid.1", sender, receiver_contact.phone_number)]
+        )
+    )
+
+    # Act
+    second = asyncio.run(
+        use_case.execute_batch(
+            [_incoming("wamid.2", sender, receiver_contact.phone_number)]
+        )
+    )
+
+    # Assert
+    assert second[0].status == ReceiveStatus.CREATED
+    assert chat_repository.contact_lookups == 1
+    conversation = conversations.get(receiver_contact.company_id, sender)
+    messages = message_repository.get_by_chat_id(conversation.chat_id).items
+    assert {message.id for message in messages} == {
+        first[0].message_id,
+        second[0].message_id,
+    }
+
+
+def test_receive_message_batch_remembers_nothing_when_rolled_back(
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
+    receiver_contact,
+):
+    # Arrange
+    class FailingMessageRepository(InMemoryMessageRepository):
+        def save_many(self, messages):
+            raise RuntimeError("database down")
+
+    idempotency_filter = IdempotencyFilter(capacity=10)
+    conversations = ConversationDirectory(TTLCache(ttl_seconds=60, capacity=10))
+    use_case = ReceiveMessageUseCase(
+        message_repository=AsyncRepositoryAdapter(FailingMessageRepository()),
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
+        idempotency_filter=idempotency_filter,
+        conversations=conversations,
+    )
+
+    # Act
+    with pytest.raises(RuntimeError):
+        asyncio.run(
+            use_case.execute_batch(
+                [_incoming("wamid.1", "5588999030001", receiver_contact.phone_number)]
+            )
+        )
+
+    # Assert
+    assert not idempotency_filter.seen("wamid.1")
+    assert conversations.get(receiver_contact.company_id, "5588999030001") is None
+    assert unit_of_work.rollbacks == 1
+
+
+def test_get_message_use_case(message, message_repository, async_message_repository):
+    # Arrange
+    use_case = GetMessageUseCase(message_repository=async_message_repository)
+
+    # Act
+    fetched_message = asyncio.run(use_case.execute(message_id=message.id))
 
     # Assert
     assert fetched_message.id == message.id
     assert fetched_message.text == message.text
 
 
-def test_update_message_use_case_existing_message(message, message_repository):
+def test_update_message_use_case_existing_message(
+    message, message_repository, async_message_repository
+):
     # Arrange
     message_repository.save(message)
-    use_case = UpdateMessageUseCase(message_repository=message_repository)
+    use_case = UpdateMessageUseCase(message_repository=async_message_repository)
 
     # Act
     new_text = "New Text"
-    use_case.execute(message_id=message.id, text=new_text)
+    asyncio.run(use_case.execute(message_id=message.id, text=new_text))
 
     # Assert
     message = message_repository.get_by_id(message.id)
     assert message.text == new_text
 
 
-def test_update_message_use_case_non_existing_message(message_repository):
+def test_update_message_use_case_non_existing_message(async_message_repository):
     # Arrange
-    use_case = UpdateMessageUseCase(message_repository=message_repository)
+    use_case = UpdateMessageUseCase(message_repository=async_message_repository)
 
     # Act/Assert
     with pytest.raises(MessageNotFoundError):
-        use_case.execute("message.id", "New Text")
+        asyncio.run(use_case.execute("message.id", "New Text"))
 
 
-def test_delete_message_use_case(message, message_repository):
+def test_delete_message_use_case(message, message_repository, async_message_repository):
     # Arrange
-    use_case = DeleteMessageUseCase(message_repository=message_repository)
+    use_case = DeleteMessageUseCase(message_repository=async_message_repository)
 
     # Act
-    use_case.execute(message.id)
+    asyncio.run(use_case.execute(message.id))
 
     # Act/Assert
     with pytest.raises(MessageNotFoundError):
@@ -177,6 +646,10 @@ def test_receive_message_defaults_to_unread(
     message_repository,
     contact_repository,
     chat_repository,
+    async_message_repository,
+    async_contact_repository,
+    async_chat_repository,
+    unit_of_work,
     receiver_contact,
 ):
     # Arrange
@@ -188,19 +661,22 @@ def test_receive_message_defaults_to_unread(
     text = "Hello"
 
     use_case = ReceiveMessageUseCase(
-        message_repository=message_repository,
-        contact_repository=contact_repository,
-        chat_repository=chat_repository,
+        message_repository=async_message_repository,
+        contact_repository=async_contact_repository,
+        chat_repository=async_chat_repository,
+        unit_of_work=unit_of_work,
     )
 
     # Act
-    message = use_case.execute(
-        sender_phone_number=sender_phone_number,
-        sender_name=sender_name,
-        message_external_id=message_external_id,
-        message_timestamp=message_timestamp,
-        receiver_phone_number=receiver_phone_number,
-        text=text,
+    message = asyncio.run(
+        use_case.execute(
+            sender_phone_number=sender_phone_number,
+            sender_name=sender_name,
+            message_external_id=message_external_id,
+            message_timestamp=message_timestamp,
+            receiver_phone_number=receiver_phone_number,
+            text=text,
+        )
     )
 
     # Assert
@@ -270,10 +746,12 @@ def test_mark_chat_as_read_use_case():
     fake_repo.save(message2)
     fake_repo.save(message3)
 
-    use_case = MarkChatAsReadUseCase(message_repository=fake_repo)
+    use_case = MarkChatAsReadUseCase(
+        message_repository=AsyncRepositoryAdapter(fake_repo)
+    )
 
     # Act
-    updated_count = use_case.execute(chat_id="chat-1")
+    updated_count = asyncio.run(use_case.execute(chat_id="chat-1"))
 
     # Assert
     assert updated_count == 2  # Only 2 were unread
@@ -304,10 +782,12 @@ def test_mark_chat_as_read_when_all_already_read():
     )
     fake_repo.save(message)
 
-    use_case = MarkChatAsReadUseCase(message_repository=fake_repo)
+    use_case = MarkChatAsReadUseCase(
+        message_repository=AsyncRepositoryAdapter(fake_repo)
+    )
 
     # Act
-    updated_count = use_case.execute(chat_id="chat-1")
+    updated_count = asyncio.run(use_case.execute(chat_id="chat-1"))
 
     # Assert
     assert updated_count == 0  # No updates needed
@@ -339,10 +819,12 @@ def test_mark_chat_as_read_only_affects_target_chat():
     fake_repo.save(message1)
     fake_repo.save(message2)
 
-    use_case = MarkChatAsReadUseCase(message_repository=fake_repo)
+    use_case = MarkChatAsReadUseCase(
+        message_repository=AsyncRepositoryAdapter(fake_repo)
+    )
 
     # Act
-    updated_count = use_case.execute(chat_id="chat-1")
+    updated_count = asyncio.run(use_case.execute(chat_id="chat-1"))
 
     # Assert
     assert updated_count == 1  # Only 1 message in chat-1
@@ -404,3 +886,86 @@ def test_fake_repository_mark_chat_messages_as_read():
     assert msg1.updated_at is not None
     assert msg2.read is True  # Still read
     assert msg3.read is False  # Different chat, unchanged
+
+
+def test_get_chat_messages_use_case_returns_latest_and_pages_backwards(
+    chat, message_factory, async_message_repository
+):
+    # Arrange
+    messages = [
+        message_factory(
+            external_id=f"wamid.{minute}",
+            external_timestamp=datetime(2025, 11, 2, 10, minute, tzinfo=UTC),
+        )
+        for minute in range(5)
+    ]
+    use_case = GetChatMessagesUseCase(message_repository=async_message_repository)
+
+    # Act
+    latest = asyncio.run(use_case.execute(chat_id=chat.id, limit=2))
+    older = asyncio.run(
+        use_case.execute(chat_id=chat.id, limit=2, before=latest.next_cursor)
+    )
+    oldest = asyncio.run(
+        use_case.execute(chat_id=chat.id, limit=2, before=older.next_cursor)
+    )
+
+    # Assert
+    assert [m.id for m in latest.items] == [m.id for m in messages[3:]]
+    assert [m.id for m in older.items] == [m.id for m in messages[1:3]]
+    assert [m.id for m in oldest.items] == [messages[0].id]
+    assert oldest.next_cursor is None
+
+
+def test_send_message_use_case_publishes_to_the_chat_attendant(
+    chat_factory, async_message_repository, async_chat_repository
+):
+    # Arrange
+    chat = chat_factory(attached_user_id="user-1")
+    events = EventHub()
+    attendant = events.subscribe(chat.company_id, attendant_id="user-1")
+    other_attendant = events.subscribe(chat.company_id, attendant_id="user-2")
+    use_case = SendMessageUseCase(
+        message_repository=async_message_repository,
+        chat_repository=async_chat_repository,
+        events=events,
+    )
+
+    # Act
+    message = asyncio.run(
+        use_case.execute(chat_id=chat.id, text="Hello", sent_by_user_id="user-1")
+    )
+
+    # Assert
+    payload = json.loads(attendant._queue.get_nowait())
+    assert payload["type"] == "message.created"
+    assert payload["chat_id"] == chat.id
+    assert payload["data"]["id"] == message.id
+    assert other_attendant._queue.empty()
+
+
+def test_mark_chat_as_read_use_case_publishes_only_when_messages_were_read(
+    chat, message_factory, async_message_repository, async_chat_repository
+):
+    # Arrange
+    message_factory(read=False)
+    events = EventHub()
+    subscription = events.subscribe(chat.company_id)
+    use_case = MarkChatAsReadUseCase(
+        message_repository=async_message_repository,
+        chat_repository=async_chat_repository,
+        events=events,
+    )
+
+    # Act
+    asyncio.run(use_case.execute(chat_id=chat.id))
+    asyncio.run(use_case.execute(chat_id=chat.id))
+
+    # Assert
+    payload = json.loads(subscription._queue.get_nowait())
+    assert payload == {
+        "type": "chat.read",
+        "chat_id": chat.id,
+        "data": {"updated_count": 1},
+    }
+    assert subscription._queue.empty()
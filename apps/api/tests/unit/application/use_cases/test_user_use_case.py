@@ -171,7 +171,7 @@ def test_list_user_use_case(company, user_factory, user_repository):
     users = use_case.execute(company_id=company.id)
 
     # Assert
-    assert len(users) == 2
+    assert len(users.items) == 2
 
 
 def test_create_user_with_is_active_false(user_repository, company_repository):
@@ -0,0 +1,51 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.errors import InvalidCursorError
+from src.domain.pagination import build_page, decode_cursor, encode_cursor
+
+
+def test_cursor_round_trips_typed_keyset_values():
+    # Arrange
+    created_at = datetime(2025, 11, 2, 10, 30, tzinfo=UTC)
+    cursor = encode_cursor((0.25, created_at, "chat-id"))
+
+    # Act
+    values = decode_cursor(cursor, (float, datetime, str))
+
+    # Assert
+    assert values == (0.25, created_at, "chat-id")
+
+
+def test_decode_cursor_returns_none_without_cursor():
+    assert decode_cursor(None, (datetime, str)) is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not base64 at all!",
+        encode_cursor(("only-one-value",)),
+        encode_cursor(("not-a-date", "chat-id")),
+        encode_cursor((1, "chat-id")),
+    ],
+)
+def test_decode_cursor_rejects_tampered_cursors(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, (datetime, str))
+
+
+def test_build_page_sets_next_cursor_only_when_more_rows_exist():
+    # Arrange
+    rows = [("a", 1), ("b", 2), ("c", 3)]
+
+    # Act
+    first_page = build_page(rows, limit=2, key=lambda row: row, parse=lambda r: r[0])
+    last_page = build_page(rows, limit=3, key=lambda row: row, parse=lambda r: r[0])
+
+    # Assert
+    assert first_page.items == ["a", "b"]
+    assert decode_cursor(first_page.next_cursor, (str, int)) == ("b", 2)
+    assert last_page.items == ["a", "b", "c"]
+    assert last_page.next_cursor is None
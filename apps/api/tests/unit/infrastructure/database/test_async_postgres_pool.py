@@ -0,0 +1,85 @@
+import asyncio
+
+import asyncpg
+
+from src.infrastructure.database import async_postgres_pool
+from src.infrastructure.database.async_postgres_pool import (
+    AsyncPostgresConnectionPool,
+)
+
+
+class FakeAsyncConnection:
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.closed = False
+
+    def get_server_pid(self) -> int:
+        return self.pid
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeAsyncpgPool:
+    """Hands out one connection at a time, reconnecting once it is closed."""
+
+    def __init__(self, init):
+        self.init = init
+        self.conn = None
+        self.opened = 0
+        self.released = []
+
+    async def acquire(self, timeout=None) -> FakeAsyncConnection:
+        if self.conn is None or self.conn.closed:
+            self.opened += 1
+            self.conn = FakeAsyncConnection(pid=self.opened)
+            await self.init(self.conn)
+        return self.conn
+
+    async def release(self, conn) -> None:
+        self.released.append(conn)
+
+    def get_size(self) -> int:
+        return 0 if self.conn is None or self.conn.closed else 1
+
+    def get_idle_size(self) -> int:
+        return self.get_size()
+
+
+def test_async_pool_recycles_connections_past_max_lifetime(monkeypatch):
+    # Arrange
+    fake_pools = []
+
+    async def create_pool(**kwargs):
+        fake_pools.append(FakeAsyncpgPool(kwargs["init"]))
+        return fake_pools[-1]
+
+    clock = [1000.0]
+    monkeypatch.setattr(asyncpg, "create_pool", create_pool)
+    monkeypatch.setattr(async_postgres_pool.time, "monotonic", lambda: clock[0])
+    pool = AsyncPostgresConnectionPool("postgresql://localhost/db", max_lifetime=60)
+
+    async def checkout() -> int:
+        async with pool.connection() as conn:
+            return conn.get_server_pid()
+
+    async def work():
+        first = await checkout()
+        clock[0] += 30
+        # Busy connections age too: still young enough to reuse
+        second = await checkout()
+        clock[0] += 31
+        third = await checkout()
+        fourth = await checkout()
+        return [first, second, third, fourth]
+
+    # Act
+    pids = asyncio.run(work())
+
+    # Assert - closed on the return that found it expired, then replaced
+    assert pids == [1, 1, 1, 2]
+    assert pool.stats().recycled == 1
+    assert fake_pools[0].released[2].closed
@@ -0,0 +1,99 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.database.postgres_unit_of_work import PostgresUnitOfWork
+from src.infrastructure.repositories.async_repository_adapter import (
+    AsyncRepositoryAdapter,
+)
+from tests.unit.infrastructure.database.test_postgres_pool import make_pool
+
+
+def test_unit_of_work_runs_block_on_one_connection_and_commits_once():
+    # Arrange
+    pool = make_pool()
+    unit_of_work = PostgresUnitOfWork(pool)
+
+    async def work():
+        async with unit_of_work.transaction():
+            for _ in range(3):
+                with pool.connection() as conn:
+                    conn.commit()
+        return conn._conn
+
+    # Act
+    conn = asyncio.run(work())
+
+    # Assert
+    stats = pool.stats()
+    assert stats.checkouts == 1
+    assert stats.in_use == 0
+    assert conn.commits == 1
+    assert conn.rollbacks == 0
+
+
+def test_unit_of_work_rolls_back_on_error():
+    # Arrange
+    pool = make_pool()
+    unit_of_work = PostgresUnitOfWork(pool)
+
+    async def work():
+        async with unit_of_work.transaction():
+            with pool.connection():
+                pass
+            raise ValueError("boom")
+
+    # Act/Assert
+    with pytest.raises(ValueError):
+        asyncio.run(work())
+    conn = pool.getconn()
+    assert conn.commits == 0
+    assert conn.rollbacks == 1
+    assert pool.is_bound() is False
+
+
+def test_unit_of_work_is_shared_with_repository_calls_on_executor_threads():
+    # Arrange
+    pool = make_pool(max_size=1)
+
+    class Repository:
+        def call(self):
+            with pool.connection() as conn:
+                return conn._conn
+
+    async def work(executor):
+        unit_of_work = PostgresUnitOfWork(pool, executor=executor)
+        repository = AsyncRepositoryAdapter(Repository(), executor=executor)
+        async with unit_of_work.transaction():
+            first = await repository.call()
+            second = await repository.call()
+        return first, second
+
+    # Act
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first, second = asyncio.run(work(executor))
+
+    # Assert
+    assert second is first
+    assert pool.stats().checkouts == 1
+
+
+def test_nested_unit_of_work_joins_outer_transaction():
+    # Arrange
+    pool = make_pool()
+    unit_of_work = PostgresUnitOfWork(pool)
+
+    async def work():
+        async with unit_of_work.transaction():
+            async with unit_of_work.transaction():
+                with pool.connection() as conn:
+                    pass
+        return conn._conn
+
+    # Act
+    conn = asyncio.run(work())
+
+    # Assert
+    assert conn.commits == 1
+    assert pool.stats().checkouts == 1
@@ -0,0 +1,31 @@
+from src.infrastructure.database.repair_chat_activity import repair_chat_activity
+
+
+class FakeChatDAO:
+    def __init__(self, chat_ids: list[str], drifted: set[str]):
+        self.chat_ids = sorted(chat_ids)
+        self.drifted = drifted
+        self.calls = []
+
+    def repair_activity(self, after_id: str | None, batch_size: int):
+        self.calls.append(after_id)
+        batch = [
+            chat_id
+            for chat_id in self.chat_ids
+            if after_id is None or chat_id > after_id
+        ][:batch_size]
+        if not batch:
+            return None, 0
+        return batch[-1], len(self.drifted.intersection(batch))
+
+
+def test_repair_walks_every_batch_and_sums_the_fixed_chats():
+    # Arrange
+    dao = FakeChatDAO(["a", "b", "c", "d", "e"], drifted={"b", "e"})
+
+    # Act
+    repaired = repair_chat_activity(dao, batch_size=2)
+
+    # Assert
+    assert repaired == 2
+    assert dao.calls == [None, "b", "d", "e"]
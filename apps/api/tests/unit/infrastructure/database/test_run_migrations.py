@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.database import run_migrations
+from src.infrastructure.database.run_migrations import (
+    NO_TRANSACTION_MARKER,
+    split_statements,
+)
+
+DATABASE_DIR = Path(run_migrations.__file__).parent
+
+
+def test_split_statements_drops_comments_and_empty_statements():
+    # Arrange
+    migration_sql = """
+    -- header; with a semicolon
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_a ON a (x);
+
+    -- second
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_b
+        ON b (y)
+        WHERE z = FALSE;
+    """
+
+    # Act
+    statements = split_statements(migration_sql)
+
+    # Assert
+    assert len(statements) == 2
+    assert statements[0] == "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_a ON a (x)"
+    assert statements[1].endswith("WHERE z = FALSE")
+
+
+INDEX_MIGRATIONS = [
+    "002_add_query_indexes.sql",
+    "003_add_search_indexes.sql",
+    "004_add_keyset_pagination_indexes.sql",
+]
+
+
+def _dropped_indexes() -> set[str]:
+    dropped = set()
+    for migration in INDEX_MIGRATIONS:
+        migration_sql = (DATABASE_DIR / "migrations" / migration).read_text()
+        for statement in split_statements(migration_sql):
+            if statement.startswith("DROP INDEX"):
+                dropped.add(statement.split()[-1])
+    return dropped
+
+
+@pytest.mark.parametrize("migration", INDEX_MIGRATIONS)
+def test_index_migration_is_concurrent_and_mirrored_in_schema(migration):
+    # Arrange
+    migration_sql = (DATABASE_DIR / "migrations" / migration).read_text()
+    schema_sql = (DATABASE_DIR / "create_postgres_tables.sql").read_text()
+    dropped = _dropped_indexes()
+
+    # Act
+    statements = [
+        statement
+        for statement in split_statements(migration_sql)
+        if statement.startswith(("CREATE INDEX", "DROP INDEX"))
+    ]
+
+    # Assert
+    assert NO_TRANSACTION_MARKER in migration_sql
+    assert statements
+    for statement in statements:
+        assert statement.startswith(
+            ("CREATE INDEX CONCURRENTLY IF NOT EXISTS", "DROP INDEX CONCURRENTLY")
+        )
+        if statement.startswith("DROP INDEX"):
+            continue
+        index_name = statement.split()[6]
+        if index_name in dropped:
+            assert f"INDEX IF NOT EXISTS {index_name}\n" not in schema_sql
+        else:
+            assert f"CREATE INDEX IF NOT EXISTS {index_name}\n" in schema_sql
@@ -0,0 +1,94 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.domain.errors import ChatNotFoundError
+from src.infrastructure.repositories import async_repository_adapter
+from src.infrastructure.repositories.async_repository_adapter import (
+    AsyncRepositoryAdapter,
+)
+from tests.fakes.repositories.fake_in_memory_chat_repository import (
+    InMemoryChatRepository,
+)
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_adapter_awaits_sync_repository_methods(chat_factory):
+    # Arrange
+    repository = InMemoryChatRepository()
+    adapter = AsyncRepositoryAdapter(repository)
+    chat = chat_factory()
+
+    # Act
+    asyncio.run(adapter.save(chat))
+    fetched_chat = asyncio.run(adapter.get_by_id(chat_id=chat.id))
+
+    # Assert
+    assert fetched_chat.id == chat.id
+    assert adapter.repository is repository
+
+
+def test_adapter_propagates_repository_errors():
+    # Arrange
+    adapter = AsyncRepositoryAdapter(InMemoryChatRepository())
+
+    # Act/Assert
+    with pytest.raises(ChatNotFoundError):
+        asyncio.run(adapter.get_by_id(chat_id="missing"))
+
+
+def test_adapter_runs_on_executor_with_caller_context():
+    # Arrange
+    class Repository:
+        def whoami(self):
+            return threading.current_thread().name, request_id.get()
+
+    async def call(adapter):
+        request_id.set("req-1")
+        return await adapter.whoami()
+
+    with ThreadPoolExecutor(thread_name_prefix="repo") as executor:
+        adapter = AsyncRepositoryAdapter(Repository(), executor=executor)
+
+        # Act
+        thread_name, value = asyncio.run(call(adapter))
+
+    # Assert
+    assert thread_name.startswith("repo")
+    assert value == "req-1"
+
+
+def test_adapter_iterates_sync_iterators_in_batches(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(async_repository_adapter, "ITER_BATCH_SIZE", 2)
+    pulled = []
+
+    class Repository:
+        def iter_numbers(self, count):
+            try:
+                for number in range(count):
+                    pulled.append(number)
+                    yield number
+            finally:
+                pulled.append("closed")
+
+    async def first_three(adapter):
+        numbers = []
+        async for number in adapter.iter_numbers(count=10):
+            numbers.append(number)
+            if len(numbers) == 3:
+                break
+        return numbers
+
+    adapter = AsyncRepositoryAdapter(Repository())
+
+    # Act
+    numbers = asyncio.run(first_three(adapter))
+
+    # Assert - two batches were pulled, then the sync iterator was closed
+    assert numbers == [0, 1, 2]
+    assert pulled == [0, 1, 2, 3, "closed"]
@@ -0,0 +1,165 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.entities.base import BaseEntity
+from src.domain.entities.chat import Chat
+from src.domain.entities.company import Company
+from src.domain.entities.contact import Contact
+from src.domain.entities.message import Message
+from src.domain.entities.user import User
+from src.domain.enums import ChatStatuses, UserTypes
+from src.infrastructure.repositories.postgres_chat_repository import (
+    PostgresChatRepository,
+)
+from src.infrastructure.repositories.postgres_company_repository import (
+    PostgresCompanyRepository,
+)
+from src.infrastructure.repositories.postgres_contact_repository import (
+    PostgresContactRepository,
+)
+from src.infrastructure.repositories.postgres_message_repository import (
+    PostgresMessageRepository,
+)
+from src.infrastructure.repositories.postgres_user_repository import (
+    PostgresUserRepository,
+)
+
+CREATED_AT = datetime(2025, 11, 2, 12, 0, tzinfo=UTC)
+UPDATED_AT = datetime(2025, 11, 2, 13, 0, tzinfo=UTC)
+
+
+def slots(entity_type: type) -> list[str]:
+    return [
+        slot
+        for cls in entity_type.__mro__
+        if issubclass(cls, BaseEntity)
+        for slot in cls.__slots__
+    ]
+
+
+def fields(entity: BaseEntity) -> dict:
+    return {slot: getattr(entity, slot) for slot in slots(type(entity))}
+
+
+@pytest.mark.parametrize(
+    ("parse", "row", "expected"),
+    [
+        (
+            PostgresMessageRepository._parse_row,
+            ("m-1", "wamid.1", CREATED_AT, "c-1", "Hi", None, True, CREATED_AT, None),
+            Message(
+                id="m-1",
+                external_id="wamid.1",
+                external_timestamp=CREATED_AT,
+                chat_id="c-1",
+                text="Hi",
+                read=True,
+                created_at=CREATED_AT,
+            ),
+        ),
+        (
+            PostgresChatRepository._parse_row,
+            ("c-1", "co-1", "ct-1", "pending", "u-1", CREATED_AT, UPDATED_AT),
+            Chat(
+                id="c-1",
+                company_id="co-1",
+                contact_id="ct-1",
+                status=ChatStatuses.PENDING,
+                attached_user_id="u-1",
+                created_at=CREATED_AT,
+                updated_at=UPDATED_AT,
+            ),
+        ),
+        (
+            PostgresContactRepository._parse_row,
+            (
+                "ct-1",
+                "Ana",
+                "5511999990000",
+                None,
+                "co-1",
+                False,
+                "vip,new",
+                "note",
+                CREATED_AT,
+                CREATED_AT,
+                None,
+            ),
+            Contact(
+                id="ct-1",
+                name="Ana",
+                phone_number="5511999990000",
+                company_id="co-1",
+                tags=["vip", "new"],
+                notes="note",
+                last_contact_at=CREATED_AT,
+                created_at=CREATED_AT,
+            ),
+        ),
+        (
+            PostgresCompanyRepository._parse_row,
+            (
+                "co-1",
+                "Acme",
+                CREATED_AT,
+                None,
+                "acme@test.com",
+                "+5511999990000",
+                True,
+                False,
+                None,
+            ),
+            Company(
+                id="co-1",
+                name="Acme",
+                email="acme@test.com",
+                phone="+5511999990000",
+                attendant_sees_all_conversations=False,
+                created_at=CREATED_AT,
+            ),
+        ),
+        (
+            PostgresUserRepository._parse_row_with_password,
+            (
+                "u-1",
+                "Bia",
+                "bia@test.com",
+                "staff",
+                "hash",
+                "co-1",
+                True,
+                CREATED_AT,
+                None,
+            ),
+            User(
+                id="u-1",
+                name="Bia",
+                email="bia@test.com",
+                type=UserTypes.STAFF,
+                password_hash="hash",
+                company_id="co-1",
+                created_at=CREATED_AT,
+            ),
+        ),
+    ],
+)
+def test_row_mapper_fills_every_field_init_would(parse, row, expected):
+    # Act
+    entity = parse(row)
+
+    # Assert
+    assert type(entity) is type(expected)
+    assert fields(entity) == fields(expected)
+
+
+def test_entities_have_no_instance_dict():
+    # Arrange
+    message = PostgresMessageRepository._parse_row(
+        ("m-1", "wamid.1", CREATED_AT, "c-1", "Hi", None, False, CREATED_AT, None)
+    )
+
+    # Act/Assert
+    assert not hasattr(message, "__dict__")
+    with pytest.raises(AttributeError):
+        message.unknown_field = True
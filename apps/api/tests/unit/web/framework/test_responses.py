@@ -0,0 +1,52 @@
+import asyncio
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from src.web.framework.responses import FastJSONResponse, StreamingJSONResponse
+
+
+def test_fast_json_response_encodes_datetimes():
+    # Arrange
+    created_at = datetime(2025, 11, 2, 12, 30, 15, 123456, tzinfo=UTC)
+    content = {"created_at": created_at, "updated_at": None, "text": "olá"}
+
+    # Act
+    response = FastJSONResponse(content=content)
+
+    # Assert
+    assert json.loads(response.body) == {
+        "created_at": created_at.isoformat(),
+        "updated_at": None,
+        "text": "olá",
+    }
+
+
+def test_fast_json_response_rejects_unknown_types():
+    # Act/Assert
+    with pytest.raises(TypeError):
+        FastJSONResponse(content={"value": object()})
+
+
+def test_streaming_json_response_holds_a_slot_while_it_is_sent():
+    # Arrange
+    slots = asyncio.Semaphore(2)
+    held = []
+
+    async def items():
+        for index in range(3):
+            held.append(slots._value)
+            yield {"index": index}
+
+    async def send():
+        response = StreamingJSONResponse(items(), slots=slots)
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    # Act
+    body = asyncio.run(send())
+
+    # Assert - one slot taken until the last item, then given back
+    assert json.loads(body)["results"] == [{"index": i} for i in range(3)]
+    assert held == [1, 1, 1]
+    assert slots._value == 2
@@ -0,0 +1,97 @@
+import asyncio
+import contextvars
+import threading
+
+import pytest
+
+from src.web.framework.thread_pools import BoundedThreadPool, create_thread_pools
+
+request_id = contextvars.ContextVar("request_id", default=None)
+
+
+def test_thread_pool_reports_active_and_queued_tasks():
+    # Arrange
+    pool = BoundedThreadPool(name="test", max_workers=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(timeout=5)
+
+    # Act
+    first = pool.submit(block)
+    started.wait(timeout=5)
+    second = pool.submit(block)
+    busy_stats = pool.stats()
+    release.set()
+    first.result(timeout=5)
+    second.result(timeout=5)
+    pool.shutdown(wait=True)
+    idle_stats = pool.stats()
+
+    # Assert
+    assert busy_stats.active == 1
+    assert busy_stats.queued == 1
+    assert busy_stats.saturated is True
+    assert idle_stats.active == 0
+    assert idle_stats.queued == 0
+    assert idle_stats.completed == 2
+    assert idle_stats.peak_queued == 1
+    assert idle_stats.saturated is False
+
+
+def test_thread_pool_counts_failed_tasks_as_completed():
+    # Arrange
+    pool = BoundedThreadPool(name="test", max_workers=1)
+
+    def fail():
+        raise ValueError("boom")
+
+    # Act
+    future = pool.submit(fail)
+
+    # Assert
+    with pytest.raises(ValueError):
+        future.result(timeout=5)
+    pool.shutdown(wait=True)
+    assert pool.stats().completed == 1
+    assert pool.stats().active == 0
+
+
+def test_thread_pool_run_carries_context_to_worker_thread():
+    # Arrange
+    pool = BoundedThreadPool(name="test", max_workers=1)
+
+    def whoami():
+        return threading.current_thread().name, request_id.get()
+
+    async def call():
+        request_id.set("req-1")
+        return await pool.run(whoami)
+
+    # Act
+    thread_name, value = asyncio.run(call())
+    pool.shutdown(wait=True)
+
+    # Assert
+    assert thread_name.startswith("test-pool")
+    assert value == "req-1"
+
+
+def test_thread_pool_rejects_invalid_size():
+    # Act/Assert
+    with pytest.raises(ValueError):
+        BoundedThreadPool(name="test", max_workers=0)
+
+
+def test_create_thread_pools_uses_settings(app_settings):
+    # Act
+    pools = create_thread_pools(settings=app_settings)
+
+    # Assert
+    assert pools["webhook"].max_workers == app_settings.THREAD_POOL_WEBHOOK_SIZE
+    assert pools["reads"].max_workers == app_settings.THREAD_POOL_READS_SIZE
+    assert pools["auth"].max_workers == app_settings.THREAD_POOL_AUTH_SIZE
+    for pool in pools.values():
+        pool.shutdown()
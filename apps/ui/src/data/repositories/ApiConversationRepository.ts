@@ -6,6 +6,9 @@ import { AuthUser, UserRole } from "@/domain/entities/User";
 import { IConversationRepository } from "@/domain/repositories/IConversationRepository";
 import { HttpClient } from "@/infrastructure/http/HttpClient";
 
+// The largest page the API serves
+const CHAT_PAGE_SIZE = 200;
+
 export class ApiConversationRepository implements IConversationRepository {
   private userCache: Map<string, UserDTO> = new Map();
   private contactCache: Map<string, ContactDTO> = new Map();
@@ -96,6 +99,24 @@ export class ApiConversationRepository implements IConversationRepository {
     };
   }
 
+  private async getAllChats(
+    path: string,
+    query: Record<string, string | undefined>,
+  ): Promise<ChatDTO[]> {
+    // Chat lists are paginated: follow next_cursor until the last page
+    const chats: ChatDTO[] = [];
+    let cursor: string | undefined;
+    do {
+      const res = await this.client.get(path, {
+        query: { ...query, limit: CHAT_PAGE_SIZE, cursor },
+      });
+      const page = res.data as { results?: ChatDTO[]; next_cursor?: string | null };
+      chats.push(...(page.results || []));
+      cursor = page.next_cursor || undefined;
+    } while (cursor);
+    return chats;
+  }
+
   private mapMessageDTOToMessage(dto: MessageDTO, userMap: Map<string, string>): Message {
     const isFromCustomer = dto.sent_by_user_id === null;
     const attendantName = dto.sent_by_user_id ? userMap.get(dto.sent_by_user_id) : undefined;
@@ -113,8 +134,7 @@ export class ApiConversationRepository implements IConversationRepository {
   }
 
   async getAll(companyId: string): Promise<Conversation[]> {
-    const res = await this.client.get(`/chats`, { query: { company_id: companyId } });
-    const chats = (res.data as any).results as ChatDTO[];
+    const chats = await this.getAllChats(`/chats`, { company_id: companyId });
 
     // Fetch all messages in parallel for better performance
     const messagePromises = chats.map((chat) =>
@@ -209,17 +229,13 @@ export class ApiConversationRepository implements IConversationRepository {
   }
 
   async getByAttendant(user: AuthUser): Promise<Conversation[]> {
-    let res;
-
-    if (user.role === UserRole.ATTENDANT) {
-      res = await this.client.get(`/chats/by-attendant`, {
-        query: { company_id: user.companyId, attendant_id: user.id },
-      });
-    } else {
-      res = await this.client.get(`/chats`, { query: { company_id: user.companyId } });
-    }
-
-    const chats = ((res.data as any).results as ChatDTO[]) || [];
+    const chats =
+      user.role === UserRole.ATTENDANT
+        ? await this.getAllChats(`/chats/by-attendant`, {
+            company_id: user.companyId,
+            attendant_id: user.id,
+          })
+        : await this.getAllChats(`/chats`, { company_id: user.companyId });
     return await this.buildConversationsFromChats(chats);
   }
 
@@ -344,36 +360,24 @@ export class ApiConversationRepository implements IConversationRepository {
   }
 
   async search(companyId: string, query: string): Promise<Conversation[]> {
-    const res = await this.client.get(`/chats/search`, {
-      query: { company_id: companyId, query },
-    });
-    const chats = ((res.data as any).results as ChatDTO[]) || [];
+    const chats = await this.getAllChats(`/chats/search`, { company_id: companyId, query });
     return await this.buildConversationsFromChats(chats);
   }
 
   async getUnassigned(companyId: string): Promise<Conversation[]> {
-    const res = await this.client.get(`/chats/unassigned`, {
-      query: { company_id: companyId },
-    });
-    const chats = ((res.data as any).results as ChatDTO[]) || [];
+    const chats = await this.getAllChats(`/chats/unassigned`, { company_id: companyId });
     return await this.buildConversationsFromChats(chats);
   }
 
   async getPending(companyId: string): Promise<Conversation[]> {
-    const res = await this.client.get(`/chats/pending`, {
-      query: { company_id: companyId },
-    });
-    const chats = ((res.data as any).results as ChatDTO[]) || [];
+    const chats = await this.getAllChats(`/chats/pending`, { company_id: companyId });
     const conversations = await this.buildConversationsFromChats(chats);
     // Client-side filter for unread > 0 (final PENDING requirement)
     return conversations.filter((conv) => conv.unread > 0);
   }
 
   async getResolved(companyId: string): Promise<Conversation[]> {
-    const res = await this.client.get(`/chats/resolved`, {
-      query: { company_id: companyId },
-    });
-    const chats = ((res.data as any).results as ChatDTO[]) || [];
+    const chats = await this.getAllChats(`/chats/resolved`, { company_id: companyId });
     return await this.buildConversationsFromChats(chats);
   }
 